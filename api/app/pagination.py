@@ -1,10 +1,17 @@
 import base64
+import binascii
 import json
 from collections import OrderedDict
+from datetime import date
 from typing import Any
 
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from util.engine_models.identities.models import IdentityModel
 
@@ -15,6 +22,198 @@ class CustomPagination(PageNumberPagination):
     max_page_size = 999
 
 
+class KeysetPagination(CustomPagination):
+    """
+    Page number pagination, with an opt-in keyset (cursor) mode for large
+    tables, used when the request has a `cursor` query parameter (empty for
+    the first page).
+
+    In keyset mode, pages are filtered on the values of the queryset's
+    ordering fields, with the primary key as the tie-breaker, of the last
+    (or first) object of the previous page, instead of an offset. The count
+    is estimated from the planner statistics on PostgreSQL when it is above
+    `exact_count_threshold`, rather than counting every row.
+    """
+
+    cursor_query_param = "cursor"
+    exact_count_threshold = 10000
+
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(  # type: ignore[override]
+        self,
+        queryset: QuerySet[Model],
+        request: Request,
+        view: Any = None,
+    ) -> list[Model] | None:
+        if self.cursor_query_param not in request.query_params:
+            self.keyset = False
+            return super().paginate_queryset(queryset, request, view)  # type: ignore[no-any-return]
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.keyset = True
+        self.request = request
+        self.ordering = self._get_ordering(queryset)
+        cursor = self._decode_cursor(request.query_params[self.cursor_query_param])
+        is_reversed = bool(cursor and cursor["reverse"])
+
+        ordering = (
+            [_invert_ordering_field(field) for field in self.ordering]
+            if is_reversed
+            else self.ordering
+        )
+        page_queryset = queryset.order_by(*ordering)
+        if cursor:
+            page_queryset = page_queryset.filter(
+                _get_keyset_filter(ordering, cursor["values"])
+            )
+
+        objects = list(page_queryset[: page_size + 1])
+        has_more = len(objects) > page_size
+        self.keyset_page = objects[:page_size]
+        if is_reversed:
+            self.keyset_page.reverse()
+
+        # Moving in one direction from a cursor means there are objects
+        # in the other direction.
+        self.has_next = has_more if not is_reversed else True
+        self.has_previous = has_more if is_reversed else cursor is not None
+        self.keyset_count = self._get_count(queryset)
+        return self.keyset_page
+
+    def get_paginated_response(self, data: Any) -> Response:
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.keyset_count),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.keyset:
+            return super().get_next_link()
+        if not (self.has_next and self.keyset_page):
+            return None
+        return self._get_cursor_link(self.keyset_page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.keyset:
+            return super().get_previous_link()
+        if not (self.has_previous and self.keyset_page):
+            return None
+        return self._get_cursor_link(self.keyset_page[0], reverse=True)
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.cursor_query_param,
+                "in": "query",
+                "description": (
+                    "Opt in to cursor pagination by passing an empty cursor, then "
+                    "the cursor of the next or previous link."
+                ),
+                "required": False,
+                "schema": {"type": "string"},
+            },
+        ]
+
+    def _get_ordering(self, queryset: QuerySet[Model]) -> list[str]:
+        ordering = [
+            field
+            for field in (
+                queryset.query.order_by or queryset.model._meta.ordering or ()
+            )
+            if isinstance(field, str)
+        ]
+        pk_name = queryset.model._meta.pk.name  # type: ignore[union-attr]
+        if not {pk_name, "pk"} & {field.lstrip("-") for field in ordering}:
+            # Keep the primary key in the same direction as the last field so
+            # that the ordering matches (created_date, id) style indexes.
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(f"-{pk_name}" if descending else pk_name)
+        return ordering
+
+    def _get_count(self, queryset: QuerySet[Model]) -> int:
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return queryset.count()
+
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        estimated_count = int(plan[0]["Plan"]["Plan Rows"])
+        if estimated_count < self.exact_count_threshold:
+            return queryset.count()
+        return estimated_count
+
+    def _get_cursor_link(self, obj: Model, reverse: bool) -> str:
+        values = [getattr(obj, field.lstrip("-")) for field in self.ordering]
+        cursor = base64.urlsafe_b64encode(
+            json.dumps(
+                {"values": values, "reverse": reverse}, default=_encode_cursor_value
+            ).encode()
+        ).decode()
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def _decode_cursor(self, encoded_cursor: str) -> dict[str, Any] | None:
+        if not encoded_cursor:
+            return None
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded_cursor.encode()))
+            values = cursor["values"]
+            reverse = cursor["reverse"]
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return {"values": values, "reverse": bool(reverse)}
+
+
+def _encode_cursor_value(value: Any) -> str:
+    # Unlike `DjangoJSONEncoder`, keep microseconds so that no object is
+    # skipped or repeated between pages.
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _invert_ordering_field(field: str) -> str:
+    return field[1:] if field.startswith("-") else f"-{field}"
+
+
+def _get_keyset_filter(ordering: list[str], values: list[Any]) -> Q:
+    """
+    Get a filter for the objects after `values` in `ordering`, i.e.
+    `(a > x) OR (a = x AND b > y) OR ...` for each field in turn.
+    """
+    keyset_filter = Q()
+    for index, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        equal_fields = {
+            previous.lstrip("-"): value
+            for previous, value in zip(ordering[:index], values)
+        }
+        keyset_filter |= Q(**equal_fields, **{f"{name}__{lookup}": values[index]})
+    return keyset_filter
+
+
 class EdgeIdentityPagination(CustomPagination):
     max_page_size = 100
     page_size = 100
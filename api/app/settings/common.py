@@ -439,6 +439,12 @@ FEATURE_EVALUATION_CACHE_SECONDS = env.int(
     "FEATURE_EVALUATION_CACHE_SECONDS", default=60
 )
 
+# Usage data caches are sharded per thread; counts for new keys are dropped
+# once a thread's shard holds this many keys, until the next flush.
+USAGE_DATA_CACHE_MAX_KEYS_PER_THREAD = env.int(
+    "USAGE_DATA_CACHE_MAX_KEYS_PER_THREAD", default=10_000
+)
+
 ENABLE_API_USAGE_TRACKING = env.bool("ENABLE_API_USAGE_TRACKING", default=True)
 
 if ENABLE_API_USAGE_TRACKING:
@@ -694,6 +700,39 @@ if ENABLE_DB_LOGGING:
 
 CACHE_FLAGS_SECONDS = env.int("CACHE_FLAGS_SECONDS", default=0)
 FLAGS_CACHE_LOCATION = "environment-flags"
+
+# Serve pre-rendered `/api/v1/flags/` payloads, written on environment updates.
+CACHE_FLAGS_PAYLOADS = env.bool("CACHE_FLAGS_PAYLOADS", default=False)
+FLAGS_PAYLOADS_CACHE_NAME = "flags-payloads"
+FLAGS_PAYLOADS_CACHE_BACKEND = env.str(
+    "FLAGS_PAYLOADS_CACHE_BACKEND",
+    default="django.core.cache.backends.db.DatabaseCache",
+)
+FLAGS_PAYLOADS_CACHE_LOCATION = env.str(
+    "FLAGS_PAYLOADS_CACHE_LOCATION", default=FLAGS_PAYLOADS_CACHE_NAME
+)
+# Payloads are keyed by `Environment.updated_at`, so superseded entries
+# only need to live long enough to be evicted.
+FLAGS_PAYLOADS_CACHE_SECONDS = env.int(
+    "FLAGS_PAYLOADS_CACHE_SECONDS", default=24 * 60 * 60
+)
+FLAGS_PAYLOADS_CACHE_OPTIONS = env.json("FLAGS_PAYLOADS_CACHE_OPTIONS", default=None)
+
+# Hashes of the environment documents last written to DynamoDB, used to skip
+# writing unchanged documents. Set the timeout to 0 to always write documents.
+DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_NAME = "dynamo-environment-document-hashes"
+DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_BACKEND = env.str(
+    "DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_BACKEND",
+    default="django.core.cache.backends.db.DatabaseCache",
+)
+DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_LOCATION = env.str(
+    "DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_LOCATION",
+    default=DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_NAME,
+)
+DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_SECONDS = env.int(
+    "DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_SECONDS", default=24 * 60 * 60
+)
+
 CHARGEBEE_CACHE_LOCATION = "chargebee-objects"
 
 ENVIRONMENT_CACHE_SECONDS = env.int("ENVIRONMENT_CACHE_SECONDS", default=60)
@@ -705,6 +744,13 @@ ENVIRONMENT_CACHE_NAME = "environment-objects"
 ENVIRONMENT_CACHE_LOCATION = env.str(
     "ENVIRONMENT_CACHE_LOCATION", default=ENVIRONMENT_CACHE_NAME
 )
+# Per-process cache tier in front of the environment cache. Disabled when 0.
+ENVIRONMENT_LOCAL_CACHE_MAX_ENTRIES = env.int(
+    "ENVIRONMENT_LOCAL_CACHE_MAX_ENTRIES", default=0
+)
+# How long environments are served from the per-process tier before
+# being revalidated against the version stamp in the environment cache.
+ENVIRONMENT_LOCAL_CACHE_SECONDS = env.int("ENVIRONMENT_LOCAL_CACHE_SECONDS", default=5)
 
 GET_FLAGS_ENDPOINT_CACHE_SECONDS = env.int(
     "GET_FLAGS_ENDPOINT_CACHE_SECONDS", default=0
@@ -751,6 +797,54 @@ ENVIRONMENT_SEGMENTS_CACHE_BACKEND = env(
     "django.core.cache.backends.locmem.LocMemCache",
 )
 
+# Segment rules translated to ClickHouse SQL for the segment membership counts
+# and member pages, keyed by segment version so edits never serve stale entries.
+SEGMENT_PREDICATES_CACHE_NAME = "segment-predicates"
+SEGMENT_PREDICATES_CACHE_SECONDS = env.int("CACHE_SEGMENT_PREDICATES_SECONDS", 3600)
+SEGMENT_PREDICATES_CACHE_LOCATION = env(
+    "SEGMENT_PREDICATES_CACHE_LOCATION", "segment-predicates"
+)
+SEGMENT_PREDICATES_CACHE_BACKEND = env(
+    "CACHE_SEGMENT_PREDICATES_BACKEND",
+    "django.core.cache.backends.locmem.LocMemCache",
+)
+
+# Evaluate identities for the SDK identities endpoints in memory, against the
+# environment's feature states and segments cached per `Environment.updated_at`,
+# so that identify requests only read the identity's own overrides from the database.
+SDK_IDENTITIES_IN_MEMORY_EVALUATION = env.bool(
+    "SDK_IDENTITIES_IN_MEMORY_EVALUATION", default=False
+)
+# Maximum number of identities accepted by the bulk identify endpoint.
+SDK_BULK_IDENTIFY_MAX_IDENTITIES = env.int("SDK_BULK_IDENTIFY_MAX_IDENTITIES", 1000)
+# Also caches environment feature states and project segments for the Edge
+# identity feature state views.
+ENVIRONMENT_EVALUATION_CACHE_NAME = "environment-evaluation"
+# Scheduled feature state changes do not update the environment, so this also
+# bounds how long they can take to be picked up by in-memory evaluation.
+ENVIRONMENT_EVALUATION_CACHE_SECONDS = env.int(
+    "CACHE_ENVIRONMENT_EVALUATION_SECONDS", 60
+)
+ENVIRONMENT_EVALUATION_CACHE_LOCATION = env(
+    "ENVIRONMENT_EVALUATION_CACHE_LOCATION", "environment-evaluation"
+)
+ENVIRONMENT_EVALUATION_CACHE_BACKEND = env(
+    "CACHE_ENVIRONMENT_EVALUATION_BACKEND",
+    "django.core.cache.backends.locmem.LocMemCache",
+)
+
+# Materialized user and group permissions, see `permissions.user_permissions`.
+# Disabled by default. The cache is shared between processes so that entries
+# invalidated on permission changes are invalidated everywhere.
+USER_PERMISSIONS_CACHE_NAME = "user-permissions"
+CACHE_USER_PERMISSIONS_SECONDS = env.int("CACHE_USER_PERMISSIONS_SECONDS", 0)
+CACHE_USER_PERMISSIONS_LOCATION = env(
+    "CACHE_USER_PERMISSIONS_LOCATION", "user-permissions"
+)
+CACHE_USER_PERMISSIONS_BACKEND = env(
+    "CACHE_USER_PERMISSIONS_BACKEND", "django.core.cache.backends.db.DatabaseCache"
+)
+
 CACHE_ENVIRONMENT_DOCUMENT_LOCATION = env(
     "CACHE_ENVIRONMENT_DOCUMENT_LOCATION", default="environment-documents"
 )
@@ -766,6 +860,14 @@ CACHE_ENVIRONMENT_DOCUMENT_SECONDS = env.int("CACHE_ENVIRONMENT_DOCUMENT_SECONDS
 CACHE_ENVIRONMENT_DOCUMENT_OPTIONS = env.json(
     "CACHE_ENVIRONMENT_DOCUMENT_OPTIONS", default=None
 )
+# Cache environment documents as pre-rendered JSON bytes, along with their
+# compressed variants and a content hash used as the response ETag.
+CACHE_ENVIRONMENT_DOCUMENT_ENCODED = env.bool(
+    "CACHE_ENVIRONMENT_DOCUMENT_ENCODED", default=False
+)
+# Brotli-compressed environment documents are only available if the `brotli`
+# package is installed.
+BROTLI_INSTALLED = importlib.util.find_spec("brotli") is not None
 
 if (
     CACHE_ENVIRONMENT_DOCUMENT_MODE == EnvironmentDocumentCacheMode.PERSISTENT
@@ -843,6 +945,17 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": FLAGS_CACHE_LOCATION,
     },
+    FLAGS_PAYLOADS_CACHE_NAME: {
+        "BACKEND": FLAGS_PAYLOADS_CACHE_BACKEND,
+        "LOCATION": FLAGS_PAYLOADS_CACHE_LOCATION,
+        "TIMEOUT": FLAGS_PAYLOADS_CACHE_SECONDS,
+        "OPTIONS": FLAGS_PAYLOADS_CACHE_OPTIONS or {},
+    },
+    DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_NAME: {
+        "BACKEND": DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_BACKEND,
+        "LOCATION": DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_LOCATION,
+        "TIMEOUT": DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_SECONDS,
+    },
     PROJECT_SEGMENTS_CACHE_LOCATION: {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
         "LOCATION": PROJECT_SEGMENTS_CACHE_LOCATION,
@@ -881,6 +994,21 @@ CACHES = {
         "LOCATION": ENVIRONMENT_SEGMENTS_CACHE_LOCATION,
         "TIMEOUT": ENVIRONMENT_SEGMENTS_CACHE_SECONDS,
     },
+    SEGMENT_PREDICATES_CACHE_NAME: {
+        "BACKEND": SEGMENT_PREDICATES_CACHE_BACKEND,
+        "LOCATION": SEGMENT_PREDICATES_CACHE_LOCATION,
+        "TIMEOUT": SEGMENT_PREDICATES_CACHE_SECONDS,
+    },
+    ENVIRONMENT_EVALUATION_CACHE_NAME: {
+        "BACKEND": ENVIRONMENT_EVALUATION_CACHE_BACKEND,
+        "LOCATION": ENVIRONMENT_EVALUATION_CACHE_LOCATION,
+        "TIMEOUT": ENVIRONMENT_EVALUATION_CACHE_SECONDS,
+    },
+    USER_PERMISSIONS_CACHE_NAME: {
+        "BACKEND": CACHE_USER_PERMISSIONS_BACKEND,
+        "LOCATION": CACHE_USER_PERMISSIONS_LOCATION,
+        "TIMEOUT": CACHE_USER_PERMISSIONS_SECONDS,
+    },
     USER_THROTTLE_CACHE_NAME: {
         "BACKEND": USER_THROTTLE_CACHE_BACKEND,
         "LOCATION": USER_THROTTLE_CACHE_LOCATION,
@@ -1047,8 +1175,18 @@ ENVIRONMENTS_TABLE_NAME_DYNAMO = env.str("ENVIRONMENTS_TABLE_NAME_DYNAMO", "")
 # V2 was created to improve storage over overrides data.
 ENVIRONMENTS_V2_TABLE_NAME_DYNAMO = env.str("ENVIRONMENTS_V2_TABLE_NAME_DYNAMO", "")
 
+# Number of threads preparing environment documents to be written to DynamoDB.
+DYNAMO_ENVIRONMENT_DOCUMENT_WORKERS = env.int(
+    "DYNAMO_ENVIRONMENT_DOCUMENT_WORKERS", default=4
+)
+
 # DynamoDB table name for storing identities
 IDENTITIES_TABLE_NAME_DYNAMO = env.str("IDENTITIES_TABLE_NAME_DYNAMO", "")
+# Number of identifier ranges read concurrently when iterating over all of an
+# environment's identities, e.g. to delete or export them.
+IDENTITIES_PARALLEL_SEGMENTS_DYNAMO = env.int(
+    "IDENTITIES_PARALLEL_SEGMENTS_DYNAMO", default=8
+)
 
 # DynamoDB table name for storing environment api keys
 ENVIRONMENTS_API_KEY_TABLE_NAME_DYNAMO = env.str(
@@ -1193,6 +1331,11 @@ SAML_USE_NAME_ID_AS_EMAIL = env.bool("SAML_USE_NAME_ID_AS_EMAIL", False)
 # Used to control the size(number of identities) of the project that can be self migrated to edge
 MAX_SELF_MIGRATABLE_IDENTITIES = env.int("MAX_SELF_MIGRATABLE_IDENTITIES", 100000)
 
+# Identities are migrated to Edge in chunks of this size, written concurrently
+# by this many workers.
+IDENTITY_MIGRATION_CHUNK_SIZE = env.int("IDENTITY_MIGRATION_CHUNK_SIZE", 2000)
+IDENTITY_MIGRATION_WRITE_WORKERS = env.int("IDENTITY_MIGRATION_WRITE_WORKERS", 4)
+
 # RUN_BY_PROCESSOR is set by the task processor entrypoint
 TASK_PROCESSOR_MODE = env.bool("RUN_BY_PROCESSOR", False)
 
@@ -1214,6 +1357,22 @@ ENABLE_TASK_PROCESSOR_HEALTH_CHECK = env.bool(
 # Allows us to prevent the postpone decorator from running things async
 ENABLE_POSTPONE_DECORATOR = env.bool("ENABLE_POSTPONE_DECORATOR", default=True)
 
+# Identify events sent to identity integrations (Amplitude, Segment, etc.) are
+# queued per process and sent in batches, see `integrations.common.dispatcher`.
+# Events are sent synchronously when the postpone decorator is disabled.
+IDENTITY_INTEGRATIONS_QUEUE_SIZE = env.int(
+    "IDENTITY_INTEGRATIONS_QUEUE_SIZE", default=10000
+)
+IDENTITY_INTEGRATIONS_BATCH_SIZE = env.int(
+    "IDENTITY_INTEGRATIONS_BATCH_SIZE", default=500
+)
+IDENTITY_INTEGRATIONS_FLUSH_INTERVAL_SECONDS = env.float(
+    "IDENTITY_INTEGRATIONS_FLUSH_INTERVAL_SECONDS", default=1.0
+)
+IDENTITY_INTEGRATIONS_DISPATCH_WORKERS = env.int(
+    "IDENTITY_INTEGRATIONS_DISPATCH_WORKERS", default=4
+)
+
 ENABLE_CLEAN_UP_OLD_TASKS = env.bool("ENABLE_CLEAN_UP_OLD_TASKS", default=True)
 TASK_DELETE_RETENTION_DAYS = env.int("TASK_DELETE_RETENTION_DAYS", default=30)
 TASK_DELETE_BATCH_SIZE = env.int("TASK_DELETE_BATCH_SIZE", default=2000)
@@ -1249,6 +1408,9 @@ RAW_ANALYTICS_DATA_RETENTION_DAYS = env.int("RAW_ANALYTICS_DATA_RETENTION_DAYS",
 BUCKETED_ANALYTICS_DATA_RETENTION_DAYS = env.int(
     "BUCKETED_ANALYTICS_DATA_RETENTION_DAYS", 90
 )
+# Length of the partitions of analytics tables converted with the
+# `partition_analytics_tables` management command, e.g. 1 (daily) or 7 (weekly).
+ANALYTICS_PARTITION_INTERVAL_DAYS = env.int("ANALYTICS_PARTITION_INTERVAL_DAYS", 7)
 
 DISABLE_INVITE_LINKS = env.bool("DISABLE_INVITE_LINKS", False)
 PREVENT_SIGNUP = env.bool("PREVENT_SIGNUP", default=False)
@@ -1299,7 +1461,10 @@ SKIP_MIGRATION_TESTS = env.bool("SKIP_MIGRATION_TESTS", False)
 SOFTDELETE_CASCADE_ALLOW_DELETE_ALL = False
 
 # Used for serializing and deserializing GenericForeignKey(used in metadata) using the natural key of the object
-SERIALIZATION_MODULES = {"json": "import_export.json_serializers_with_metadata_support"}
+SERIALIZATION_MODULES = {
+    "json": "import_export.json_serializers_with_metadata_support",
+    "jsonl": "import_export.jsonl_serializers_with_metadata_support",
+}
 
 # Define the cooldown duration, in seconds, for password reset emails
 PASSWORD_RESET_EMAIL_COOLDOWN = env.int("PASSWORD_RESET_EMAIL_COOLDOWN", 60 * 60 * 24)
@@ -1459,6 +1624,10 @@ SEGMENT_RULES_EXPLICIT_ORDERING_ENABLED = env.bool(
 
 WEBHOOK_BACKOFF_BASE = env.int("WEBHOOK_BACKOFF_BASE", default=2)
 WEBHOOK_BACKOFF_RETRIES = env.int("WEBHOOK_BACKOFF_RETRIES", default=3)
+# Maximum number of concurrent requests when delivering an event to webhooks.
+WEBHOOK_DELIVERY_MAX_WORKERS = env.int("WEBHOOK_DELIVERY_MAX_WORKERS", default=10)
+# Number of webhook hosts to keep connections alive to, per process.
+WEBHOOK_DELIVERY_POOL_HOSTS = env.int("WEBHOOK_DELIVERY_POOL_HOSTS", default=50)
 
 
 ENABLE_API_USAGE_ALERTING = env.bool("ENABLE_API_USAGE_ALERTING", default=False)
@@ -1540,6 +1709,12 @@ CLICKHOUSE_CONNECTION_CLIENT_NAME = "flagsmith-core-api"
 # TODO: consolidate connection management across the two CH use cases
 #  https://github.com/Flagsmith/flagsmith/issues/8033
 EXPERIMENTATION_CLICKHOUSE_URL = env.str("EXPERIMENTATION_CLICKHOUSE_URL", default=None)
+# When set, experiment results only count metric events within this many days of
+# an identity's first exposure, so that the results of identities exposed longer
+# ago can be stored once rather than recomputed on every refresh.
+EXPERIMENT_RESULTS_ATTRIBUTION_DAYS = env.int(
+    "EXPERIMENT_RESULTS_ATTRIBUTION_DAYS", default=0
+)
 
 SEGMENT_MEMBERSHIP_REFRESH_INTERVAL_HOURS = env.int(
     "SEGMENT_MEMBERSHIP_REFRESH_INTERVAL_HOURS", default=6
@@ -1555,6 +1730,11 @@ if (
         "SEGMENT_MEMBERSHIP_REFRESH_PROJECT_STAGGER_WINDOW_HOURS must not exceed "
         "SEGMENT_MEMBERSHIP_REFRESH_INTERVAL_HOURS."
     )
+# Only recount environments with identities changed since the previous refresh,
+# rather than every environment of the project.
+SEGMENT_MEMBERSHIP_INCREMENTAL_REFRESH = env.bool(
+    "SEGMENT_MEMBERSHIP_INCREMENTAL_REFRESH", default=True
+)
 SEGMENT_MEMBERSHIP_DELETE_REFRESH_DELAY_SECONDS = env.int(
     "SEGMENT_MEMBERSHIP_DELETE_REFRESH_DELAY_SECONDS",
     default=120,  # We can expect the identity deletion to propagate by T+120 seconds based on Edge CDC SLO.
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
 import structlog
 from common.core.utils import is_saas, using_database_replica
@@ -23,6 +23,8 @@ from app_analytics.influxdb_wrapper import (
 from app_analytics.mappers import map_annotated_api_usage_buckets_to_usage_data
 from app_analytics.models import (
     APIUsageBucket,
+    BucketSource,
+    BucketWatermark,
     FeatureEvaluationBucket,
 )
 from app_analytics.types import Labels, PeriodType
@@ -83,10 +85,11 @@ def _get_api_usage_bucket_qs(
     environment_id: int | None = None,
     project_id: int | None = None,
     labels_filter: Labels | None = None,
+    bucket_size_filter: Q | None = None,
 ) -> QuerySet[APIUsageBucket]:
     qs = APIUsageBucket.objects.filter(
+        bucket_size_filter or Q(bucket_size=constants.ANALYTICS_READ_BUCKET_SIZE),
         environment_id__in=_get_environment_ids_for_org(organisation),
-        bucket_size=constants.ANALYTICS_READ_BUCKET_SIZE,
     )
     if project_id:
         # Evaluate the queryset because the analytics database has no environments table
@@ -133,10 +136,8 @@ def get_usage_data_from_local_db(
         environment_id=environment_id,
         project_id=project_id,
         labels_filter=labels_filter,
-    ).filter(
-        created_at__date__lte=date_stop,
-        created_at__date__gt=date_start,
-    )
+        bucket_size_filter=_get_daily_bucket_size_filter(BucketSource.API_USAGE),
+    ).filter(_get_days_filter(date_start, date_stop))
     return _aggregate_buckets(qs)
 
 
@@ -239,10 +240,9 @@ def get_total_events_count(
     date_stop = date_stop or today
     if settings.USE_POSTGRES_FOR_ANALYTICS:
         count: int = APIUsageBucket.objects.filter(
+            _get_daily_bucket_size_filter(BucketSource.API_USAGE),
+            _get_days_filter(date_start, date_stop),
             environment_id__in=_get_environment_ids_for_org(organisation),
-            created_at__date__lte=date_stop,
-            created_at__date__gt=date_start,
-            bucket_size=constants.ANALYTICS_READ_BUCKET_SIZE,
         ).aggregate(total_count=Sum("total_count"))["total_count"]
     else:
         count = get_events_for_organisation(
@@ -288,12 +288,10 @@ def get_feature_evaluation_data_from_local_db(
     period_days: int = 30,
     labels_filter: Labels | None = None,
 ) -> list[FeatureEvaluationData]:
-    filter = Q(
-        environment_id=environment_id,
-        bucket_size=constants.ANALYTICS_READ_BUCKET_SIZE,
-        feature_name=feature.name,
-        created_at__date__lte=timezone.now(),
-        created_at__date__gt=timezone.now() - timedelta(days=period_days),
+    filter = (
+        _get_daily_bucket_size_filter(BucketSource.FEATURE_EVALUATION)
+        & _get_days_filter(timezone.now() - timedelta(days=period_days), timezone.now())
+        & Q(environment_id=environment_id, feature_name=feature.name)
     )
     if labels_filter:
         filter &= Q(labels__contains=labels_filter)
@@ -315,6 +313,48 @@ def get_feature_evaluation_data_from_local_db(
     return usage_list
 
 
+def _get_days_filter(date_start: date | datetime, date_stop: date | datetime) -> Q:
+    """
+    Filter data created in the days after `date_start`, up to and including
+    `date_stop`. Filters on `created_at` itself rather than its date, so that
+    partitioned tables are pruned.
+    """
+    return Q(
+        created_at__gte=_get_start_of_next_day(date_start),
+        created_at__lt=_get_start_of_next_day(date_stop),
+    )
+
+
+def _get_start_of_next_day(value: date | datetime) -> datetime:
+    if isinstance(value, datetime):
+        value = timezone.localtime(value).date()
+    return timezone.make_aware(datetime.combine(value + timedelta(days=1), time.min))
+
+
+def _get_daily_bucket_size_filter(source: BucketSource) -> Q:
+    """
+    Filter buckets to read for per-day data, using daily buckets for the days
+    rolled up into them and the smallest buckets for the remaining data.
+    """
+    daily_processed_till = (
+        BucketWatermark.objects.filter(
+            source=source,
+            bucket_size=constants.ANALYTICS_DAILY_BUCKET_SIZE,
+        )
+        .values_list("processed_till", flat=True)
+        .first()
+    )
+    if daily_processed_till is None:
+        return Q(bucket_size=constants.ANALYTICS_READ_BUCKET_SIZE)
+    return Q(
+        bucket_size=constants.ANALYTICS_DAILY_BUCKET_SIZE,
+        created_at__lt=daily_processed_till,
+    ) | Q(
+        bucket_size=constants.ANALYTICS_READ_BUCKET_SIZE,
+        created_at__gte=daily_processed_till,
+    )
+
+
 def _get_environment_ids_for_org(organisation: Organisation) -> list[int]:
     # Evaluate the queryset because the analytics database has no environments table
     return list(
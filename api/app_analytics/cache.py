@@ -1,43 +1,187 @@
-from threading import Lock
+"""
+In-process caches aggregating usage data before it is written.
+
+Counts are kept in per-thread shards, so tracking a request only touches
+the current thread's shard and never contends with other request threads.
+A background flusher thread periodically swaps the shards out and writes
+the aggregated counts, so no request ever pays for a flush.
+
+Each shard holds at most `USAGE_DATA_CACHE_MAX_KEYS_PER_THREAD` keys; counts
+for new keys beyond that are dropped until the next flush.
+"""
+
+import atexit
+import logging
+import os
+import time
+import typing
+from abc import ABC, abstractmethod
+from threading import Event, Lock, Thread, current_thread, local
 
 from django.conf import settings
-from django.utils import timezone
+from django.db import close_old_connections
 
 from app_analytics.mappers import (
     map_feature_evaluation_cache_to_track_feature_evaluations_by_environment_kwargs,
 )
+from app_analytics.metrics import (
+    flagsmith_usage_data_cache_dropped_total,
+    flagsmith_usage_data_cache_flush_duration_seconds,
+)
 from app_analytics.models import Resource
 from app_analytics.tasks import (
     track_feature_evaluations_by_environment,
-    track_request,
+    track_requests,
 )
 from app_analytics.types import (
     APIUsageCacheKey,
     FeatureEvaluationCacheKey,
     Labels,
 )
+from util.db import closing_stale_connections
+
+logger = logging.getLogger(__name__)
+
+KeyT = typing.TypeVar("KeyT", APIUsageCacheKey, FeatureEvaluationCacheKey)
+
+
+class _Shard(typing.Generic[KeyT]):
+    def __init__(self) -> None:
+        self.counts: dict[KeyT, int] = {}
+        self.thread = current_thread()
+        # Only contended by the flusher while it swaps the counts out.
+        self.lock = Lock()
 
 
-class APIUsageCache:
+class _ShardedUsageCache(ABC, typing.Generic[KeyT]):
+    cache_name: str
+
     def __init__(self) -> None:
-        self._cache: dict[APIUsageCacheKey, int] = {}
-        self._last_flushed_at = timezone.now()
-        self._lock = Lock()
-
-    def _flush(self) -> None:
-        for key, value in self._cache.items():
-            track_request.run_in_thread(
-                kwargs={
-                    "resource": key.resource.value,
-                    "host": key.host,
-                    "environment_key": key.environment_key,
-                    "count": value,
-                    "labels": dict(key.labels),
-                }
+        self._reset()
+
+    def _reset(self) -> None:
+        self._local = local()
+        self._shards: list[_Shard[KeyT]] = []
+        self._shards_lock = Lock()
+        self._stop_event = Event()
+        self._flusher: Thread | None = None
+        self._pid: int | None = None
+
+    @abstractmethod
+    def _get_flush_interval_seconds(self) -> int:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _write(self, counts: dict[KeyT, int]) -> None:
+        raise NotImplementedError()
+
+    def _increment(self, key: KeyT, count: int) -> None:
+        if self._pid != os.getpid():
+            self._start_flusher()
+
+        try:
+            shard: _Shard[KeyT] = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._add_shard()
+
+        with shard.lock:
+            counts = shard.counts
+            if key in counts:
+                counts[key] += count
+            elif len(counts) < settings.USAGE_DATA_CACHE_MAX_KEYS_PER_THREAD:
+                counts[key] = count
+            else:
+                flagsmith_usage_data_cache_dropped_total.labels(
+                    cache=self.cache_name,
+                ).inc(count)
+
+    def _add_shard(self) -> _Shard[KeyT]:
+        shard: _Shard[KeyT] = _Shard()
+        with self._shards_lock:
+            self._shards.append(shard)
+        return shard
+
+    def _start_flusher(self) -> None:
+        with self._shards_lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # Forked from a process that was already tracking; its counts
+                # are flushed by the parent.
+                self._reset()
+            self._pid = os.getpid()
+            self._flusher = Thread(
+                target=self._run_flusher,
+                name=f"{self.cache_name}-cache-flusher",
+                daemon=True,
             )
+            self._flusher.start()
+        atexit.register(self.flush)
+
+    def _run_flusher(self) -> None:
+        while not self._stop_event.wait(self._get_flush_interval_seconds()):
+            # Writes may use this thread's DB connection, which is never
+            # cleaned up after by a request cycle.
+            close_old_connections()
+            try:
+                with closing_stale_connections():
+                    self.flush()
+            except Exception:
+                logger.exception("Failed to flush %s cache.", self.cache_name)
+
+    def stop(self) -> None:
+        """
+        Stop the background flusher and flush any remaining counts.
+        """
+        self._stop_event.set()
+        if self._flusher:
+            self._flusher.join()
+        self.flush()
+
+    def flush(self) -> None:
+        started_at = time.perf_counter()
+
+        with self._shards_lock:
+            shards = list(self._shards)
+            # Threads that have exited will not track again.
+            self._shards = [shard for shard in shards if shard.thread.is_alive()]
+
+        counts: dict[KeyT, int] = {}
+        for shard in shards:
+            with shard.lock:
+                shard_counts, shard.counts = shard.counts, {}
+            for key, count in shard_counts.items():
+                counts[key] = counts.get(key, 0) + count
+
+        if counts:
+            self._write(counts)
+
+        flagsmith_usage_data_cache_flush_duration_seconds.labels(
+            cache=self.cache_name,
+        ).observe(time.perf_counter() - started_at)
+
 
-        self._cache = {}
-        self._last_flushed_at = timezone.now()
+class APIUsageCache(_ShardedUsageCache[APIUsageCacheKey]):
+    cache_name = "api_usage"
+
+    def _get_flush_interval_seconds(self) -> int:
+        return settings.API_USAGE_CACHE_SECONDS
+
+    def _write(self, counts: dict[APIUsageCacheKey, int]) -> None:
+        track_requests.run_in_thread(
+            kwargs={
+                "requests": [
+                    {
+                        "resource": key.resource.value,
+                        "host": key.host,
+                        "environment_key": key.environment_key,
+                        "count": value,
+                        "labels": dict(key.labels),
+                    }
+                    for key, value in counts.items()
+                ],
+            }
+        )
 
     def track_request(
         self,
@@ -52,32 +196,21 @@ class APIUsageCache:
             environment_key=environment_key,
             labels=tuple(sorted(labels.items())),
         )
-        with self._lock:
-            if key not in self._cache:
-                self._cache[key] = 1
-            else:
-                self._cache[key] += 1
-            if (
-                timezone.now() - self._last_flushed_at
-            ).seconds > settings.API_USAGE_CACHE_SECONDS:
-                self._flush()
+        self._increment(key, 1)
 
 
-class FeatureEvaluationCache:
-    def __init__(self) -> None:
-        self._cache: dict[FeatureEvaluationCacheKey, int] = {}
-        self._last_flushed_at = timezone.now()
-        self._lock = Lock()
+class FeatureEvaluationCache(_ShardedUsageCache[FeatureEvaluationCacheKey]):
+    cache_name = "feature_evaluation"
 
-    def _flush(self) -> None:
+    def _get_flush_interval_seconds(self) -> int:
+        return settings.FEATURE_EVALUATION_CACHE_SECONDS
+
+    def _write(self, counts: dict[FeatureEvaluationCacheKey, int]) -> None:
         for kwargs in map_feature_evaluation_cache_to_track_feature_evaluations_by_environment_kwargs(
-            self._cache
+            counts
         ):
             track_feature_evaluations_by_environment.delay(kwargs=dict(kwargs))
 
-        self._cache = {}
-        self._last_flushed_at = timezone.now()
-
     def track_feature_evaluation(
         self,
         environment_id: int,
@@ -90,13 +223,4 @@ class FeatureEvaluationCache:
             environment_id=environment_id,
             labels=tuple((sorted(labels.items()))),
         )
-        with self._lock:
-            if key not in self._cache:
-                self._cache[key] = evaluation_count
-            else:
-                self._cache[key] += evaluation_count
-
-            if (
-                timezone.now() - self._last_flushed_at
-            ).seconds > settings.FEATURE_EVALUATION_CACHE_SECONDS:
-                self._flush()
+        self._increment(key, evaluation_count)
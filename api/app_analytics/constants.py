@@ -3,6 +3,15 @@ from typing import get_args
 from app_analytics.types import InputLabel, KnownSDK, Label, PeriodType
 
 ANALYTICS_READ_BUCKET_SIZE = 15
+ANALYTICS_HOURLY_BUCKET_SIZE = 60
+ANALYTICS_DAILY_BUCKET_SIZE = 60 * 24
+
+# Each bucket size is rolled up from the one before it.
+ANALYTICS_ROLLUP_BUCKET_SIZES = (
+    ANALYTICS_READ_BUCKET_SIZE,
+    ANALYTICS_HOURLY_BUCKET_SIZE,
+    ANALYTICS_DAILY_BUCKET_SIZE,
+)
 
 # get_usage_data() related period constants
 CURRENT_BILLING_PERIOD: PeriodType
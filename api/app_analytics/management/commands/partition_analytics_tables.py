@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from app_analytics.partitions import (
+    PARTITIONABLE_MODELS,
+    is_partitioned,
+    partition_table,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert analytics tables to tables partitioned by creation time. "
+        "Each table is locked while it is converted."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not settings.USE_POSTGRES_FOR_ANALYTICS:
+            self.stderr.write("Postgres analytics are not enabled.")
+            return
+
+        for model in PARTITIONABLE_MODELS:
+            table = model._meta.db_table
+            if is_partitioned(model):
+                self.stdout.write(f"{table} is already partitioned.")
+                continue
+            partition_table(model)
+            self.stdout.write(f"Partitioned {table}.")
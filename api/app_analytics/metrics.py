@@ -0,0 +1,13 @@
+import prometheus_client
+
+flagsmith_usage_data_cache_flush_duration_seconds = prometheus_client.Histogram(
+    "flagsmith_usage_data_cache_flush_duration_seconds",
+    "Duration of a background flush of an in-process usage data cache. `cache` label is either `api_usage` or `feature_evaluation`.",
+    ["cache"],
+)
+
+flagsmith_usage_data_cache_dropped_total = prometheus_client.Counter(
+    "flagsmith_usage_data_cache_dropped_total",
+    "Usage counts dropped because a thread's shard of an in-process usage data cache reached `USAGE_DATA_CACHE_MAX_KEYS_PER_THREAD` keys. `cache` label is either `api_usage` or `feature_evaluation`.",
+    ["cache"],
+)
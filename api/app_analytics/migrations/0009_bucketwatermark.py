@@ -0,0 +1,53 @@
+# Generated by Django 5.2.17 on 2026-10-17 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app_analytics", "0008_labels_jsonb"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BucketWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        choices=[
+                            ("api_usage", "Api Usage"),
+                            ("feature_evaluation", "Feature Evaluation"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "bucket_size",
+                    models.PositiveIntegerField(help_text="Bucket size in minutes"),
+                ),
+                (
+                    "processed_till",
+                    models.DateTimeField(
+                        help_text="Data created before this time has been rolled up"
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("source", "bucket_size"), name="unique_bucket_watermark"
+                    )
+                ],
+            },
+        ),
+    ]
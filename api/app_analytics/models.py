@@ -128,3 +128,29 @@ class FeatureEvaluationBucket(AbstractBucket):
     def check_overlapping_buckets(self):  # type: ignore[no-untyped-def]
         filter = models.Q(feature_name=self.feature_name)
         super().check_overlapping_buckets(filter)  # type: ignore[no-untyped-call]
+
+
+class BucketSource(models.TextChoices):
+    API_USAGE = "api_usage"
+    FEATURE_EVALUATION = "feature_evaluation"
+
+
+class BucketWatermark(models.Model):
+    """
+    Tracks how far raw analytics data, or buckets of a smaller size, have
+    been rolled up into buckets of a given size.
+    """
+
+    source = models.CharField(max_length=50, choices=BucketSource.choices)
+    bucket_size = models.PositiveIntegerField(help_text="Bucket size in minutes")
+    processed_till = models.DateTimeField(
+        help_text="Data created before this time has been rolled up"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "bucket_size"],
+                name="unique_bucket_watermark",
+            ),
+        ]
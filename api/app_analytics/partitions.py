@@ -0,0 +1,260 @@
+"""
+Range partitioning of analytics tables by `created_at`.
+
+Tables are converted with the `partition_analytics_tables` management
+command. The existing table is attached as a legacy partition holding all
+data created so far, so no rows are copied. New partitions of
+`ANALYTICS_PARTITION_INTERVAL_DAYS` days are then created ahead of time,
+and partitions whose data is past retention are dropped instead of
+deleting their rows. The legacy partition is only dropped once all of its
+data is past retention, so expired rows are deleted from it until then.
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.backends.utils import CursorWrapper
+from django.db.models import Model
+from django.utils import timezone
+
+from app_analytics.models import (
+    APIUsageBucket,
+    APIUsageRaw,
+    FeatureEvaluationBucket,
+    FeatureEvaluationRaw,
+)
+from app_analytics.rollup import get_bucket_start
+
+logger = logging.getLogger(__name__)
+
+PARTITIONABLE_MODELS: tuple[type[Model], ...] = (
+    APIUsageRaw,
+    FeatureEvaluationRaw,
+    APIUsageBucket,
+    FeatureEvaluationBucket,
+)
+
+# Number of partition intervals to create ahead of the current one.
+PARTITIONS_AHEAD = 2
+
+_PARTITION_UPPER_BOUND_RE = re.compile(r"TO \('([^']+)'\)")
+
+
+def get_retention_days(model: type[Model]) -> int:
+    if model in (APIUsageRaw, FeatureEvaluationRaw):
+        return settings.RAW_ANALYTICS_DATA_RETENTION_DAYS
+    return settings.BUCKETED_ANALYTICS_DATA_RETENTION_DAYS
+
+
+def is_partitioned(model: type[Model]) -> bool:
+    with _get_cursor(model) as cursor:
+        cursor.execute(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    return row is not None and row[0] == "p"
+
+
+def partition_table(model: type[Model]) -> None:
+    """
+    Convert the table of the given model to a partitioned table, keeping
+    the existing table as its legacy partition.
+    """
+    table = model._meta.db_table
+    legacy_table = f"{table}_legacy"
+    first_partition_start = _get_partition_start(timezone.now()) + _get_interval()
+
+    with transaction.atomic(using=_get_db_alias(model)), _get_cursor(model) as cursor:
+        cursor.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            "SELECT indexname, indexdef FROM pg_indexes "
+            "WHERE tablename = %s AND indexdef NOT LIKE 'CREATE UNIQUE%%'",
+            [table],
+        )
+        index_definitions = cursor.fetchall()
+
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy_table}")
+        cursor.execute(f"ALTER TABLE {legacy_table} DROP CONSTRAINT {table}_pkey")
+        for index_name, _ in index_definitions:
+            cursor.execute(
+                f"ALTER INDEX {index_name} RENAME TO {index_name[:56]}_legacy"
+            )
+
+        cursor.execute(
+            f"CREATE TABLE {table} "
+            f"(LIKE {legacy_table} INCLUDING DEFAULTS INCLUDING IDENTITY) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        # Unique constraints of partitioned tables must include the partition key.
+        cursor.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey "
+            "PRIMARY KEY (id, created_at)"
+        )
+        for _, index_definition in index_definitions:
+            # Matching indexes of the legacy partition are attached, not rebuilt.
+            cursor.execute(index_definition)
+        _take_over_id_sequence(cursor, table, legacy_table)
+
+        cursor.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {legacy_table} "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [first_partition_start],
+        )
+        # Catches rows beyond the partitions created ahead of time.
+        cursor.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    create_partitions(model)
+
+
+def create_partitions(model: type[Model]) -> None:
+    """
+    Create partitions for the current and upcoming intervals, if missing.
+    """
+    table = model._meta.db_table
+    interval = _get_interval()
+    partition_start = _get_partition_start(timezone.now())
+
+    with _get_cursor(model) as cursor:
+        upper_bounds = _get_partition_upper_bounds(cursor, table)
+        legacy_upper_bound = upper_bounds.get(f"{table}_legacy")
+        for _ in range(PARTITIONS_AHEAD + 1):
+            partition = f"{table}_p{partition_start:%Y%m%d}"
+            partition_end = partition_start + interval
+            if partition not in upper_bounds and (
+                not legacy_upper_bound or partition_start >= legacy_upper_bound
+            ):
+                with transaction.atomic(using=_get_db_alias(model)):
+                    _create_partition(
+                        cursor, table, partition, partition_start, partition_end
+                    )
+            partition_start = partition_end
+
+
+def delete_expired_data(model: type[Model], retention_days: int) -> None:
+    """
+    Drop partitions only holding data older than `retention_days` days, and
+    delete older rows from the legacy partition until it can be dropped.
+    """
+    table = model._meta.db_table
+    legacy_table = f"{table}_legacy"
+    expired_before = timezone.now() - timedelta(days=retention_days)
+
+    with _get_cursor(model) as cursor:
+        for partition, upper_bound in _get_partition_upper_bounds(
+            cursor, table
+        ).items():
+            if upper_bound <= expired_before:
+                logger.info("Dropping expired analytics partition %s", partition)
+                cursor.execute(f"DROP TABLE {partition}")
+            elif partition == legacy_table:
+                cursor.execute(
+                    f"DELETE FROM {legacy_table} WHERE created_at < %s",
+                    [expired_before],
+                )
+
+
+def _create_partition(
+    cursor: CursorWrapper,
+    table: str,
+    partition: str,
+    partition_start: datetime,
+    partition_end: datetime,
+) -> None:
+    default_table = f"{table}_default"
+    # Keep rows from being written to the default partition until the new
+    # partition takes over its range.
+    cursor.execute(f"LOCK TABLE {default_table} IN ACCESS EXCLUSIVE MODE")
+    cursor.execute(
+        f"SELECT EXISTS (SELECT 1 FROM {default_table} "
+        "WHERE created_at >= %s AND created_at < %s)",
+        [partition_start, partition_end],
+    )
+    (has_default_rows,) = cursor.fetchone()
+
+    if has_default_rows:
+        # Rows written while the partition was missing landed in the default
+        # partition, which can't hold rows in the range of another partition.
+        logger.info(
+            "Moving rows of analytics partition %s out of %s", partition, default_table
+        )
+        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default_table}")
+
+    cursor.execute(
+        f"CREATE TABLE {partition} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+        [partition_start, partition_end],
+    )
+
+    if has_default_rows:
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {default_table} "
+            "WHERE created_at >= %s AND created_at < %s RETURNING *) "
+            f"INSERT INTO {partition} SELECT * FROM moved",
+            [partition_start, partition_end],
+        )
+        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default_table} DEFAULT")
+
+
+def _get_partition_upper_bounds(
+    cursor: CursorWrapper,
+    table: str,
+) -> dict[str, datetime]:
+    cursor.execute(
+        "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+        "FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = to_regclass(%s)",
+        [table],
+    )
+    upper_bounds = {}
+    for partition, bound in cursor.fetchall():
+        # The default partition has no bounds.
+        if match := _PARTITION_UPPER_BOUND_RE.search(bound):
+            upper_bounds[partition] = datetime.fromisoformat(match.group(1))
+    return upper_bounds
+
+
+def _take_over_id_sequence(
+    cursor: CursorWrapper,
+    table: str,
+    legacy_table: str,
+) -> None:
+    cursor.execute(
+        "SELECT attidentity FROM pg_attribute "
+        "WHERE attrelid = to_regclass(%s) AND attname = 'id'",
+        [legacy_table],
+    )
+    (identity,) = cursor.fetchone()
+    if identity:
+        # The new table has its own identity sequence, which must continue
+        # after the existing ids.
+        cursor.execute(
+            "SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {legacy_table}), 0) + 1, false)",
+            [table],
+        )
+    else:
+        # Both tables share the serial sequence, which must outlive the
+        # legacy partition.
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [legacy_table])
+        (sequence,) = cursor.fetchone()
+        cursor.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+
+
+def _get_interval() -> timedelta:
+    return timedelta(days=settings.ANALYTICS_PARTITION_INTERVAL_DAYS)
+
+
+def _get_partition_start(value: datetime) -> datetime:
+    return get_bucket_start(value, settings.ANALYTICS_PARTITION_INTERVAL_DAYS * 60 * 24)
+
+
+def _get_db_alias(model: type[Model]) -> str:
+    return router.db_for_write(model)
+
+
+def _get_cursor(model: type[Model]) -> CursorWrapper:
+    return connections[_get_db_alias(model)].cursor()
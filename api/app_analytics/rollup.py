@@ -0,0 +1,202 @@
+"""
+Incremental rollup of raw analytics data into buckets.
+
+Raw data is aggregated into buckets of `ANALYTICS_READ_BUCKET_SIZE`
+minutes, which are in turn cascaded into hourly and daily buckets. Each
+rollup is a single `INSERT ... SELECT ... GROUP BY` statement covering
+everything since the previous run, as recorded by a `BucketWatermark` per
+source and bucket size, so every row is only ever aggregated once.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import connections, router, transaction
+from django.db.models import Max, Min, Model
+from django.utils import timezone
+
+from app_analytics.constants import ANALYTICS_ROLLUP_BUCKET_SIZES
+from app_analytics.models import (
+    APIUsageBucket,
+    APIUsageRaw,
+    BucketSource,
+    BucketWatermark,
+    FeatureEvaluationBucket,
+    FeatureEvaluationRaw,
+)
+
+# Leaves time for raw data stamped just before a bucket closes to be
+# committed before the bucket is rolled up.
+ROLLUP_DELAY = timedelta(minutes=1)
+
+
+@dataclass(frozen=True)
+class _RollupSpec:
+    raw_model: type[Model]
+    raw_count_column: str
+    bucket_model: type[Model]
+    dimension_columns: tuple[str, ...]
+
+
+_ROLLUP_SPECS = {
+    BucketSource.API_USAGE: _RollupSpec(
+        raw_model=APIUsageRaw,
+        raw_count_column="count",
+        bucket_model=APIUsageBucket,
+        dimension_columns=("environment_id", "resource", "labels"),
+    ),
+    BucketSource.FEATURE_EVALUATION: _RollupSpec(
+        raw_model=FeatureEvaluationRaw,
+        raw_count_column="evaluation_count",
+        bucket_model=FeatureEvaluationBucket,
+        dimension_columns=("environment_id", "feature_name", "labels"),
+    ),
+}
+
+
+def rollup_buckets(source: BucketSource) -> None:
+    """
+    Roll up all closed buckets of every size in `ANALYTICS_ROLLUP_BUCKET_SIZES`,
+    smallest first, so each size is cascaded from the one before it.
+    """
+    source_bucket_size = None
+    for bucket_size in ANALYTICS_ROLLUP_BUCKET_SIZES:
+        rollup_bucket_size(source, bucket_size, source_bucket_size)
+        source_bucket_size = bucket_size
+
+
+def rollup_bucket_size(
+    source: BucketSource,
+    bucket_size: int,
+    source_bucket_size: int | None = None,
+) -> None:
+    """
+    Aggregate raw data, or buckets of `source_bucket_size` when given, into
+    buckets of `bucket_size` minutes, from the watermark up to the start of
+    the latest closed bucket.
+    """
+    spec = _ROLLUP_SPECS[source]
+    using = router.db_for_write(BucketWatermark)
+
+    with transaction.atomic(using=using):
+        watermark = (
+            BucketWatermark.objects.using(using)
+            .select_for_update()
+            .filter(source=source, bucket_size=bucket_size)
+            .first()
+        )
+
+        process_till = get_bucket_start(timezone.now() - ROLLUP_DELAY, bucket_size)
+        if source_bucket_size:
+            source_processed_till = (
+                BucketWatermark.objects.using(using)
+                .filter(source=source, bucket_size=source_bucket_size)
+                .values_list("processed_till", flat=True)
+                .first()
+            )
+            if source_processed_till is None:
+                return
+            process_till = min(
+                process_till, get_bucket_start(source_processed_till, bucket_size)
+            )
+
+        if watermark:
+            process_from = watermark.processed_till
+        else:
+            process_from = _get_initial_watermark(
+                spec, bucket_size, source_bucket_size, default=process_till
+            )
+
+        if process_from < process_till:
+            _insert_buckets(
+                spec, bucket_size, source_bucket_size, process_from, process_till
+            )
+        else:
+            process_till = process_from
+
+        BucketWatermark.objects.using(using).update_or_create(
+            source=source,
+            bucket_size=bucket_size,
+            defaults={"processed_till": process_till},
+        )
+
+
+def get_bucket_start(value: datetime, bucket_size: int) -> datetime:
+    bucket_seconds = bucket_size * 60
+    timestamp = value.timestamp()
+    return datetime.fromtimestamp(
+        timestamp - timestamp % bucket_seconds, tz=dt_timezone.utc
+    )
+
+
+def _get_initial_watermark(
+    spec: _RollupSpec,
+    bucket_size: int,
+    source_bucket_size: int | None,
+    default: datetime,
+) -> datetime:
+    # Continue after buckets populated before watermarks were tracked,
+    # or start from the earliest data otherwise.
+    latest_bucket_start = spec.bucket_model.objects.filter(  # type: ignore[attr-defined]
+        bucket_size=bucket_size
+    ).aggregate(value=Max("created_at"))["value"]
+    if latest_bucket_start:
+        return latest_bucket_start + timedelta(minutes=bucket_size)  # type: ignore[no-any-return]
+
+    if source_bucket_size:
+        source_qs = spec.bucket_model.objects.filter(  # type: ignore[attr-defined]
+            bucket_size=source_bucket_size
+        )
+    else:
+        source_qs = spec.raw_model.objects.all()  # type: ignore[attr-defined]
+    earliest_created_at = source_qs.aggregate(value=Min("created_at"))["value"]
+    if earliest_created_at:
+        return get_bucket_start(earliest_created_at, bucket_size)
+    return default
+
+
+def _insert_buckets(
+    spec: _RollupSpec,
+    bucket_size: int,
+    source_bucket_size: int | None,
+    process_from: datetime,
+    process_till: datetime,
+) -> None:
+    bucket_table = spec.bucket_model._meta.db_table
+    dimensions = ", ".join(spec.dimension_columns)
+    params: dict[str, int | datetime] = {
+        "bucket_size": bucket_size,
+        "bucket_seconds": bucket_size * 60,
+        "process_from": process_from,
+        "process_till": process_till,
+    }
+    if source_bucket_size:
+        source_table = bucket_table
+        count_column = "total_count"
+        source_filter = "AND bucket_size = %(source_bucket_size)s"
+        params["source_bucket_size"] = source_bucket_size
+    else:
+        source_table = spec.raw_model._meta.db_table
+        count_column = spec.raw_count_column
+        source_filter = ""
+
+    sql = f"""
+        INSERT INTO {bucket_table}
+            ({dimensions}, bucket_size, created_at, total_count)
+        SELECT
+            {dimensions},
+            %(bucket_size)s,
+            to_timestamp(
+                floor(extract(epoch FROM created_at) / %(bucket_seconds)s)
+                * %(bucket_seconds)s
+            ) AS bucket_start,
+            SUM({count_column})
+        FROM {source_table}
+        WHERE created_at >= %(process_from)s
+            AND created_at < %(process_till)s
+            {source_filter}
+        GROUP BY {dimensions}, bucket_start
+    """
+    with connections[router.db_for_write(spec.bucket_model)].cursor() as cursor:
+        cursor.execute(sql, params)
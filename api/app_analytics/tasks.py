@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from typing import Any, List, Tuple, Unpack
 
 from django.conf import settings
-from django.db.models import Q, Sum
+from django.db.models import F, Q, Sum
 from django.db.models.query import QuerySet
 from django.utils import timezone
 from task_processor.decorators import (
@@ -10,11 +10,13 @@ from task_processor.decorators import (
     register_task_handler,
 )
 
+from app_analytics import partitions, rollup
 from app_analytics.constants import ANALYTICS_READ_BUCKET_SIZE
 from app_analytics.mappers import map_feature_evaluation_data_to_feature_evaluation_raw
 from app_analytics.models import (
     APIUsageBucket,
     APIUsageRaw,
+    BucketSource,
     FeatureEvaluationBucket,
     FeatureEvaluationRaw,
     Resource,
@@ -22,6 +24,7 @@ from app_analytics.models import (
 from app_analytics.track import (
     track_feature_evaluation_influxdb,
     track_request_influxdb,
+    track_requests_influxdb,
 )
 from app_analytics.track import (
     track_feature_evaluation_influxdb_v2 as track_feature_evaluation_influxdb_v2_service,
@@ -29,51 +32,42 @@ from app_analytics.track import (
 from app_analytics.types import (
     Labels,
     TrackFeatureEvaluationsByEnvironmentKwargs,
+    TrackRequestData,
 )
 from environments.models import Environment
 
 if settings.USE_POSTGRES_FOR_ANALYTICS:  # pragma: no cover
 
     @register_recurring_task(
-        run_every=timedelta(minutes=60),
-        kwargs={
-            "bucket_size": ANALYTICS_READ_BUCKET_SIZE,
-            "run_every": 60,
-        },
+        run_every=timedelta(minutes=ANALYTICS_READ_BUCKET_SIZE),
     )
-    def populate_bucket(
-        bucket_size: int,
-        run_every: int,
-        source_bucket_size: int | None = None,
-    ) -> None:
-        populate_api_usage_bucket(bucket_size, run_every, source_bucket_size)
-        populate_feature_evaluation_bucket(bucket_size, run_every, source_bucket_size)
+    def rollup_buckets() -> None:
+        for source in BucketSource:
+            rollup.rollup_buckets(source)
+
+    @register_recurring_task(
+        run_every=timedelta(days=1),
+    )
+    def create_analytics_partitions() -> None:
+        for model in partitions.PARTITIONABLE_MODELS:
+            if partitions.is_partitioned(model):
+                partitions.create_partitions(model)
 
 
 @register_recurring_task(
     run_every=timedelta(days=1),
 )
 def clean_up_old_analytics_data():  # type: ignore[no-untyped-def]
-    # delete raw analytics data older than `RAW_ANALYTICS_DATA_RETENTION_DAYS`
-    APIUsageRaw.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.RAW_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
-    FeatureEvaluationRaw.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.RAW_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
-
-    # delete bucketed analytics data older than `BUCKETED_ANALYTICS_DATA_RETENTION_DAYS`
-    APIUsageBucket.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.BUCKETED_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
-
-    FeatureEvaluationBucket.objects.filter(
-        created_at__lt=timezone.now()
-        - timedelta(days=settings.BUCKETED_ANALYTICS_DATA_RETENTION_DAYS)
-    ).delete()
+    # delete raw analytics data older than `RAW_ANALYTICS_DATA_RETENTION_DAYS`,
+    # and bucketed analytics data older than `BUCKETED_ANALYTICS_DATA_RETENTION_DAYS`
+    for model in partitions.PARTITIONABLE_MODELS:
+        retention_days = partitions.get_retention_days(model)
+        if partitions.is_partitioned(model):
+            partitions.delete_expired_data(model, retention_days)
+        else:
+            model.objects.filter(  # type: ignore[attr-defined]
+                created_at__lt=timezone.now() - timedelta(days=retention_days)
+            ).delete()
 
 
 @register_task_handler()
@@ -143,6 +137,54 @@ def track_request(
             )
 
 
+@register_task_handler()
+def track_requests(requests: list[TrackRequestData]) -> None:
+    """
+    Bulk counterpart of `track_request`, writing the usage of all given
+    requests at once.
+    """
+    environments_by_key = _get_environments_by_key(
+        {request["environment_key"] for request in requests}
+    )
+    tracked_requests = [
+        (environment, request)
+        for request in requests
+        if (environment := environments_by_key.get(request["environment_key"]))
+    ]
+    if settings.USE_POSTGRES_FOR_ANALYTICS:
+        APIUsageRaw.objects.bulk_create(
+            [
+                APIUsageRaw(
+                    resource=Resource(request["resource"]),
+                    host=request["host"],
+                    environment_id=environment.id,
+                    count=request["count"],
+                    labels=request["labels"],
+                )
+                for environment, request in tracked_requests
+            ]
+        )
+    elif settings.INFLUXDB_TOKEN:
+        track_requests_influxdb(tracked_requests)
+
+
+def _get_environments_by_key(environment_keys: set[str]) -> dict[str, Environment]:
+    # Requests can be made with either the client-side or a server-side key.
+    environments = (
+        Environment.objects.filter(
+            Q(api_key__in=environment_keys) | Q(api_keys__key__in=environment_keys)
+        )
+        .select_related("project", "project__organisation")
+        .annotate(server_side_key=F("api_keys__key"))
+    )
+    environments_by_key = {}
+    for environment in environments:
+        for key in (environment.api_key, environment.server_side_key):
+            if key in environment_keys:
+                environments_by_key[key] = environment
+    return environments_by_key
+
+
 track_feature_evaluation_influxdb_v2 = register_task_handler()(
     track_feature_evaluation_influxdb_v2_service
 )
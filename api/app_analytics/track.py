@@ -9,7 +9,12 @@ from django.core.cache import caches
 from app_analytics.influxdb_wrapper import InfluxDBWrapper
 from app_analytics.mappers import map_labels_to_influx_record_values
 from app_analytics.models import Resource
-from app_analytics.types import Label, Labels, TrackFeatureEvaluationsByEnvironmentData
+from app_analytics.types import (
+    Label,
+    Labels,
+    TrackFeatureEvaluationsByEnvironmentData,
+    TrackRequestData,
+)
 from environments.models import Environment
 from util.util import postpone
 
@@ -96,23 +101,59 @@ def track_request_influxdb(
     :param request: (HttpRequest) the request being made
     """
     if resource.is_tracked:
-        tags: dict[str, str | int | float] = {
-            "resource": resource.resource_name,
-            "organisation": environment.project.organisation.get_unique_slug(),
-            "organisation_id": environment.project.organisation_id,
-            "project": environment.project.name,
-            "project_id": environment.project_id,
-            "environment": environment.name,
-            "environment_id": environment.id,
-            "host": host,
-            **map_labels_to_influx_record_values(labels),
-        }
-
         influxdb = InfluxDBWrapper("api_call")  # type: ignore[no-untyped-call]
-        influxdb.add_data_point("request_count", count, tags=tags)
+        influxdb.add_data_point(
+            "request_count",
+            count,
+            tags=_get_api_call_tags(resource, host, environment, labels),
+        )
+        influxdb.write()
+
+
+def track_requests_influxdb(
+    requests: list[tuple["Environment", TrackRequestData]],
+) -> None:
+    """
+    Sends API event data for multiple requests to InfluxDB in a single write
+
+    :param requests: (list) pairs of the requested environment and the request data
+    """
+    influxdb = InfluxDBWrapper("api_call")  # type: ignore[no-untyped-call]
+
+    for environment, request in requests:
+        resource = Resource(request["resource"])
+        if resource.is_tracked:
+            influxdb.add_data_point(
+                "request_count",
+                request["count"],
+                tags=_get_api_call_tags(
+                    resource, request["host"], environment, request["labels"]
+                ),
+            )
+
+    if influxdb.records:
         influxdb.write()
 
 
+def _get_api_call_tags(
+    resource: Resource,
+    host: str,
+    environment: "Environment",
+    labels: Labels,
+) -> dict[str, str | int | float]:
+    return {
+        "resource": resource.resource_name,
+        "organisation": environment.project.organisation.get_unique_slug(),
+        "organisation_id": environment.project.organisation_id,
+        "project": environment.project.name,
+        "project_id": environment.project_id,
+        "environment": environment.name,
+        "environment_id": environment.id,
+        "host": host,
+        **map_labels_to_influx_record_values(labels),
+    }
+
+
 def track_feature_evaluation_influxdb(
     environment_id: int,
     feature_evaluations: list[TrackFeatureEvaluationsByEnvironmentData],
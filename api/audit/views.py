@@ -8,7 +8,7 @@ from drf_spectacular.utils import extend_schema
 from rest_framework import mixins, viewsets
 from rest_framework.permissions import IsAuthenticated
 
-from app.pagination import CustomPagination
+from app.pagination import KeysetPagination
 from audit.models import AuditLog
 from audit.permissions import (
     OrganisationAuditLogPermissions,
@@ -31,7 +31,7 @@ class _BaseAuditLogViewSet(
     mixins.RetrieveModelMixin,
     viewsets.GenericViewSet,  # type: ignore[type-arg]
 ):
-    pagination_class = CustomPagination
+    pagination_class = KeysetPagination
 
     def get_queryset(self) -> QuerySet[AuditLog]:
         if getattr(self, "swagger_fake_view", False):
@@ -29,6 +29,19 @@ def forward_identity_request(  # type: ignore[no-untyped-def]
     requests.get(url, params=query_params, headers=headers, timeout=5)
 
 
+def forward_identity_requests(
+    request_method: str,
+    headers: dict[str, str],
+    project_id: int,
+    payload: list[dict[str, Any]],
+) -> None:
+    # Edge has no bulk identify endpoint, so each identity is forwarded on its own.
+    for identity_data in payload:
+        forward_identity_request(
+            request_method, headers, project_id, request_data=identity_data
+        )
+
+
 def forward_trait_request(  # type: ignore[no-untyped-def]
     request_method: str,
     headers: dict[str, str],
@@ -18,93 +18,77 @@ logger = logging.getLogger(__name__)
 
 def export_edge_identity_and_overrides(  # noqa: C901
     environment_api_key: str,
-) -> tuple[list, list, list]:  # type: ignore[type-arg]
-    kwargs = {
-        "environment_api_key": environment_api_key,
-        "limit": EXPORT_EDGE_IDENTITY_PAGINATION_LIMIT,
-    }
-    identity_export = []
-    traits_export = []
-    identity_override_export = []
-
+) -> typing.Iterator[dict]:  # type: ignore[type-arg]
+    """
+    Export the identities of the environment, each followed by its traits and
+    overrides, so that the export can be streamed without holding the
+    environment's identities in memory.
+    """
     feature_id_to_uuid: dict[int, str] = get_feature_uuid_cache(environment_api_key)
     mv_feature_option_id_to_uuid: dict[int, str] = get_mv_feature_option_uuid_cache(
         environment_api_key
     )
-    while True:
-        response = EdgeIdentity.dynamo_wrapper.get_all_items(**kwargs)  # type: ignore[arg-type]
-        for item in response["Items"]:
-            identifier = item["identifier"]
-            # export identity
-            identity_export.append(
-                export_edge_identity(
-                    identifier,  # type: ignore[arg-type]
-                    environment_api_key,
-                    item["created_date"],  # type: ignore[arg-type]
-                )
+    for item in EdgeIdentity.dynamo_wrapper.iter_all_items_parallel(
+        environment_api_key=environment_api_key,
+        limit=EXPORT_EDGE_IDENTITY_PAGINATION_LIMIT,
+    ):
+        identifier = item["identifier"]
+        # export identity
+        yield export_edge_identity(
+            identifier,  # type: ignore[arg-type]
+            environment_api_key,
+            item["created_date"],  # type: ignore[arg-type]
+        )
+        # export traits
+        for trait in item["identity_traits"]:  # type: ignore[union-attr]
+            yield export_edge_trait(trait, identifier, environment_api_key)  # type: ignore[arg-type]
+        for override in item["identity_features"]:  # type: ignore[union-attr]
+            featurestate_uuid = override["featurestate_uuid"]  # type: ignore[call-overload,index]
+            feature_id = override["feature"]["id"]  # type: ignore[call-overload,index]
+            if feature_id not in feature_id_to_uuid:
+                logging.warning("Feature with id %s does not exist", feature_id)
+                continue
+
+            feature_uuid = feature_id_to_uuid[feature_id]  # type: ignore[index]
+
+            # export feature state
+            yield export_edge_feature_state(
+                identifier,  # type: ignore[arg-type]
+                environment_api_key,
+                featurestate_uuid,
+                feature_uuid,
+                override["enabled"],  # type: ignore[arg-type,call-overload,index]
             )
-            # export traits
-            for trait in item["identity_traits"]:  # type: ignore[union-attr]
-                traits_export.append(
-                    export_edge_trait(trait, identifier, environment_api_key)  # type: ignore[arg-type]
-                )
-            for override in item["identity_features"]:  # type: ignore[union-attr]
-                featurestate_uuid = override["featurestate_uuid"]  # type: ignore[call-overload,index]
-                feature_id = override["feature"]["id"]  # type: ignore[call-overload,index]
-                if feature_id not in feature_id_to_uuid:
-                    logging.warning("Feature with id %s does not exist", feature_id)
-                    continue
-
-                feature_uuid = feature_id_to_uuid[feature_id]  # type: ignore[index]
-
-                # export feature state
-                identity_override_export.append(
-                    export_edge_feature_state(
-                        identifier,  # type: ignore[arg-type]
-                        environment_api_key,
+
+            # We always want to create the FeatureStateValue, but if there is none in the
+            # dynamo object, we just create a default object with a value of null.
+            featurestate_value = override.get("feature_state_value")  # type: ignore[union-attr]
+            yield export_featurestate_value(featurestate_value, featurestate_uuid)
+
+            if mvfsv_overrides := override.get("multivariate_feature_state_values"):  # type: ignore[union-attr]
+                for mvfsv_override in mvfsv_overrides:
+                    mv_feature_option_id = mvfsv_override[
+                        "multivariate_feature_option"
+                    ]["id"]
+                    if mv_feature_option_id not in mv_feature_option_id_to_uuid:
+                        logging.warning(
+                            "MultivariateFeatureOption with id %s does not exist",
+                            mv_feature_option_id,
+                        )
+                        continue
+
+                    mv_feature_option_uuid = mv_feature_option_id_to_uuid[
+                        mv_feature_option_id
+                    ]
+                    percentage_allocation = float(
+                        mvfsv_override["percentage_allocation"]
+                    )
+                    # export mv feature state value
+                    yield export_mv_featurestate_value(
                         featurestate_uuid,
-                        feature_uuid,
-                        override["enabled"],  # type: ignore[arg-type,call-overload,index]
+                        mv_feature_option_uuid,  # type: ignore[arg-type]
+                        percentage_allocation,
                     )
-                )
-
-                # We always want to create the FeatureStateValue, but if there is none in the
-                # dynamo object, we just create a default object with a value of null.
-                featurestate_value = override.get("feature_state_value")  # type: ignore[union-attr]
-                identity_override_export.append(
-                    export_featurestate_value(featurestate_value, featurestate_uuid)
-                )
-
-                if mvfsv_overrides := override.get("multivariate_feature_state_values"):  # type: ignore[union-attr]
-                    for mvfsv_override in mvfsv_overrides:
-                        mv_feature_option_id = mvfsv_override[
-                            "multivariate_feature_option"
-                        ]["id"]
-                        if mv_feature_option_id not in mv_feature_option_id_to_uuid:
-                            logging.warning(
-                                "MultivariateFeatureOption with id %s does not exist",
-                                mv_feature_option_id,
-                            )
-                            continue
-
-                        mv_feature_option_uuid = mv_feature_option_id_to_uuid[
-                            mv_feature_option_id
-                        ]
-                        percentage_allocation = float(
-                            mvfsv_override["percentage_allocation"]
-                        )
-                        # export mv feature state value
-                        identity_override_export.append(
-                            export_mv_featurestate_value(
-                                featurestate_uuid,
-                                mv_feature_option_uuid,  # type: ignore[arg-type]
-                                percentage_allocation,
-                            )
-                        )
-        if "LastEvaluatedKey" not in response:
-            break
-        kwargs["start_key"] = response["LastEvaluatedKey"]
-    return identity_export, traits_export, identity_override_export
 
 
 def get_feature_uuid_cache(environment_api_key: str) -> dict[int, str]:
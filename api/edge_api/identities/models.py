@@ -4,7 +4,6 @@ from contextlib import suppress
 from datetime import timedelta
 
 from django.conf import settings
-from django.db.models import Prefetch, Q
 from django.utils import timezone
 
 from api_keys.user import APIKeyUser
@@ -16,10 +15,9 @@ from edge_api.identities.tasks import (
 from edge_api.identities.types import IdentityChangeset
 from edge_api.identities.utils import generate_change_dict
 from environments.dynamodb import DynamoIdentityWrapper
+from environments.identities.evaluation import get_environment_evaluation_data
 from environments.models import Environment
 from features.models import FeatureState
-from features.multivariate.models import MultivariateFeatureStateValue
-from features.versioning.versioning_service import get_environment_flags_dict
 from users.models import FFAdminUser
 from util.engine_models.features.models import FeatureStateModel
 from util.engine_models.identities.models import IdentityFeaturesList, IdentityModel
@@ -90,44 +88,32 @@ class EdgeIdentity:
         :return: tuple of (list of feature states, set of feature names that were overridden
             for the identity specifically)
         """
-        segment_ids = self.dynamo_wrapper.get_segment_ids(
-            identity_model=self.engine_identity_model
+        segment_ids = set(
+            self.dynamo_wrapper.get_segment_ids(
+                identity_model=self.engine_identity_model
+            )
         )
         django_environment = self.environment
 
         # since identity overrides are included in the document retrieved from dynamo,
-        # we only want to retrieve the environment default and (relevant) segment overrides
-        # from the ORM.
-        additional_filters = Q(identity__isnull=True) & (
-            Q(feature_segment__segment__id__in=segment_ids)
-            | Q(feature_segment__isnull=True)
-        )
-
-        feature_states: dict[str, FeatureState | FeatureStateModel] = (
-            get_environment_flags_dict(  # type: ignore[assignment]
-                environment=django_environment,
-                additional_filters=additional_filters,
-                additional_select_related_args=[
-                    "feature",
-                    "feature_segment",
-                    "feature_segment__segment",
-                    "feature_state_value",
-                ],
-                additional_prefetch_related_args=[
-                    Prefetch(
-                        "multivariate_feature_state_values",
-                        queryset=MultivariateFeatureStateValue.objects.select_related(
-                            "multivariate_feature_option"
-                        ),
-                    )
-                ],
-                # since we only want to retrieve the highest priority feature state,
-                # we key off the feature name instead of the default
-                # (feature_id, segment_id, identity_id). This will give us only e.g.
-                # the highest priority matching segment override for a given feature.
-                key_function=lambda fs: fs.feature.name,  # type: ignore[arg-type,return-value]
-            )
-        )
+        # we only want the environment default and (relevant) segment overrides,
+        # which are cached per version of the environment.
+        evaluation_data = get_environment_evaluation_data(django_environment)
+
+        # since we only want to retrieve the highest priority feature state,
+        # we key off the feature name. This will give us only e.g. the highest
+        # priority matching segment override for a given feature.
+        feature_states: dict[str, FeatureState | FeatureStateModel] = {}
+        for feature_state in evaluation_data.feature_states:
+            if (
+                feature_state.feature_segment
+                and feature_state.feature_segment.segment_id not in segment_ids
+            ):
+                continue
+            feature_name = feature_state.feature.name
+            current_feature_state = feature_states.get(feature_name)
+            if not current_feature_state or feature_state > current_feature_state:
+                feature_states[feature_name] = feature_state
 
         # Since the identity overrides are the highest priority, we can now iterate
         # over the dictionary and replace any feature states with those that have
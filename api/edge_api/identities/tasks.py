@@ -12,6 +12,9 @@ from audit.related_object_type import RelatedObjectType
 from edge_api.identities.edge_request_forwarder import (
     forward_identity_request as forward_identity_request_service,
 )
+from edge_api.identities.edge_request_forwarder import (
+    forward_identity_requests as forward_identity_requests_service,
+)
 from edge_api.identities.edge_request_forwarder import (
     forward_trait_request as forward_trait_request_service,
 )
@@ -188,6 +191,11 @@ forward_identity_request = register_task_handler(
     priority=TaskPriority.LOW,
 )(forward_identity_request_service)
 
+forward_identity_requests = register_task_handler(
+    queue_size=1000,
+    priority=TaskPriority.LOW,
+)(forward_identity_requests_service)
+
 forward_trait_request = register_task_handler(
     queue_size=2000,
     priority=TaskPriority.LOW,
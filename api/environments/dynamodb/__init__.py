@@ -5,6 +5,7 @@ from environments.dynamodb.wrappers import (
     DynamoEnvironmentWrapper,
     DynamoIdentityWrapper,
 )
+from environments.dynamodb.wrappers.base import IterationCheckpoint
 from environments.dynamodb.wrappers.exceptions import CapacityBudgetExceeded
 
 __all__ = (
@@ -14,4 +15,5 @@ __all__ = (
     "DynamoEnvironmentWrapper",
     "DynamoIdentityWrapper",
     "DynamoProjectMetadata",
+    "IterationCheckpoint",
 )
@@ -1,3 +1,5 @@
+import string
+
 ENVIRONMENTS_V2_PARTITION_KEY = "environment_id"
 ENVIRONMENTS_V2_SORT_KEY = "document_key"
 
@@ -8,6 +10,11 @@ ENVIRONMENTS_V2_SECONDARY_INDEX_PARTITION_KEY = "environment_api_key"
 
 DYNAMODB_MAX_BATCH_WRITE_ITEM_COUNT = 25
 IDENTITIES_PAGINATION_LIMIT = 1000
+# Identifiers are split into ranges between these characters to read an
+# environment's identities in parallel.
+IDENTIFIER_SEGMENT_BOUNDARY_CHARACTERS = (
+    string.digits + string.ascii_uppercase + string.ascii_lowercase
+)
 
 SYSTEM_TRAIT_WRITE_MAX_ATTEMPTS = 3
 
@@ -1,5 +1,8 @@
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from django.conf import settings
 from django.db.models import Prefetch
 
 from edge_api.identities.events import send_migration_event
@@ -18,12 +21,24 @@ from .wrappers import (
 
 
 class IdentityMigrator:
-    @staticmethod
+    @classmethod
     def iter_identities_in_chunks(
-        project_id: int, chunk_size: int = 2000
+        cls, project_id: int, chunk_size: int = 2000
     ) -> Iterator[Identity]:
         """
-        Yield identities in fixed-size chunks using keyset pagination.
+        Yield identities, fetched in fixed-size chunks.
+        """
+        for chunk in cls.iter_identity_chunks(project_id, chunk_size):
+            yield from chunk
+
+    @staticmethod
+    def iter_identity_chunks(
+        project_id: int,
+        chunk_size: int = 2000,
+        start_after_pk: int | None = None,
+    ) -> Iterator[list[Identity]]:
+        """
+        Yield chunks of identities, ordered by pk, using keyset pagination.
 
         We don't use Django's built-in QuerySet.iterator() here because
         it uses server-side cursors (DECLARE/FETCH), which plan the
@@ -53,7 +68,7 @@ class IdentityMigrator:
             )
         )
         queryset = identities_qs.order_by("pk")
-        last_pk = None
+        last_pk = start_after_pk
 
         while True:
             chunk_qs = (
@@ -62,7 +77,7 @@ class IdentityMigrator:
             chunk = list(chunk_qs[:chunk_size])
             if not chunk:
                 break
-            yield from chunk
+            yield chunk
             last_pk = chunk[-1].pk
 
     def __init__(self, project_id):  # type: ignore[no-untyped-def]
@@ -77,6 +92,13 @@ class IdentityMigrator:
         migration_status = self.migration_status
         return migration_status == ProjectIdentityMigrationStatus.MIGRATION_COMPLETED
 
+    @property
+    def can_resume(self) -> bool:
+        return (
+            self.migration_status
+            == ProjectIdentityMigrationStatus.MIGRATION_IN_PROGRESS
+        )
+
     @property
     def can_migrate(self) -> bool:
         return self.migration_status in (
@@ -93,7 +115,12 @@ class IdentityMigrator:
         self.project_metadata.trigger_identity_migration()  # type: ignore[no-untyped-call]
 
     def migrate(self):  # type: ignore[no-untyped-def]
-        self.project_metadata.start_identity_migration()  # type: ignore[no-untyped-call]
+        """
+        Migrate the project to Edge, resuming from the last identity written
+        if the migration was already started.
+        """
+        if not self.can_resume:
+            self.project_metadata.start_identity_migration()  # type: ignore[no-untyped-call]
 
         project_id = self.project_metadata.id
 
@@ -108,6 +135,48 @@ class IdentityMigrator:
         api_keys = EnvironmentAPIKey.objects.filter(environment__project_id=project_id)
         api_key_wrapper.write_api_keys(api_keys)
 
-        identity_wrapper = DynamoIdentityWrapper()
-        identity_wrapper.write_identities(self.iter_identities_in_chunks(project_id))
+        self._migrate_identities(DynamoIdentityWrapper())
         self.project_metadata.finish_identity_migration()  # type: ignore[no-untyped-call]
+
+    def _migrate_identities(self, identity_wrapper: DynamoIdentityWrapper) -> None:
+        """
+        Write the project's identities in chunks, mapping each chunk to
+        documents while earlier chunks are written concurrently.
+
+        Identities are read and mapped on this thread, as they're ORM objects.
+        The pk of the last identity is checkpointed once its chunk, and all
+        chunks before it, are written.
+        """
+        max_workers = settings.IDENTITY_MIGRATION_WRITE_WORKERS
+        pending_writes: deque[tuple[int, Future[None]]] = deque()
+
+        def checkpoint_written_chunks(block_until_size: int) -> None:
+            while pending_writes and (
+                len(pending_writes) > block_until_size or pending_writes[0][1].done()
+            ):
+                last_pk, write = pending_writes.popleft()
+                write.result()
+                self.project_metadata.checkpoint_identity_migration(last_pk)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk in self.iter_identity_chunks(
+                self.project_metadata.id,
+                chunk_size=settings.IDENTITY_MIGRATION_CHUNK_SIZE,
+                start_after_pk=self.project_metadata.last_migrated_identity_pk,
+            ):
+                identity_documents = list(
+                    identity_wrapper.iter_identity_documents(chunk)
+                )
+                pending_writes.append(
+                    (
+                        chunk[-1].pk,
+                        executor.submit(
+                            identity_wrapper.write_identity_documents,
+                            identity_documents,
+                            table=identity_wrapper.get_table(),
+                        ),
+                    )
+                )
+                # Bound the chunks held in memory to one queued per worker.
+                checkpoint_written_chunks(block_until_size=max_workers)
+            checkpoint_written_chunks(block_until_size=0)
@@ -37,11 +37,15 @@ class DynamoProjectMetadata:
     migration_start_time: str = None  # type: ignore[assignment]
     migration_end_time: str = None  # type: ignore[assignment]
     triggered_at: str = None  # type: ignore[assignment]
+    last_migrated_identity_pk: int | None = None
 
     @classmethod
     def get_or_new(cls, project_id: int) -> "DynamoProjectMetadata":
         document = project_metadata_table.get_item(Key={"id": project_id}).get("Item")  # type: ignore[union-attr]
         if document:
+            if (last_pk := document.get("last_migrated_identity_pk")) is not None:
+                # DynamoDB returns all numbers as Decimal.
+                document["last_migrated_identity_pk"] = int(last_pk)  # type: ignore[call-overload]
             return cls(**document)
         return cls(id=project_id)
 
@@ -69,6 +73,10 @@ class DynamoProjectMetadata:
         self.migration_start_time = datetime.now().isoformat()
         self._save()  # type: ignore[no-untyped-call]
 
+    def checkpoint_identity_migration(self, last_migrated_identity_pk: int) -> None:
+        self.last_migrated_identity_pk = last_migrated_identity_pk
+        self._save()  # type: ignore[no-untyped-call]
+
     def finish_identity_migration(self):  # type: ignore[no-untyped-def]
         if self.migration_end_time:
             raise AttributeError("Migration has already been finished.")
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from collections.abc import Mapping
 from decimal import Decimal
@@ -15,6 +16,24 @@ def estimate_document_size(document: Mapping[str, Any]) -> int:
     )
 
 
+def get_document_hash(document: Mapping[str, Any]) -> str:
+    """Get a hash of a DynamoDB item's content, independent of key order."""
+    return hashlib.sha256(
+        json.dumps(
+            document,
+            default=_hash_json_default,
+            separators=(",", ":"),
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+
+def _hash_json_default(obj: object) -> Any:
+    if isinstance(obj, bytes):
+        return obj.hex()
+    return _json_default(obj)
+
+
 def _json_default(obj: object) -> Any:
     if isinstance(obj, bytes):
         # Binary values: use raw byte length as a placeholder string
@@ -1,12 +1,19 @@
 import typing
-from decimal import Context
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from decimal import Context, Decimal
 from functools import partial
+from queue import Empty, Full, Queue
+from threading import Event, Lock
 
 import boto3
 import boto3.dynamodb.types
 from botocore.config import Config
 from sentry_sdk import set_context  # TODO @kgustyr: Replace with OTel
 
+from environments.dynamodb.wrappers.exceptions import CapacityBudgetExceeded
+
 if typing.TYPE_CHECKING:
     from mypy_boto3_dynamodb.service_resource import Table
     from mypy_boto3_dynamodb.type_defs import (
@@ -21,6 +28,126 @@ if typing.TYPE_CHECKING:
 # See https://github.com/boto/boto3/issues/2500
 boto3.dynamodb.types.DYNAMODB_CONTEXT = Context(prec=100)
 
+# How long segment workers wait on a full page queue before checking whether
+# the iteration was stopped.
+_PAGE_QUEUE_PUT_TIMEOUT_SECONDS = 0.1
+
+
+@dataclass
+class IterationCheckpoint:
+    """
+    Progress of a parallel iteration over segments of items, which can be
+    persisted to resume the iteration from.
+
+    `start_keys` maps each unfinished segment, out of `total_segments`, to
+    the key to continue reading it from, or `None` if it's yet to be read.
+    """
+
+    total_segments: int
+    start_keys: dict[int, dict[str, typing.Any] | None] = field(default_factory=dict)
+
+    @classmethod
+    def new(cls, total_segments: int) -> "IterationCheckpoint":
+        return cls(
+            total_segments=total_segments,
+            start_keys=dict.fromkeys(range(total_segments)),
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.start_keys
+
+
+class _CapacityBudget:
+    """Read capacity shared by the workers of a parallel iteration."""
+
+    def __init__(self, capacity_budget: Decimal) -> None:
+        self.capacity_budget = capacity_budget
+        self.capacity_spent = Decimal(0)
+        self._lock = Lock()
+
+    @property
+    def is_exceeded(self) -> bool:
+        return self.capacity_spent >= self.capacity_budget
+
+    def spend(self, response: "DynamoDBOutput") -> None:
+        with suppress(KeyError), self._lock:
+            self.capacity_spent += Decimal(
+                str(response["ConsumedCapacity"]["CapacityUnits"])  # type: ignore[typeddict-item]
+            )
+
+
+class _SegmentPageReader:
+    """
+    Pages read by the workers of a parallel iteration, one per segment,
+    handed over to the consuming thread through a bounded queue.
+    """
+
+    def __init__(
+        self,
+        get_segment_page: "typing.Callable[[Table, int, dict[str, typing.Any] | None], DynamoDBOutput]",
+        budget: _CapacityBudget,
+        total_workers: int,
+    ) -> None:
+        self._get_segment_page = get_segment_page
+        self._budget = budget
+        self._pages: Queue[tuple[int, "DynamoDBOutput | BaseException | None"]] = Queue(
+            maxsize=2 * total_workers
+        )
+        self._stopped = Event()
+
+    def read_segment(
+        self,
+        table: "Table",
+        segment: int,
+        start_key: dict[str, typing.Any] | None,
+    ) -> None:
+        try:
+            while not (self._stopped.is_set() or self._budget.is_exceeded):
+                page = self._get_segment_page(table, segment, start_key)
+                self._budget.spend(page)
+                self._put_page(segment, page)
+                if not (start_key := page.get("LastEvaluatedKey")):
+                    break
+        except Exception as exc:
+            self._put_page(segment, exc)
+        finally:
+            # Mark the segment's worker as finished.
+            self._put_page(segment, None)
+
+    def iter_pages(
+        self, running_workers: int
+    ) -> typing.Generator[tuple[int, "DynamoDBOutput"], None, None]:
+        """
+        Yield pages with their segment until all workers are finished,
+        raising the first error a worker ran into.
+        """
+        while running_workers:
+            segment, page = self._pages.get()
+            if page is None:
+                running_workers -= 1
+                continue
+            if isinstance(page, BaseException):
+                raise page
+            yield segment, page
+
+    def stop(self) -> None:
+        self._stopped.set()
+        # Unblock workers waiting on a full queue.
+        with suppress(Empty):
+            while True:
+                self._pages.get_nowait()
+
+    def _put_page(
+        self, segment: int, page: "DynamoDBOutput | BaseException | None"
+    ) -> None:
+        while not self._stopped.is_set():
+            with suppress(Full):
+                self._pages.put(
+                    (segment, page), timeout=_PAGE_QUEUE_PUT_TIMEOUT_SECONDS
+                )
+                return
+
 
 class BaseDynamoWrapper:
     table_name: str = ""
@@ -88,3 +215,51 @@ class BaseDynamoWrapper:
     ) -> typing.Generator[dict[str, "TableAttributeValueTypeDef"], None, None]:
         assert self.table is not None
         return self._iter_all_items(self.table.query, **kwargs)
+
+    def _iter_all_items_parallel(
+        self,
+        get_segment_page: "typing.Callable[[Table, int, dict[str, typing.Any] | None], DynamoDBOutput]",
+        checkpoint: IterationCheckpoint,
+        capacity_budget: Decimal = Decimal("Inf"),
+    ) -> typing.Generator[dict[str, "TableAttributeValueTypeDef"], None, None]:
+        """
+        Read the unfinished segments of `checkpoint` concurrently, one thread
+        per segment, yielding items as their pages arrive.
+
+        `get_segment_page` reads a page of a segment, given the table to read
+        from, the segment and the key to start from. Each thread gets its own
+        table resource, as resources can't be shared between threads.
+
+        `checkpoint` is updated as pages are consumed. Once `capacity_budget`
+        is spent, segments stop reading further pages and
+        `CapacityBudgetExceeded` is raised with the checkpoint to resume from.
+        Pages being read when the budget runs out are still consumed, so the
+        capacity spent can exceed the budget by up to one page per segment.
+        """
+        budget = _CapacityBudget(capacity_budget)
+        segments = list(checkpoint.start_keys.items())
+        if not segments:
+            return
+
+        reader = _SegmentPageReader(get_segment_page, budget, len(segments))
+        tables = [self.get_table() for _ in segments]
+        with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+            try:
+                for table, (segment, start_key) in zip(tables, segments):
+                    executor.submit(reader.read_segment, table, segment, start_key)
+
+                for segment, page in reader.iter_pages(len(segments)):
+                    yield from page["Items"]
+                    if last_evaluated_key := page.get("LastEvaluatedKey"):
+                        checkpoint.start_keys[segment] = last_evaluated_key
+                    else:
+                        del checkpoint.start_keys[segment]
+            finally:
+                reader.stop()
+
+        if not checkpoint.is_complete:
+            raise CapacityBudgetExceeded(
+                capacity_budget=capacity_budget,
+                capacity_spent=budget.capacity_spent,
+                checkpoint=checkpoint,
+            )
@@ -1,10 +1,13 @@
 import abc
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Iterable
 
 import structlog
 from boto3.dynamodb.conditions import Key
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import prefetch_related_objects
 
@@ -16,18 +19,21 @@ from environments.dynamodb.constants import (
 from environments.dynamodb.types import IdentityOverridesV2Changeset
 from environments.dynamodb.utils import (
     estimate_document_size,
+    get_document_hash,
     get_environments_v2_identity_override_document_key,
 )
 from environments.metrics import (
+    flagsmith_dynamo_environment_document_bytes_total,
     flagsmith_dynamo_environment_document_compression_ratio,
     flagsmith_dynamo_environment_document_size_bytes,
+    flagsmith_dynamo_environment_document_writes_total,
 )
 from integrations.flagsmith.client import get_openfeature_client
 from util.mappers import (
-    map_environment_to_compressed_environment_document,
-    map_environment_to_compressed_environment_v2_document,
+    map_environment_document_to_compressed_environment_document,
     map_environment_to_environment_document,
     map_environment_to_environment_v2_document,
+    map_environment_v2_document_to_compressed_environment_v2_document,
     map_identity_override_to_identity_override_document,
 )
 from util.util import iter_paired_chunks
@@ -39,9 +45,30 @@ if typing.TYPE_CHECKING:
 
     from environments.models import Environment
     from util.dataclasses import CompressedEnvironmentDocument
+    from util.mappers.types import Document
 
 logger = structlog.get_logger("dynamodb")
 
+environment_document_hashes_cache = caches[
+    settings.DYNAMO_ENVIRONMENT_DOCUMENT_HASHES_CACHE_NAME
+]
+
+
+@dataclass
+class _EnvironmentDocumentWrite:
+    environment: "Environment"
+    document: "Document"
+    compress: bool
+    document_hash_cache_key: str
+    previous_document_hash: str | None
+    document_hash: str = ""
+    document_size_bytes: int = 0
+    compressed_document: "CompressedEnvironmentDocument | None" = None
+
+    @property
+    def is_unchanged(self) -> bool:
+        return self.document_hash == self.previous_document_hash
+
 
 class BaseDynamoEnvironmentWrapper(BaseDynamoWrapper, abc.ABC):
     def write_environment(self, environment: "Environment") -> None:
@@ -57,51 +84,132 @@ class BaseDynamoEnvironmentWrapper(BaseDynamoWrapper, abc.ABC):
     ) -> dict[str, Any]: ...
 
     @abc.abstractmethod
-    def _map_compressed_environment_document(
+    def _compress_environment_document(
         self,
-        environment: "Environment",
+        environment_document: "Document",
     ) -> "CompressedEnvironmentDocument": ...
 
+    @abc.abstractmethod
+    def _get_document_id(self, environment: "Environment") -> str: ...
+
+    def _get_document_hash_cache_key(self, document_id: str) -> str:
+        return f"{self.get_table_name()}:{document_id}"
+
     def _write_environments(self, environments: Iterable["Environment"]) -> None:
         openfeature_client = get_openfeature_client()
+        environments = list(environments)
         prefetch_related_objects(
             environments,
             "project__organisation",
             "project__organisation__subscription",
         )
+        document_hash_cache_keys = {
+            environment.id: self._get_document_hash_cache_key(
+                self._get_document_id(environment)
+            )
+            for environment in environments
+        }
+        if not document_hash_cache_keys:
+            return
+        previous_document_hashes = environment_document_hashes_cache.get_many(
+            document_hash_cache_keys.values()
+        )
+
+        # Documents are mapped on this thread since mapping queries the
+        # database, leaving hashing and compression to the pool.
+        writes = []
+        for environment in environments:
+            organisation = environment.project.organisation
+            document_hash_cache_key = document_hash_cache_keys[environment.id]
+            writes.append(
+                _EnvironmentDocumentWrite(
+                    environment=environment,
+                    document=self._map_environment_document(environment),
+                    compress=openfeature_client.get_boolean_value(
+                        "compress_dynamo_documents",
+                        default_value=False,
+                        evaluation_context=organisation.openfeature_evaluation_context,
+                    ),
+                    document_hash_cache_key=document_hash_cache_key,
+                    previous_document_hash=previous_document_hashes.get(
+                        document_hash_cache_key
+                    ),
+                )
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(writes), settings.DYNAMO_ENVIRONMENT_DOCUMENT_WORKERS)
+        ) as executor:
+            list(executor.map(self._prepare_environment_document_write, writes))
 
+        table_name = self.get_table_name()
+        written_document_hashes: dict[str, str] = {}
         assert self.table
         with self.table.batch_writer() as writer:
-            for environment in environments:
-                organisation = environment.project.organisation
-                if openfeature_client.get_boolean_value(
-                    "compress_dynamo_documents",
-                    default_value=False,
-                    evaluation_context=organisation.openfeature_evaluation_context,
-                ):
-                    result = self._map_compressed_environment_document(environment)
-                    writer.put_item(Item=result.document)
+            for write in writes:
+                if write.is_unchanged:
+                    flagsmith_dynamo_environment_document_writes_total.labels(
+                        table=table_name, result="skipped"
+                    ).inc()
+                    flagsmith_dynamo_environment_document_bytes_total.labels(
+                        table=table_name, result="skipped"
+                    ).inc(write.document_size_bytes)
+                    continue
+
+                if write.compressed_document:
+                    writer.put_item(Item=write.compressed_document.document)
 
                     flagsmith_dynamo_environment_document_size_bytes.labels(
-                        table=self.get_table_name(),
+                        table=table_name,
                         compressed="true",
-                    ).observe(result.compressed_size_bytes)
+                    ).observe(write.compressed_document.compressed_size_bytes)
                     flagsmith_dynamo_environment_document_compression_ratio.labels(
-                        table=self.get_table_name(),
-                    ).observe(result.compression_ratio)
+                        table=table_name,
+                    ).observe(write.compressed_document.compression_ratio)
+                    flagsmith_dynamo_environment_document_bytes_total.labels(
+                        table=table_name, result="written"
+                    ).inc(write.compressed_document.compressed_size_bytes)
                     logger.info(
                         "environment-document-compressed",
-                        environment_id=environment.id,
-                        environment_api_key=environment.api_key,
+                        environment_id=write.environment.id,
+                        environment_api_key=write.environment.api_key,
                     )
                 else:
-                    item = self._map_environment_document(environment)
-                    writer.put_item(Item=item)
+                    writer.put_item(Item=write.document)
 
                     flagsmith_dynamo_environment_document_size_bytes.labels(
-                        table=self.get_table_name(),
+                        table=table_name,
                         compressed="false",
-                    ).observe(estimate_document_size(item))
+                    ).observe(write.document_size_bytes)
+                    flagsmith_dynamo_environment_document_bytes_total.labels(
+                        table=table_name, result="written"
+                    ).inc(write.document_size_bytes)
+
+                flagsmith_dynamo_environment_document_writes_total.labels(
+                    table=table_name, result="written"
+                ).inc()
+                written_document_hashes[write.document_hash_cache_key] = (
+                    write.document_hash
+                )
+
+        environment_document_hashes_cache.set_many(written_document_hashes)
+
+    def _prepare_environment_document_write(
+        self,
+        write: _EnvironmentDocumentWrite,
+    ) -> None:
+        # `updated_at` is bumped on every environment of a project for project
+        # level changes, even if their documents are otherwise unchanged. The
+        # stored document keeps the `updated_at` of its last content change.
+        document = {k: v for k, v in write.document.items() if k != "updated_at"}
+        write.document_hash = get_document_hash(
+            {**document, "compressed": write.compress}
+        )
+        write.document_size_bytes = estimate_document_size(write.document)
+        if write.compress and not write.is_unchanged:
+            write.compressed_document = self._compress_environment_document(
+                write.document
+            )
 
 
 class DynamoEnvironmentWrapper(BaseDynamoEnvironmentWrapper):
@@ -111,10 +219,15 @@ class DynamoEnvironmentWrapper(BaseDynamoEnvironmentWrapper):
     def _map_environment_document(self, environment: "Environment") -> dict[str, Any]:
         return map_environment_to_environment_document(environment)
 
-    def _map_compressed_environment_document(
-        self, environment: "Environment"
+    def _get_document_id(self, environment: "Environment") -> str:
+        return environment.api_key
+
+    def _compress_environment_document(
+        self, environment_document: "Document"
     ) -> "CompressedEnvironmentDocument":
-        return map_environment_to_compressed_environment_document(environment)
+        return map_environment_document_to_compressed_environment_document(
+            environment_document
+        )
 
     def get_item(self, api_key: str) -> dict:  # type: ignore[type-arg]
         try:
@@ -124,6 +237,9 @@ class DynamoEnvironmentWrapper(BaseDynamoEnvironmentWrapper):
 
     def delete_environment(self, api_key: str) -> None:
         self.table.delete_item(Key={"api_key": api_key})  # type: ignore[union-attr]
+        environment_document_hashes_cache.delete(
+            self._get_document_hash_cache_key(api_key)
+        )
 
 
 class DynamoEnvironmentV2Wrapper(BaseDynamoEnvironmentWrapper):
@@ -193,14 +309,22 @@ class DynamoEnvironmentV2Wrapper(BaseDynamoEnvironmentWrapper):
     def _map_environment_document(self, environment: "Environment") -> dict[str, Any]:
         return map_environment_to_environment_v2_document(environment)
 
-    def _map_compressed_environment_document(
+    def _get_document_id(self, environment: "Environment") -> str:
+        return str(environment.id)
+
+    def _compress_environment_document(
         self,
-        environment: "Environment",
+        environment_document: "Document",
     ) -> "CompressedEnvironmentDocument":
-        return map_environment_to_compressed_environment_v2_document(environment)
+        return map_environment_v2_document_to_compressed_environment_v2_document(
+            environment_document
+        )
 
     def delete_environment(self, environment_id: int):  # type: ignore[no-untyped-def]
         environment_id = str(environment_id)  # type: ignore[assignment]
+        environment_document_hashes_cache.delete(
+            self._get_document_hash_cache_key(environment_id)  # type: ignore[arg-type]
+        )
         filter_expression = Key(ENVIRONMENTS_V2_PARTITION_KEY).eq(environment_id)
         query_kwargs: "QueryInputRequestTypeDef" = {  # type: ignore[typeddict-item]
             "KeyConditionExpression": filter_expression,  # type: ignore[typeddict-item]
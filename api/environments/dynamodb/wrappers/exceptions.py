@@ -1,5 +1,9 @@
+import typing
 from decimal import Decimal
 
+if typing.TYPE_CHECKING:
+    from environments.dynamodb.wrappers.base import IterationCheckpoint
+
 
 class SystemTraitWriteRaceError(Exception):
     def __init__(self, composite_key: str) -> None:
@@ -16,6 +20,9 @@ class CapacityBudgetExceeded(Exception):
         self,
         capacity_budget: Decimal,
         capacity_spent: Decimal,
+        checkpoint: "IterationCheckpoint | None" = None,
     ) -> None:
         self.capacity_budget = capacity_budget
         self.capacity_spent = capacity_spent
+        # Set by parallel iterations, to resume them from.
+        self.checkpoint = checkpoint
@@ -12,6 +12,7 @@ from rest_framework.exceptions import NotFound
 
 from edge_api.identities.search import EdgeIdentitySearchData
 from environments.dynamodb.constants import (
+    IDENTIFIER_SEGMENT_BOUNDARY_CHARACTERS,
     IDENTITIES_PAGINATION_LIMIT,
     SYSTEM_TRAIT_WRITE_MAX_ATTEMPTS,
 )
@@ -22,20 +23,19 @@ from environments.dynamodb.wrappers.exceptions import (
 from environments.identities.traits.constants import (
     TRAIT_STRING_VALUE_MAX_LENGTH,
 )
-from util.engine_models.context.mappers import (
-    is_context_in_segment,
-    map_environment_identity_to_context,
-)
+from segments.evaluation import get_matching_segments
+from util.engine_models.context.mappers import map_environment_identity_to_context
 from util.engine_models.identities.models import IdentityModel
 from util.mappers import (
     map_engine_identity_to_identity_document,
     map_identity_to_identity_document,
 )
 
-from .base import BaseDynamoWrapper
+from .base import BaseDynamoWrapper, IterationCheckpoint
 
 if typing.TYPE_CHECKING:
     from boto3.dynamodb.conditions import ConditionBase
+    from mypy_boto3_dynamodb.service_resource import Table
     from mypy_boto3_dynamodb.type_defs import (
         QueryInputRequestTypeDef,
         QueryOutputTableTypeDef,
@@ -58,6 +58,37 @@ def _system_trait_value_matches(
     )
 
 
+def _get_identifier_segment(
+    segment: int,
+    total_segments: int,
+) -> tuple["ConditionBase | None", str | None]:
+    """
+    Return the condition on `identifier` selecting one of `total_segments`
+    contiguous ranges of identifiers, along with the identifier to drop from
+    the results, if any, as it belongs to the next range.
+    """
+    if not 1 <= total_segments <= len(IDENTIFIER_SEGMENT_BOUNDARY_CHARACTERS):
+        raise ValueError(
+            "Total segments must be between 1 and "
+            f"{len(IDENTIFIER_SEGMENT_BOUNDARY_CHARACTERS)}."
+        )
+    if total_segments == 1:
+        return None, None
+    boundaries = [
+        IDENTIFIER_SEGMENT_BOUNDARY_CHARACTERS[
+            len(IDENTIFIER_SEGMENT_BOUNDARY_CHARACTERS) * i // total_segments
+        ]
+        for i in range(1, total_segments)
+    ]
+    if segment == 0:
+        return Key("identifier").lt(boundaries[0]), None
+    if segment == total_segments - 1:
+        return Key("identifier").gte(boundaries[-1]), None
+    # Key conditions have no exclusive range, so the upper bound is dropped.
+    upper_bound = boundaries[segment]
+    return Key("identifier").between(boundaries[segment - 1], upper_bound), upper_bound
+
+
 class DynamoIdentityWrapper(BaseDynamoWrapper):
     def __init__(self) -> None:
         super().__init__()
@@ -72,16 +103,34 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
         self.table.put_item(Item=identity_dict)  # type: ignore[union-attr]
 
     def write_identities(self, identities: Iterable["Identity"]):  # type: ignore[no-untyped-def]
-        with self.table.batch_writer() as batch:  # type: ignore[union-attr]
-            for identity in identities:
-                identity_document = map_identity_to_identity_document(identity)
-                # Since sort keys can not be greater than 1024
-                # https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/ServiceQuotas.html#limits-partition-sort-keys
-                if len(identity_document["identifier"]) > 1024:  # type: ignore[arg-type]
-                    logger.warning(
-                        f"Can't migrate identity {identity.id}; identifier too long"
-                    )
-                    continue
+        self.write_identity_documents(self.iter_identity_documents(identities))
+
+    def iter_identity_documents(
+        self, identities: Iterable["Identity"]
+    ) -> typing.Generator[dict[str, typing.Any], None, None]:
+        for identity in identities:
+            identity_document = map_identity_to_identity_document(identity)
+            # Since sort keys can not be greater than 1024
+            # https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/ServiceQuotas.html#limits-partition-sort-keys
+            if len(identity_document["identifier"]) > 1024:  # type: ignore[arg-type]
+                logger.warning(
+                    f"Can't migrate identity {identity.id}; identifier too long"
+                )
+                continue
+            yield identity_document
+
+    def write_identity_documents(
+        self,
+        identity_documents: Iterable[dict[str, typing.Any]],
+        table: "Table | None" = None,
+    ) -> None:
+        """
+        Batch write identity documents, optionally to a given `table` resource
+        so that writes can run on another thread.
+        """
+        table = table or self.table
+        with table.batch_writer() as batch:  # type: ignore[union-attr]
+            for identity_document in identity_documents:
                 batch.put_item(Item=identity_document)
 
     def get_item(self, composite_key: str) -> typing.Optional[dict]:  # type: ignore[type-arg]
@@ -212,7 +261,7 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
 
     def delete_all_identities(self, environment_api_key: str):  # type: ignore[no-untyped-def]
         with self.table.batch_writer() as writer:  # type: ignore[union-attr]
-            for item in self.iter_all_items_paginated(
+            for item in self.iter_all_items_parallel(
                 environment_api_key=environment_api_key,
                 projection_expression="composite_key",
             ):
@@ -245,7 +294,30 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
         projection_expression: str | None = None,
         return_consumed_capacity: bool = False,
     ) -> "QueryOutputTableTypeDef":
+        return self.query_items(
+            **self._get_all_items_query_kwargs(
+                environment_api_key=environment_api_key,
+                limit=limit,
+                start_key=start_key,
+                filter_expression=filter_expression,
+                projection_expression=projection_expression,
+                return_consumed_capacity=return_consumed_capacity,
+            )
+        )
+
+    def _get_all_items_query_kwargs(
+        self,
+        environment_api_key: str,
+        limit: int,
+        start_key: dict[str, "TableAttributeValueTypeDef"] | None = None,
+        filter_expression: "ConditionBase | str | None" = None,
+        projection_expression: str | None = None,
+        return_consumed_capacity: bool = False,
+        identifier_condition: "ConditionBase | None" = None,
+    ) -> "QueryInputRequestTypeDef":
         key_condition_expression = Key("environment_api_key").eq(environment_api_key)
+        if identifier_condition is not None:
+            key_condition_expression &= identifier_condition
         query_kwargs: "QueryInputRequestTypeDef" = {  # type: ignore[typeddict-item]
             "IndexName": "environment_api_key-identifier-index",
             "KeyConditionExpression": key_condition_expression,  # type: ignore[typeddict-item]
@@ -260,7 +332,7 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
         if return_consumed_capacity:
             # Use `TOTAL` because we don't need per-index/per-table consumed capacity
             query_kwargs["ReturnConsumedCapacity"] = "TOTAL"
-        return self.query_items(**query_kwargs)
+        return query_kwargs
 
     def iter_all_items_paginated(
         self,
@@ -296,6 +368,68 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
             if last_evaluated_key := query_response.get("LastEvaluatedKey"):  # type: ignore[assignment]
                 get_all_items_kwargs["start_key"] = last_evaluated_key
 
+    def iter_all_items_parallel(
+        self,
+        environment_api_key: str,
+        total_segments: int | None = None,
+        limit: int = IDENTITIES_PAGINATION_LIMIT,
+        projection_expression: str | None = None,
+        capacity_budget: Decimal = Decimal("Inf"),
+        overrides_only: bool = False,
+        checkpoint: IterationCheckpoint | None = None,
+    ) -> typing.Generator[dict, None, None]:  # type: ignore[type-arg]
+        """
+        Iterate over all identities of an environment like
+        `iter_all_items_paginated`, reading `total_segments` ranges of
+        identifiers concurrently. Items are yielded in no particular order.
+
+        When `capacity_budget` is exceeded, `CapacityBudgetExceeded` is raised
+        with a checkpoint which can be passed back in to resume the iteration.
+        """
+        if checkpoint is None:
+            checkpoint = IterationCheckpoint.new(
+                total_segments or settings.IDENTITIES_PARALLEL_SEGMENTS_DYNAMO
+            )
+        if projection_expression and "identifier" not in {
+            attribute.strip() for attribute in projection_expression.split(",")
+        }:
+            # Needed to drop items belonging to the next range.
+            projection_expression = f"{projection_expression}, identifier"
+        filter_expression = Attr("identity_features").ne([]) if overrides_only else None
+
+        def get_segment_page(
+            table: "Table",
+            segment: int,
+            start_key: dict[str, "TableAttributeValueTypeDef"] | None,
+        ) -> "QueryOutputTableTypeDef":
+            identifier_condition, excluded_identifier = _get_identifier_segment(
+                segment, checkpoint.total_segments
+            )
+            query_response = table.query(
+                **self._get_all_items_query_kwargs(
+                    environment_api_key=environment_api_key,
+                    limit=limit,
+                    start_key=start_key,
+                    filter_expression=filter_expression,
+                    projection_expression=projection_expression,
+                    return_consumed_capacity=capacity_budget != Decimal("Inf"),
+                    identifier_condition=identifier_condition,
+                )
+            )
+            if excluded_identifier is not None:
+                query_response["Items"] = [
+                    item
+                    for item in query_response["Items"]
+                    if item["identifier"] != excluded_identifier
+                ]
+            return query_response
+
+        yield from self._iter_all_items_parallel(
+            get_segment_page,  # type: ignore[arg-type]
+            checkpoint=checkpoint,
+            capacity_budget=capacity_budget,
+        )
+
     def search_items(
         self,
         environment_api_key: str,
@@ -326,8 +460,8 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
         identity_pk: str = None,  # type: ignore[assignment]
         identity_model: IdentityModel = None,  # type: ignore[assignment]
     ) -> list:  # type: ignore[type-arg]
+        from environments.identities.evaluation import get_project_segments
         from environments.models import Environment
-        from util.mappers.engine import map_segment_to_engine
 
         if not (identity_pk or identity_model):
             raise ValueError("Must provide one of identity_pk or identity_model.")
@@ -339,7 +473,6 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
             environment = Environment.objects.select_related("project").get(
                 api_key=identity.environment_api_key,
             )
-            segments = environment.project.get_segments_from_cache()
             context = map_environment_identity_to_context(
                 environment=environment,
                 identity=identity,
@@ -347,8 +480,10 @@ class DynamoIdentityWrapper(BaseDynamoWrapper):
             )
             return [
                 segment.id
-                for segment in segments
-                if is_context_in_segment(context, map_segment_to_engine(segment))
+                for segment in get_matching_segments(
+                    context,  # type: ignore[arg-type]
+                    get_project_segments(environment),
+                )
             ]
 
         return []
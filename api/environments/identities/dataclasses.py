@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from environments.identities.traits.models import Trait
+
+
+@dataclass
+class TraitChanges:
+    keys_to_delete: set[str]
+    new_traits: list["Trait"]
+    updated_traits: list["Trait"]
+    traits: list["Trait"]
@@ -0,0 +1,139 @@
+"""
+Environment data for in-memory identity evaluation.
+
+When `SDK_IDENTITIES_IN_MEMORY_EVALUATION` is enabled, the environment
+defaults, segment overrides and overridden segments of an environment are
+loaded once and cached, so that identities can be evaluated against them
+without querying the environment's feature states on every request.
+
+The segments of an environment's project are cached in the same way for
+resolving the segments of Edge identities.
+
+Entries are keyed by environment and `Environment.updated_at`, so an entry
+loaded for a previous version of the environment is never used once the
+environment has been updated. Segment changes update every environment of
+their project.
+"""
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Prefetch, Q
+
+from environments.metrics import (
+    CACHE_HIT,
+    CACHE_MISS,
+    flagsmith_environment_evaluation_cache_queries_total,
+)
+from environments.models import Environment
+from features.models import FeatureState
+from features.multivariate.models import MultivariateFeatureStateValue
+from features.versioning.versioning_service import get_environment_flags_list
+from segments.evaluation import CompiledSegment, compile_segments
+from segments.models import Segment
+
+environment_evaluation_cache = caches[settings.ENVIRONMENT_EVALUATION_CACHE_NAME]
+
+
+@dataclass
+class EnvironmentEvaluationData:
+    feature_states: list[FeatureState]
+    """Environment defaults and segment overrides of the environment."""
+
+    segments: list[CompiledSegment]
+    """Segments overridden in the environment, compiled for evaluation."""
+
+
+def get_multivariate_feature_state_values_prefetch() -> Prefetch:  # type: ignore[type-arg]
+    return Prefetch(
+        "multivariate_feature_state_values",
+        queryset=MultivariateFeatureStateValue.objects.select_related(
+            "multivariate_feature_option"
+        ),
+    )
+
+
+def get_environment_evaluation_data(
+    environment: Environment,
+) -> EnvironmentEvaluationData:
+    """
+    Get the data needed to evaluate identities of the given environment,
+    loading and storing it if it is not cached yet.
+    """
+    cache_key = f"{environment.id}:{environment.updated_at.timestamp()}"
+    data: EnvironmentEvaluationData | None = environment_evaluation_cache.get(cache_key)
+
+    if not (cache_hit := data is not None):
+        data = load_environment_evaluation_data(environment)
+        environment_evaluation_cache.set(cache_key, data)
+
+    flagsmith_environment_evaluation_cache_queries_total.labels(
+        result=CACHE_HIT if cache_hit else CACHE_MISS,
+    ).inc()
+
+    # Share the request's environment rather than the cached copy, as feature
+    # state comparisons depend on it.
+    for feature_state in data.feature_states:
+        feature_state.environment = environment
+
+    return data
+
+
+def get_project_segments(environment: Environment) -> list[CompiledSegment]:
+    """
+    Get all segments of the environment's project, compiled for evaluation,
+    loading and storing them if they are not cached yet.
+    """
+    cache_key = (
+        f"project-segments:{environment.id}:{environment.updated_at.timestamp()}"
+    )
+    segments: list[CompiledSegment] | None = environment_evaluation_cache.get(cache_key)
+
+    if not (cache_hit := segments is not None):
+        segments = compile_segments(
+            environment.project.get_segments_from_cache()  # type: ignore[no-untyped-call]
+        )
+        environment_evaluation_cache.set(cache_key, segments)
+
+    flagsmith_environment_evaluation_cache_queries_total.labels(
+        result=CACHE_HIT if cache_hit else CACHE_MISS,
+    ).inc()
+
+    return segments  # type: ignore[return-value]
+
+
+def load_environment_evaluation_data(
+    environment: Environment,
+    additional_filters: Q | None = None,
+) -> EnvironmentEvaluationData:
+    filters = Q(identity=None)
+    if additional_filters:
+        filters &= additional_filters
+
+    feature_states = get_environment_flags_list(
+        environment=environment,
+        additional_filters=filters,
+        additional_select_related_args=["feature_segment__segment"],
+        additional_prefetch_related_args=[
+            get_multivariate_feature_state_values_prefetch()
+        ],
+    )
+    segment_ids = {
+        feature_state.feature_segment.segment_id
+        for feature_state in feature_states
+        if feature_state.feature_segment
+    }
+    segments = compile_segments(
+        Segment.live_objects.filter(id__in=segment_ids).prefetch_related(
+            "rules",
+            "rules__conditions",
+            "rules__rules",
+            "rules__rules__conditions",
+            "rules__rules__rules",
+        )
+    )
+    return EnvironmentEvaluationData(
+        feature_states=feature_states,
+        segments=segments,
+    )
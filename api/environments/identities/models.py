@@ -2,8 +2,14 @@ from itertools import chain
 
 from django.db import models
 from django.db.models import Prefetch, Q
-from flag_engine.engine import get_evaluation_result
 
+from core.request_origin import RequestOrigin
+from environments.identities.dataclasses import TraitChanges
+from environments.identities.evaluation import (
+    EnvironmentEvaluationData,
+    get_environment_evaluation_data,
+    get_multivariate_feature_state_values_prefetch,
+)
 from environments.identities.managers import IdentityManager
 from environments.identities.traits.models import Trait
 from environments.models import Environment
@@ -11,6 +17,11 @@ from environments.sdk.types import SDKTraitData
 from features.models import FeatureState
 from features.multivariate.models import MultivariateFeatureStateValue
 from features.versioning.versioning_service import get_environment_flags_list
+from segments.evaluation import (
+    CompiledSegment,
+    compile_segments,
+    get_matching_segments,
+)
 from segments.models import Segment
 from util.mappers.engine import map_environment_to_evaluation_context
 
@@ -127,6 +138,69 @@ class Identity(models.Model):
 
         return list(identity_flags.values())
 
+    def get_all_feature_states_in_memory(
+        self,
+        traits: list[Trait] | None = None,
+        origin: RequestOrigin = RequestOrigin.SERVER,
+        identity_feature_states: list[FeatureState] | None = None,
+        evaluation_data: EnvironmentEvaluationData | None = None,
+    ) -> list[FeatureState]:
+        """
+        Get all feature states for an identity, with the same priorities as
+        `get_all_feature_states`, evaluated in memory against the environment's
+        cached feature states and segments. Only the identity's own overrides
+        are read from the database.
+
+        :param traits: override the identity's traits when evaluating segments
+        :param origin: the origin of the request, used to exclude server-side
+            only features from client requests
+        :param identity_feature_states: the identity's overrides, if already
+            retrieved, e.g. for a batch of identities
+        :param evaluation_data: the environment's feature states and segments,
+            if already loaded, instead of the cached ones
+        :return: (list) flags for an identity with the correct values based on
+            identity / segment priorities
+        """
+        if evaluation_data is None:
+            evaluation_data = get_environment_evaluation_data(self.environment)
+        segment_ids = {
+            segment.pk
+            for segment in self._get_matching_segments(
+                evaluation_data.segments, traits=traits
+            )
+        }
+
+        feature_states = [
+            feature_state
+            for feature_state in evaluation_data.feature_states
+            if not feature_state.feature_segment
+            or feature_state.feature_segment.segment_id in segment_ids
+        ]
+        if identity_feature_states is not None:
+            feature_states += identity_feature_states
+        elif self.id:
+            feature_states += get_environment_flags_list(
+                environment=self.environment,
+                additional_filters=Q(identity=self),
+                additional_prefetch_related_args=[
+                    get_multivariate_feature_state_values_prefetch()
+                ],
+            )
+
+        identity_flags: dict[int, FeatureState] = {}
+        for flag in feature_states:
+            if origin is RequestOrigin.CLIENT and flag.feature.is_server_key_only:
+                continue
+            current_flag = identity_flags.get(flag.feature_id)
+            if not current_flag or flag > current_flag:
+                identity_flags[flag.feature_id] = flag
+
+        if self.environment.get_hide_disabled_flags() is True:
+            # filter out any flags that are disabled
+            return [value for value in identity_flags.values() if value.enabled]
+
+        return list(identity_flags.values())
+
     def get_overridden_feature_states(self) -> dict[int, FeatureState]:
         """
         Get all overridden feature states for an identity.
@@ -148,27 +222,30 @@ class Identity(models.Model):
         :param overrides_only: only retrieve the segments which have a valid override in the environment
         :return: List of matching segments
         """
+        if overrides_only:
+            compiled_segments = self.environment.get_compiled_segments_from_cache()
+        else:
+            compiled_segments = compile_segments(
+                self.environment.project.get_segments_from_cache()
+            )
+
+        return self._get_matching_segments(compiled_segments, traits=traits)
+
+    def _get_matching_segments(
+        self,
+        compiled_segments: list[CompiledSegment],
+        traits: list[Trait] | None = None,
+    ) -> list[Segment]:
         db_traits = (
             self.identity_traits.all() if (traits is None and self.id) else traits or []
         )
 
-        if overrides_only:
-            all_segments = self.environment.get_segments_from_cache()
-        else:
-            all_segments = self.environment.project.get_segments_from_cache()
-
-        segments_by_pk = {segment.pk: segment for segment in all_segments}
         context = map_environment_to_evaluation_context(
             identity=self,
             environment=self.environment,
             traits=db_traits,
-            segments=all_segments,
         )
-        result = get_evaluation_result(context)
-        return [
-            segments_by_pk[segment_result["metadata"]["pk"]]
-            for segment_result in result["segments"]
-        ]
+        return get_matching_segments(context, compiled_segments)
 
     def get_all_user_traits(self):  # type: ignore[no-untyped-def]
         # this is pointless, we should probably replace all uses with the below code
@@ -226,6 +303,39 @@ class Identity(models.Model):
         :param trait_data_items: list of dictionaries validated by TraitSerializerFull
         :return: queryset of updated trait models
         """
+        trait_changes = self.get_trait_changes(trait_data_items)
+
+        # delete the traits that had their keys set to None
+        # (except the transient ones)
+        if trait_changes.keys_to_delete:
+            self.identity_traits.filter(
+                trait_key__in=trait_changes.keys_to_delete
+            ).delete()
+
+        Trait.objects.bulk_update(
+            trait_changes.updated_traits, fields=Trait.BULK_UPDATE_FIELDS
+        )
+
+        # use ignore_conflicts to handle race conditions which result in IntegrityError if another request
+        # has added a particular trait_key for the identity while this method has been determining what to
+        # update or create.
+        # See: https://github.com/Flagsmith/flagsmith/issues/370
+        Trait.objects.bulk_create(trait_changes.new_traits, ignore_conflicts=True)
+
+        return trait_changes.traits
+
+    def get_trait_changes(
+        self,
+        trait_data_items: list[SDKTraitData],
+    ) -> TraitChanges:
+        """
+        Given a list of traits, determine which of the identity's traits need to
+        be created, updated or deleted, without writing anything to the database.
+
+        :param trait_data_items: list of dictionaries validated by TraitSerializerFull
+        :return: the trait changes, along with the full list of traits for the
+            given identity after these changes
+        """
         current_traits = {t.trait_key: t for t in self.identity_traits.all()}
 
         keys_to_delete = set()
@@ -279,34 +389,27 @@ class Identity(models.Model):
                 )
             )
 
-        # delete the traits that had their keys set to None
-        # (except the transient ones)
-        if keys_to_delete:
-            current_traits = {
-                trait_key: trait
-                for trait_key, trait in current_traits.items()
-                if trait_key not in keys_to_delete
-            }
-            self.identity_traits.filter(trait_key__in=keys_to_delete).delete()
-
-        Trait.objects.bulk_update(updated_traits, fields=Trait.BULK_UPDATE_FIELDS)
-
-        # use ignore_conflicts to handle race conditions which result in IntegrityError if another request
-        # has added a particular trait_key for the identity while this method has been determining what to
-        # update or create.
-        # See: https://github.com/Flagsmith/flagsmith/issues/370
-        Trait.objects.bulk_create(new_traits, ignore_conflicts=True)
-
-        # return the full list of traits for this identity
-        # override persisted traits by transient traits in case of key collisions
-        return [
-            *{
-                trait.trait_key: trait
-                for trait in chain(
-                    current_traits.values(),
-                    updated_traits,
-                    new_traits,
-                    transient_traits,
-                )
-            }.values()
-        ]
+        current_traits = {
+            trait_key: trait
+            for trait_key, trait in current_traits.items()
+            if trait_key not in keys_to_delete
+        }
+
+        return TraitChanges(
+            keys_to_delete=keys_to_delete,
+            new_traits=new_traits,
+            updated_traits=updated_traits,
+            # the full list of traits for this identity, overriding persisted
+            # traits by transient traits in case of key collisions
+            traits=[
+                *{
+                    trait.trait_key: trait
+                    for trait in chain(
+                        current_traits.values(),
+                        updated_traits,
+                        new_traits,
+                        transient_traits,
+                    )
+                }.values()
+            ],
+        )
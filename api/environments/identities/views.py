@@ -18,10 +18,13 @@ from rest_framework import status, viewsets
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from app.pagination import CustomPagination
+from app.pagination import KeysetPagination
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER, SDK_ENVIRONMENT_KEY_HEADER
 from core.request_origin import RequestOrigin
-from edge_api.identities.tasks import forward_identity_request
+from edge_api.identities.tasks import (
+    forward_identity_request,
+    forward_identity_requests,
+)
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     IdentitySerializer,
@@ -33,7 +36,9 @@ from environments.permissions.permissions import NestedEnvironmentPermissions
 from environments.sdk.serializers import (
     IdentifyWithTraitsSerializer,
     IdentitySerializerWithTraitsAndSegments,
+    SDKBulkIdentifySerializer,
 )
+from features.models import FeatureState
 from features.serializers import SDKIdentityFeatureStateSerializer
 from integrations.integration import identify_integrations
 from util.views import SDKAPIView
@@ -41,7 +46,7 @@ from util.views import SDKAPIView
 
 class IdentityViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
     serializer_class = IdentitySerializer
-    pagination_class = CustomPagination
+    pagination_class = KeysetPagination
 
     def get_queryset(self):  # type: ignore[no-untyped-def]
         if getattr(self, "swagger_fake_view", False):
@@ -281,6 +286,15 @@ class SDKIdentities(SDKAPIView):
             return Q(feature__is_server_key_only=False)
         return None
 
+    def _get_all_feature_states(self, identity: Identity) -> list[FeatureState]:
+        if settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION:
+            return identity.get_all_feature_states_in_memory(
+                origin=self.request.originated_from,
+            )
+        return identity.get_all_feature_states(
+            additional_filters=self._get_additional_filters(),
+        )
+
     def _get_single_feature_state_response(
         self,
         identity: Identity,
@@ -289,9 +303,7 @@ class SDKIdentities(SDKAPIView):
     ) -> Response:
         context = self.get_serializer_context()  # type: ignore[no-untyped-call]
 
-        for feature_state in identity.get_all_feature_states(
-            additional_filters=self._get_additional_filters(),
-        ):
+        for feature_state in self._get_all_feature_states(identity):
             if feature_state.feature.name == feature_name:
                 serializer = SDKIdentityFeatureStateSerializer(
                     feature_state, context=context
@@ -317,9 +329,7 @@ class SDKIdentities(SDKAPIView):
         :param identity: Identity model to return feature states for
         :return: Response containing lists of both serialized flags and traits
         """
-        all_feature_states = identity.get_all_feature_states(
-            additional_filters=self._get_additional_filters(),
-        )
+        all_feature_states = self._get_all_feature_states(identity)
         serializer_class = self.get_serializer_class()
         serializer = serializer_class(
             {
@@ -335,3 +345,56 @@ class SDKIdentities(SDKAPIView):
         return Response(
             data=serializer.data, status=status.HTTP_200_OK, headers=headers
         )
+
+
+@extend_schema(tags=["sdk"])
+class SDKBulkIdentities(SDKAPIView):
+    serializer_class = SDKBulkIdentifySerializer
+    pagination_class = None  # set here to ensure documentation is correct
+    throttle_classes = []
+
+    def get_serializer_context(self):  # type: ignore[no-untyped-def]
+        context = super().get_serializer_context()
+        if hasattr(self.request, "environment"):
+            context["environment"] = self.request.environment
+            if self.request.originated_from is RequestOrigin.CLIENT:
+                context["feature_states_additional_filters"] = Q(
+                    feature__is_server_key_only=False
+                )
+        return context
+
+    @extend_schema(
+        responses={200: IdentifyWithTraitsSerializer(many=True)},
+        operation_id="sdk_v1_post_bulk_identify",
+    )
+    def post(self, request):  # type: ignore[no-untyped-def]
+        """
+        Identify many users, set their traits, and retrieve their flags.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save()
+
+        if settings.EDGE_API_URL and request.environment.project.enable_dynamo_db:
+            forward_identity_requests.delay(
+                args=(
+                    request.method,
+                    dict(request.headers),
+                    request.environment.project.id,
+                    request.data["identities"],
+                ),
+            )
+
+        context = self.get_serializer_context()  # type: ignore[no-untyped-call]
+        return Response(
+            [
+                IdentifyWithTraitsSerializer(
+                    instance=result,
+                    context={**context, "identity": result["identity"]},
+                ).data
+                for result in results
+            ],
+            headers={
+                FLAGSMITH_UPDATED_AT_HEADER: request.environment.updated_at.timestamp()
+            },
+        )
@@ -0,0 +1,143 @@
+"""
+Per-process tier in front of the shared environment cache.
+
+`Environment.get_from_cache` runs on every SDK request. With a remote
+`ENVIRONMENT_CACHE_BACKEND`, each call costs a network round trip and
+unpickling the environment along with its project, organisation and
+integration configs. The local tier keeps a bounded number of recently used
+environments in memory for `ENVIRONMENT_LOCAL_CACHE_SECONDS`, after which an
+entry is revalidated against a small version stamp kept in the shared cache.
+
+Whenever the shared cache entries for an environment are cleared, a new
+version stamp is published, so local entries are reloaded on their next
+revalidation.
+"""
+
+import copy
+import time
+import typing
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+from django.conf import settings
+from django.core.cache import caches
+
+from environments.metrics import (
+    CACHE_HIT,
+    CACHE_MISS,
+    flagsmith_environment_local_cache_evictions_total,
+    flagsmith_environment_local_cache_queries_total,
+)
+
+if typing.TYPE_CHECKING:
+    from environments.models import Environment
+
+environment_cache = caches[settings.ENVIRONMENT_CACHE_NAME]
+
+ENVIRONMENT_CACHE_VERSION_KEY_PREFIX = "version"
+
+
+@dataclass
+class _EnvironmentLocalCacheEntry:
+    environment: "Environment"
+    version: str
+    validated_at: float
+
+
+class EnvironmentLocalCache:
+    def __init__(self, max_entries: int, timeout: int) -> None:
+        self._entries: OrderedDict[str, _EnvironmentLocalCacheEntry] = OrderedDict()
+        self._max_entries = max_entries
+        self._timeout = timeout
+        self._lock = Lock()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def get(self, api_key: str) -> "Environment | None":
+        with self._lock:
+            if entry := self._entries.get(api_key):
+                self._entries.move_to_end(api_key)
+
+        if entry and not self._is_valid(api_key, entry):
+            self.delete(api_key)
+            entry = None
+
+        flagsmith_environment_local_cache_queries_total.labels(
+            result=CACHE_HIT if entry else CACHE_MISS,
+        ).inc()
+
+        if not entry:
+            return None
+
+        # Hand out a copy so that per-request changes to the instance,
+        # e.g. cached relations, are not shared between requests.
+        return copy.copy(entry.environment)
+
+    def set(self, api_key: str, environment: "Environment", version: str) -> None:
+        entry = _EnvironmentLocalCacheEntry(
+            environment=environment,
+            version=version,
+            validated_at=time.monotonic(),
+        )
+        with self._lock:
+            self._entries[api_key] = entry
+            self._entries.move_to_end(api_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                flagsmith_environment_local_cache_evictions_total.inc()
+
+    def delete(self, api_key: str) -> None:
+        with self._lock:
+            self._entries.pop(api_key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _is_valid(self, api_key: str, entry: _EnvironmentLocalCacheEntry) -> bool:
+        if time.monotonic() - entry.validated_at <= self._timeout:
+            return True
+
+        if get_environment_cache_version(api_key) != entry.version:
+            return False
+
+        entry.validated_at = time.monotonic()
+        return True
+
+
+def get_environment_cache_version_key(api_key: str) -> str:
+    return f"{ENVIRONMENT_CACHE_VERSION_KEY_PREFIX}:{api_key}"
+
+
+def get_environment_cache_version(api_key: str) -> str | None:
+    return environment_cache.get(get_environment_cache_version_key(api_key))  # type: ignore[no-any-return]
+
+
+def get_or_create_environment_cache_version(api_key: str) -> str:
+    version_key = get_environment_cache_version_key(api_key)
+    version = uuid.uuid4().hex
+    if not environment_cache.add(version_key, version):
+        # Another process has already published a version.
+        version = environment_cache.get(version_key, version)
+    return version
+
+
+def publish_environment_cache_versions(api_keys: typing.Iterable[str]) -> None:
+    """
+    Publish new version stamps for the given environment keys, invalidating
+    any copies held by local cache tiers.
+    """
+    version = uuid.uuid4().hex
+    environment_cache.set_many(
+        {get_environment_cache_version_key(api_key): version for api_key in api_keys}
+    )
+
+
+environment_local_cache = EnvironmentLocalCache(
+    max_entries=settings.ENVIRONMENT_LOCAL_CACHE_MAX_ENTRIES,
+    timeout=settings.ENVIRONMENT_LOCAL_CACHE_SECONDS,
+)
@@ -14,6 +14,23 @@ flagsmith_environment_document_cache_queries_total = prometheus_client.Counter(
     ["result"],
 )
 
+flagsmith_environment_local_cache_queries_total = prometheus_client.Counter(
+    "flagsmith_environment_local_cache_queries_total",
+    "Results of in-process cache retrieval for environments. `result` label is either `hit` or `miss`.",
+    ["result"],
+)
+
+flagsmith_environment_local_cache_evictions_total = prometheus_client.Counter(
+    "flagsmith_environment_local_cache_evictions_total",
+    "Environments evicted from the in-process cache to stay within `ENVIRONMENT_LOCAL_CACHE_MAX_ENTRIES`.",
+)
+
+flagsmith_environment_evaluation_cache_queries_total = prometheus_client.Counter(
+    "flagsmith_environment_evaluation_cache_queries_total",
+    "Results of cache retrieval for environment data used by in-memory identity evaluation. `result` label is either `hit` or `miss`.",
+    ["result"],
+)
+
 flagsmith_dynamo_environment_document_size_bytes = prometheus_client.Histogram(
     "flagsmith_dynamo_environment_document_size_bytes",
     "Size of environment documents written to DynamoDB.",
@@ -27,3 +44,15 @@ flagsmith_dynamo_environment_document_compression_ratio = prometheus_client.Hist
     ["table"],
     buckets=COMPRESSION_RATIO_HISTOGRAM_BUCKETS,
 )
+
+flagsmith_dynamo_environment_document_writes_total = prometheus_client.Counter(
+    "flagsmith_dynamo_environment_document_writes_total",
+    "Environment documents written to DynamoDB. `result` label is either `written`, or `skipped` if unchanged since last written.",
+    ["table", "result"],
+)
+
+flagsmith_dynamo_environment_document_bytes_total = prometheus_client.Counter(
+    "flagsmith_dynamo_environment_document_bytes_total",
+    "Estimated size of environment documents written to DynamoDB. `result` label is either `written`, or `skipped` if unchanged since last written.",
+    ["table", "result"],
+)
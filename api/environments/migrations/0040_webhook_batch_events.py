@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("environments", "0039_use_no_ssrf_url_field"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_events",
+            field=models.BooleanField(
+                default=False,
+                help_text="Deliver events triggered together in a single batch payload.",
+            ),
+        ),
+    ]
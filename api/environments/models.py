@@ -45,17 +45,28 @@ from environments.dynamodb import (
 )
 from environments.enums import EnvironmentDocumentCacheMode
 from environments.exceptions import EnvironmentHeaderNotPresentError
+from environments.local_cache import (
+    environment_local_cache,
+    get_or_create_environment_cache_version,
+    publish_environment_cache_versions,
+)
 from environments.managers import EnvironmentManager
 from environments.metrics import (
     CACHE_HIT,
     CACHE_MISS,
     flagsmith_environment_document_cache_queries_total,
 )
+from environments.sdk.encoding import (
+    EncodedEnvironmentDocument,
+    encode_environment_document,
+    get_encoded_environment_document_cache_key,
+)
 from features.models import Feature, FeatureSegment, FeatureState
 from features.multivariate.models import MultivariateFeatureStateValue
 from integrations.flagsmith.client import get_openfeature_client
 from metadata.models import Metadata
 from projects.models import Project
+from segments.evaluation import CompiledSegment, compile_segments
 from segments.models import Segment
 from util.mappers import (
     map_environment_to_sdk_document,
@@ -187,13 +198,21 @@ class Environment(
     @hook(AFTER_UPDATE)  # type: ignore[misc]
     def clear_environment_cache(self) -> None:
         # TODO: this could rebuild the cache itself (using an async task)
-        environment_cache.delete_many(
-            [self.initial_value("api_key"), *[eak.key for eak in self.api_keys.all()]]
-        )
+        api_keys = [
+            self.initial_value("api_key"),
+            *[eak.key for eak in self.api_keys.all()],
+        ]
+        environment_cache.delete_many(api_keys)
+        publish_environment_cache_versions(api_keys)
 
     @hook(AFTER_UPDATE, when="api_key", has_changed=True)  # type: ignore[misc]
     def update_environment_document_cache(self) -> None:
-        environment_document_cache.delete(self.initial_value("api_key"))
+        api_key = self.initial_value("api_key")
+        environment_document_cache.delete(api_key)
+        if settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED:
+            environment_document_cache.delete(
+                get_encoded_environment_document_cache_key(api_key)
+            )
         self.write_environment_documents(self.id)
 
     @hook(AFTER_DELETE)  # type: ignore[misc]
@@ -211,6 +230,10 @@ class Environment(
             or settings.CACHE_ENVIRONMENT_DOCUMENT_SECONDS > 0
         ):
             environment_document_cache.delete(self.api_key)
+            if settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED:
+                environment_document_cache.delete(
+                    get_encoded_environment_document_cache_key(self.api_key)
+                )
 
     # Use the BEFORE_SAVE hook instead of BEFORE_CREATE to account for the logic in the
     # Environment.clone() method
@@ -287,10 +310,20 @@ class Environment(
             logger.warning("Requested environment with null api_key.")
             return None
 
+        if environment_local_cache.is_enabled and (
+            environment := environment_local_cache.get(api_key)
+        ):
+            return environment
+
         if cls.is_bad_key(api_key):
             return None
 
-        environment: "Environment" = environment_cache.get(api_key)
+        if environment_local_cache.is_enabled:
+            # Read the version before the environment itself so that we never
+            # store an environment against a version published after it changed.
+            version = get_or_create_environment_cache_version(api_key)
+
+        environment = environment_cache.get(api_key)
         if not environment:
             select_related_args = (
                 "project",
@@ -316,6 +349,9 @@ class Environment(
                     timeout=settings.ENVIRONMENT_CACHE_SECONDS,
                 )
 
+        if environment and environment_local_cache.is_enabled:
+            environment_local_cache.set(api_key, environment, version)
+
         return environment
 
     @classmethod
@@ -374,13 +410,23 @@ class Environment(
             settings.CACHE_ENVIRONMENT_DOCUMENT_MODE
             == EnvironmentDocumentCacheMode.PERSISTENT
         ):
-            environment_document_cache.set_many(
-                {
-                    # Use the SDK mapper so the cache perfectly matches the DB fallback
-                    e.api_key: map_environment_to_sdk_document(e)
-                    for e in environments
-                }
-            )
+            documents = {
+                # Use the SDK mapper so the cache perfectly matches the DB fallback
+                e.api_key: map_environment_to_sdk_document(e)
+                for e in environments
+            }
+            if settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED:
+                # The plain documents are still served by `get_environment_document`,
+                # and persistent entries never expire, so both are rewritten.
+                documents.update(
+                    {
+                        get_encoded_environment_document_cache_key(
+                            api_key
+                        ): encode_environment_document(document)
+                        for api_key, document in list(documents.items())
+                    }
+                )
+            environment_document_cache.set_many(documents)
 
     def get_feature_state(
         self,
@@ -549,6 +595,20 @@ class Environment(
             environment_segments_cache.set(self.id, segments)
         return segments  # type: ignore[no-any-return]
 
+    def get_compiled_segments_from_cache(self) -> list[CompiledSegment]:
+        """
+        Get any segments that have been overridden in this environment,
+        compiled for identity evaluation.
+        """
+        # Segment changes update the environment, so keying off `updated_at`
+        # ensures that segments are recompiled once changed.
+        cache_key = f"compiled:{self.id}:{self.updated_at.timestamp()}"
+        compiled_segments = environment_segments_cache.get(cache_key)
+        if compiled_segments is None:
+            compiled_segments = compile_segments(self.get_segments_from_cache())
+            environment_segments_cache.set(cache_key, compiled_segments)
+        return compiled_segments  # type: ignore[no-any-return]
+
     @classmethod
     def get_environment_document(
         cls,
@@ -562,6 +622,21 @@ class Environment(
             return cls._get_environment_document_from_cache(api_key)
         return cls._get_environment_document_from_db(api_key)
 
+    @classmethod
+    def get_encoded_environment_document(
+        cls,
+        api_key: str,
+    ) -> EncodedEnvironmentDocument:
+        if (
+            settings.CACHE_ENVIRONMENT_DOCUMENT_SECONDS > 0
+            or settings.CACHE_ENVIRONMENT_DOCUMENT_MODE
+            == EnvironmentDocumentCacheMode.PERSISTENT
+        ):
+            return cls._get_encoded_environment_document_from_cache(api_key)
+        return encode_environment_document(
+            cls._get_environment_document_from_db(api_key)
+        )
+
     def get_create_log_message(self, history_instance) -> typing.Optional[str]:  # type: ignore[no-untyped-def]
         return ENVIRONMENT_CREATED_MESSAGE % self.name  # type: ignore[no-any-return]
 
@@ -590,6 +665,25 @@ class Environment(
 
         return environment_document  # type: ignore[no-any-return]
 
+    @classmethod
+    def _get_encoded_environment_document_from_cache(
+        cls,
+        api_key: str,
+    ) -> EncodedEnvironmentDocument:
+        cache_key = get_encoded_environment_document_cache_key(api_key)
+        encoded_document = environment_document_cache.get(cache_key)
+        if not (cache_hit := encoded_document is not None):
+            encoded_document = encode_environment_document(
+                cls._get_environment_document_from_db(api_key)
+            )
+            environment_document_cache.set(cache_key, encoded_document)
+
+        flagsmith_environment_document_cache_queries_total.labels(
+            result=CACHE_HIT if cache_hit else CACHE_MISS,
+        ).inc()
+
+        return encoded_document  # type: ignore[no-any-return]
+
     @classmethod
     def _get_environment_document_from_db(
         cls,
@@ -644,6 +738,10 @@ class Webhook(AbstractBaseExportableWebhookModel):
         Environment, on_delete=models.CASCADE, related_name="webhooks"
     )
     enabled = models.BooleanField(default=True)
+    batch_events = models.BooleanField(
+        default=False,
+        help_text="Deliver events triggered together in a single batch payload.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -0,0 +1,101 @@
+import gzip
+import hashlib
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from util.mappers.sdk import SDKDocument
+from util.renderers import PydanticJSONRenderer
+
+GZIP = "gzip"
+BROTLI = "br"
+
+ENCODED_ENVIRONMENT_DOCUMENT_CACHE_KEY_PREFIX = "encoded"
+
+
+@dataclass(frozen=True)
+class EncodedEnvironmentDocument:
+    """
+    An environment document rendered to JSON once, along with its compressed
+    variants and a content hash, ready to be served as is.
+    """
+
+    content: bytes
+    content_hash: str
+    gzip_content: bytes
+    brotli_content: bytes | None = None
+
+    def get_content(self, content_encoding: str | None) -> bytes:
+        if content_encoding == GZIP:
+            return self.gzip_content
+        if content_encoding == BROTLI and self.brotli_content is not None:
+            return self.brotli_content
+        return self.content
+
+    def get_etag(self, content_encoding: str | None) -> str:
+        """
+        Get a strong ETag for the content served with `content_encoding`,
+        distinct per encoding as the bytes served differ.
+        """
+        if content_encoding:
+            return f"{self.content_hash}-{content_encoding}"
+        return self.content_hash
+
+    def get_content_encoding(self, accept_encoding: str) -> str | None:
+        """
+        Pick the best content encoding available for the given
+        `Accept-Encoding` header value.
+        """
+        accepted_encodings = _parse_accept_encoding(accept_encoding)
+        if self.brotli_content is not None and BROTLI in accepted_encodings:
+            return BROTLI
+        if GZIP in accepted_encodings:
+            return GZIP
+        return None
+
+
+def get_encoded_environment_document_cache_key(api_key: str) -> str:
+    return f"{ENCODED_ENVIRONMENT_DOCUMENT_CACHE_KEY_PREFIX}:{api_key}"
+
+
+def encode_environment_document(
+    environment_document: SDKDocument,
+) -> EncodedEnvironmentDocument:
+    # Render with the default renderer so the bytes match a regular `Response`.
+    content = PydanticJSONRenderer().render(environment_document)
+    return EncodedEnvironmentDocument(
+        content=content,
+        content_hash=hashlib.sha256(content).hexdigest(),
+        # `mtime=0` keeps the compressed bytes deterministic.
+        gzip_content=gzip.compress(content, mtime=0),
+        brotli_content=_brotli_compress(content),
+    )
+
+
+def _brotli_compress(content: bytes) -> bytes | None:
+    if not settings.BROTLI_INSTALLED:
+        return None
+
+    import brotli  # type: ignore[import-not-found,unused-ignore]
+
+    return brotli.compress(content)  # type: ignore[no-any-return]
+
+
+def _parse_accept_encoding(accept_encoding: str) -> set[str]:
+    accepted_encodings = set()
+    for value in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in value.split(";")]
+        if coding and not _is_refused(params):
+            accepted_encodings.add(coding.lower())
+    return accepted_encodings
+
+
+def _is_refused(params: list[str]) -> bool:
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip() == "q":
+            try:
+                return float(value) == 0
+            except ValueError:
+                return False
+    return False
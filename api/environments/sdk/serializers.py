@@ -1,9 +1,14 @@
 import typing
 from collections import defaultdict
 
+from django.conf import settings
 from rest_framework import serializers
 
 from core.constants import BOOLEAN, FLOAT, INTEGER, STRING
+from environments.identities.evaluation import (
+    get_environment_evaluation_data,
+    load_environment_evaluation_data,
+)
 from environments.identities.models import Identity
 from environments.identities.serializers import (
     IdentifierOnlyIdentitySerializer,
@@ -13,6 +18,8 @@ from environments.identities.traits.models import Trait
 from environments.identities.traits.serializers import TraitSerializerBasic
 from environments.sdk.services import (
     get_identified_transient_identity_and_traits,
+    get_identity_feature_states_by_identity_id,
+    get_persisted_identities_and_traits,
     get_persisted_identity_and_traits,
     get_transient_identity_and_traits,
 )
@@ -177,10 +184,18 @@ class IdentifyWithTraitsSerializer(
                 sdk_trait_data=sdk_trait_data,
             )
 
-        all_feature_states = identity.get_all_feature_states(
-            traits=traits,
-            additional_filters=self.context.get("feature_states_additional_filters"),
-        )
+        if settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION:
+            all_feature_states = identity.get_all_feature_states_in_memory(
+                traits=traits,
+                origin=self.context["request"].originated_from,
+            )
+        else:
+            all_feature_states = identity.get_all_feature_states(
+                traits=traits,
+                additional_filters=self.context.get(
+                    "feature_states_additional_filters"
+                ),
+            )
         identify_integrations(identity, all_feature_states, traits)  # type: ignore[no-untyped-call]
 
         return {
@@ -195,3 +210,80 @@ class IdentifyWithTraitsSerializer(
         if traits and not request.environment.trait_persistence_allowed(request):
             return []
         return traits
+
+
+class SDKBulkIdentifyIdentitySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    identifier = serializers.CharField()
+    traits = TraitSerializerBasic(required=False, many=True)
+
+
+class SDKBulkIdentifySerializer(serializers.Serializer):  # type: ignore[type-arg]
+    identities = SDKBulkIdentifyIdentitySerializer(  # type: ignore[call-arg]
+        many=True,
+        allow_empty=False,
+        max_length=settings.SDK_BULK_IDENTIFY_MAX_IDENTITIES,
+    )
+
+    def validate_identities(
+        self,
+        identities: list[dict[str, typing.Any]],
+    ) -> list[dict[str, typing.Any]]:
+        identifiers = {identity_data["identifier"] for identity_data in identities}
+        if len(identifiers) != len(identities):
+            raise serializers.ValidationError("Identifiers must be unique.")
+
+        request = self.context["request"]
+        if not request.environment.trait_persistence_allowed(request):
+            for identity_data in identities:
+                identity_data["traits"] = []
+        return identities
+
+    def save(self, **kwargs: typing.Any) -> list[dict[str, typing.Any]]:
+        """
+        Create the identities with their associated traits and evaluate their
+        flags in memory. The environment's feature states and segments are
+        loaded once and shared across all of them, from the cache when
+        `SDK_IDENTITIES_IN_MEMORY_EVALUATION` is enabled.
+        """
+        environment = self.context["environment"]
+        origin = self.context["request"].originated_from
+        additional_filters = self.context.get("feature_states_additional_filters")
+
+        identities_and_traits = get_persisted_identities_and_traits(
+            environment=environment,
+            sdk_trait_data_by_identifier={
+                identity_data["identifier"]: identity_data.get("traits", [])
+                for identity_data in self.validated_data["identities"]
+            },
+        )
+        evaluation_data = (
+            get_environment_evaluation_data(environment)
+            if settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION
+            else load_environment_evaluation_data(
+                environment, additional_filters=additional_filters
+            )
+        )
+        identity_feature_states = get_identity_feature_states_by_identity_id(
+            environment=environment,
+            identities=[identity for identity, _ in identities_and_traits],
+            additional_filters=additional_filters,
+        )
+
+        results = []
+        for identity, traits in identities_and_traits:
+            all_feature_states = identity.get_all_feature_states_in_memory(
+                traits=traits,
+                origin=origin,
+                identity_feature_states=identity_feature_states[identity.id],
+                evaluation_data=evaluation_data,
+            )
+            identify_integrations(identity, all_feature_states, traits)  # type: ignore[no-untyped-call]
+            results.append(
+                {
+                    "identity": identity,
+                    "identifier": identity.identifier,
+                    "traits": traits,
+                    "flags": all_feature_states,
+                }
+            )
+        return results
@@ -4,13 +4,19 @@ from itertools import chain
 from operator import itemgetter
 from typing import TypeAlias
 
+from django.db.models import Q
 from django.utils import timezone
 
+from environments.identities.evaluation import (
+    get_multivariate_feature_state_values_prefetch,
+)
 from environments.identities.models import Identity
 from environments.identities.services import replace_identity_environment
 from environments.identities.traits.models import Trait
 from environments.models import Environment
 from environments.sdk.types import SDKTraitData
+from features.models import FeatureState
+from features.versioning.versioning_service import get_environment_flags_list
 
 IdentityAndTraits: TypeAlias = tuple[Identity, list[Trait]]
 
@@ -94,6 +100,111 @@ def get_persisted_identity_and_traits(
     )
 
 
+def get_persisted_identities_and_traits(
+    environment: Environment,
+    sdk_trait_data_by_identifier: dict[str, list[SDKTraitData]],
+) -> list[IdentityAndTraits]:
+    """
+    Retrieve or persist `Identity` instances for many identifiers at once.
+    Behaves like `get_persisted_identity_and_traits` for every identifier,
+    using a fixed number of queries regardless of the number of identities.
+    """
+    identifiers = list(sdk_trait_data_by_identifier)
+    Identity.objects.bulk_create(
+        [
+            Identity(environment=environment, identifier=identifier)
+            for identifier in identifiers
+        ],
+        ignore_conflicts=True,
+    )
+    identities_by_identifier = {
+        identity.identifier: identity
+        for identity in Identity.objects.with_traits().filter(
+            environment=environment,
+            identifier__in=identifiers,
+        )
+    }
+    identities = [identities_by_identifier[identifier] for identifier in identifiers]
+    for identity in identities:
+        replace_identity_environment(identity, environment)
+
+    if not environment.project.organisation.persist_trait_data:
+        return [
+            (
+                identity,
+                list(
+                    {
+                        trait.trait_key: trait
+                        for trait in chain(
+                            identity.identity_traits.all(),
+                            identity.generate_traits(
+                                sdk_trait_data_by_identifier[identity.identifier],
+                                persist=False,
+                            ),
+                        )
+                    }.values()
+                ),
+            )
+            for identity in identities
+        ]
+
+    trait_changes = [
+        identity.get_trait_changes(sdk_trait_data_by_identifier[identity.identifier])
+        for identity in identities
+    ]
+
+    traits_to_delete = Q()
+    for identity, identity_trait_changes in zip(identities, trait_changes):
+        if identity_trait_changes.keys_to_delete:
+            traits_to_delete |= Q(
+                identity=identity,
+                trait_key__in=identity_trait_changes.keys_to_delete,
+            )
+    if traits_to_delete:
+        Trait.objects.filter(traits_to_delete).delete()
+
+    Trait.objects.bulk_update(
+        [trait for changes in trait_changes for trait in changes.updated_traits],
+        fields=Trait.BULK_UPDATE_FIELDS,
+    )
+    # See `Identity.update_traits` for why conflicts are ignored.
+    Trait.objects.bulk_create(
+        [trait for changes in trait_changes for trait in changes.new_traits],
+        ignore_conflicts=True,
+    )
+
+    return [
+        (identity, identity_trait_changes.traits)
+        for identity, identity_trait_changes in zip(identities, trait_changes)
+    ]
+
+
+def get_identity_feature_states_by_identity_id(
+    environment: Environment,
+    identities: list[Identity],
+    additional_filters: Q | None = None,
+) -> dict[int, list[FeatureState]]:
+    """
+    Get the feature state overrides of many identities with a single query.
+    """
+    filters = Q(identity__in=identities)
+    if additional_filters:
+        filters &= additional_filters
+
+    identity_feature_states: dict[int, list[FeatureState]] = {
+        identity.id: [] for identity in identities
+    }
+    for feature_state in get_environment_flags_list(
+        environment=environment,
+        additional_filters=filters,
+        additional_prefetch_related_args=[
+            get_multivariate_feature_state_values_prefetch()
+        ],
+    ):
+        identity_feature_states[feature_state.identity_id].append(feature_state)  # type: ignore[index]
+    return identity_feature_states
+
+
 def get_transient_identifier(sdk_trait_data: list[SDKTraitData]) -> str:
     if sdk_trait_data:
         return hashlib.sha256(
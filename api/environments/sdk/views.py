@@ -1,6 +1,9 @@
 from datetime import datetime
 from typing import Optional
 
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import patch_vary_headers
 from django.utils.decorators import method_decorator
 from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
@@ -15,6 +18,7 @@ from environments.authentication import (
 )
 from environments.models import Environment
 from environments.permissions.permissions import EnvironmentKeyPermissions
+from environments.sdk.encoding import EncodedEnvironmentDocument
 
 
 def get_last_modified(request: Request) -> datetime | None:
@@ -22,6 +26,21 @@ def get_last_modified(request: Request) -> datetime | None:
     return updated_at
 
 
+def get_etag(request: Request) -> str | None:
+    if not settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED:
+        return None
+    # Keep the document on the request so the view doesn't fetch it twice.
+    encoded_document = Environment.get_encoded_environment_document(
+        request.environment.api_key
+    )
+    request.encoded_environment_document = encoded_document  # type: ignore[attr-defined]
+    return encoded_document.get_etag(
+        encoded_document.get_content_encoding(
+            request.headers.get("Accept-Encoding", "")
+        )
+    )
+
+
 @extend_schema(tags=["sdk"])
 class SDKEnvironmentAPIView(APIView):
     permission_classes = (EnvironmentKeyPermissions,)
@@ -34,12 +53,17 @@ class SDKEnvironmentAPIView(APIView):
         responses={200: V1EnvironmentDocumentResponse},
         operation_id="sdk_v1_environment_document",
     )
-    @method_decorator(condition(last_modified_func=get_last_modified))
-    def get(self, request: Request) -> Response:
+    @method_decorator(
+        condition(etag_func=get_etag, last_modified_func=get_last_modified)
+    )
+    def get(self, request: Request) -> HttpResponseBase:
         """
         Retrieve the environment document.
         Used by SDKs in local evaluation mode, and Edge Proxy.
         """
+        if settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED:
+            return self._get_encoded_response(request)
+
         environment_document = Environment.get_environment_document(
             request.environment.api_key,
         )
@@ -48,3 +72,23 @@ class SDKEnvironmentAPIView(APIView):
             environment_document,
             headers={FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()},
         )
+
+    def _get_encoded_response(self, request: Request) -> HttpResponse:
+        encoded_document: EncodedEnvironmentDocument = (
+            request.encoded_environment_document
+        )
+        content_encoding = encoded_document.get_content_encoding(
+            request.headers.get("Accept-Encoding", "")
+        )
+
+        response = HttpResponse(
+            encoded_document.get_content(content_encoding),
+            content_type="application/json",
+            headers={
+                FLAGSMITH_UPDATED_AT_HEADER: request.environment.updated_at.timestamp(),
+            },
+        )
+        if content_encoding:
+            response.headers["Content-Encoding"] = content_encoding
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
@@ -187,7 +187,15 @@ class CloneEnvironmentSerializer(EnvironmentSerializerLight):
 class WebhookSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
     class Meta:
         model = Webhook
-        fields = ("id", "url", "enabled", "created_at", "updated_at", "secret")
+        fields = (
+            "id",
+            "url",
+            "enabled",
+            "batch_events",
+            "created_at",
+            "updated_at",
+            "secret",
+        )
         read_only_fields = ("id", "created_at", "updated_at")
 
 
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db.models import Prefetch, Q
 from django.utils import timezone
 from task_processor.decorators import (
@@ -12,6 +13,7 @@ from environments.models import (
     environment_v2_wrapper,
     environment_wrapper,
 )
+from features.flags_payloads import write_flags_payloads
 from features.multivariate.models import MultivariateFeatureStateValue
 from features.versioning.models import EnvironmentFeatureVersion
 from features.versioning.versioning_service import (
@@ -37,6 +39,11 @@ def process_environment_update(audit_log_id: int):  # type: ignore[no-untyped-de
         environment_id=audit_log.environment_id, project_id=audit_log.project_id
     )
 
+    if settings.CACHE_FLAGS_PAYLOADS:
+        write_flags_payloads(
+            environment_id=audit_log.environment_id, project_id=audit_log.project_id
+        )
+
     # send environment update message
     if audit_log.environment_id:
         send_environment_update_message_for_environment(audit_log.environment)
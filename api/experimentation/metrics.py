@@ -25,3 +25,12 @@ flagsmith_experimentation_warehouse_delivery_objects_total = prometheus_client.C
     "moved aside and never retried.",
     ["result"],
 )
+
+flagsmith_experimentation_warehouse_delivery_rows_per_second = (
+    prometheus_client.Histogram(
+        "flagsmith_experimentation_warehouse_delivery_rows_per_second",
+        "Throughput, in rows inserted per second, of per-connection runs "
+        "delivering buffered event objects to customers' own data warehouses.",
+        buckets=(100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000),
+    )
+)
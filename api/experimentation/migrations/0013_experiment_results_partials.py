@@ -0,0 +1,57 @@
+# Generated by Django 5.2.16 on 2026-10-17 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("experimentation", "0012_warehouse_delivery_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="experimentresults",
+            name="partials_closed_until",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="experimentresults",
+            name="partials_fingerprint",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.CreateModel(
+            name="ExperimentResultsPartial",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("cohort_day", models.DateField()),
+                ("variant", models.CharField(max_length=255)),
+                ("n", models.PositiveBigIntegerField()),
+                ("metric_stats", models.JSONField(default=dict)),
+                (
+                    "results",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="partials",
+                        to="experimentation.experimentresults",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("results", "cohort_day", "variant"),
+                        name="unique_results_partial_per_cohort_day_variant",
+                    )
+                ],
+            },
+        ),
+    ]
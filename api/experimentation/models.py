@@ -265,6 +265,37 @@ class ExperimentResults(ExperimentComputation[ResultsSummary]):
         on_delete=models.CASCADE,
         related_name="results",
     )
+    # Results of identities first exposed before this day are stored as
+    # partials, computed with the metrics and attribution window fingerprinted.
+    partials_closed_until = models.DateField(null=True, blank=True)
+    partials_fingerprint = models.CharField(max_length=64, null=True, blank=True)
+
+
+class ExperimentResultsPartial(models.Model):
+    """Per-variant sufficient statistics of the identities first exposed to an
+    experiment on one day. Once every metric event attributable to them is in,
+    they no longer change, so refreshes add them up rather than recompute."""
+
+    results = models.ForeignKey(
+        ExperimentResults,
+        on_delete=models.CASCADE,
+        related_name="partials",
+    )
+    cohort_day = models.DateField()
+    variant = models.CharField(max_length=255)
+    n = models.PositiveBigIntegerField()
+    # {metric_id: {"sum": ..., "sum_squares": ...}}
+    metric_stats: models.JSONField[
+        dict[str, dict[str, float]], dict[str, dict[str, float]]
+    ] = models.JSONField(default=dict)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["results", "cohort_day", "variant"],
+                name="unique_results_partial_per_cohort_day_variant",
+            ),
+        ]
 
 
 class MetricAggregation(models.TextChoices):
@@ -11,10 +11,16 @@ ResultsQueryBuilder owns the slots and provides build_query() + decode_rows().
 Because decode_rows looks each column up by name, the SELECT and the decode
 bind on the alias rather than on column order — a reordered or inserted column
 can't silently misalign them.
+
+Built ``by_cohort_day``, the query only covers identities first exposed since
+``cohort_start``, groups them by the day of their first exposure, and counts
+metric events within ``attribution_days`` of it; decode_cohort_rows() then
+reads the statistics back per day.
 """
 
 from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import date
 from typing import Any
 
 from experimentation.dataclasses import MetricSpec
@@ -50,11 +56,21 @@ WHERE quarantined = 0
 GROUP BY variant"""
 )
 
+_EXPOSURES_COHORT_COUNT_ONLY_QUERY = (
+    _EXPOSURES_CTE
+    + """
+SELECT toDate(first_exposure, 'UTC') AS cohort_day, variant, count() AS n
+FROM exposures
+WHERE quarantined = 0
+    AND first_exposure >= %(cohort_start)s
+GROUP BY cohort_day, variant"""
+)
+
 _METRIC_JOIN = """    LEFT JOIN events AS m
         ON m.identifier = e.identifier
         AND m.environment_key = %(environment_key)s
         AND m.event IN %(metric_events)s
-        AND m.timestamp >= %(window_start)s
+        AND m.timestamp >= %({metric_window_start})s
         AND m.timestamp < %(window_end)s"""
 
 
@@ -68,6 +84,7 @@ class _MetricSlot:
 
     spec: MetricSpec
     index: int
+    attribution_window: bool = False
 
     @property
     def _alias(self) -> str:
@@ -77,10 +94,16 @@ class _MetricSlot:
         # Post-exposure attribution lives in conditional aggregation, not JOIN ON:
         # ClickHouse 24.8 rejects ON clauses mixing left+right columns in an
         # inequality (error 403).
-        return (
+        condition = (
             f"m.event = %(metric_{self.index}_event)s"
             f" AND m.timestamp >= e.first_exposure"
         )
+        if self.attribution_window:
+            condition += (
+                " AND m.timestamp < e.first_exposure"
+                " + toIntervalDay(%(attribution_days)s)"
+            )
+        return condition
 
     def unit_select(self) -> str:
         """Per-identity expression for the unit_values CTE SELECT."""
@@ -116,32 +139,56 @@ class _MetricSlot:
 class ResultsQueryBuilder:
     """Assembles and decodes the experimentation results ClickHouse query."""
 
-    def __init__(self, specs: Sequence[MetricSpec]) -> None:
-        self._slots = [_MetricSlot(spec, i) for i, spec in enumerate(specs)]
+    def __init__(
+        self,
+        specs: Sequence[MetricSpec],
+        *,
+        by_cohort_day: bool = False,
+    ) -> None:
+        self._by_cohort_day = by_cohort_day
+        self._slots = [
+            _MetricSlot(spec, i, attribution_window=by_cohort_day)
+            for i, spec in enumerate(specs)
+        ]
 
     def build_query(self) -> str:
         if not self._slots:
+            if self._by_cohort_day:
+                return _EXPOSURES_COHORT_COUNT_ONLY_QUERY
             return _EXPOSURES_COUNT_ONLY_QUERY
 
         unit_selects = ",\n        ".join(s.unit_select() for s in self._slots)
         outer_selects = ",\n    ".join(s.outer_select() for s in self._slots)
 
+        if self._by_cohort_day:
+            # Identities first exposed earlier have no events attributable
+            # before cohort_start, so neither side needs to scan further back.
+            metric_join = _METRIC_JOIN.format(metric_window_start="cohort_start")
+            cohort_select = "toDate(e.first_exposure, 'UTC') AS cohort_day,\n        "
+            cohort_filter = "\n        AND e.first_exposure >= %(cohort_start)s"
+            cohort_group = ", cohort_day"
+            outer_group = "cohort_day, variant"
+        else:
+            metric_join = _METRIC_JOIN.format(metric_window_start="window_start")
+            cohort_select = cohort_filter = cohort_group = ""
+            outer_group = "variant"
+
         return (
             _EXPOSURES_CTE
             + f""",
 unit_values AS (
     SELECT
         e.variant AS variant,
-        {unit_selects}
+        {cohort_select}{unit_selects}
     FROM exposures AS e
-{_METRIC_JOIN}
-    WHERE e.quarantined = 0
-    GROUP BY e.identifier, e.variant
+{metric_join}
+    WHERE e.quarantined = 0{cohort_filter}
+    GROUP BY e.identifier, e.variant{cohort_group}
 )
-SELECT variant, count() AS n,
+SELECT {outer_group}, count() AS n,
     {outer_selects}
 FROM unit_values
-GROUP BY variant"""
+GROUP BY {outer_group}"""
         )
 
     def add_metric_params(self, params: dict[str, object]) -> None:
@@ -162,13 +209,39 @@ GROUP BY variant"""
         """
         index = {name: position for position, name in enumerate(column_names)}
         exposure_counts: dict[str, int] = {}
-        metric_stats: dict[int, dict[str, VariantStats]] = {
-            slot.spec.metric_id: {} for slot in self._slots
-        }
+        metric_stats = self._empty_metric_stats()
         for row in rows:
-            variant = str(row[index["variant"]])
-            n = int(row[index["n"]])
-            exposure_counts[variant] = n
-            for slot in self._slots:
-                metric_stats[slot.spec.metric_id][variant] = slot.decode(n, row, index)
+            self._decode_row(row, index, exposure_counts, metric_stats)
         return exposure_counts, metric_stats
+
+    def decode_cohort_rows(
+        self, rows: list[Any], column_names: Sequence[str]
+    ) -> dict[date, tuple[dict[str, int], dict[int, dict[str, VariantStats]]]]:
+        """Decode raw rows of a ``by_cohort_day`` query into exposure counts and
+        per-metric stats per first-exposure day."""
+        index = {name: position for position, name in enumerate(column_names)}
+        cohorts: dict[
+            date, tuple[dict[str, int], dict[int, dict[str, VariantStats]]]
+        ] = {}
+        for row in rows:
+            exposure_counts, metric_stats = cohorts.setdefault(
+                row[index["cohort_day"]], ({}, self._empty_metric_stats())
+            )
+            self._decode_row(row, index, exposure_counts, metric_stats)
+        return cohorts
+
+    def _empty_metric_stats(self) -> dict[int, dict[str, VariantStats]]:
+        return {slot.spec.metric_id: {} for slot in self._slots}
+
+    def _decode_row(
+        self,
+        row: Sequence[Any],
+        index: dict[str, int],
+        exposure_counts: dict[str, int],
+        metric_stats: dict[int, dict[str, VariantStats]],
+    ) -> None:
+        variant = str(row[index["variant"]])
+        n = int(row[index["n"]])
+        exposure_counts[variant] = n
+        for slot in self._slots:
+            metric_stats[slot.spec.metric_id][variant] = slot.decode(n, row, index)
@@ -4,8 +4,12 @@ import hashlib
 import json
 import time
 import typing
-from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
 from functools import lru_cache
+from threading import Event, Lock
 
 import structlog
 from clickhouse_connect.driver.exceptions import ClickHouseError
@@ -18,6 +22,7 @@ from django.db.models import Q
 from django.utils import timezone
 from flag_engine.segments.constants import ALL_RULE, PERCENTAGE_SPLIT
 from rest_framework.exceptions import ValidationError
+from structlog.typing import FilteringBoundLogger
 
 from audit.models import AuditLog
 from audit.related_object_type import RelatedObjectType
@@ -50,11 +55,14 @@ from experimentation.dataclasses import (
 from experimentation.metrics import (
     flagsmith_experimentation_warehouse_connection_verifications_total,
     flagsmith_experimentation_warehouse_delivery_objects_total,
+    flagsmith_experimentation_warehouse_delivery_rows_per_second,
     flagsmith_experimentation_warehouse_delivery_runs_total,
 )
 from experimentation.models import (
     VALID_STATUS_TRANSITIONS,
     Experiment,
+    ExperimentResults,
+    ExperimentResultsPartial,
     ExperimentStatus,
     MetricAggregation,
     MetricDirection,
@@ -67,7 +75,7 @@ from experimentation.results_query import _EXPOSURES_CTE, ResultsQueryBuilder
 from experimentation.stats import (
     Inference,
     VariantStats,
-    compare_to_control,
+    compare_treatments_to_control,
     srm_p_value,
 )
 from features.feature_states.models import API_VALUE_TYPES
@@ -86,8 +94,8 @@ from segments.models import Condition, Segment, SegmentRule
 from segments.types import SegmentRule as SegmentRuleType
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Sequence
-    from datetime import datetime
+    from collections.abc import Iterable, Sequence
+    from datetime import date
 
     from clickhouse_connect.driver.client import Client as ClickHouseHTTPClient
 
@@ -129,6 +137,8 @@ def _customer_cache_key(kind: str, connection: "WarehouseConnection") -> str:
 # A delivery run stops taking on new objects after this long, leaving room for
 # the slowest possible in-flight insert to still land inside the task timeout.
 DELIVERY_TIME_BUDGET_SECONDS = 210
+# Objects delivered concurrently to a single connection's warehouse.
+DELIVERY_MAX_WORKERS = 4
 
 
 def is_warehouse_feature_enabled(organisation: Organisation) -> bool:
@@ -404,6 +414,70 @@ def get_metric_variant_stats(
     )
 
 
+def get_metric_variant_cohort_stats(
+    *,
+    environment_key: str,
+    feature_name: str,
+    window_start: datetime,
+    window_end: datetime,
+    cohort_start: datetime,
+    attribution_days: int,
+    specs: Sequence[MetricSpec],
+) -> dict[date, ResultsAggregates]:
+    """Run the warehouse query for identities first exposed since
+    ``cohort_start``, returning their aggregates per first-exposure day. Metric
+    events only count within ``attribution_days`` of an identity's exposure."""
+    builder = ResultsQueryBuilder(specs, by_cohort_day=True)
+    params: dict[str, object] = {
+        "environment_key": environment_key,
+        "exposure_event": EXPOSURE_EVENT_NAME,
+        "feature_name": feature_name,
+        "window_start": window_start,
+        "window_end": window_end,
+        "cohort_start": cohort_start,
+        "attribution_days": attribution_days,
+    }
+    builder.add_metric_params(params)
+
+    rows, columns = _get_clickhouse_client(
+        send_receive_timeout=CLICKHOUSE_BACKGROUND_QUERY_TIMEOUT_SECONDS,
+    ).execute(builder.build_query(), params, with_column_types=True)
+    return {
+        cohort_day: ResultsAggregates(
+            specs=list(specs),
+            exposure_counts=exposure_counts,
+            metric_stats=metric_stats,
+        )
+        for cohort_day, (exposure_counts, metric_stats) in builder.decode_cohort_rows(
+            rows, [name for name, _type in columns]
+        ).items()
+    }
+
+
+def merge_results_aggregates(
+    specs: Sequence[MetricSpec],
+    partials: Iterable[ResultsAggregates],
+) -> ResultsAggregates:
+    """Add up aggregates gathered over separate groups of identities."""
+    exposure_counts: dict[str, int] = {}
+    metric_stats: dict[int, dict[str, VariantStats]] = {
+        spec.metric_id: {} for spec in specs
+    }
+    for partial in partials:
+        for variant, n in partial.exposure_counts.items():
+            exposure_counts[variant] = exposure_counts.get(variant, 0) + n
+        for metric_id, variants in metric_stats.items():
+            for variant, stats in partial.metric_stats.get(metric_id, {}).items():
+                variants[variant] = (
+                    variants[variant] + stats if variant in variants else stats
+                )
+    return ResultsAggregates(
+        specs=list(specs),
+        exposure_counts=exposure_counts,
+        metric_stats=metric_stats,
+    )
+
+
 def build_results_summary(
     aggregates: ResultsAggregates,
     *,
@@ -455,6 +529,113 @@ def compute_results_summary(
     )
 
 
+def compute_incremental_results_summary(
+    results: ExperimentResults,
+    *,
+    window_end: datetime,
+) -> ResultsSummary:
+    """Like ``compute_results_summary``, but metric events only count within
+    ``EXPERIMENT_RESULTS_ATTRIBUTION_DAYS`` of an identity's first exposure.
+
+    The aggregates of identities first exposed on a day stop changing once
+    that window has passed for all of them, so they are stored as partials
+    and only the identities first exposed since are queried from the
+    warehouse. Identities of stored days that are later served another
+    variant are not excluded retroactively."""
+    experiment = results.experiment
+    specs = _experiment_metric_specs(experiment)
+    attribution_days = settings.EXPERIMENT_RESULTS_ATTRIBUTION_DAYS
+    fingerprint = _results_partials_fingerprint(specs, attribution_days)
+
+    if results.partials_fingerprint != fingerprint:
+        # Metrics or their definitions changed: stored partials answer a
+        # different question, so start over.
+        results.partials.all().delete()
+        results.partials_closed_until = None
+        results.partials_fingerprint = fingerprint
+
+    closed_until = results.partials_closed_until
+    cohort_start = experiment.started_at
+    if closed_until is not None:
+        cohort_start = max(
+            cohort_start,
+            datetime.combine(closed_until, datetime.min.time(), dt_timezone.utc),
+        )
+    cohorts = get_metric_variant_cohort_stats(
+        environment_key=experiment.environment.api_key,
+        feature_name=experiment.feature.name,
+        window_start=experiment.started_at,
+        window_end=window_end,
+        cohort_start=cohort_start,
+        attribution_days=attribution_days,
+        specs=specs,
+    )
+
+    # A day closes once the attribution window of its last identity has passed.
+    new_closed_until = (
+        window_end.astimezone(dt_timezone.utc) - timedelta(days=attribution_days)
+    ).date()
+    with transaction.atomic():
+        ExperimentResultsPartial.objects.bulk_create(
+            [
+                ExperimentResultsPartial(
+                    results=results,
+                    cohort_day=cohort_day,
+                    variant=variant,
+                    n=n,
+                    metric_stats={
+                        str(metric_id): {
+                            "sum": variants[variant].sum,
+                            "sum_squares": variants[variant].sum_squares,
+                        }
+                        for metric_id, variants in aggregates.metric_stats.items()
+                    },
+                )
+                for cohort_day, aggregates in cohorts.items()
+                if cohort_day < new_closed_until
+                for variant, n in aggregates.exposure_counts.items()
+            ],
+            # A concurrent refresh may have stored the same days already.
+            ignore_conflicts=True,
+        )
+        if closed_until is None or new_closed_until > closed_until:
+            results.partials_closed_until = new_closed_until
+        results.save(update_fields=["partials_closed_until", "partials_fingerprint"])
+
+    stored = [
+        ResultsAggregates(
+            specs=specs,
+            exposure_counts={partial.variant: partial.n},
+            metric_stats={
+                int(metric_id): {
+                    partial.variant: VariantStats(n=partial.n, **stats),
+                }
+                for metric_id, stats in partial.metric_stats.items()
+            },
+        )
+        for partial in results.partials.filter(cohort_day__lt=cohort_start.date())
+    ]
+    return build_results_summary(
+        merge_results_aggregates(specs, [*stored, *cohorts.values()]),
+        expected_shares=_expected_variant_shares(experiment),
+    )
+
+
+def _results_partials_fingerprint(
+    specs: Sequence[MetricSpec],
+    attribution_days: int,
+) -> str:
+    return hashlib.sha256(
+        json.dumps(
+            [
+                attribution_days,
+                *(asdict(spec) for spec in sorted(specs, key=lambda s: s.metric_id)),
+            ],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()
+
+
 def _experiment_metric_specs(experiment: "Experiment") -> list[MetricSpec]:
     return [
         MetricSpec(
@@ -530,37 +711,55 @@ def _metric_inference(
     variants: dict[str, VariantStats],
 ) -> dict[str, Inference | None]:
     control = variants.get(CONTROL_VARIANT_KEY)
-    return {
-        variant_key: _infer_treatment(spec, control, treatment)
+    inference: dict[str, Inference | None] = {
+        variant_key: None
+        for variant_key in variants
+        if variant_key != CONTROL_VARIANT_KEY
+    }
+    if control is None:
+        return inference
+    treatments = {
+        variant_key: treatment
         for variant_key, treatment in variants.items()
         if variant_key != CONTROL_VARIANT_KEY
+        and _has_enough_data(spec, control, treatment)
     }
+    # Every treatment is compared against control in one pass.
+    for variant_key, treatment_inference in zip(
+        treatments,
+        compare_treatments_to_control(control, list(treatments.values())),
+        strict=True,
+    ):
+        if treatment_inference is not None and spec.lower_is_better:
+            # "Winning" means moving the metric the good way; for a
+            # lower-is-better metric that's a fall, so the chance of winning is
+            # the chance lift < 0.
+            treatment_inference = replace(
+                treatment_inference,
+                chance_to_win=1.0 - treatment_inference.chance_to_win,
+            )
+        inference[variant_key] = treatment_inference
+    return inference
 
 
-def _infer_treatment(
+def _has_enough_data(
     spec: MetricSpec,
-    control: VariantStats | None,
+    control: VariantStats,
     treatment: VariantStats,
-) -> Inference | None:
-    # Product floor for showing a result at all; compare_to_control applies its
-    # own independent guards (e.g. zero control mean) on top of this.
+) -> bool:
+    # Product floor for showing a result at all; compare_treatments_to_control
+    # applies its own independent guards (e.g. zero control mean) on top of this.
     if (
-        control is None
-        or control.n < RESULTS_MIN_IDENTITIES_PER_VARIANT
+        control.n < RESULTS_MIN_IDENTITIES_PER_VARIANT
         or treatment.n < RESULTS_MIN_IDENTITIES_PER_VARIANT
     ):
-        return None
+        return False
     if spec.aggregation == MetricAggregation.OCCURRENCE and (
         control.sum < RESULTS_MIN_CONVERSIONS_PER_VARIANT
         or treatment.sum < RESULTS_MIN_CONVERSIONS_PER_VARIANT
     ):
-        return None
-    inference = compare_to_control(control, treatment)
-    if inference is not None and spec.lower_is_better:
-        # "Winning" means moving the metric the good way; for a lower-is-better
-        # metric that's a fall, so the chance of winning is the chance lift < 0.
-        inference = replace(inference, chance_to_win=1.0 - inference.chance_to_win)
-    return inference
+        return False
+    return True
 
 
 def _resolve_audit_log_author(
@@ -944,8 +1143,14 @@ def mark_warehouse_delivery_succeeded(connection: WarehouseConnection) -> None:
     connection.save(update_fields=["status", "status_detail"])
 
 
+@dataclass
+class _ObjectDeliveryResult:
+    s3_key: str
+    rows_count: int | None = None
+    error: str | None = None
+
+
 def _deliver_pending_objects(
-    client: ClickHouseHTTPClient,
     *,
     bucket_name: str,
     pending: list[str],
@@ -960,61 +1165,138 @@ def _deliver_pending_objects(
     # keeps delivering, so it must finish first: whatever is left is picked up
     # on the next tick.
     deadline = time.monotonic() + DELIVERY_TIME_BUDGET_SECONDS
-    delivered_count = rejected_count = rows_count = 0
-    for index, s3_key in enumerate(pending):
-        if time.monotonic() > deadline:
-            log.info(
-                "delivery.budget_exhausted",
-                objects__remaining_count=len(pending) - index,
-            )
-            break
+    started_at = time.perf_counter()
+
+    # Workers take the oldest pending object in turn, until the budget runs
+    # out or one of them finds the warehouse unusable.
+    pending_lock = Lock()
+    stop = Event()
+    taken_count = 0
+    budget_exhausted = False
+
+    def take_object() -> str | None:
+        nonlocal taken_count, budget_exhausted
+        with pending_lock:
+            if stop.is_set() or taken_count == len(pending):
+                return None
+            if time.monotonic() > deadline:
+                budget_exhausted = True
+                return None
+            taken_count += 1
+            return pending[taken_count - 1]
+
+    results: list[_ObjectDeliveryResult] = []
+
+    def deliver_objects() -> None:
         try:
-            object_rows_count = warehouse_delivery_service.deliver_object(
-                client,
-                bucket_name,
-                s3_key,
-            )
-        except warehouse_delivery_service.ObjectRejectedError as exc:
-            # This object's contents are the problem; the ones behind it are
-            # still deliverable.
-            warehouse_delivery_service.move_object(
-                bucket_name,
-                s3_key,
-                to_prefix=warehouse_delivery_service.FAILED_PREFIX,
-            )
-            WarehouseDeliveryLog.objects.create(
-                connection=connection,
-                s3_key=s3_key,
-                outcome=WarehouseDeliveryOutcome.REJECTED,
-                error=str(exc),
-            )
-            rejected_count += 1
-            flagsmith_experimentation_warehouse_delivery_objects_total.labels(
-                result="rejected"
-            ).inc()
-            log.error(
-                "delivery.object_rejected",
-                s3__key=s3_key,
-                exc_info=True,
-            )
-            continue
-        warehouse_delivery_service.move_object(
+            # Clients hold a ClickHouse session, which can't run concurrent
+            # queries, so each worker uses its own.
+            with warehouse_delivery_service.delivery_client(connection) as client:
+                while (s3_key := take_object()) is not None:
+                    results.append(
+                        _deliver_pending_object(client, bucket_name, s3_key, log)
+                    )
+        except BaseException:
+            stop.set()
+            raise
+
+    workers_count = min(DELIVERY_MAX_WORKERS, len(pending))
+    with ThreadPoolExecutor(
+        max_workers=workers_count,
+        thread_name_prefix="warehouse-delivery",
+    ) as executor:
+        futures = [executor.submit(deliver_objects) for _ in range(workers_count)]
+
+    if budget_exhausted:
+        log.info(
+            "delivery.budget_exhausted",
+            objects__remaining_count=len(pending) - taken_count,
+        )
+
+    # Objects already moved are recorded even if the run is then aborted.
+    _log_delivery_results(connection, results)
+    for future in futures:
+        if exc := future.exception():
+            raise exc
+
+    return _count_delivery_results(results, started_at=started_at)
+
+
+def _log_delivery_results(
+    connection: WarehouseConnection,
+    results: list[_ObjectDeliveryResult],
+) -> None:
+    WarehouseDeliveryLog.objects.bulk_create(
+        WarehouseDeliveryLog(
+            connection=connection,
+            s3_key=result.s3_key,
+            outcome=(
+                WarehouseDeliveryOutcome.REJECTED
+                if result.error is not None
+                else WarehouseDeliveryOutcome.DELIVERED
+            ),
+            rows_count=result.rows_count,
+            error=result.error,
+        )
+        for result in results
+    )
+
+
+def _count_delivery_results(
+    results: list[_ObjectDeliveryResult],
+    *,
+    started_at: float,
+) -> tuple[int, int, int]:
+    """Return the delivered, rejected and delivered rows counts of a run."""
+    rejected_count = sum(result.error is not None for result in results)
+    delivered_count = len(results) - rejected_count
+    rows_count = sum(result.rows_count or 0 for result in results)
+    if rows_count:
+        flagsmith_experimentation_warehouse_delivery_rows_per_second.observe(
+            rows_count / (time.perf_counter() - started_at)
+        )
+    return delivered_count, rejected_count, rows_count
+
+
+def _deliver_pending_object(
+    client: ClickHouseHTTPClient,
+    bucket_name: str,
+    s3_key: str,
+    log: FilteringBoundLogger,
+) -> _ObjectDeliveryResult:
+    try:
+        rows_count = warehouse_delivery_service.deliver_object(
+            client,
             bucket_name,
             s3_key,
-            to_prefix=warehouse_delivery_service.ARCHIVE_PREFIX,
         )
-        WarehouseDeliveryLog.objects.create(
-            connection=connection,
-            s3_key=s3_key,
-            outcome=WarehouseDeliveryOutcome.DELIVERED,
-            rows_count=object_rows_count,
+    except warehouse_delivery_service.ObjectRejectedError as exc:
+        # This object's contents are the problem; the ones behind it are
+        # still deliverable.
+        warehouse_delivery_service.move_object(
+            bucket_name,
+            s3_key,
+            to_prefix=warehouse_delivery_service.FAILED_PREFIX,
         )
-        rows_count += object_rows_count
-        delivered_count += 1
         flagsmith_experimentation_warehouse_delivery_objects_total.labels(
-            result="delivered"
+            result="rejected"
         ).inc()
-    return delivered_count, rejected_count, rows_count
+        log.error(
+            "delivery.object_rejected",
+            s3__key=s3_key,
+            exc_info=True,
+        )
+        return _ObjectDeliveryResult(s3_key=s3_key, error=str(exc))
+
+    warehouse_delivery_service.move_object(
+        bucket_name,
+        s3_key,
+        to_prefix=warehouse_delivery_service.ARCHIVE_PREFIX,
+    )
+    flagsmith_experimentation_warehouse_delivery_objects_total.labels(
+        result="delivered"
+    ).inc()
+    return _ObjectDeliveryResult(s3_key=s3_key, rows_count=rows_count)
 
 
 def deliver_warehouse_events(
@@ -1037,13 +1319,11 @@ def deliver_warehouse_events(
         return
 
     try:
-        with warehouse_delivery_service.delivery_client(connection) as client:
-            delivered_count, rejected_count, rows_count = _deliver_pending_objects(
-                client,
-                bucket_name=bucket_name,
-                pending=pending,
-                connection=connection,
-            )
+        delivered_count, rejected_count, rows_count = _deliver_pending_objects(
+            bucket_name=bucket_name,
+            pending=pending,
+            connection=connection,
+        )
     except (warehouse_delivery_service.DeliveryConfigError, ClickHouseError) as exc:
         # The warehouse itself is unusable; deliver nothing, leave every
         # remaining object in place for the next run, and surface the
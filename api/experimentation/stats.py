@@ -31,6 +31,15 @@ class VariantStats:
     sum: float  # total of their per-identity values
     sum_squares: float  # total of the squares, used to derive the spread
 
+    def __add__(self, other: "VariantStats") -> "VariantStats":
+        # Totals over separate groups of identities just add up, so stats
+        # gathered per group combine exactly.
+        return VariantStats(
+            n=self.n + other.n,
+            sum=self.sum + other.sum,
+            sum_squares=self.sum_squares + other.sum_squares,
+        )
+
     @property
     def mean(self) -> float:
         return self.sum / self.n
@@ -54,19 +63,46 @@ def compare_to_control(
     control: VariantStats,
     treatment: VariantStats,
 ) -> Inference | None:
+    return compare_treatments_to_control(control, [treatment])[0]
+
+
+def compare_treatments_to_control(
+    control: VariantStats,
+    treatments: Sequence[VariantStats],
+) -> list[Inference | None]:
+    """Compare each treatment against the same control, returning inferences
+    in the same order. Control's part of the uncertainty is worked out once
+    and shared by every treatment."""
     # Inference is undefined without two observations per arm (no spread to
     # measure) or a non-positive control mean (relative lift against it is
     # meaningless, and divides by zero when the mean is exactly zero).
-    if control.n < 2 or treatment.n < 2 or control.mean <= 0:
-        return None
-
-    lift = (treatment.mean - control.mean) / control.mean
+    if control.n < 2 or control.mean <= 0:
+        return [None] * len(treatments)
+
+    control_mean = control.mean
+    # Control's contribution to the variance of every lift, before scaling by
+    # each treatment's own mean (see _compare).
+    control_term = control.variance / (control.n * control_mean**4)
+    return [
+        _compare(control_mean, control_term, treatment) if treatment.n >= 2 else None
+        for treatment in treatments
+    ]
+
+
+def _compare(
+    control_mean: float,
+    control_term: float,
+    treatment: VariantStats,
+) -> Inference:
+    treatment_mean = treatment.mean
+    lift = (treatment_mean - control_mean) / control_mean
     # How uncertain that lift is. Both arms are noisy, so the uncertainty of a
     # ratio combines both; the delta method is the standard approximation, and
     # the arms being independent means there is no covariance term.
-    variance = treatment.variance / (
-        treatment.n * control.mean**2
-    ) + treatment.mean**2 * control.variance / (control.n * control.mean**4)
+    variance = (
+        treatment.variance / (treatment.n * control_mean**2)
+        + treatment_mean**2 * control_term
+    )
     standard_error = math.sqrt(variance)
     if standard_error == 0:
         # No uncertainty (every value identical): the result is exact.
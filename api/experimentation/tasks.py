@@ -1,6 +1,7 @@
 from datetime import timedelta
 
 import structlog
+from django.conf import settings
 from django.utils import timezone
 from task_processor.decorators import (
     register_recurring_task,
@@ -25,6 +26,7 @@ from experimentation.organisation_ingestion_service import (
 )
 from experimentation.services import (
     compute_exposures_summary,
+    compute_incremental_results_summary,
     compute_results_summary,
     deliver_warehouse_events,
 )
@@ -220,11 +222,14 @@ def compute_experiment_results(experiment_id: int) -> None:
 
     as_of = experiment.ended_at or timezone.now()
     try:
-        summary = compute_results_summary(
-            experiment,
-            window_start=experiment.started_at,
-            window_end=as_of,
-        )
+        if settings.EXPERIMENT_RESULTS_ATTRIBUTION_DAYS:
+            summary = compute_incremental_results_summary(results, window_end=as_of)
+        else:
+            summary = compute_results_summary(
+                experiment,
+                window_start=experiment.started_at,
+                window_end=as_of,
+            )
     except Exception as exc:
         results.record_failure()
         logger.error(
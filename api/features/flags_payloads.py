@@ -0,0 +1,124 @@
+"""
+Pre-rendered `/api/v1/flags/` payloads.
+
+When `CACHE_FLAGS_PAYLOADS` is enabled, the final JSON bytes of the flags
+endpoint are rendered whenever an environment is updated, and the endpoint
+serves them without touching the ORM or the serializers.
+
+Payloads are keyed by environment and `Environment.updated_at`, so a payload
+written for a previous version of the environment is never served once the
+environment has been updated.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+from rest_framework.renderers import JSONRenderer
+
+from core.request_origin import RequestOrigin
+from environments.metrics import CACHE_HIT, CACHE_MISS
+from environments.models import Environment
+from features.metrics import flagsmith_flags_payload_cache_queries_total
+from features.versioning.versioning_service import get_environment_flags_list
+
+flags_payloads_cache = caches[settings.FLAGS_PAYLOADS_CACHE_NAME]
+
+HIDE_DISABLED_VARIANT = "HIDE_DISABLED"
+
+
+def get_flags_additional_filters(
+    environment: Environment,
+    origin: RequestOrigin,
+) -> Q:
+    """
+    Get the filters applied to an environment's feature states for the
+    `/api/v1/flags/` endpoint, given the origin of the request.
+    """
+    filters = Q(feature_segment=None, identity=None)
+
+    if environment.get_hide_disabled_flags() is True:
+        return filters & Q(enabled=True)
+
+    if origin is RequestOrigin.CLIENT:
+        return filters & Q(feature__is_server_key_only=False)
+
+    return filters
+
+
+def get_flags_payload(environment: Environment, origin: RequestOrigin) -> bytes:
+    """
+    Get the rendered flags payload for the given environment and request
+    origin, rendering and storing it if it has not been written yet.
+    """
+    cache_key = _get_cache_key(environment, _get_variant(environment, origin))
+    payload: bytes | None = flags_payloads_cache.get(cache_key)
+
+    if not (cache_hit := payload is not None):
+        # Read from the primary database so that we never store a payload
+        # rendered from a lagging replica against the current `updated_at`.
+        payload = render_flags_payload(environment, origin)
+        flags_payloads_cache.set(cache_key, payload)
+
+    flagsmith_flags_payload_cache_queries_total.labels(
+        result=CACHE_HIT if cache_hit else CACHE_MISS,
+    ).inc()
+
+    return payload
+
+
+def render_flags_payload(environment: Environment, origin: RequestOrigin) -> bytes:
+    from features.serializers import SDKFeatureStateSerializer
+
+    feature_states = get_environment_flags_list(
+        environment=environment,
+        additional_filters=get_flags_additional_filters(environment, origin),
+    )
+    data = SDKFeatureStateSerializer(
+        feature_states,
+        many=True,
+        context={"environment": environment},
+    ).data
+    return JSONRenderer().render(data)  # type: ignore[no-any-return]
+
+
+def write_flags_payloads(
+    environment_id: int | None = None,
+    project_id: int | None = None,
+) -> None:
+    """
+    Render and store the flags payloads for every request origin of the given
+    environment, or of every environment in the given project.
+    """
+    environments_filter = (
+        Q(id=environment_id) if environment_id else Q(project_id=project_id)
+    )
+    payloads: dict[str, bytes] = {}
+
+    for environment in Environment.objects.filter(environments_filter).select_related(
+        "project"
+    ):
+        for variant, origin in _get_origins_by_variant(environment).items():
+            payloads[_get_cache_key(environment, variant)] = render_flags_payload(
+                environment, origin
+            )
+
+    if payloads:
+        flags_payloads_cache.set_many(payloads)
+
+
+def _get_variant(environment: Environment, origin: RequestOrigin) -> str:
+    # Hiding disabled flags takes precedence over the request origin,
+    # see `get_flags_additional_filters`.
+    if environment.get_hide_disabled_flags() is True:
+        return HIDE_DISABLED_VARIANT
+    return origin.value
+
+
+def _get_origins_by_variant(
+    environment: Environment,
+) -> dict[str, RequestOrigin]:
+    return {_get_variant(environment, origin): origin for origin in RequestOrigin}
+
+
+def _get_cache_key(environment: Environment, variant: str) -> str:
+    return f"{environment.id}:{environment.updated_at.timestamp()}:{variant}"
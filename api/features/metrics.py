@@ -0,0 +1,7 @@
+import prometheus_client
+
+flagsmith_flags_payload_cache_queries_total = prometheus_client.Counter(
+    "flagsmith_flags_payload_cache_queries_total",
+    "Results of cache retrieval for pre-rendered flags payloads. `result` label is either `hit` or `miss`.",
+    ["result"],
+)
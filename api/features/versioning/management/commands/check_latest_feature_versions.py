@@ -0,0 +1,74 @@
+from argparse import ArgumentParser
+from typing import Any
+
+from django.core.management import BaseCommand, CommandError
+
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LatestEnvironmentFeatureVersion,
+)
+from features.versioning.versioning_service import (
+    get_expected_latest_environment_feature_version,
+    update_latest_environment_feature_version,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that the recorded latest version of every feature in every "
+        "environment matches its version history."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Update inconsistent latest versions.",
+        )
+
+    def handle(self, *args: Any, fix: bool, **options: Any) -> None:
+        recorded_version_uuids = {
+            (environment_id, feature_id): version_uuid
+            for environment_id, feature_id, version_uuid in (
+                LatestEnvironmentFeatureVersion.objects.values_list(
+                    "environment_id", "feature_id", "environment_feature_version_id"
+                ).iterator()
+            )
+        }
+        keys = set(recorded_version_uuids) | set(
+            EnvironmentFeatureVersion.objects.filter(published_at__isnull=False)
+            .values_list("environment_id", "feature_id")
+            .distinct()
+        )
+
+        inconsistent_count = 0
+        for environment_id, feature_id in sorted(keys):
+            expected_version = get_expected_latest_environment_feature_version(
+                environment_id, feature_id
+            )
+            expected_version_uuid = expected_version and expected_version.uuid
+            recorded_version_uuid = recorded_version_uuids.get(
+                (environment_id, feature_id)
+            )
+            if recorded_version_uuid == expected_version_uuid:
+                continue
+
+            inconsistent_count += 1
+            self.stdout.write(
+                f"Environment {environment_id}, feature {feature_id}: "
+                f"recorded {recorded_version_uuid}, expected {expected_version_uuid}."
+            )
+            if fix:
+                update_latest_environment_feature_version(environment_id, feature_id)
+
+        if inconsistent_count and not fix:
+            raise CommandError(
+                f"Found {inconsistent_count} inconsistent latest versions. "
+                "Run with --fix to update them."
+            )
+        self.stdout.write(
+            f"Checked {len(keys)} latest versions, "
+            f"fixed {inconsistent_count} inconsistent ones."
+            if fix
+            else f"Checked {len(keys)} latest versions."
+        )
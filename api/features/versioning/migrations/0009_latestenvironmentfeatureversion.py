@@ -0,0 +1,112 @@
+# Generated by Django 5.2.17 on 2026-10-17 08:03
+
+import django.db.models.deletion
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.utils import timezone
+
+
+def populate_latest_environment_feature_versions(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    environment_feature_version_model = apps.get_model(
+        "feature_versioning", "EnvironmentFeatureVersion"
+    )
+    latest_environment_feature_version_model = apps.get_model(
+        "feature_versioning", "LatestEnvironmentFeatureVersion"
+    )
+
+    now = timezone.now()
+    latest_versions: dict[tuple[int, int], tuple[str, object]] = {}
+    for environment_id, feature_id, version_uuid, live_from in (
+        environment_feature_version_model.objects.filter(
+            published_at__isnull=False, deleted_at__isnull=True
+        )
+        .order_by("live_from")
+        .values_list("environment_id", "feature_id", "uuid", "live_from")
+        .iterator()
+    ):
+        key = (environment_id, feature_id)
+        # Keep the live version or, if none is live yet, the earliest
+        # scheduled one.
+        if key not in latest_versions or live_from <= now:
+            latest_versions[key] = (version_uuid, live_from)
+
+    latest_environment_feature_version_model.objects.bulk_create(
+        [
+            latest_environment_feature_version_model(
+                environment_id=environment_id,
+                feature_id=feature_id,
+                environment_feature_version_id=version_uuid,
+                live_from=live_from,
+            )
+            for (environment_id, feature_id), (
+                version_uuid,
+                live_from,
+            ) in latest_versions.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    # The auto-generated cross-app dependencies are trimmed to the previous
+    # migration only, see 0008_add_last_modified_indexes.
+    dependencies = [
+        ("feature_versioning", "0008_add_last_modified_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LatestEnvironmentFeatureVersion",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("live_from", models.DateTimeField()),
+                (
+                    "environment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="environments.environment",
+                    ),
+                ),
+                (
+                    "environment_feature_version",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="feature_versioning.environmentfeatureversion",
+                    ),
+                ),
+                (
+                    "feature",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="features.feature",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("environment", "feature"),
+                        name="unique_latest_environment_feature_version",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            populate_latest_environment_feature_versions,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
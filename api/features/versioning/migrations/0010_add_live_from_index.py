@@ -0,0 +1,40 @@
+# Generated by Django 5.2.17 on 2026-10-17 08:03
+
+from django.db import migrations, models
+
+from core.migration_helpers import PostgresOnlyRunSQL
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("feature_versioning", "0009_latestenvironmentfeatureversion"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="environmentfeatureversion",
+                    index=models.Index(
+                        condition=models.Q(
+                            ("deleted_at__isnull", True),
+                            ("published_at__isnull", False),
+                        ),
+                        fields=["environment", "feature", "live_from"],
+                        name="efv_env_feature_pub_live_from",
+                    ),
+                ),
+            ],
+            database_operations=[
+                PostgresOnlyRunSQL(
+                    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "efv_env_feature_pub_live_from" '
+                    'ON "feature_versioning_environmentfeatureversion" '
+                    '("environment_id", "feature_id", "live_from") '
+                    'WHERE ("deleted_at" IS NULL AND "published_at" IS NOT NULL);',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "efv_env_feature_pub_live_from";',
+                ),
+            ],
+        ),
+    ]
@@ -117,6 +117,12 @@ class EnvironmentFeatureVersion(  # type: ignore[django-manager-missing]
                 fields=("environment", "feature", "-created_at"),
                 condition=Q(published_at__isnull=False, deleted_at__isnull=True),
             ),
+            # Serve versions going live after their `LatestEnvironmentFeatureVersion`.
+            Index(
+                name="efv_env_feature_pub_live_from",
+                fields=("environment", "feature", "live_from"),
+                condition=Q(published_at__isnull=False, deleted_at__isnull=True),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -197,6 +203,37 @@ class EnvironmentFeatureVersion(  # type: ignore[django-manager-missing]
             environment_feature_version_published.send(self.__class__, instance=self)
 
 
+class LatestEnvironmentFeatureVersion(models.Model):
+    """
+    Points at the live version of a feature in an environment, so flag reads
+    don't have to resolve it from the whole version history.
+
+    When no version is live yet, the earliest scheduled version is recorded
+    instead. Versions going live after the record was last updated are picked
+    up by reads until the `update_latest_environment_feature_versions` task
+    catches up.
+    """
+
+    environment = models.ForeignKey(
+        "environments.Environment", related_name="+", on_delete=models.CASCADE
+    )
+    feature = models.ForeignKey(
+        "features.Feature", related_name="+", on_delete=models.CASCADE
+    )
+    environment_feature_version = models.ForeignKey(
+        EnvironmentFeatureVersion, related_name="+", on_delete=models.CASCADE
+    )
+    live_from = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["environment", "feature"],
+                name="unique_latest_environment_feature_version",
+            )
+        ]
+
+
 class VersionChangeSet(LifecycleModelMixin, SoftDeleteObject):  # type: ignore[misc]
     created_at = models.DateTimeField(auto_now_add=True)  # type: ignore[var-annotated]
     updated_at = models.DateTimeField(auto_now=True)  # type: ignore[var-annotated]
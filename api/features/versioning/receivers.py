@@ -1,4 +1,4 @@
-from django.db.models.signals import post_init, post_save, pre_save
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -12,6 +12,7 @@ from features.versioning.tasks import (
 )
 from features.versioning.versioning_service import (
     get_updated_feature_states_for_version,
+    update_latest_environment_feature_version,
 )
 
 
@@ -32,6 +33,16 @@ def add_existing_feature_states(  # type: ignore[no-untyped-def]
         )
 
 
+@receiver(post_save, sender=EnvironmentFeatureVersion)
+@receiver(post_delete, sender=EnvironmentFeatureVersion)
+def update_latest_version(instance: EnvironmentFeatureVersion, **kwargs) -> None:  # type: ignore[no-untyped-def]
+    # Covers publishing, as well as (soft) deleting, published versions.
+    if instance.published:
+        update_latest_environment_feature_version(
+            instance.environment_id, instance.feature_id
+        )
+
+
 @receiver(pre_save, sender=EnvironmentFeatureVersion)
 def update_live_from(instance: EnvironmentFeatureVersion, **kwargs):  # type: ignore[no-untyped-def]
     if instance.published and not instance.live_from:
@@ -1,29 +1,35 @@
 select
-	efv1."uuid",
-	efv1."published_at",
-	efv1."live_from"
-from
-	feature_versioning_environmentfeatureversion efv1
-join (
+	latest_versions."uuid",
+	latest_versions."published_at",
+	latest_versions."live_from"
+from (
 	select
-		efv2."feature_id",
-		efv2."environment_id",
-		MAX(efv2."live_from") as "latest_release"
+		efv."uuid",
+		efv."published_at",
+		efv."live_from",
+		rank() over (
+			partition by efv."feature_id"
+			order by efv."live_from" desc
+		) as "live_from_rank"
 	from
-		feature_versioning_environmentfeatureversion efv2
+		feature_versioning_latestenvironmentfeatureversion lefv
+	inner join
+		environments_environment e on e.id = lefv.environment_id
+	-- Also matches versions that went live after the recorded one, until
+	-- the record is updated.
+	inner join
+		feature_versioning_environmentfeatureversion efv on
+			efv."environment_id" = lefv."environment_id"
+			and efv."feature_id" = lefv."feature_id"
+			and efv."live_from" >= lefv."live_from"
 	where
-		efv2."deleted_at" is null
-		and efv2."published_at" is not null
-	    and efv2."live_from" <= %(live_from_before)s
-	group by
-		efv2."feature_id",
-		efv2."environment_id"
-) latest_release_dates on
-	efv1."feature_id" = latest_release_dates."feature_id"
-	and efv1."environment_id" = latest_release_dates."environment_id"
-	and efv1."live_from" = latest_release_dates."latest_release"
-inner join
-	environments_environment e on e.id = efv1.environment_id
+		efv."deleted_at" is null
+		and efv."published_at" is not null
+		and efv."live_from" <= %(live_from_before)s
+		and (
+			(%(environment_id)s is not null and lefv.environment_id = %(environment_id)s)
+			or (%(api_key)s is not null and e.api_key = %(api_key)s)
+		)
+) latest_versions
 where
-	(%(environment_id)s is not null and efv1.environment_id = %(environment_id)s)
-	or (%(api_key)s is not null and e.api_key = %(api_key)s);
\ No newline at end of file
+	latest_versions."live_from_rank" = 1;
@@ -1,11 +1,13 @@
 import logging
 import typing
+from datetime import timedelta
 
 from django.conf import settings
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils import timezone
 from task_processor.decorators import (
+    register_recurring_task,
     register_task_handler,
 )
 
@@ -23,12 +25,14 @@ from features.versioning.schemas import (
 )
 from features.versioning.versioning_service import (
     get_environment_flags_queryset,
+    get_outdated_latest_environment_feature_versions,
     get_updated_feature_states_for_version,
+    update_latest_environment_feature_version,
 )
 from users.models import FFAdminUser
 from webhooks import mappers as webhook_mappers
 from webhooks.tasks import call_environment_webhooks, call_organisation_webhooks
-from webhooks.webhooks import WebhookEventType
+from webhooks.webhooks import WebhookEventType, batch_webhook_events
 
 if typing.TYPE_CHECKING:
     from environments.models import Environment
@@ -249,16 +253,19 @@ def trigger_update_version_webhooks(environment_feature_version_uuid: str) -> No
         logger.exception("Feature version has not been published.")
         return
 
-    # Trigger FLAG_UPDATED webhooks for any feature states that have changed
-    _trigger_feature_state_webhooks_for_version(environment_feature_version)
+    with batch_webhook_events():
+        # Trigger FLAG_UPDATED webhooks for any feature states that have changed
+        _trigger_feature_state_webhooks_for_version(environment_feature_version)
 
-    # Then trigger the NEW_VERSION_PUBLISHED webhook as a summary event
-    data = environment_feature_version_webhook_schema.dump(environment_feature_version)
-    call_environment_webhooks(
-        environment_id=environment_feature_version.environment_id,
-        data=data,
-        event_type=WebhookEventType.NEW_VERSION_PUBLISHED.value,
-    )
+        # Then trigger the NEW_VERSION_PUBLISHED webhook as a summary event
+        data = environment_feature_version_webhook_schema.dump(
+            environment_feature_version
+        )
+        call_environment_webhooks(
+            environment_id=environment_feature_version.environment_id,
+            data=data,
+            event_type=WebhookEventType.NEW_VERSION_PUBLISHED.value,
+        )
 
 
 @register_task_handler()
@@ -358,6 +365,21 @@ def publish_version_change_set(
     version_change_set.save()
 
 
+@register_recurring_task(run_every=timedelta(minutes=5))
+def update_latest_environment_feature_versions() -> None:
+    """
+    Catch up on scheduled versions that have gone live, so flag reads don't
+    have to look past the recorded latest versions.
+    """
+    for (
+        environment_id,
+        feature_id,
+    ) in get_outdated_latest_environment_feature_versions().values_list(
+        "environment_id", "feature_id"
+    ):
+        update_latest_environment_feature_version(environment_id, feature_id)
+
+
 def _send_failed_due_to_conflict_alert_to_change_request_author(
     version_change_set: VersionChangeSet,
 ) -> None:
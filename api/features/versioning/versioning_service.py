@@ -1,7 +1,7 @@
 import typing
 
 from common.core.utils import using_database_replica
-from django.db.models import F, Prefetch, Q, QuerySet, Value, Window
+from django.db.models import Exists, F, OuterRef, Prefetch, Q, QuerySet, Value, Window
 from django.db.models.functions import Coalesce, RowNumber
 from django.utils import timezone
 from rest_framework.exceptions import NotFound, ValidationError
@@ -17,7 +17,10 @@ from features.versioning.dataclasses import (
     MultivariateValueChangeSet,
 )
 from features.versioning.exceptions import DirectFeatureStateWriteNotAllowedError
-from features.versioning.models import EnvironmentFeatureVersion
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LatestEnvironmentFeatureVersion,
+)
 
 
 def require_direct_state_write(
@@ -136,6 +139,66 @@ def get_current_live_environment_feature_version(
     )
 
 
+def get_expected_latest_environment_feature_version(
+    environment_id: int, feature_id: int
+) -> EnvironmentFeatureVersion | None:
+    """
+    Get the version a `LatestEnvironmentFeatureVersion` should point at: the
+    current live version or, if none is live yet, the earliest scheduled one.
+    """
+    return get_current_live_environment_feature_version(environment_id, feature_id) or (
+        EnvironmentFeatureVersion.objects.filter(
+            environment_id=environment_id,
+            feature_id=feature_id,
+            published_at__isnull=False,
+        )
+        .order_by("live_from")
+        .first()
+    )
+
+
+def update_latest_environment_feature_version(
+    environment_id: int, feature_id: int
+) -> None:
+    version = get_expected_latest_environment_feature_version(
+        environment_id, feature_id
+    )
+    if not version:
+        LatestEnvironmentFeatureVersion.objects.filter(
+            environment_id=environment_id, feature_id=feature_id
+        ).delete()
+        return
+
+    LatestEnvironmentFeatureVersion.objects.update_or_create(
+        environment_id=environment_id,
+        feature_id=feature_id,
+        defaults={
+            "environment_feature_version": version,
+            "live_from": version.live_from,
+        },
+    )
+
+
+def get_outdated_latest_environment_feature_versions() -> QuerySet[
+    LatestEnvironmentFeatureVersion
+]:
+    """
+    Get the `LatestEnvironmentFeatureVersion` objects superseded by a version
+    that has gone live since they were last updated.
+    """
+    return LatestEnvironmentFeatureVersion.objects.filter(
+        Exists(
+            EnvironmentFeatureVersion.objects.filter(
+                environment_id=OuterRef("environment_id"),
+                feature_id=OuterRef("feature_id"),
+                published_at__isnull=False,
+                live_from__gt=OuterRef("live_from"),
+                live_from__lte=timezone.now(),
+            )
+        )
+    )
+
+
 def update_flag(
     environment: Environment, feature: Feature, change_set: FlagChangeSet
 ) -> FeatureState:
@@ -18,6 +18,7 @@ from django.db.models import (
     Value,
     When,
 )
+from django.http import HttpResponse
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
@@ -39,13 +40,12 @@ from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from app.pagination import CustomPagination
+from app.pagination import KeysetPagination
 from app_analytics.analytics_db_service import get_feature_evaluation_data
 from app_analytics.influxdb_wrapper import get_multiple_event_list_for_feature
 from app_analytics.mappers import map_request_to_sdk_label
 from app_analytics.throttles import InfluxQueryThrottle
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER, SDK_ENVIRONMENT_KEY_HEADER
-from core.request_origin import RequestOrigin
 from edge_api.identities.edge_identity_service import (
     get_overridden_feature_ids_for_edge_identity,
 )
@@ -76,6 +76,7 @@ from webhooks.webhooks import WebhookEventType
 
 from .constants import INTERSECTION, UNION
 from .features_service import get_overrides_data
+from .flags_payloads import get_flags_additional_filters, get_flags_payload
 from .models import Feature, FeatureSegment, FeatureState
 from .multivariate.serializers import (
     FeatureMVOptionsValuesResponseSerializer,
@@ -169,7 +170,7 @@ def get_feature_by_uuid(request, uuid):  # type: ignore[no-untyped-def]
 )
 class FeatureViewSet(viewsets.ModelViewSet):  # type: ignore[type-arg]
     permission_classes = [FeaturePermissions]
-    pagination_class = CustomPagination
+    pagination_class = KeysetPagination
 
     def get_serializer_class(self):  # type: ignore[no-untyped-def]
         return {
@@ -1060,6 +1061,15 @@ class SDKFeatureStates(GenericAPIView):  # type: ignore[type-arg]
 
             return Response(self.get_serializer(feature_states[0]).data)
 
+        updated_at = self.request.environment.updated_at
+
+        if settings.CACHE_FLAGS_PAYLOADS:
+            return HttpResponse(
+                get_flags_payload(request.environment, request.originated_from),
+                content_type="application/json",
+                headers={FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()},
+            )
+
         if settings.CACHE_FLAGS_SECONDS > 0:
             data = self._get_flags_from_cache(request.environment, from_replica=True)
         else:
@@ -1072,7 +1082,6 @@ class SDKFeatureStates(GenericAPIView):  # type: ignore[type-arg]
                 many=True,
             ).data
 
-        updated_at = self.request.environment.updated_at
         return Response(
             data,
             headers={FLAGSMITH_UPDATED_AT_HEADER: updated_at.timestamp()},
@@ -1080,15 +1089,9 @@ class SDKFeatureStates(GenericAPIView):  # type: ignore[type-arg]
 
     @property
     def _additional_filters(self) -> Q:
-        filters = Q(feature_segment=None, identity=None)
-
-        if self.request.environment.get_hide_disabled_flags() is True:
-            return filters & Q(enabled=True)
-
-        if self.request.originated_from is RequestOrigin.CLIENT:
-            return filters & Q(feature__is_server_key_only=False)
-
-        return filters
+        return get_flags_additional_filters(
+            self.request.environment, self.request.originated_from
+        )
 
     def _get_flags_from_cache(
         self,
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from mypy_boto3_s3.client import S3Client
 from django.core import serializers
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db.models import F, Model, Q
+from django.db.models import F, Max, Model, Q
 
 from edge_api.identities.export import export_edge_identity_and_overrides
 from environments.identities.models import Identity
@@ -69,6 +69,14 @@ class S3OrganisationExporter:
         bucket_name: str,
         key: str,
     ) -> None:
+        """
+        Stream the export to S3 as a multipart upload of `MIN_PART_SIZE` parts,
+        so memory use is bound by the part size rather than the organisation.
+
+        Keys ending in `.jsonl` (or `.jsonl.gz`) are written as newline
+        delimited JSON, which can be imported without loading the whole file,
+        and keys ending in `.gz` are gzip compressed.
+        """
         data = full_export(organisation_id)
         logger.debug("Starting streaming export for organisation.")
 
@@ -82,16 +90,37 @@ class S3OrganisationExporter:
             encoding="utf-8",
             transport_params=transport_params,
         ) as fout:
-            fout.write("[")
-            for index, item in enumerate(data):
-                if index:
-                    fout.write(",")
-                fout.write(json.dumps(item, cls=DjangoJSONEncoder))
-            fout.write("]")
+            for chunk in serialize_export(data, jsonl=is_jsonl_export(key)):
+                fout.write(chunk)
 
         logger.info("Finished streaming data export to S3.")
 
 
+def is_jsonl_export(file_name: str) -> bool:
+    return file_name.removesuffix(".gz").endswith(".jsonl")
+
+
+def serialize_export(
+    data: Iterator[dict[str, typing.Any]],
+    jsonl: bool = False,
+) -> Iterator[str]:
+    """
+    Serialize exported objects one at a time, either as newline delimited
+    JSON or as a JSON array.
+    """
+    if jsonl:
+        for item in data:
+            yield json.dumps(item, cls=DjangoJSONEncoder) + "\n"
+        return
+
+    yield "["
+    for index, item in enumerate(data):
+        if index:
+            yield ","
+        yield json.dumps(item, cls=DjangoJSONEncoder)
+    yield "]"
+
+
 def full_export(
     organisation_id: int,
 ) -> Iterator[dict[str, typing.Any]]:
@@ -202,34 +231,32 @@ def export_environments(
 def export_identities(
     organisation_id: int,
 ) -> Iterator[dict[str, typing.Any]]:
-    # We export the traits first so that we take a 'snapshot' before exporting the
-    # identities, otherwise we end up with issues where new traits are created for new
-    # identities during the export process and the identity doesn't exist in the import.
-    # We then need to reverse the order so that the identities are imported first.
-    traits = list(
-        _export_entities(
-            _EntityExportConfig(
-                Trait,
-                Q(
-                    identity__environment__project__organisation__id=organisation_id,
-                    identity__environment__project__enable_dynamo_db=False,
-                ),
-            ),
-        )
+    identities_filter = Q(
+        environment__project__organisation__id=organisation_id,
+        environment__project__enable_dynamo_db=False,
     )
+    # We only export identities, and their traits, that existed when the export
+    # started, otherwise we end up with issues where new traits are created for
+    # new identities during the export process and the identity doesn't exist in
+    # the import. Bounding by id avoids holding the traits in memory as a snapshot.
+    max_identity_id = Identity.objects.filter(identities_filter).aggregate(
+        max_id=Max("id")
+    )["max_id"]
+    if max_identity_id is None:
+        return
 
     yield from _export_entities(
+        _EntityExportConfig(Identity, identities_filter & Q(id__lte=max_identity_id)),
         _EntityExportConfig(
-            Identity,
+            Trait,
             Q(
-                environment__project__organisation__id=organisation_id,
-                environment__project__enable_dynamo_db=False,
+                identity__environment__project__organisation__id=organisation_id,
+                identity__environment__project__enable_dynamo_db=False,
+                identity_id__lte=max_identity_id,
             ),
         ),
     )
 
-    yield from traits
-
 
 def export_edge_identities(
     organisation_id: int,
@@ -237,12 +264,7 @@ def export_edge_identities(
     for environment in Environment.objects.filter(
         project__organisation__id=organisation_id, project__enable_dynamo_db=True
     ):
-        exported_identities, exported_traits, exported_overrides = (
-            export_edge_identity_and_overrides(environment.api_key)
-        )
-        yield from exported_identities
-        yield from exported_traits
-        yield from exported_overrides
+        yield from export_edge_identity_and_overrides(environment.api_key)
 
 
 def export_features(
@@ -252,19 +274,13 @@ def export_features(
     Export all features and related entities, except ChangeRequests.
     """
 
-    # Buffer feature states because we need to modify them (remove change_request FK)
-    # and they need to be imported after Feature, EnvironmentFeatureVersion, etc.
-    feature_states: list[dict[str, typing.Any]] = []
-    for feature_state in _export_entities(
-        _EntityExportConfig(
-            FeatureState, Q(feature__project__organisation__id=organisation_id)
-        )
-    ):
-        # Since we're not exporting any user objects, we want to exclude change
-        # requests from the export. This means, however, that we need to remove the
-        # FK dependency on the change request from the FeatureState before export.
-        feature_state["fields"]["change_request"] = None
-        feature_states.append(feature_state)
+    # Feature states need to be imported after Feature, EnvironmentFeatureVersion,
+    # etc. but we only export those that existed before exporting them, bounding
+    # by id rather than holding the feature states in memory as a snapshot.
+    feature_states_filter = Q(feature__project__organisation__id=organisation_id)
+    max_feature_state_id = FeatureState.objects.filter(feature_states_filter).aggregate(
+        max_id=Max("id")
+    )["max_id"]
 
     yield from _export_entities(
         _EntityExportConfig(
@@ -288,7 +304,18 @@ def export_features(
     )
 
     # Feature states need to be imported in correct order (after features)
-    yield from feature_states
+    if max_feature_state_id is not None:
+        for feature_state in _export_entities(
+            _EntityExportConfig(
+                FeatureState, feature_states_filter & Q(id__lte=max_feature_state_id)
+            )
+        ):
+            # Since we're not exporting any user objects, we want to exclude change
+            # requests from the export. This means, however, that we need to remove
+            # the FK dependency on the change request from the FeatureState before
+            # export.
+            feature_state["fields"]["change_request"] = None
+            yield feature_state
 
     yield from _export_entities(
         _EntityExportConfig(
@@ -1,9 +1,12 @@
 import logging
+import os
 import uuid
 
 import boto3
 from django.core.management import call_command
 
+from import_export.export import is_jsonl_export
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,18 +27,33 @@ class OrganisationImporter:
         call_command function. We store it in /tmp/ with a unique uuid and remove it
         after, regardless of the success of the task to ensure we're not clogging up
         the task's storage.
+
+        The file is downloaded in chunks, and newline delimited (`.jsonl`, or
+        `.jsonl.gz`) exports are loaded one object at a time, so that large
+        exports can be imported without holding them in memory.
         """
 
         logger.info("Starting organisation import.")
 
-        obj = self._s3_client.get_object(Bucket=s3_bucket, Key=s3_key)
-        file_path = f"/tmp/{uuid.uuid4()}.json"
+        file_path = f"/tmp/{uuid.uuid4()}{_get_fixture_extension(s3_key)}"
+
+        try:
+            with open(file_path, "wb") as f:
+                logger.debug("Writing file to '%s'", file_path)
+                self._s3_client.download_fileobj(s3_bucket, s3_key, f)
+                logger.debug("Finished writing file.")
 
-        with open(file_path, "a+") as f:
-            logger.debug("Writing file to '%s'", file_path)
-            f.write(obj["Body"].read().decode("utf-8"))
-            logger.debug("Finished writing file.")
-            f.seek(0)
             logger.debug("Calling loaddata")
-            call_command("loaddata", f.name, format="json")
+            call_command("loaddata", file_path)
             logger.debug("Finished loading data")
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+
+def _get_fixture_extension(s3_key: str) -> str:
+    # loaddata infers the format, and compression, from the file extension.
+    extension = ".jsonl" if is_jsonl_export(s3_key) else ".json"
+    if s3_key.endswith(".gz"):
+        extension += ".gz"
+    return extension
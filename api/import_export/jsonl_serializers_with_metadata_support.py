@@ -0,0 +1,26 @@
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.jsonl import Deserializer as JsonlDeserializer
+from django.core.serializers.jsonl import Serializer as JsonlSerializer
+
+from import_export.json_serializers_with_metadata_support import (
+    resolve_metadata_object_ids,
+)
+
+# We do not override the Serializer but this module must define it
+Serializer = JsonlSerializer
+
+
+def Deserializer(stream_or_string, **options):  # type: ignore[no-untyped-def]
+    # Unlike the json deserializer, objects are deserialized one line at a
+    # time so that large exports can be imported without loading them whole.
+    try:
+        yield from resolve_metadata_object_ids(
+            JsonlDeserializer(stream_or_string, **options)
+        )
+
+    except GeneratorExit:
+        raise
+    except DeserializationError:
+        raise
+    except Exception as exc:
+        raise DeserializationError() from exc
@@ -1,10 +1,8 @@
-import json
 import logging
 
 from django.core.management import BaseCommand, CommandParser
-from django.core.serializers.json import DjangoJSONEncoder
 
-from import_export.export import full_export
+from import_export.export import full_export, serialize_export
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +17,10 @@ class Command(BaseCommand):
         parser.add_argument(
             "file-location",
             type=str,
-            help="Full path to file in which to write organisation data.",
+            help=(
+                "Full path to file in which to write organisation data. Paths "
+                "ending in .jsonl are written as newline delimited JSON."
+            ),
         )
 
     def handle(self, *args, **options):  # type: ignore[no-untyped-def]
@@ -29,6 +30,7 @@ class Command(BaseCommand):
         logger.info("Dumping organisation '%d' to '%s'", organisation_id, file_location)
 
         with open(file_location, "a+") as output_file:
-            output_file.write(
-                json.dumps(full_export(organisation_id), cls=DjangoJSONEncoder)
-            )
+            for chunk in serialize_export(
+                full_export(organisation_id), jsonl=file_location.endswith(".jsonl")
+            ):
+                output_file.write(chunk)
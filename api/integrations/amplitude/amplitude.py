@@ -15,20 +15,32 @@ AmplitudeUserData: typing.TypeAlias = dict[str, typing.Any]
 
 logger = logging.getLogger(__name__)
 
+# Shared by all Amplitude wrappers in the process, so connections are kept alive.
+session = requests.Session()
+
 
 class AmplitudeWrapper(AbstractBaseIdentityIntegrationWrapper[AmplitudeUserData]):
+    # The Identify API accepts a list of identifications.
+    max_batch_size = 50
+
     def __init__(self, config: AmplitudeConfiguration):
         self.api_key = config.api_key
         self.url = f"{config.base_url}/identify"
 
     def _identify_user(self, user_data: AmplitudeUserData) -> None:
-        payload = {"api_key": self.api_key, "identification": json.dumps([user_data])}
+        self.identify_users([user_data])
 
-        response = requests.post(self.url, data=payload)
+    def identify_users(self, users_data: list[AmplitudeUserData]) -> None:
+        payload = {"api_key": self.api_key, "identification": json.dumps(users_data)}
+
+        response = session.post(self.url, data=payload)
         logger.debug(
             "Sent event to Amplitude. Response code was: %s" % response.status_code
         )
 
+    def get_batch_key(self) -> typing.Hashable:
+        return type(self), self.api_key, self.url
+
     def generate_user_data(
         self,
         identity: Identity,
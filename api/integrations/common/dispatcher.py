@@ -0,0 +1,175 @@
+"""
+In-process dispatcher sending identify events to identity integrations.
+
+Events are queued per process and sent by a single background thread, which
+groups the events queued within `IDENTITY_INTEGRATIONS_FLUSH_INTERVAL_SECONDS`
+by integration configuration so that integrations with batch APIs receive
+them in bulk. Batches are sent by a bounded pool of threads, rather than by
+a new thread per event.
+
+The queue holds at most `IDENTITY_INTEGRATIONS_QUEUE_SIZE` events; events
+beyond that are dropped until the queue drains.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock, Thread
+
+from django.conf import settings
+
+from integrations.metrics import (
+    flagsmith_identity_integrations_batch_size,
+    flagsmith_identity_integrations_dropped_total,
+)
+
+if typing.TYPE_CHECKING:
+    from integrations.common.wrapper import (
+        AbstractBaseIdentityIntegrationWrapper,
+    )
+
+logger = logging.getLogger(__name__)
+
+_Event = tuple["AbstractBaseIdentityIntegrationWrapper[typing.Any]", typing.Any]
+
+
+class IdentifyDispatcher:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._queue: queue.Queue[_Event] = queue.Queue(
+            maxsize=settings.IDENTITY_INTEGRATIONS_QUEUE_SIZE
+        )
+        self._executor: ThreadPoolExecutor | None = None
+        # Bounds the batches waiting to be sent, so that a slow integration
+        # fills the queue, and drops events, instead of growing memory.
+        self._pending_batches = BoundedSemaphore(
+            settings.IDENTITY_INTEGRATIONS_DISPATCH_WORKERS * 2
+        )
+        self._pid: int | None = None
+
+    def dispatch(
+        self,
+        wrapper: "AbstractBaseIdentityIntegrationWrapper[typing.Any]",
+        user_data: typing.Any,
+    ) -> None:
+        if not settings.ENABLE_POSTPONE_DECORATOR:
+            self._send(wrapper, [user_data])
+            return
+
+        if self._pid != os.getpid():
+            self._start()
+
+        try:
+            self._queue.put_nowait((wrapper, user_data))
+        except queue.Full:
+            flagsmith_identity_integrations_dropped_total.labels(
+                integration=type(wrapper).__name__,
+            ).inc()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                # Forked from a process that was already dispatching; its
+                # queued events are sent by the parent.
+                self._reset()
+            self._pid = os.getpid()
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.IDENTITY_INTEGRATIONS_DISPATCH_WORKERS,
+                thread_name_prefix="identity-integrations-sender",
+            )
+            Thread(
+                target=self._run,
+                name="identity-integrations-dispatcher",
+                daemon=True,
+            ).start()
+        atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            events = [self._queue.get()]
+            events.extend(self._get_events(self._get_flush_deadline()))
+            try:
+                self._submit(events)
+            except Exception:
+                logger.exception("Failed to dispatch identify events.")
+
+    def _get_flush_deadline(self) -> float:
+        return time.monotonic() + settings.IDENTITY_INTEGRATIONS_FLUSH_INTERVAL_SECONDS
+
+    def _get_events(self, deadline: float | None = None) -> list[_Event]:
+        events = []
+        while len(events) < settings.IDENTITY_INTEGRATIONS_BATCH_SIZE:
+            try:
+                if deadline is None:
+                    events.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                events.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return events
+
+    def flush(self) -> None:
+        """
+        Send the events queued in this process, blocking until they are sent.
+        """
+        if self._pid != os.getpid():
+            return
+        while events := self._get_events():
+            for wrapper, batch in _group_events(events):
+                self._send(wrapper, batch)
+
+    def _submit(self, events: list[_Event]) -> None:
+        assert self._executor
+        for wrapper, batch in _group_events(events):
+            self._pending_batches.acquire()
+            future = self._executor.submit(self._send, wrapper, batch)
+            future.add_done_callback(lambda _: self._pending_batches.release())
+
+    def _send(
+        self,
+        wrapper: "AbstractBaseIdentityIntegrationWrapper[typing.Any]",
+        batch: list[typing.Any],
+    ) -> None:
+        flagsmith_identity_integrations_batch_size.labels(
+            integration=type(wrapper).__name__,
+        ).observe(len(batch))
+        try:
+            wrapper.identify_users(batch)
+        except Exception:
+            logger.exception(
+                "Failed to send identify events to %s.", type(wrapper).__name__
+            )
+
+
+def _group_events(
+    events: list[_Event],
+) -> typing.Iterator[
+    tuple["AbstractBaseIdentityIntegrationWrapper[typing.Any]", list[typing.Any]]
+]:
+    # Events for the same integration configuration are sent by the first
+    # wrapper queued for it, in chunks the integration accepts.
+    batches: dict[
+        typing.Hashable,
+        tuple["AbstractBaseIdentityIntegrationWrapper[typing.Any]", list[typing.Any]],
+    ] = {}
+    for wrapper, user_data in events:
+        batches.setdefault(wrapper.get_batch_key(), (wrapper, []))[1].append(user_data)
+
+    for wrapper, user_data in batches.values():
+        for index in range(0, len(user_data), wrapper.max_batch_size):
+            yield wrapper, user_data[index : index + wrapper.max_batch_size]
+
+
+identify_dispatcher = IdentifyDispatcher()
@@ -1,6 +1,7 @@
 import typing
 from abc import ABC, abstractmethod
 
+from integrations.common.dispatcher import identify_dispatcher
 from util.util import postpone
 
 if typing.TYPE_CHECKING:
@@ -28,13 +29,28 @@ class AbstractBaseEventIntegrationWrapper(ABC):
 
 
 class AbstractBaseIdentityIntegrationWrapper(ABC, typing.Generic[T]):
+    # Maximum number of users sent to the integration in a single request by
+    # `identify_users`. Integrations without a batch API send one at a time.
+    max_batch_size: int = 1
+
     @abstractmethod
     def _identify_user(self, user_data: T) -> None:
         raise NotImplementedError()
 
-    @postpone  # type: ignore[misc]
     def identify_user_async(self, data: T) -> None:
-        self._identify_user(data)
+        identify_dispatcher.dispatch(self, data)
+
+    def identify_users(self, users_data: list[T]) -> None:
+        for user_data in users_data:
+            self._identify_user(user_data)
+
+    def get_batch_key(self) -> typing.Hashable:
+        """
+        Identify events of wrappers with the same batch key are sent together,
+        using the first of the wrappers, so this must identify the
+        integration configuration the events are sent with.
+        """
+        return id(self)
 
     @abstractmethod
     def generate_user_data(
@@ -13,6 +13,9 @@ from .models import HeapConfiguration
 
 logger = logging.getLogger(__name__)
 
+# Shared by all Heap wrappers in the process, so connections are kept alive.
+session = requests.Session()
+
 
 class HeapWrapper(AbstractBaseIdentityIntegrationWrapper):  # type: ignore[type-arg]
     def __init__(self, config: HeapConfiguration):
@@ -21,7 +24,7 @@ class HeapWrapper(AbstractBaseIdentityIntegrationWrapper):  # type: ignore[type-
         self.url = f"{base_url}/api/track"
 
     def _identify_user(self, user_data: dict) -> None:  # type: ignore[type-arg]
-        response = requests.post(self.url, json=user_data)
+        response = session.post(self.url, json=user_data)
         logger.debug("Sent event to Heap. Response code was: %s" % response.status_code)
 
     def generate_user_data(
@@ -0,0 +1,17 @@
+import prometheus_client
+
+flagsmith_identity_integrations_dropped_total = prometheus_client.Counter(
+    "flagsmith_identity_integrations_dropped_total",
+    "Identify events dropped because the in-process identity integrations queue "
+    "reached `IDENTITY_INTEGRATIONS_QUEUE_SIZE` events. "
+    "`integration` label is the name of the integration wrapper.",
+    ["integration"],
+)
+
+flagsmith_identity_integrations_batch_size = prometheus_client.Histogram(
+    "flagsmith_identity_integrations_batch_size",
+    "Number of identify events sent to an integration in a single batch. "
+    "`integration` label is the name of the integration wrapper.",
+    ["integration"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
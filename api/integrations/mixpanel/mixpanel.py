@@ -16,8 +16,14 @@ MixpanelUserData: typing.TypeAlias = list[dict[str, typing.Any]]
 
 logger = logging.getLogger(__name__)
 
+# Shared by all Mixpanel wrappers in the process, so connections are kept alive.
+session = requests.Session()
+
 
 class MixpanelWrapper(AbstractBaseIdentityIntegrationWrapper[MixpanelUserData]):
+    # The Engage API accepts a list of profile updates.
+    max_batch_size = 50
+
     def __init__(self, config: MixpanelConfiguration):
         self.api_key = config.api_key
         base_url = (config.base_url or DEFAULT_MIXPANEL_API_URL).rstrip("/")
@@ -30,12 +36,20 @@ class MixpanelWrapper(AbstractBaseIdentityIntegrationWrapper[MixpanelUserData]):
         }
 
     def _identify_user(self, user_data: MixpanelUserData) -> None:
-        response = requests.post(self.url, headers=self.headers, json=user_data)
+        response = session.post(self.url, headers=self.headers, json=user_data)
         logger.debug(
             "Sent event to Mixpanel. Response code was: %s" % response.status_code
         )
         logger.debug("Sent event to Mixpanel. Response content was: %s" % response.text)
 
+    def identify_users(self, users_data: list[MixpanelUserData]) -> None:
+        self._identify_user(
+            [profile_update for user_data in users_data for profile_update in user_data]
+        )
+
+    def get_batch_key(self) -> typing.Hashable:
+        return type(self), self.api_key, self.url
+
     def generate_user_data(
         self,
         identity: Identity,
@@ -14,7 +14,12 @@ logger = logging.getLogger(__name__)
 
 
 class SegmentWrapper(AbstractBaseIdentityIntegrationWrapper):  # type: ignore[type-arg]
+    # The client sends queued messages to the Batch API, 100 at a time.
+    max_batch_size = 100
+
     def __init__(self, config: SegmentConfiguration):
+        self.api_key = config.api_key
+        self.base_url = config.base_url
         self.analytics = SegmentClient(
             write_key=config.api_key, sync_mode=True, host=config.base_url
         )
@@ -22,6 +27,21 @@ class SegmentWrapper(AbstractBaseIdentityIntegrationWrapper):  # type: ignore[ty
     def _identify_user(self, data: dict) -> None:  # type: ignore[type-arg]
         self.analytics.identify(**data)
 
+    def identify_users(self, users_data: list[dict]) -> None:  # type: ignore[type-arg]
+        if len(users_data) == 1:
+            self._identify_user(users_data[0])
+            return
+
+        # Queue the messages on an asynchronous client, and block until its
+        # consumer has sent them in batches.
+        batch_client = SegmentClient(write_key=self.api_key, host=self.base_url)
+        for data in users_data:
+            batch_client.identify(**data)
+        batch_client.shutdown()
+
+    def get_batch_key(self) -> typing.Hashable:
+        return type(self), self.api_key, self.base_url
+
     def generate_user_data(
         self,
         identity: Identity,
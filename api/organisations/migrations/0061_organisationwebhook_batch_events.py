@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organisations", "0060_add_targeting_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organisationwebhook",
+            name="batch_events",
+            field=models.BooleanField(
+                default=False,
+                help_text="Deliver events triggered together in a single batch payload.",
+            ),
+        ),
+    ]
@@ -188,15 +188,16 @@ class Organisation(LifecycleModelMixin, SoftDeleteExportableModel):  # type: ign
 
     @hook(AFTER_SAVE)
     def clear_environment_caches(self):  # type: ignore[no-untyped-def]
+        from environments.local_cache import publish_environment_cache_versions
         from environments.models import Environment
 
-        environment_cache.delete_many(
-            list(
-                Environment.objects.filter(project__organisation=self).values_list(
-                    "api_key", flat=True
-                )
+        api_keys = list(
+            Environment.objects.filter(project__organisation=self).values_list(
+                "api_key", flat=True
             )
         )
+        environment_cache.delete_many(api_keys)
+        publish_environment_cache_versions(api_keys)
 
     @hook(AFTER_SAVE, when="stop_serving_flags", has_changed=True)
     def rebuild_environments(self):  # type: ignore[no-untyped-def]
@@ -491,6 +492,10 @@ class Subscription(LifecycleModelMixin, SoftDeleteExportableModel):  # type: ign
 class OrganisationWebhook(AbstractBaseExportableWebhookModel):
     name = models.CharField(max_length=100)
     enabled = models.BooleanField(default=True)
+    batch_events = models.BooleanField(
+        default=False,
+        help_text="Deliver events triggered together in a single batch payload.",
+    )
     organisation = models.ForeignKey(
         Organisation, on_delete=models.CASCADE, related_name="webhooks"
     )
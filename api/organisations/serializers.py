@@ -250,7 +250,15 @@ class PortalUrlSerializer(serializers.Serializer):  # type: ignore[type-arg]
 class OrganisationWebhookSerializer(serializers.ModelSerializer):  # type: ignore[type-arg]
     class Meta:
         model = OrganisationWebhook
-        fields = ("id", "url", "enabled", "secret", "created_at", "updated_at")
+        fields = (
+            "id",
+            "url",
+            "enabled",
+            "batch_events",
+            "secret",
+            "created_at",
+            "updated_at",
+        )
         read_only_fields = ("id",)
 
 
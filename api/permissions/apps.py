@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class PermissionsConfig(AppConfig):
+    name = "permissions"
+
+    def ready(self):  # type: ignore[no-untyped-def]
+        from . import receivers  # noqa
@@ -15,6 +15,11 @@ from .rbac_wrapper import (  # type: ignore[attr-defined]
     is_master_api_key_object_admin,
     master_api_key_has_organisation_permission_using_roles,
 )
+from .user_permissions import (
+    ObjectPermissions,
+    UserPermissions,
+    get_user_permissions,
+)
 
 if TYPE_CHECKING:
     from api_keys.models import MasterAPIKey
@@ -88,6 +93,13 @@ def get_permitted_projects_for_user(
         tag_ids=tag_ids,
     )
 
+    if (user_permissions := get_user_permissions(user)) is not None:
+        return Project.objects.filter(
+            Q(id__in=project_ids_from_base_filter)
+            | Q(organisation_id__in=user_permissions.admin_organisation_ids),
+            organisation_id__in=user_permissions.organisation_ids,
+        )
+
     # The user has access to any projects belonging to organisations
     # they are an admin of
     admin_organisations_filter = Q(
@@ -166,7 +178,11 @@ def get_permitted_environments_for_user(
         queryset = queryset.prefetch_related("metadata")
 
     # Final check to ensure the user is a member of the organisation
-    queryset = queryset.filter(project__organisation__users=user)
+    if (user_permissions := get_user_permissions(user)) is not None:
+        if not user_permissions.is_organisation_member(project.organisation_id):
+            queryset = queryset.none()
+    else:
+        queryset = queryset.filter(project__organisation__users=user)
 
     # Description is defered due to Oracle support where a
     # query can't have a where clause if description is in
@@ -213,6 +229,12 @@ def user_has_organisation_permission(
     if is_user_organisation_admin(user, organisation):
         return True
 
+    if (user_permissions := get_user_permissions(user)) is not None:
+        # Direct, group and role permissions, in organisations the user belongs to.
+        return organisation.id in user_permissions.get_permitted_ids(
+            user_permissions.organisations, permission_key, allow_admin=False
+        )
+
     # Check: verify user belongs to the organisation
     if not Organisation.objects.filter(id=organisation.id, users=user).exists():
         return False
@@ -272,6 +294,12 @@ def _is_user_object_admin(
     model_class = type(object_)
     object_id = object_.id
 
+    if (user_permissions := get_user_permissions(user)) is not None:
+        # Direct, group and role permissions, in organisations the user belongs to.
+        return object_id in user_permissions.get_permitted_ids(
+            _get_object_permissions(user_permissions, model_class)
+        )
+
     # Check: verify user belongs to the organisation that owns this object
     if model_class is Project:
         if not Project.objects.filter(id=object_id, organisation__users=user).exists():
@@ -305,6 +333,17 @@ def _is_user_object_admin(
     return False
 
 
+def _get_object_permissions(
+    user_permissions: UserPermissions,
+    model_class: type[Union[Organisation, Project, Environment]],
+) -> dict[int, ObjectPermissions]:
+    if model_class is Organisation:
+        return user_permissions.organisations
+    if model_class is Project:
+        return user_permissions.projects
+    return user_permissions.environments
+
+
 def get_base_permission_filter(  # type: ignore[no-untyped-def]
     user: "FFAdminUser",
     for_model: Union[Organisation, Project, Environment] = None,  # type: ignore[assignment]
@@ -329,6 +368,14 @@ def get_object_id_from_base_permission_filter(  # type: ignore[no-untyped-def]
     allow_admin: bool = True,
     tag_ids=None,
 ) -> Set[int]:
+    if (user_permissions := get_user_permissions(user)) is not None:
+        return user_permissions.get_permitted_ids(
+            _get_object_permissions(user_permissions, for_model),  # type: ignore[arg-type]
+            permission_key,
+            allow_admin,
+            tag_ids,
+        )
+
     object_ids = set()
     user_filter = get_user_permission_filter(user, permission_key, allow_admin)
     object_ids.update(
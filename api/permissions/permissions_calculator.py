@@ -26,6 +26,7 @@ from .rbac_wrapper import (  # type: ignore[attr-defined]
 
 if typing.TYPE_CHECKING:
     from environments.models import Environment
+    from permissions.user_permissions import ObjectPermissions
     from users.models import FFAdminUser
 
 UserPermissionType = typing.Union[
@@ -240,6 +241,14 @@ class _UserDetailedPermissionBuilder:
 def get_organisation_permission_data(
     organisation_id: int, user: "FFAdminUser"
 ) -> PermissionData:
+    from permissions.user_permissions import get_user_permissions
+
+    if (user_permissions := get_user_permissions(user)) is not None:
+        return _get_materialized_permission_data(
+            user_permissions.organisations.get(organisation_id),
+            is_organisation_admin=user.is_organisation_admin(organisation_id),
+        )
+
     org_permission_svc = _OrganisationPermissionService(organisation_id, user.id)
     return PermissionData(
         is_organisation_admin=user.is_organisation_admin(organisation_id),
@@ -252,6 +261,14 @@ def get_organisation_permission_data(
 def get_project_permission_data(
     project: Project, user: "FFAdminUser"
 ) -> PermissionData:
+    from permissions.user_permissions import get_user_permissions
+
+    if (user_permissions := get_user_permissions(user)) is not None:
+        return _get_materialized_permission_data(
+            user_permissions.projects.get(project.id),
+            is_organisation_admin=user.is_organisation_admin(project.organisation_id),
+        )
+
     project_permission_svc = _ProjectPermissionService(project.id, user.id)
     return PermissionData(
         is_organisation_admin=user.is_organisation_admin(project.organisation_id),
@@ -264,6 +281,25 @@ def get_project_permission_data(
 def get_environment_permission_data(
     environment: "Environment", user: "FFAdminUser"
 ) -> PermissionData:
+    from permissions.user_permissions import get_user_permissions
+
+    if (user_permissions := get_user_permissions(user)) is not None:
+        permission_data = _get_materialized_permission_data(
+            user_permissions.environments.get(environment.id),
+            is_organisation_admin=user.is_organisation_admin(
+                environment.project.organisation_id
+            ),
+        )
+        if project_permissions := user_permissions.projects.get(environment.project_id):
+            permission_data.inherited_admin_groups = [
+                group for group in project_permissions.groups.values() if group.admin
+            ]
+            permission_data.inherited_admin_roles = [
+                role for role in project_permissions.roles if role.admin
+            ]
+            permission_data.admin_override = project_permissions.user.admin
+        return permission_data
+
     project_permission_svc = _ProjectPermissionService(environment.project_id, user.id)
     environment_permission_svc = _EnvironmentPermissionService(
         environment.id, user.id, project_permission_svc=project_permission_svc
@@ -328,6 +364,27 @@ def get_groups_permission_data(
     return group_permission_data_objects
 
 
+def _get_materialized_permission_data(
+    object_permissions: typing.Optional["ObjectPermissions"],
+    is_organisation_admin: bool,
+) -> PermissionData:
+    if object_permissions is None:
+        return PermissionData(
+            is_organisation_admin=is_organisation_admin,
+            user=UserPermissionData(),
+            groups=[],
+            roles=[],
+        )
+    return PermissionData(
+        is_organisation_admin=is_organisation_admin,
+        user=object_permissions.user,
+        groups=sorted(
+            object_permissions.groups.values(), key=lambda group: group.group.id
+        ),
+        roles=object_permissions.roles,
+    )
+
+
 @dataclass
 class _OrganisationPermissionService:
     organisation_id: int
@@ -0,0 +1,193 @@
+import typing
+
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from environments.permissions.models import (
+    UserEnvironmentPermission,
+    UserPermissionGroupEnvironmentPermission,
+)
+from organisations.models import UserOrganisation
+from organisations.permissions.models import (
+    UserOrganisationPermission,
+    UserPermissionGroupOrganisationPermission,
+)
+from permissions.user_permissions import invalidate_user_permissions
+from projects.models import (
+    UserPermissionGroupProjectPermission,
+    UserProjectPermission,
+)
+from users.models import UserPermissionGroup, UserPermissionGroupMembership
+
+UserPermissionModel = (
+    UserOrganisationPermission | UserProjectPermission | UserEnvironmentPermission
+)
+GroupPermissionModel = (
+    UserPermissionGroupOrganisationPermission
+    | UserPermissionGroupProjectPermission
+    | UserPermissionGroupEnvironmentPermission
+)
+
+
+def _get_group_user_ids(group_id: int) -> list[int]:
+    return list(
+        UserPermissionGroupMembership.objects.filter(
+            userpermissiongroup_id=group_id
+        ).values_list("ffadminuser_id", flat=True)
+    )
+
+
+@receiver(post_save, sender=UserOrganisation)
+@receiver(post_delete, sender=UserOrganisation)
+def invalidate_organisation_member_permissions(
+    instance: UserOrganisation,
+    **kwargs: typing.Any,
+) -> None:
+    invalidate_user_permissions([instance.user_id])
+
+
+@receiver(post_save, sender=UserPermissionGroupMembership)
+@receiver(post_delete, sender=UserPermissionGroupMembership)
+def invalidate_group_member_permissions(
+    instance: UserPermissionGroupMembership,
+    **kwargs: typing.Any,
+) -> None:
+    invalidate_user_permissions([instance.ffadminuser_id])
+
+
+@receiver(post_save, sender=UserOrganisationPermission)
+@receiver(post_delete, sender=UserOrganisationPermission)
+@receiver(post_save, sender=UserProjectPermission)
+@receiver(post_delete, sender=UserProjectPermission)
+@receiver(post_save, sender=UserEnvironmentPermission)
+@receiver(post_delete, sender=UserEnvironmentPermission)
+def invalidate_user_permission(
+    instance: UserPermissionModel,
+    **kwargs: typing.Any,
+) -> None:
+    invalidate_user_permissions([instance.user_id])
+
+
+@receiver(post_save, sender=UserPermissionGroupOrganisationPermission)
+@receiver(post_delete, sender=UserPermissionGroupOrganisationPermission)
+@receiver(post_save, sender=UserPermissionGroupProjectPermission)
+@receiver(post_delete, sender=UserPermissionGroupProjectPermission)
+@receiver(post_save, sender=UserPermissionGroupEnvironmentPermission)
+@receiver(post_delete, sender=UserPermissionGroupEnvironmentPermission)
+def invalidate_group_permission(
+    instance: GroupPermissionModel,
+    **kwargs: typing.Any,
+) -> None:
+    invalidate_user_permissions(_get_group_user_ids(instance.group_id))
+
+
+@receiver(m2m_changed, sender=UserOrganisationPermission.permissions.through)
+@receiver(m2m_changed, sender=UserProjectPermission.permissions.through)
+@receiver(m2m_changed, sender=UserEnvironmentPermission.permissions.through)
+@receiver(
+    m2m_changed, sender=UserPermissionGroupOrganisationPermission.permissions.through
+)
+@receiver(m2m_changed, sender=UserPermissionGroupProjectPermission.permissions.through)
+@receiver(
+    m2m_changed, sender=UserPermissionGroupEnvironmentPermission.permissions.through
+)
+def invalidate_permission_keys(
+    instance: UserPermissionModel | GroupPermissionModel,
+    action: str,
+    reverse: bool,
+    **kwargs: typing.Any,
+) -> None:
+    # Permission keys are only ever set from the permission side.
+    if reverse or not action.startswith("post_"):
+        return
+    if group_id := getattr(instance, "group_id", None):
+        invalidate_user_permissions(_get_group_user_ids(group_id))
+    else:
+        invalidate_user_permissions([instance.user_id])  # type: ignore[union-attr]
+
+
+@receiver(m2m_changed, sender=UserPermissionGroup.users.through)
+def invalidate_group_members(
+    instance: "UserPermissionGroup | typing.Any",
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: typing.Any,
+) -> None:
+    if reverse:
+        # Groups added to, or removed from, a user.
+        if action.startswith("post_"):
+            invalidate_user_permissions([instance.pk])
+    elif action == "pre_clear":
+        invalidate_user_permissions(_get_group_user_ids(instance.pk))
+    elif action in ("post_add", "post_remove"):
+        invalidate_user_permissions(pk_set or ())
+
+
+if settings.IS_RBAC_INSTALLED:  # pragma: no cover
+    from rbac.models import (  # type: ignore[import-not-found,unused-ignore]
+        GroupRole,
+        Role,
+        RoleEnvironmentPermission,
+        RoleOrganisationPermission,
+        RoleProjectPermission,
+        UserRole,
+    )
+
+    def _get_role_user_ids(role_id: int) -> set[int]:
+        user_ids = set(
+            UserRole.objects.filter(role_id=role_id).values_list("user_id", flat=True)
+        )
+        user_ids.update(
+            UserPermissionGroupMembership.objects.filter(
+                userpermissiongroup_id__in=GroupRole.objects.filter(
+                    role_id=role_id
+                ).values_list("group_id", flat=True)
+            ).values_list("ffadminuser_id", flat=True)
+        )
+        return user_ids
+
+    @receiver(post_save, sender=UserRole)
+    @receiver(post_delete, sender=UserRole)
+    def invalidate_user_role_permissions(
+        instance: "UserRole",
+        **kwargs: typing.Any,
+    ) -> None:
+        invalidate_user_permissions([instance.user_id])
+
+    @receiver(post_save, sender=GroupRole)
+    @receiver(post_delete, sender=GroupRole)
+    def invalidate_group_role_permissions(
+        instance: "GroupRole",
+        **kwargs: typing.Any,
+    ) -> None:
+        invalidate_user_permissions(_get_group_user_ids(instance.group_id))
+
+    @receiver(post_save, sender=RoleOrganisationPermission)
+    @receiver(post_delete, sender=RoleOrganisationPermission)
+    @receiver(post_save, sender=RoleProjectPermission)
+    @receiver(post_delete, sender=RoleProjectPermission)
+    @receiver(post_save, sender=RoleEnvironmentPermission)
+    @receiver(post_delete, sender=RoleEnvironmentPermission)
+    def invalidate_role_permission(
+        instance: typing.Any,
+        **kwargs: typing.Any,
+    ) -> None:
+        invalidate_user_permissions(_get_role_user_ids(instance.role_id))
+
+    @receiver(m2m_changed, sender=RoleOrganisationPermission.permissions.through)
+    @receiver(m2m_changed, sender=RoleProjectPermission.permissions.through)
+    @receiver(m2m_changed, sender=RoleEnvironmentPermission.permissions.through)
+    @receiver(m2m_changed, sender=Role.tags.through)
+    def invalidate_role_permission_keys(
+        instance: typing.Any,
+        action: str,
+        reverse: bool,
+        **kwargs: typing.Any,
+    ) -> None:
+        # Permission keys and tags are only ever set from the role side.
+        if reverse or not action.startswith("post_"):
+            return
+        role_id = instance.pk if isinstance(instance, Role) else instance.role_id
+        invalidate_user_permissions(_get_role_user_ids(role_id))
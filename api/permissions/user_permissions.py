@@ -0,0 +1,373 @@
+"""
+Materialized permissions of users.
+
+When `CACHE_USER_PERMISSIONS_SECONDS` is set, the organisation, project and
+environment permissions granted to a user directly, through their groups and,
+if RBAC is installed, through their roles are loaded at once and cached per
+user, so that permission checks, permitted object lookups and the permission
+calculator don't query the permission tables every time.
+
+Cached entries are invalidated by `permissions.receivers` whenever the
+user's permissions, group memberships, organisation memberships or roles
+change.
+"""
+
+import typing
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import CharField, IntegerField, Value
+
+from environments.models import Environment
+from environments.permissions.models import (
+    UserEnvironmentPermission,
+    UserPermissionGroupEnvironmentPermission,
+)
+from organisations.models import Organisation, OrganisationRole, UserOrganisation
+from organisations.permissions.models import (
+    UserOrganisationPermission,
+    UserPermissionGroupOrganisationPermission,
+)
+from permissions.permissions_calculator import (
+    GroupData,
+    GroupPermissionData,
+    RolePermissionData,
+    UserPermissionData,
+)
+from projects.models import (
+    Project,
+    UserPermissionGroupProjectPermission,
+    UserProjectPermission,
+)
+
+from .rbac_wrapper import (  # type: ignore[attr-defined]
+    get_role_permission_filter,
+    get_roles_permission_data_for_environment,
+    get_roles_permission_data_for_organisation,
+    get_roles_permission_data_for_project,
+)
+
+if typing.TYPE_CHECKING:
+    from users.models import FFAdminUser
+
+user_permissions_cache = caches[settings.USER_PERMISSIONS_CACHE_NAME]
+
+
+@dataclass
+class ObjectPermissions:
+    """
+    Permissions granted to a user for an organisation, project or environment,
+    directly, through each of their groups and through each of their roles.
+    """
+
+    organisation_id: int
+    user: UserPermissionData = field(default_factory=UserPermissionData)
+    groups: dict[int, GroupPermissionData] = field(default_factory=dict)
+    roles: list[RolePermissionData] = field(default_factory=list)
+
+    @property
+    def admin(self) -> bool:
+        return any(grant.admin for grant in self._get_grants())
+
+    @property
+    def permissions(self) -> set[str]:
+        # Tag-based role permissions only apply to objects with those tags.
+        return set().union(
+            *(grant.permissions for grant in self._get_grants(tag_ids=[]))
+        )
+
+    def has_permission(
+        self,
+        permission_key: str | None,
+        allow_admin: bool = True,
+        tag_ids: list[int] | None = None,
+    ) -> bool:
+        return any(
+            (allow_admin and grant.admin) or permission_key in grant.permissions
+            for grant in self._get_grants(tag_ids)
+        )
+
+    def _get_grants(
+        self, tag_ids: list[int] | None = None
+    ) -> list[UserPermissionData | GroupPermissionData | RolePermissionData]:
+        return [
+            self.user,
+            *self.groups.values(),
+            *(role for role in self.roles if _is_role_applicable(role, tag_ids)),
+        ]
+
+
+@dataclass
+class UserPermissions:
+    """
+    Permissions granted to a user directly, through their groups and through
+    their roles, keyed by the id of the organisation, project or environment
+    they apply to.
+    """
+
+    organisation_roles: dict[int, str] = field(default_factory=dict)
+    organisations: dict[int, ObjectPermissions] = field(default_factory=dict)
+    projects: dict[int, ObjectPermissions] = field(default_factory=dict)
+    environments: dict[int, ObjectPermissions] = field(default_factory=dict)
+
+    @property
+    def organisation_ids(self) -> set[int]:
+        return set(self.organisation_roles)
+
+    @property
+    def admin_organisation_ids(self) -> set[int]:
+        return {
+            organisation_id
+            for organisation_id, role in self.organisation_roles.items()
+            if role == OrganisationRole.ADMIN.name
+        }
+
+    def is_organisation_member(self, organisation_id: int) -> bool:
+        return organisation_id in self.organisation_roles
+
+    def get_permitted_ids(
+        self,
+        object_permissions: dict[int, ObjectPermissions],
+        permission_key: str | None = None,
+        allow_admin: bool = True,
+        tag_ids: list[int] | None = None,
+    ) -> set[int]:
+        """
+        Get the ids of objects, in organisations the user is a member of,
+        the user has `permission_key`, or admin if `allow_admin` is set, for.
+
+        Roles restricted to tags only count if `tag_ids` is None or contains
+        one of their tags, same as `get_role_permission_filter`.
+        """
+        return {
+            object_id
+            for object_id, permissions in object_permissions.items()
+            if self.is_organisation_member(permissions.organisation_id)
+            and permissions.has_permission(permission_key, allow_admin, tag_ids)
+        }
+
+
+def get_user_permissions(user: "FFAdminUser") -> UserPermissions | None:
+    """
+    Get the materialized permissions of the user, loading and storing them
+    if they are not cached yet. Returns `None` if the cache is disabled.
+    """
+    if not settings.CACHE_USER_PERMISSIONS_SECONDS:
+        return None
+
+    cache_key = _get_cache_key(user.id)
+    user_permissions: UserPermissions | None = user_permissions_cache.get(cache_key)
+    if user_permissions is None:
+        user_permissions = load_user_permissions(user)
+        user_permissions_cache.set(
+            cache_key,
+            user_permissions,
+            timeout=settings.CACHE_USER_PERMISSIONS_SECONDS,
+        )
+    return user_permissions
+
+
+def load_user_permissions(user: "FFAdminUser") -> UserPermissions:
+    user_permissions = UserPermissions(
+        organisation_roles=dict(
+            UserOrganisation.objects.filter(user=user).values_list(
+                "organisation_id", "role"
+            )
+        )
+    )
+
+    for organisation_id, group_id, group_name, permission_key in (
+        UserOrganisationPermission.objects.filter(user=user)
+        .annotate(**_NO_GROUP)
+        .values_list("organisation_id", "group_id", "group_name", "permissions__key")
+        .union(
+            UserPermissionGroupOrganisationPermission.objects.filter(
+                group__users=user
+            ).values_list(
+                "organisation_id", "group_id", "group__name", "permissions__key"
+            )
+        )
+    ):
+        _add_permission(
+            user_permissions.organisations,
+            object_id=organisation_id,
+            organisation_id=organisation_id,
+            group_id=group_id,
+            group_name=group_name,
+            admin=False,
+            permission_key=permission_key,
+        )
+
+    for project_id, organisation_id, group_id, group_name, admin, permission_key in (
+        UserProjectPermission.objects.filter(user=user)
+        .annotate(**_NO_GROUP)
+        .values_list(
+            "project_id",
+            "project__organisation_id",
+            "group_id",
+            "group_name",
+            "admin",
+            "permissions__key",
+        )
+        .union(
+            UserPermissionGroupProjectPermission.objects.filter(
+                group__users=user
+            ).values_list(
+                "project_id",
+                "project__organisation_id",
+                "group_id",
+                "group__name",
+                "admin",
+                "permissions__key",
+            )
+        )
+    ):
+        _add_permission(
+            user_permissions.projects,
+            object_id=project_id,
+            organisation_id=organisation_id,
+            group_id=group_id,
+            group_name=group_name,
+            admin=admin,
+            permission_key=permission_key,
+        )
+
+    for (
+        environment_id,
+        organisation_id,
+        group_id,
+        group_name,
+        admin,
+        permission_key,
+    ) in (
+        UserEnvironmentPermission.objects.filter(user=user)
+        .annotate(**_NO_GROUP)
+        .values_list(
+            "environment_id",
+            "environment__project__organisation_id",
+            "group_id",
+            "group_name",
+            "admin",
+            "permissions__key",
+        )
+        .union(
+            UserPermissionGroupEnvironmentPermission.objects.filter(
+                group__users=user
+            ).values_list(
+                "environment_id",
+                "environment__project__organisation_id",
+                "group_id",
+                "group__name",
+                "admin",
+                "permissions__key",
+            )
+        )
+    ):
+        _add_permission(
+            user_permissions.environments,
+            object_id=environment_id,
+            organisation_id=organisation_id,
+            group_id=group_id,
+            group_name=group_name,
+            admin=admin,
+            permission_key=permission_key,
+        )
+
+    if settings.IS_RBAC_INSTALLED:  # pragma: no cover
+        _load_role_permissions(user, user_permissions)
+
+    return user_permissions
+
+
+def invalidate_user_permissions(user_ids: typing.Iterable[int]) -> None:
+    cache_keys = [_get_cache_key(user_id) for user_id in user_ids]
+    if not cache_keys:
+        return
+    user_permissions_cache.delete_many(cache_keys)
+    # Permissions loaded by concurrent requests before the change is
+    # committed would otherwise stay cached until they expire.
+    transaction.on_commit(lambda: user_permissions_cache.delete_many(cache_keys))
+
+
+# Selected in place of the group of permissions granted to users directly.
+_NO_GROUP = {
+    "group_id": Value(None, output_field=IntegerField()),
+    "group_name": Value(None, output_field=CharField()),
+}
+
+
+def _load_role_permissions(
+    user: "FFAdminUser", user_permissions: UserPermissions
+) -> None:
+    for model_class, object_permissions, organisation_field, get_roles_data in (
+        (
+            Organisation,
+            user_permissions.organisations,
+            "id",
+            get_roles_permission_data_for_organisation,
+        ),
+        (
+            Project,
+            user_permissions.projects,
+            "organisation_id",
+            get_roles_permission_data_for_project,
+        ),
+        (
+            Environment,
+            user_permissions.environments,
+            "project__organisation_id",
+            get_roles_permission_data_for_environment,
+        ),
+    ):
+        # Objects any role of the user, or of their groups, grants permissions for.
+        role_filter = get_role_permission_filter(user, model_class, allow_admin=False)
+        for object_id, organisation_id in (
+            model_class.objects.filter(role_filter)
+            .values_list("id", organisation_field)
+            .distinct()
+        ):
+            object_permissions.setdefault(
+                object_id, ObjectPermissions(organisation_id=organisation_id)
+            ).roles = get_roles_data(object_id, user.id)
+
+
+def _add_permission(
+    object_permissions: dict[int, ObjectPermissions],
+    object_id: int,
+    organisation_id: int,
+    group_id: int | None,
+    group_name: str | None,
+    admin: bool,
+    permission_key: str | None,
+) -> None:
+    permissions = object_permissions.setdefault(
+        object_id, ObjectPermissions(organisation_id=organisation_id)
+    )
+    grant: UserPermissionData | GroupPermissionData
+    if group_id is None:
+        grant = permissions.user
+    else:
+        grant = permissions.groups.setdefault(
+            group_id,
+            GroupPermissionData(group=GroupData(id=group_id, name=group_name)),  # type: ignore[arg-type]
+        )
+    grant.admin = grant.admin or admin
+    if permission_key:
+        grant.permissions.add(permission_key)
+
+
+def _is_role_applicable(
+    role_permission: RolePermissionData, tag_ids: list[int] | None
+) -> bool:
+    # Roles restricted to tags only grant permissions for those tags.
+    return (
+        tag_ids is None
+        or not role_permission.role.tags
+        or not role_permission.role.tags.isdisjoint(tag_ids)
+    )
+
+
+def _get_cache_key(user_id: int) -> str:
+    return f"user-permissions:{user_id}"
@@ -18,6 +18,7 @@ from django_lifecycle import (  # type: ignore[import-untyped]
 
 from core.models import SoftDeleteExportableModel
 from environments.dynamodb import DynamoProjectMetadata
+from environments.local_cache import publish_environment_cache_versions
 from organisations.models import Organisation
 from permissions.models import (
     PROJECT_PERMISSION_TYPE,
@@ -160,9 +161,9 @@ class Project(LifecycleModelMixin, SoftDeleteExportableModel):  # type: ignore[d
 
     @hook(AFTER_SAVE)
     def clear_environments_cache(self):  # type: ignore[no-untyped-def]
-        environment_cache.delete_many(
-            list(self.environments.values_list("api_key", flat=True))
-        )
+        api_keys = list(self.environments.values_list("api_key", flat=True))
+        environment_cache.delete_many(api_keys)
+        publish_environment_cache_versions(api_keys)
 
     @hook(  # type: ignore[misc]
         AFTER_SAVE,
@@ -5,7 +5,6 @@ import pytz
 import re2 as re  # type: ignore[import-untyped]
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
-from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import Count, F, OuterRef, Q, Subquery, Value
 from django.db.models.functions import Coalesce, Greatest
 from django.http import (
@@ -13,6 +12,7 @@ from django.http import (
     HttpResponse,
     HttpResponseBadRequest,
     HttpResponseRedirect,
+    StreamingHttpResponse,
 )
 from django.shortcuts import get_object_or_404
 from django.template import loader
@@ -31,7 +31,7 @@ from environments.dynamodb.migrator import IdentityMigrator
 from environments.identities.models import Identity
 from environments.models import Environment
 from features.models import Feature
-from import_export.export import full_export
+from import_export.export import full_export, serialize_export
 from organisations.chargebee.tasks import update_chargebee_cache
 from organisations.models import (
     Organisation,
@@ -342,8 +342,8 @@ class UsageReport(TemplateView):  # pragma: no cover
 @staff_member_required()  # type: ignore[misc]
 def download_org_data(request, organisation_id):  # type: ignore[no-untyped-def]
     data = full_export(organisation_id)
-    response = HttpResponse(
-        json.dumps(data, cls=DjangoJSONEncoder), content_type="application/json"
+    response = StreamingHttpResponse(
+        serialize_export(data), content_type="application/json"
     )
     response.headers["Content-Disposition"] = (
         "attachment; filename=org-%d.json" % organisation_id
@@ -1,4 +1,11 @@
+from datetime import timedelta
+
 MAX_SEGMENT_MEMBERS_PAGE_SIZE = 200
 
 INT64_MIN = -(2**63)
 INT64_MAX = 2**63 - 1
+
+# Changed identity rows are looked for from this long before the previous
+# refresh, so rows that became visible late, or were stamped by a clock running
+# behind ours, are still picked up.
+CHANGED_IDENTITIES_OVERLAP = timedelta(minutes=5)
@@ -27,3 +27,15 @@ flagsmith_segment_membership_read_duration_seconds = prometheus_client.Histogram
     "flagsmith_segment_membership_read_duration_seconds",
     "Duration of one segment membership page read.",
 )
+
+flagsmith_segment_membership_untranslatable_segments_total = prometheus_client.Counter(
+    "flagsmith_segment_membership_untranslatable_segments_total",
+    "Total segments skipped by segment-membership queries because their rules can't be translated to ClickHouse SQL. `operation` label is either `count` or `members`.",
+    ["operation"],
+)
+
+flagsmith_segment_membership_predicate_cache_total = prometheus_client.Counter(
+    "flagsmith_segment_membership_predicate_cache_total",
+    "Total segment predicate lookups by segment-membership queries. `result` label is either `hit` or `miss`.",
+    ["result"],
+)
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.16 on 2026-10-17 10:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0029_bump_default_project_limits"),
+        ("segment_membership", "0002_segment_membership_seed"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SegmentMembershipWatermark",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("counted_at", models.DateTimeField()),
+                ("segments_fingerprint", models.CharField(max_length=64)),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 
 from environments.models import Environment
 from organisations.models import Organisation
+from projects.models import Project
 from segments.models import Segment
 
 
@@ -42,3 +43,19 @@ class SegmentMembershipSeed(models.Model):
         related_name="+",
     )
     seeded_at = models.DateTimeField(null=True)
+
+
+class SegmentMembershipWatermark(models.Model):
+    """Tracks when a project's membership counts were last refreshed, and for
+    which segment definitions.
+
+    Refreshes only recount environments with identity rows ingested since
+    `counted_at`, unless `segments_fingerprint` no longer matches."""
+
+    project = models.OneToOneField(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    counted_at = models.DateTimeField()
+    segments_fingerprint = models.CharField(max_length=64)
@@ -1,11 +1,18 @@
+import hashlib
+import json
+import math
+from collections.abc import Collection
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any, Iterator
 
 import structlog
+from django.conf import settings
+from django.core.cache import caches
 from django.db import connections
 from django.db.backends.utils import CursorWrapper
 from django.db.models import Q
+from django.utils import timezone
 from flag_engine.context.types import EvaluationContext
 from flagsmith_sql_flag_engine import (
     Binder,
@@ -20,14 +27,24 @@ from environments.models import Environment
 from integrations.flagsmith.client import get_openfeature_client
 from organisations.models import Organisation
 from projects.models import Project
+from segment_membership.metrics import (
+    flagsmith_segment_membership_predicate_cache_total,
+    flagsmith_segment_membership_untranslatable_segments_total,
+)
 from segment_membership.models import SegmentMembershipCount
-from segment_membership.types import ClickHouseReadIdentityRow, SegmentMember
+from segment_membership.types import (
+    CachedSegmentPredicate,
+    ClickHouseReadIdentityRow,
+    SegmentMember,
+)
 from segments.models import Segment
 from util.engine_models.context.mappers import map_segment_to_segment_context
 from util.mappers.engine import map_segment_to_engine
 
 logger = structlog.get_logger("segment_membership")
 
+segment_predicates_cache = caches[settings.SEGMENT_PREDICATES_CACHE_NAME]
+
 
 def is_membership_enabled(organisation: Organisation) -> bool:
     """Resolve the per-org segment-membership inspection flag, default False."""
@@ -106,11 +123,57 @@ def get_projects_to_process() -> Iterator[Project]:
         yield project
 
 
+def get_segments_fingerprint(project: Project) -> str:
+    """Identify the current definitions of `project`'s canonical segments.
+
+    Changes whenever a segment is created, edited or deleted, i.e. whenever
+    stored counts may no longer reflect the segments."""
+    segment_versions = Segment.live_objects.filter(project=project).values_list(
+        "id", "version", "updated_at"
+    )
+    return hashlib.sha256(
+        json.dumps(list(segment_versions), default=str).encode()
+    ).hexdigest()
+
+
+def get_changed_environment_keys(
+    project: Project,
+    cursor: CursorWrapper,
+    *,
+    since: datetime,
+) -> set[str]:
+    """Return the keys of `project`'s environments with identity rows ingested
+    into IDENTITIES since `since`.
+
+    Reads the narrow `ingested_at` column only, rather than the deduplicated
+    rows. The window is measured against ClickHouse's own clock, as that's
+    what stamps `ingested_at`.
+    """
+    env_keys = tuple(project.environments.values_list("api_key", flat=True))
+    if not env_keys:
+        return set()
+    cursor.execute(
+        "SELECT DISTINCT i.environment_id "
+        "FROM IDENTITIES AS i "
+        "WHERE i.environment_id IN %(env_keys)s "
+        "AND i.ingested_at >= now() - toIntervalSecond(%(since_seconds)s)",
+        {
+            "env_keys": env_keys,
+            "since_seconds": math.ceil((timezone.now() - since).total_seconds()),
+        },
+    )
+    return {str(row[0]) for row in cursor.fetchall()}
+
+
 def compute_segment_counts_for_project(
-    project: Project, cursor: CursorWrapper
+    project: Project,
+    cursor: CursorWrapper,
+    *,
+    environment_keys: Collection[str] | None = None,
 ) -> list[SegmentMembershipCount]:
     """Count identity matches per (canonical-segment, environment) for
-    `project`, scanning each environment once.
+    `project`, scanning each environment once. Pass `environment_keys` to
+    only count those of the project's environments.
 
     A single `GROUP BY environment_id` over `IDENTITIES FINAL` counts every
     segment in one pass via `countIf(<predicate>)` per segment.
@@ -122,39 +185,41 @@ def compute_segment_counts_for_project(
     ReplacingMergeTree to dedupe at read time so counts reflect the
     most-recent backfill regardless of merge state.
     """
-    segments = list(Segment.live_objects.filter(project=project))
+    segments = list(
+        Segment.live_objects.filter(project=project).select_related("project")
+    )
     env_id_by_key: dict[str, int] = dict(
         project.environments.values_list("api_key", "id"),
     )
+    if environment_keys is not None:
+        env_id_by_key = {
+            env_key: env_id
+            for env_key, env_id in env_id_by_key.items()
+            if env_key in environment_keys
+        }
     if not segments or not env_id_by_key:
         return []
 
-    dialect = ClickHouseDialect()
-    binder = Binder(PyformatParamStyle())
     count_columns: list[str] = []
     counted_segment_ids: list[int] = []
+    predicate_params: dict[str, str] = {}
     for seg in segments:
-        translate_ctx = TranslateContext(
-            evaluation_context=EvaluationContext(
-                environment={"key": "_count", "name": project.name}
-            ),
-            dialect=dialect,
-            binder=binder,
-        )
-        predicate = translate_segment(
-            map_segment_to_segment_context(map_segment_to_engine(seg)),
-            translate_ctx,
-        )
-        if predicate is None:
+        translated = get_segment_predicate(seg)
+        if translated is None:
             logger.error(
                 "compute.segment.skipped",
                 project__id=project.id,
                 segment__id=seg.id,
                 reason="untranslatable",
             )
+            flagsmith_segment_membership_untranslatable_segments_total.labels(
+                operation="count"
+            ).inc()
             continue
+        predicate, params = translated
         count_columns.append(f"countIf({predicate}) AS c{seg.id}")
         counted_segment_ids.append(seg.id)
+        predicate_params.update(params)
 
     if not count_columns:
         return []
@@ -165,7 +230,7 @@ def compute_segment_counts_for_project(
         f"WHERE i.environment_id IN %(env_keys)s AND i.is_deleted = false "
         f"GROUP BY i.environment_id"
     )
-    cursor.execute(sql, {"env_keys": tuple(env_id_by_key), **binder.params})
+    cursor.execute(sql, {"env_keys": tuple(env_id_by_key), **predicate_params})
     rows: list[tuple[Any, ...]] = cursor.fetchall()
     membership_counts: list[SegmentMembershipCount] = []
     for row in rows:
@@ -199,25 +264,18 @@ def get_segment_members_page(
     Provide identifier as `cursor` to get a page after that identifier.
     Provide `q` to filter to identifiers containing it (case-insensitive).
     """
-    binder = Binder(PyformatParamStyle())
-    translate_ctx = TranslateContext(
-        evaluation_context=EvaluationContext(
-            environment={"key": "_members", "name": segment.project.name}
-        ),
-        dialect=ClickHouseDialect(),
-        binder=binder,
-    )
-    predicate = translate_segment(
-        map_segment_to_segment_context(map_segment_to_engine(segment)),
-        translate_ctx,
-    )
-    if predicate is None:
+    translated = get_segment_predicate(segment)
+    if translated is None:
         logger.error(
             "members.segment.skipped",
             segment__id=segment.id,
             reason="untranslatable",
         )
+        flagsmith_segment_membership_untranslatable_segments_total.labels(
+            operation="members"
+        ).inc()
         return []
+    predicate, predicate_params = translated
 
     conditions = [
         "i.environment_id = %(env_key)s",
@@ -226,7 +284,7 @@ def get_segment_members_page(
     params: dict[str, Any] = {
         "env_key": environment.api_key,
         "limit": limit,
-        **binder.params,
+        **predicate_params,
     }
     if cursor:
         conditions.append("i.identifier > %(cursor)s")
@@ -272,3 +330,52 @@ def get_segment_members_page(
         SegmentMember(identifier=row[0], identity_key=row[1], traits=row[2])
         for row in rows
     ]
+
+
+def get_segment_predicate(segment: Segment) -> tuple[str, dict[str, str]] | None:
+    """Translate `segment`'s rules to a ClickHouse predicate over
+    `IDENTITIES AS i`, returning it along with the parameters it binds, or
+    `None` if the rules can't be translated.
+
+    Translations, untranslatable ones included, are cached per segment
+    version, so that count refreshes and member pages don't retranslate the
+    rule tree on every run. Parameter names are prefixed with the segment id,
+    so predicates of several segments can be bound in one query.
+    """
+    cache_key = _get_segment_predicate_cache_key(segment)
+    cached: CachedSegmentPredicate | None = segment_predicates_cache.get(cache_key)
+    if cached is not None:
+        flagsmith_segment_membership_predicate_cache_total.labels(result="hit").inc()
+    else:
+        flagsmith_segment_membership_predicate_cache_total.labels(result="miss").inc()
+        binder = Binder(PyformatParamStyle(), prefix=f"s{segment.id}_")
+        translate_ctx = TranslateContext(
+            evaluation_context=EvaluationContext(
+                environment={"key": "_membership", "name": segment.project.name}
+            ),
+            dialect=ClickHouseDialect(),
+            binder=binder,
+        )
+        predicate = translate_segment(
+            map_segment_to_segment_context(map_segment_to_engine(segment)),
+            translate_ctx,
+        )
+        cached = (predicate, binder.params)
+        segment_predicates_cache.set(cache_key, cached)
+
+    predicate, params = cached
+    if predicate is None:
+        return None
+    return predicate, params
+
+
+def _get_segment_predicate_cache_key(segment: Segment) -> str:
+    # Edits through the API bump both the version and `updated_at`. The
+    # project name is part of the evaluation context predicates are
+    # translated against.
+    project_name_digest = hashlib.sha256(segment.project.name.encode()).hexdigest()
+    updated_at = segment.updated_at.isoformat() if segment.updated_at else ""
+    return (
+        f"segment-predicate:{segment.id}:{segment.version}:{updated_at}"
+        f":{project_name_digest[:16]}"
+    )
@@ -15,6 +15,7 @@ from task_processor.models import Task
 from environments.dynamodb.wrappers.identity_wrapper import DynamoIdentityWrapper
 from organisations.models import Organisation
 from projects.models import Project
+from segment_membership.constants import CHANGED_IDENTITIES_OVERLAP
 from segment_membership.mappers import map_identity_document_to_clickhouse_row
 from segment_membership.metrics import (
     flagsmith_segment_membership_backfill_duration_seconds,
@@ -22,11 +23,17 @@ from segment_membership.metrics import (
     flagsmith_segment_membership_refresh_duration_seconds,
     flagsmith_segment_membership_refresh_failures_total,
 )
-from segment_membership.models import SegmentMembershipCount, SegmentMembershipSeed
+from segment_membership.models import (
+    SegmentMembershipCount,
+    SegmentMembershipSeed,
+    SegmentMembershipWatermark,
+)
 from segment_membership.services import (
     compute_segment_counts_for_project,
     enqueue_membership_refresh,
+    get_changed_environment_keys,
     get_projects_to_process,
+    get_segments_fingerprint,
     is_membership_enabled,
     open_clickhouse_cursor,
 )
@@ -201,7 +208,11 @@ def refresh_all_segment_counts() -> None:
 def refresh_project_segment_counts(project_id: int) -> None:
     """Compute per-segment match counts for one project and upsert into
     `SegmentMembershipCount`. Re-checks the org flag so a stale fan-out
-    skips orgs disabled since dispatch."""
+    skips orgs disabled since dispatch.
+
+    With `SEGMENT_MEMBERSHIP_INCREMENTAL_REFRESH`, only environments with
+    identity rows ingested since the previous refresh are recounted, unless
+    the project's segments changed since."""
     if not settings.CLICKHOUSE_ENABLED:
         logger.info(
             "refresh.project.skipped",
@@ -215,6 +226,8 @@ def refresh_project_segment_counts(project_id: int) -> None:
         deleted, _ = SegmentMembershipCount.objects.filter(
             segment__project=project
         ).delete()
+        # Identities may change unnoticed until the flag is back on.
+        SegmentMembershipWatermark.objects.filter(project=project).delete()
         logger.info(
             "refresh.project.skipped",
             project__id=project_id,
@@ -228,28 +241,55 @@ def refresh_project_segment_counts(project_id: int) -> None:
         f":org_{project.organisation_id}"
         f":project_{project.id}"
     )
+    now = timezone.now()
+    segments_fingerprint = get_segments_fingerprint(project)
+    watermark = SegmentMembershipWatermark.objects.filter(project=project).first()
     with (
         flagsmith_segment_membership_refresh_duration_seconds.time(),
         open_clickhouse_cursor(log_comment=log_comment) as cursor,
     ):
         try:
-            membership_counts = compute_segment_counts_for_project(project, cursor)
+            # None recounts every environment.
+            environment_keys: set[str] | None = None
+            if (
+                settings.SEGMENT_MEMBERSHIP_INCREMENTAL_REFRESH
+                and watermark is not None
+                and watermark.segments_fingerprint == segments_fingerprint
+            ):
+                environment_keys = get_changed_environment_keys(
+                    project,
+                    cursor,
+                    since=watermark.counted_at - CHANGED_IDENTITIES_OVERLAP,
+                )
+            membership_counts = compute_segment_counts_for_project(
+                project,
+                cursor,
+                environment_keys=environment_keys,
+            )
         except Exception:
             flagsmith_segment_membership_refresh_failures_total.inc()
             logger.exception("refresh.project.failed", project__id=project_id)
             return
 
-        now = timezone.now()
         for m in membership_counts:
             m.last_synced_at = now
 
+        project_counts = SegmentMembershipCount.objects.filter(segment__project=project)
+        recounted_counts = project_counts
+        if environment_keys is not None:
+            recounted_counts = project_counts.filter(
+                environment__api_key__in=environment_keys
+            )
+            # Counts of environments without changed identities still hold.
+            project_counts.exclude(environment__api_key__in=environment_keys).update(
+                last_synced_at=now
+            )
+
         new_pairs = {(m.segment_id, m.environment_id) for m in membership_counts}
         stale_ids = [
             pk
             for pk, segment_id, environment_id in (
-                SegmentMembershipCount.objects.filter(
-                    segment__project=project
-                ).values_list("id", "segment_id", "environment_id")
+                recounted_counts.values_list("id", "segment_id", "environment_id")
             )
             if (segment_id, environment_id) not in new_pairs
         ]
@@ -263,6 +303,13 @@ def refresh_project_segment_counts(project_id: int) -> None:
             unique_fields=["segment", "environment"],
             update_fields=["count", "last_synced_at"],
         )
+        SegmentMembershipWatermark.objects.update_or_create(
+            project=project,
+            defaults={
+                "counted_at": now,
+                "segments_fingerprint": segments_fingerprint,
+            },
+        )
         logger.info(
             "refresh.project.completed",
             project__id=project_id,
@@ -12,3 +12,7 @@ class SegmentMember(TypedDict):
     identifier: str
     identity_key: str
     traits: dict[str, Any] | None
+
+
+# (predicate, bound params); the predicate is None for untranslatable segments.
+CachedSegmentPredicate = tuple[str | None, dict[str, str]]
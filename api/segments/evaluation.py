@@ -0,0 +1,126 @@
+"""
+Compiled segments for identity evaluation.
+
+Mapping segments to flag engine contexts walks every rule and condition of
+every segment, so segments are compiled once and cached instead. A compiled
+segment also records the trait keys an identity must have for the segment to
+possibly match, so that segments referencing absent traits are skipped
+without being evaluated.
+"""
+
+import typing
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import reduce
+
+from flag_engine.context import types as engine_types
+from flag_engine.segments import constants
+from flag_engine.segments.evaluator import is_context_in_segment
+
+from segments.types import SegmentEngineMetadata
+from util.mappers.engine import map_segment_to_segment_context
+
+if typing.TYPE_CHECKING:
+    from segments.models import Segment
+
+# Evaluated last within a rule, as these hash or parse their operands.
+_EXPENSIVE_OPERATORS = frozenset(
+    {constants.REGEX, constants.MODULO, constants.PERCENTAGE_SPLIT}
+)
+
+
+@dataclass(frozen=True)
+class CompiledSegment:
+    segment: "Segment"
+    segment_context: "engine_types.SegmentContext[SegmentEngineMetadata, object]"
+    required_trait_keys: frozenset[str]
+
+
+def compile_segments(segments: "Iterable[Segment]") -> list[CompiledSegment]:
+    compiled_segments = []
+    for segment in segments:
+        segment_context = map_segment_to_segment_context(segment)
+        for rule in segment_context["rules"]:
+            _sort_conditions(rule)
+        compiled_segments.append(
+            CompiledSegment(
+                segment=segment,
+                segment_context=segment_context,
+                required_trait_keys=_union(
+                    _get_required_trait_keys(rule) for rule in segment_context["rules"]
+                ),
+            )
+        )
+    return compiled_segments
+
+
+def get_matching_segments(
+    context: "engine_types.EvaluationContext[SegmentEngineMetadata, object]",
+    compiled_segments: Iterable[CompiledSegment],
+) -> "list[Segment]":
+    """
+    Get the segments matching the given evaluation context. Equivalent to
+    evaluating the segments with `flag_engine.engine.get_evaluation_result`.
+    """
+    identity_context = context.get("identity")
+    traits = (identity_context and identity_context.get("traits")) or {}
+    return [
+        compiled_segment.segment
+        for compiled_segment in compiled_segments
+        if compiled_segment.required_trait_keys.issubset(traits)
+        and is_context_in_segment(context, compiled_segment.segment_context)
+    ]
+
+
+def _sort_conditions(rule: engine_types.SegmentRule) -> None:
+    # Conditions are side effect free, so their order does not affect the result.
+    if conditions := rule.get("conditions"):
+        conditions.sort(
+            key=lambda condition: condition["operator"] in _EXPENSIVE_OPERATORS
+        )
+    for sub_rule in rule.get("rules") or []:
+        _sort_conditions(sub_rule)
+
+
+def _get_required_trait_keys(rule: engine_types.SegmentRule) -> frozenset[str]:
+    """
+    Get the trait keys that must be present for the rule to match. Any
+    condition on an absent trait fails, except for `IS_NOT_SET`.
+    """
+    condition_trait_keys = [
+        frozenset({condition["property"]})
+        if _requires_trait(condition)
+        else frozenset()
+        for condition in rule.get("conditions") or []
+    ]
+    sub_rule_trait_keys = [
+        _get_required_trait_keys(sub_rule) for sub_rule in rule.get("rules") or []
+    ]
+
+    if rule["type"] == constants.ALL_RULE:
+        return _union([*condition_trait_keys, *sub_rule_trait_keys])
+    if rule["type"] == constants.ANY_RULE:
+        # Conditions and sub-rules are matched separately, and both must match.
+        return _intersection(condition_trait_keys) | _intersection(sub_rule_trait_keys)
+    # `NONE` rules match when their conditions fail.
+    return frozenset()
+
+
+def _requires_trait(condition: engine_types.SegmentCondition) -> bool:
+    condition_property = condition["property"]
+    return (
+        bool(condition_property)
+        # JSONPath properties may resolve to context values other than traits.
+        and not condition_property.startswith("$.")
+        and condition["operator"] != constants.IS_NOT_SET
+    )
+
+
+def _union(trait_keys: Iterable[frozenset[str]]) -> frozenset[str]:
+    return frozenset().union(*trait_keys)
+
+
+def _intersection(trait_keys: list[frozenset[str]]) -> frozenset[str]:
+    if not trait_keys:
+        return frozenset()
+    return reduce(frozenset.intersection, trait_keys)
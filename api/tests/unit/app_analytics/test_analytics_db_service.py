@@ -16,10 +16,17 @@ from app_analytics.analytics_db_service import (
     get_usage_data_from_local_db,
     get_usage_data_from_local_db_for_window,
 )
-from app_analytics.constants import CURRENT_BILLING_PERIOD, PREVIOUS_BILLING_PERIOD
+from app_analytics.constants import (
+    ANALYTICS_DAILY_BUCKET_SIZE,
+    ANALYTICS_READ_BUCKET_SIZE,
+    CURRENT_BILLING_PERIOD,
+    PREVIOUS_BILLING_PERIOD,
+)
 from app_analytics.dataclasses import FeatureEvaluationData, UsageData
 from app_analytics.models import (
     APIUsageBucket,
+    BucketSource,
+    BucketWatermark,
     FeatureEvaluationBucket,
     Resource,
 )
@@ -107,6 +114,43 @@ def test_get_usage_data_from_local_db__multiple_buckets__returns_aggregated_dail
         assert data.day == today - timedelta(days=29 - count)
 
 
+@pytest.mark.use_analytics_db
+def test_get_usage_data_from_local_db__daily_buckets_rolled_up__reads_daily_buckets(
+    organisation: Organisation,
+    environment: Environment,
+) -> None:
+    # Given
+    today = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday = today - timedelta(days=1)
+    BucketWatermark.objects.create(
+        source=BucketSource.API_USAGE,
+        bucket_size=ANALYTICS_DAILY_BUCKET_SIZE,
+        processed_till=today,
+    )
+    for bucket_size, created_at, total_count in [
+        (ANALYTICS_DAILY_BUCKET_SIZE, yesterday, 100),
+        # rolled up into the daily bucket above
+        (ANALYTICS_READ_BUCKET_SIZE, yesterday, 100),
+        (ANALYTICS_READ_BUCKET_SIZE, today, 5),
+    ]:
+        APIUsageBucket.objects.create(
+            environment_id=environment.id,
+            resource=Resource.FLAGS,
+            total_count=total_count,
+            bucket_size=bucket_size,
+            created_at=created_at,
+        )
+
+    # When
+    usage_data_list = get_usage_data_from_local_db(organisation)
+
+    # Then
+    assert usage_data_list == [
+        UsageData(day=yesterday.date(), flags=100, labels={}),
+        UsageData(day=today.date(), flags=5, labels={}),
+    ]
+
+
 @pytest.mark.use_analytics_db
 def test_get_usage_data_from_local_db__project_id_filter__returns_filtered_data(  # type: ignore[no-untyped-def]
     organisation: Organisation,
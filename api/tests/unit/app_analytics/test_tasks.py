@@ -19,9 +19,13 @@ from app_analytics.tasks import (
     populate_feature_evaluation_bucket,
     track_feature_evaluations_by_environment,
     track_request,
+    track_requests,
 )
-from app_analytics.types import TrackFeatureEvaluationsByEnvironmentData
-from environments.models import Environment
+from app_analytics.types import (
+    TrackFeatureEvaluationsByEnvironmentData,
+    TrackRequestData,
+)
+from environments.models import Environment, EnvironmentAPIKey
 
 pytestmark = pytest.mark.use_analytics_db
 
@@ -205,6 +209,84 @@ def test_track_request__influx__calls_expected(
     )
 
 
+@pytest.mark.use_analytics_db
+def test_track_requests__postgres__inserts_expected(
+    settings: SettingsWrapper,
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+) -> None:
+    # Given
+    settings.USE_POSTGRES_FOR_ANALYTICS = True
+    requests: list[TrackRequestData] = [
+        {
+            "resource": Resource.FLAGS.value,
+            "host": "testserver",
+            "environment_key": environment.api_key,
+            "count": 2,
+            "labels": {},
+        },
+        {
+            "resource": Resource.IDENTITIES.value,
+            "host": "testserver",
+            "environment_key": environment_api_key.key,
+            "count": 3,
+            "labels": {"client_application_name": "test-app"},
+        },
+        {
+            "resource": Resource.FLAGS.value,
+            "host": "testserver",
+            "environment_key": "unknown",
+            "count": 1,
+            "labels": {},
+        },
+    ]
+
+    # When
+    track_requests(requests)
+
+    # Then
+    assert list(
+        APIUsageRaw.objects.order_by("resource").values_list(
+            "resource", "environment_id", "count", "labels"
+        )
+    ) == [
+        (Resource.FLAGS, environment.id, 2, {}),
+        (
+            Resource.IDENTITIES,
+            environment.id,
+            3,
+            {"client_application_name": "test-app"},
+        ),
+    ]
+
+
+def test_track_requests__influx__calls_expected(
+    db: None,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+    environment: Environment,
+) -> None:
+    # Given
+    settings.INFLUXDB_TOKEN = "test_token"
+    track_requests_influxdb_mock = mocker.patch(
+        "app_analytics.tasks.track_requests_influxdb",
+        autospec=True,
+    )
+    request: TrackRequestData = {
+        "resource": Resource.FLAGS.value,
+        "host": "testserver",
+        "environment_key": environment.api_key,
+        "count": 1,
+        "labels": {},
+    }
+
+    # When
+    track_requests([request])
+
+    # Then
+    track_requests_influxdb_mock.assert_called_once_with([(environment, request)])
+
+
 @pytest.mark.use_analytics_db
 def test_track_feature_evaluations_by_environment__postgres__inserts_expected(
     settings: SettingsWrapper,
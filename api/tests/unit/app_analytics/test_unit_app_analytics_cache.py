@@ -1,107 +1,252 @@
-from django.utils import timezone
-from freezegun import freeze_time
+from threading import Event, Thread
+
+import pytest
 from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
-from app_analytics.cache import APIUsageCache, FeatureEvaluationCache
+from app_analytics.cache import (
+    APIUsageCache,
+    FeatureEvaluationCache,
+    _ShardedUsageCache,
+)
 from app_analytics.models import Resource
-from app_analytics.types import TrackFeatureEvaluationsByEnvironmentData
+from app_analytics.types import (
+    APIUsageCacheKey,
+    TrackFeatureEvaluationsByEnvironmentData,
+)
 
 
-def test_api_usage_cache__cache_interval_elapsed__flushes_tracked_requests(
+def test_api_usage_cache_flush__tracked_requests__writes_aggregated_counts(
     mocker: MockerFixture,
-    settings: SettingsWrapper,
 ) -> None:
     # Given
-    settings.API_USAGE_CACHE_SECONDS = 60
-
     cache = APIUsageCache()
-    now = timezone.now()
-    mocked_track_request_task = mocker.patch("app_analytics.cache.track_request")
+    mocked_track_requests_task = mocker.patch("app_analytics.cache.track_requests")
     host = "host"
     environment_key_1 = "environment_key_1"
     environment_key_2 = "environment_key_2"
 
-    with freeze_time(now) as frozen_time:
-        # Make some tracking requests
-        for _ in range(10):
-            for resource in Resource:
-                cache.track_request(
-                    resource=resource,
-                    host=host,
-                    environment_key=environment_key_1,
-                    labels={},
-                )
-                cache.track_request(
-                    resource=resource,
-                    host=host,
-                    environment_key=environment_key_2,
-                    labels={},
-                )
-
-        # make sure track_request task was not called
-        assert not mocked_track_request_task.called
-
-        # When
-        frozen_time.tick(settings.API_USAGE_CACHE_SECONDS + 1)
-
-        # let's track another request(to trigger flush)
-        cache.track_request(
-            resource=Resource.FLAGS,
-            host=host,
-            environment_key=environment_key_1,
-            labels={},
-        )
-
-        # Then - track request lambda was called for every resource and environment_key combination
-        expected_calls = []
+    for _ in range(10):
         for resource in Resource:
-            expected_calls.append(
-                mocker.call(
-                    kwargs={
-                        "resource": resource.value,
-                        "host": host,
-                        "environment_key": environment_key_1,
-                        "count": 11 if resource == Resource.FLAGS else 10,
-                        "labels": {},
-                    }
-                )
+            cache.track_request(
+                resource=resource,
+                host=host,
+                environment_key=environment_key_1,
+                labels={},
+            )
+            cache.track_request(
+                resource=resource,
+                host=host,
+                environment_key=environment_key_2,
+                labels={},
             )
-            expected_calls.append(
-                mocker.call(
-                    kwargs={
-                        "resource": resource.value,
-                        "host": host,
-                        "environment_key": environment_key_2,
-                        "count": 10,
-                        "labels": {},
-                    }
-                )
+
+    # make sure tracking requests does not write them
+    assert not mocked_track_requests_task.called
+
+    # When
+    cache.flush()
+
+    # Then - all resource and environment_key combinations were written at once
+    expected_requests = []
+    for resource in Resource:
+        for environment_key in (environment_key_1, environment_key_2):
+            expected_requests.append(
+                {
+                    "resource": resource.value,
+                    "host": host,
+                    "environment_key": environment_key,
+                    "count": 10,
+                    "labels": {},
+                }
+            )
+    mocked_track_requests_task.run_in_thread.assert_called_once_with(
+        kwargs={"requests": expected_requests}
+    )
+
+    # Next, let's reset the mock
+    mocked_track_requests_task.reset_mock()
+
+    # and flush again
+    cache.flush()
+
+    # finally, make sure counts were not written twice
+    assert not mocked_track_requests_task.called
+
+
+def test_api_usage_cache_flush__requests_tracked_by_multiple_threads__writes_summed_counts(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    cache = APIUsageCache()
+    mocked_track_requests_task = mocker.patch("app_analytics.cache.track_requests")
+
+    def track_requests() -> None:
+        for _ in range(100):
+            cache.track_request(
+                resource=Resource.FLAGS,
+                host="host",
+                environment_key="environment_key",
+                labels={},
             )
-        mocked_track_request_task.run_in_thread.assert_has_calls(expected_calls)
 
-        # Next, let's reset the mock
-        mocked_track_request_task.reset_mock()
+    threads = [Thread(target=track_requests) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # When
+    cache.flush()
+
+    # Then
+    mocked_track_requests_task.run_in_thread.assert_called_once_with(
+        kwargs={
+            "requests": [
+                {
+                    "resource": Resource.FLAGS.value,
+                    "host": "host",
+                    "environment_key": "environment_key",
+                    "count": 400,
+                    "labels": {},
+                }
+            ]
+        }
+    )
+    assert cache._shards == []
+
+
+def test_api_usage_cache_track_request__max_keys_reached__drops_new_keys(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.USAGE_DATA_CACHE_MAX_KEYS_PER_THREAD = 1
 
-        # and track another request
+    cache = APIUsageCache()
+    mocked_track_requests_task = mocker.patch("app_analytics.cache.track_requests")
+    mocked_dropped_metric = mocker.patch(
+        "app_analytics.cache.flagsmith_usage_data_cache_dropped_total"
+    )
+
+    # When
+    for environment_key in ("environment_key_1", "environment_key_2"):
         cache.track_request(
             resource=Resource.FLAGS,
-            host=host,
-            environment_key=environment_key_1,
+            host="host",
+            environment_key=environment_key,
             labels={},
         )
+    cache.flush()
 
-        # finally, make sure track_request task was not called
-        assert not mocked_track_request_task.called
+    # Then
+    mocked_track_requests_task.run_in_thread.assert_called_once_with(
+        kwargs={
+            "requests": [
+                {
+                    "resource": Resource.FLAGS.value,
+                    "host": "host",
+                    "environment_key": "environment_key_1",
+                    "count": 1,
+                    "labels": {},
+                }
+            ]
+        }
+    )
+    mocked_dropped_metric.labels.assert_called_once_with(cache="api_usage")
+    mocked_dropped_metric.labels.return_value.inc.assert_called_once_with(1)
 
 
-def test_feature_evaluation_cache__cache_interval_elapsed__flushes_tracked_evaluations(
+def test_api_usage_cache__cache_interval_elapsed__flushes_in_background(
     mocker: MockerFixture,
     settings: SettingsWrapper,
 ) -> None:
     # Given
-    settings.FEATURE_EVALUATION_CACHE_SECONDS = 60
+    settings.API_USAGE_CACHE_SECONDS = 0.01
+
+    cache = APIUsageCache()
+    flushed = Event()
+    mocked_track_requests_task = mocker.patch("app_analytics.cache.track_requests")
+    mocked_track_requests_task.run_in_thread.side_effect = lambda **kwargs: (
+        flushed.set()
+    )
+
+    # When
+    cache.track_request(
+        resource=Resource.FLAGS,
+        host="host",
+        environment_key="environment_key",
+        labels={},
+    )
 
+    # Then
+    assert flushed.wait(timeout=5)
+    cache.stop()
+    mocked_track_requests_task.run_in_thread.assert_called_once_with(
+        kwargs={
+            "requests": [
+                {
+                    "resource": Resource.FLAGS.value,
+                    "host": "host",
+                    "environment_key": "environment_key",
+                    "count": 1,
+                    "labels": {},
+                }
+            ]
+        }
+    )
+
+
+def test_api_usage_cache__flushed_in_background__closes_old_connections(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.API_USAGE_CACHE_SECONDS = 0.01
+
+    cache = APIUsageCache()
+    flushed = Event()
+    mocked_close_before_flush = mocker.patch(
+        "app_analytics.cache.close_old_connections"
+    )
+    mocked_close_after_flush = mocker.patch("util.db.close_old_connections")
+    mocked_track_requests_task = mocker.patch("app_analytics.cache.track_requests")
+    mocked_track_requests_task.run_in_thread.side_effect = lambda **kwargs: (
+        flushed.set()
+    )
+
+    # When
+    cache.track_request(
+        resource=Resource.FLAGS,
+        host="host",
+        environment_key="environment_key",
+        labels={},
+    )
+
+    # Then
+    assert flushed.wait(timeout=5)
+    cache.stop()
+    mocked_close_before_flush.assert_called()
+    mocked_close_after_flush.assert_called()
+
+
+def test_sharded_usage_cache__write_not_implemented__raises_on_construction() -> None:
+    # Given
+    class IncompleteCache(_ShardedUsageCache[APIUsageCacheKey]):
+        cache_name = "incomplete"
+
+        def _get_flush_interval_seconds(self) -> int:
+            return 1
+
+    # When / Then
+    with pytest.raises(TypeError):
+        IncompleteCache()  # type: ignore[abstract]
+
+
+def test_feature_evaluation_cache_flush__tracked_evaluations__writes_aggregated_counts(
+    mocker: MockerFixture,
+) -> None:
+    # Given
     mocked_track_evaluation_task = mocker.patch(
         "app_analytics.cache.track_feature_evaluations_by_environment"
     )
@@ -111,105 +256,105 @@ def test_feature_evaluation_cache__cache_interval_elapsed__flushes_tracked_evalu
     feature_2_name = "feature_2_name"
 
     cache = FeatureEvaluationCache()
-    now = timezone.now()
-
-    with freeze_time(now) as frozen_time:
-        # Track some feature evaluations
-        for _ in range(10):
-            cache.track_feature_evaluation(
-                environment_id=environment_1_id,
-                feature_name=feature_1_name,
-                evaluation_count=1,
-                labels={},
-            )
-            cache.track_feature_evaluation(
-                environment_id=environment_1_id,
-                feature_name=feature_2_name,
-                evaluation_count=1,
-                labels={},
-            )
-            cache.track_feature_evaluation(
-                environment_id=environment_2_id,
-                feature_name=feature_2_name,
-                evaluation_count=1,
-                labels={},
-            )
-
-        # When
-        frozen_time.tick(settings.FEATURE_EVALUATION_CACHE_SECONDS + 1)
 
-        # track another evaluation(to trigger cache flush)
+    # Track some feature evaluations
+    for _ in range(10):
         cache.track_feature_evaluation(
             environment_id=environment_1_id,
             feature_name=feature_1_name,
             evaluation_count=1,
             labels={},
         )
-
         cache.track_feature_evaluation(
             environment_id=environment_1_id,
-            feature_name=feature_1_name,
+            feature_name=feature_2_name,
             evaluation_count=1,
-            labels={"client_application_name": "test-app"},
+            labels={},
         )
-
-        # move time forward again
-        frozen_time.tick(settings.FEATURE_EVALUATION_CACHE_SECONDS + 1)
-
-        # track another one(to trigger cache flush)
         cache.track_feature_evaluation(
-            environment_id=environment_1_id,
-            feature_name=feature_1_name,
+            environment_id=environment_2_id,
+            feature_name=feature_2_name,
             evaluation_count=1,
             labels={},
         )
 
-        # Then
-        assert mocked_track_evaluation_task.delay.call_args_list == [
-            mocker.call(
-                kwargs={
-                    "environment_id": 1,
-                    "feature_evaluations": [
-                        TrackFeatureEvaluationsByEnvironmentData(
-                            feature_name="feature_1_name",
-                            labels={},
-                            evaluation_count=11,
-                        ),
-                        TrackFeatureEvaluationsByEnvironmentData(
-                            feature_name="feature_2_name",
-                            labels={},
-                            evaluation_count=10,
-                        ),
-                    ],
-                }
-            ),
-            mocker.call(
-                kwargs={
-                    "environment_id": 2,
-                    "feature_evaluations": [
-                        TrackFeatureEvaluationsByEnvironmentData(
-                            feature_name="feature_2_name",
-                            labels={},
-                            evaluation_count=10,
-                        )
-                    ],
-                }
-            ),
-            mocker.call(
-                kwargs={
-                    "environment_id": 1,
-                    "feature_evaluations": [
-                        TrackFeatureEvaluationsByEnvironmentData(
-                            feature_name="feature_1_name",
-                            labels={"client_application_name": "test-app"},
-                            evaluation_count=1,
-                        ),
-                        TrackFeatureEvaluationsByEnvironmentData(
-                            feature_name="feature_1_name",
-                            labels={},
-                            evaluation_count=1,
-                        ),
-                    ],
-                }
-            ),
-        ]
+    cache.track_feature_evaluation(
+        environment_id=environment_1_id,
+        feature_name=feature_1_name,
+        evaluation_count=1,
+        labels={},
+    )
+
+    # make sure tracking evaluations does not write them
+    assert not mocked_track_evaluation_task.called
+
+    # When
+    cache.flush()
+
+    # track more evaluations after the flush
+    cache.track_feature_evaluation(
+        environment_id=environment_1_id,
+        feature_name=feature_1_name,
+        evaluation_count=1,
+        labels={"client_application_name": "test-app"},
+    )
+
+    cache.track_feature_evaluation(
+        environment_id=environment_1_id,
+        feature_name=feature_1_name,
+        evaluation_count=1,
+        labels={},
+    )
+
+    # and flush again
+    cache.flush()
+
+    # Then
+    assert mocked_track_evaluation_task.delay.call_args_list == [
+        mocker.call(
+            kwargs={
+                "environment_id": 1,
+                "feature_evaluations": [
+                    TrackFeatureEvaluationsByEnvironmentData(
+                        feature_name="feature_1_name",
+                        labels={},
+                        evaluation_count=11,
+                    ),
+                    TrackFeatureEvaluationsByEnvironmentData(
+                        feature_name="feature_2_name",
+                        labels={},
+                        evaluation_count=10,
+                    ),
+                ],
+            }
+        ),
+        mocker.call(
+            kwargs={
+                "environment_id": 2,
+                "feature_evaluations": [
+                    TrackFeatureEvaluationsByEnvironmentData(
+                        feature_name="feature_2_name",
+                        labels={},
+                        evaluation_count=10,
+                    )
+                ],
+            }
+        ),
+        mocker.call(
+            kwargs={
+                "environment_id": 1,
+                "feature_evaluations": [
+                    TrackFeatureEvaluationsByEnvironmentData(
+                        feature_name="feature_1_name",
+                        labels={"client_application_name": "test-app"},
+                        evaluation_count=1,
+                    ),
+                    TrackFeatureEvaluationsByEnvironmentData(
+                        feature_name="feature_1_name",
+                        labels={},
+                        evaluation_count=1,
+                    ),
+                ],
+            }
+        ),
+    ]
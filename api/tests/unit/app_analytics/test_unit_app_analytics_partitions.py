@@ -0,0 +1,161 @@
+from datetime import UTC, datetime
+
+import pytest
+from django.core.management import call_command
+from django.db import connections
+from freezegun.api import FrozenDateTimeFactory
+from pytest_django.fixtures import SettingsWrapper
+
+from app_analytics.models import APIUsageRaw, Resource
+from app_analytics.partitions import (
+    create_partitions,
+    is_partitioned,
+    partition_table,
+)
+from app_analytics.tasks import clean_up_old_analytics_data
+
+pytestmark = pytest.mark.use_analytics_db
+
+
+def _get_partitions(table: str) -> list[str]:
+    with connections["analytics"].cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(%s) "
+            "ORDER BY child.relname",
+            [table],
+        )
+        return [partition for (partition,) in cursor.fetchall()]
+
+
+def test_partition_table__existing_rows__keeps_them_in_legacy_partition(
+    freezer: FrozenDateTimeFactory,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ANALYTICS_PARTITION_INTERVAL_DAYS = 7
+    freezer.move_to("2026-01-06T12:00:00Z")
+    existing_raw = APIUsageRaw.objects.create(
+        environment_id=1, host="host", resource=Resource.FLAGS
+    )
+
+    # When
+    partition_table(APIUsageRaw)
+
+    # Then
+    assert is_partitioned(APIUsageRaw)
+    assert _get_partitions("app_analytics_apiusageraw") == [
+        "app_analytics_apiusageraw_default",
+        "app_analytics_apiusageraw_legacy",
+        "app_analytics_apiusageraw_p20260108",
+        "app_analytics_apiusageraw_p20260115",
+    ]
+    new_raw = APIUsageRaw.objects.create(
+        environment_id=1, host="host", resource=Resource.FLAGS
+    )
+    assert new_raw.id > existing_raw.id
+    assert list(APIUsageRaw.objects.order_by("id")) == [existing_raw, new_raw]
+
+
+def test_clean_up_old_analytics_data__partitioned_table__drops_expired_partitions(
+    freezer: FrozenDateTimeFactory,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ANALYTICS_PARTITION_INTERVAL_DAYS = 7
+    settings.RAW_ANALYTICS_DATA_RETENTION_DAYS = 30
+    freezer.move_to("2026-01-06T12:00:00Z")
+    APIUsageRaw.objects.create(environment_id=1, host="host", resource=Resource.FLAGS)
+    partition_table(APIUsageRaw)
+
+    freezer.move_to("2026-01-13T12:00:00Z")
+    retained_raw = APIUsageRaw.objects.create(
+        environment_id=1, host="host", resource=Resource.FLAGS
+    )
+    assert retained_raw.created_at == datetime(2026, 1, 13, 12, tzinfo=UTC)
+
+    # When
+    freezer.move_to("2026-02-10T12:00:00Z")
+    clean_up_old_analytics_data()
+
+    # Then
+    assert _get_partitions("app_analytics_apiusageraw") == [
+        "app_analytics_apiusageraw_default",
+        "app_analytics_apiusageraw_p20260108",
+        "app_analytics_apiusageraw_p20260115",
+    ]
+    assert list(APIUsageRaw.objects.all()) == [retained_raw]
+
+
+def test_clean_up_old_analytics_data__legacy_partition_not_expired__deletes_expired_rows(
+    freezer: FrozenDateTimeFactory,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ANALYTICS_PARTITION_INTERVAL_DAYS = 7
+    settings.RAW_ANALYTICS_DATA_RETENTION_DAYS = 30
+    freezer.move_to("2025-11-01T12:00:00Z")
+    APIUsageRaw.objects.create(environment_id=1, host="host", resource=Resource.FLAGS)
+    freezer.move_to("2026-01-05T12:00:00Z")
+    retained_raw = APIUsageRaw.objects.create(
+        environment_id=1, host="host", resource=Resource.FLAGS
+    )
+    freezer.move_to("2026-01-06T12:00:00Z")
+    partition_table(APIUsageRaw)
+
+    # When
+    freezer.move_to("2026-01-20T12:00:00Z")
+    clean_up_old_analytics_data()
+
+    # Then
+    assert "app_analytics_apiusageraw_legacy" in _get_partitions(
+        "app_analytics_apiusageraw"
+    )
+    assert list(APIUsageRaw.objects.all()) == [retained_raw]
+
+
+def test_create_partitions__default_partition_holds_rows_in_range__moves_them(
+    freezer: FrozenDateTimeFactory,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ANALYTICS_PARTITION_INTERVAL_DAYS = 7
+    freezer.move_to("2026-01-06T12:00:00Z")
+    partition_table(APIUsageRaw)
+
+    freezer.move_to("2026-01-25T12:00:00Z")
+    default_raw = APIUsageRaw.objects.create(
+        environment_id=1, host="host", resource=Resource.FLAGS
+    )
+
+    # When
+    create_partitions(APIUsageRaw)
+
+    # Then
+    assert "app_analytics_apiusageraw_p20260122" in _get_partitions(
+        "app_analytics_apiusageraw"
+    )
+    with connections["analytics"].cursor() as cursor:
+        cursor.execute("SELECT id FROM app_analytics_apiusageraw_p20260122")
+        assert cursor.fetchall() == [(default_raw.id,)]
+        cursor.execute("SELECT id FROM app_analytics_apiusageraw_default")
+        assert cursor.fetchall() == []
+    assert list(APIUsageRaw.objects.all()) == [default_raw]
+
+
+def test_partition_analytics_tables__already_partitioned__skips_tables(
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.USE_POSTGRES_FOR_ANALYTICS = True
+    call_command("partition_analytics_tables")
+
+    # When
+    call_command("partition_analytics_tables")
+
+    # Then
+    assert is_partitioned(APIUsageRaw)
+    assert "app_analytics_apiusageraw_legacy" in _get_partitions(
+        "app_analytics_apiusageraw"
+    )
@@ -0,0 +1,173 @@
+from datetime import UTC, datetime
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from app_analytics.models import (
+    APIUsageBucket,
+    APIUsageRaw,
+    BucketSource,
+    BucketWatermark,
+    FeatureEvaluationBucket,
+    FeatureEvaluationRaw,
+    Resource,
+)
+from app_analytics.rollup import get_bucket_start, rollup_buckets
+
+pytestmark = pytest.mark.use_analytics_db
+
+
+def _create_api_usage_raw(created_at: datetime, count: int = 1) -> None:
+    raw = APIUsageRaw.objects.create(
+        environment_id=1,
+        host="host",
+        resource=Resource.FLAGS,
+        count=count,
+    )
+    raw.created_at = created_at
+    raw.save()
+
+
+def _get_api_usage_totals(bucket_size: int) -> list[tuple[datetime, int]]:
+    return list(
+        APIUsageBucket.objects.filter(bucket_size=bucket_size)
+        .order_by("created_at")
+        .values_list("created_at", "total_count")
+    )
+
+
+def test_get_bucket_start__daily_bucket_size__returns_start_of_utc_day() -> None:
+    # Given
+    value = datetime(2026, 1, 2, 13, 37, tzinfo=UTC)
+
+    # When
+    bucket_start = get_bucket_start(value, 60 * 24)
+
+    # Then
+    assert bucket_start == datetime(2026, 1, 2, tzinfo=UTC)
+
+
+def test_rollup_buckets__raw_api_usage__cascades_into_larger_buckets(
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 5, tzinfo=UTC), count=2)
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 10, tzinfo=UTC), count=3)
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 50, tzinfo=UTC), count=4)
+    _create_api_usage_raw(datetime(2026, 1, 1, 23, 59, tzinfo=UTC), count=5)
+    # still open, so not rolled up yet
+    _create_api_usage_raw(datetime(2026, 1, 2, 0, 1, tzinfo=UTC), count=6)
+    freezer.move_to("2026-01-02T00:10:00Z")
+
+    # When
+    rollup_buckets(BucketSource.API_USAGE)
+
+    # Then
+    assert _get_api_usage_totals(15) == [
+        (datetime(2026, 1, 1, 10, 0, tzinfo=UTC), 5),
+        (datetime(2026, 1, 1, 10, 45, tzinfo=UTC), 4),
+        (datetime(2026, 1, 1, 23, 45, tzinfo=UTC), 5),
+    ]
+    assert _get_api_usage_totals(60) == [
+        (datetime(2026, 1, 1, 10, 0, tzinfo=UTC), 9),
+        (datetime(2026, 1, 1, 23, 0, tzinfo=UTC), 5),
+    ]
+    assert _get_api_usage_totals(60 * 24) == [
+        (datetime(2026, 1, 1, tzinfo=UTC), 14),
+    ]
+    assert dict(
+        BucketWatermark.objects.filter(source=BucketSource.API_USAGE).values_list(
+            "bucket_size", "processed_till"
+        )
+    ) == {
+        15: datetime(2026, 1, 2, 0, 0, tzinfo=UTC),
+        60: datetime(2026, 1, 2, 0, 0, tzinfo=UTC),
+        60 * 24: datetime(2026, 1, 2, tzinfo=UTC),
+    }
+
+
+def test_rollup_buckets__run_again__only_aggregates_new_data(
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 5, tzinfo=UTC), count=2)
+    freezer.move_to("2026-01-01T10:20:00Z")
+    rollup_buckets(BucketSource.API_USAGE)
+
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 20, tzinfo=UTC), count=3)
+    freezer.move_to("2026-01-01T11:05:00Z")
+
+    # When
+    rollup_buckets(BucketSource.API_USAGE)
+
+    # Then
+    assert _get_api_usage_totals(15) == [
+        (datetime(2026, 1, 1, 10, 0, tzinfo=UTC), 2),
+        (datetime(2026, 1, 1, 10, 15, tzinfo=UTC), 3),
+    ]
+    assert _get_api_usage_totals(60) == [
+        (datetime(2026, 1, 1, 10, 0, tzinfo=UTC), 5),
+    ]
+    assert _get_api_usage_totals(60 * 24) == []
+
+
+def test_rollup_buckets__existing_buckets_without_watermark__continues_after_them(
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    APIUsageBucket.objects.create(
+        environment_id=1,
+        resource=Resource.FLAGS,
+        total_count=10,
+        bucket_size=15,
+        created_at=datetime(2026, 1, 1, 10, 0, tzinfo=UTC),
+    )
+    # already counted in the existing bucket
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 5, tzinfo=UTC), count=10)
+    _create_api_usage_raw(datetime(2026, 1, 1, 10, 20, tzinfo=UTC), count=3)
+    freezer.move_to("2026-01-01T10:40:00Z")
+
+    # When
+    rollup_buckets(BucketSource.API_USAGE)
+
+    # Then
+    assert _get_api_usage_totals(15) == [
+        (datetime(2026, 1, 1, 10, 0, tzinfo=UTC), 10),
+        (datetime(2026, 1, 1, 10, 15, tzinfo=UTC), 3),
+    ]
+
+
+def test_rollup_buckets__raw_feature_evaluations__aggregates_by_feature_and_labels(
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    for feature_name, labels in [
+        ("feature_1", {}),
+        ("feature_1", {}),
+        ("feature_1", {"client_application_name": "test-app"}),
+        ("feature_2", {}),
+    ]:
+        raw = FeatureEvaluationRaw.objects.create(
+            environment_id=1,
+            feature_name=feature_name,
+            evaluation_count=2,
+            labels=labels,
+        )
+        raw.created_at = datetime(2026, 1, 1, 10, 5, tzinfo=UTC)
+        raw.save()
+    freezer.move_to("2026-01-01T10:20:00Z")
+
+    # When
+    rollup_buckets(BucketSource.FEATURE_EVALUATION)
+
+    # Then
+    assert sorted(
+        FeatureEvaluationBucket.objects.filter(bucket_size=15).values_list(
+            "feature_name", "labels", "total_count"
+        ),
+        key=str,
+    ) == [
+        ("feature_1", {"client_application_name": "test-app"}, 2),
+        ("feature_1", {}, 4),
+        ("feature_2", {}, 2),
+    ]
@@ -8,6 +8,7 @@ from app_analytics.track import (
     track_feature_evaluation_influxdb,
     track_request_googleanalytics,
     track_request_influxdb,
+    track_requests_influxdb,
 )
 from app_analytics.types import TrackFeatureEvaluationsByEnvironmentData
 
@@ -113,6 +114,38 @@ def test_track_request_influxdb__with_host__sends_host_in_tags(
     )
 
 
+def test_track_requests_influxdb__multiple_requests__writes_all_data_points_at_once(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mock_influxdb = mocker.patch("app_analytics.track.InfluxDBWrapper")
+    mock_environment = mocker.MagicMock()
+
+    # When
+    track_requests_influxdb(
+        [
+            (
+                mock_environment,
+                {
+                    "resource": resource.value,
+                    "host": "testserver",
+                    "environment_key": "key",
+                    "count": 2,
+                    "labels": {},
+                },
+            )
+            for resource in (Resource.FLAGS, Resource.IDENTITIES)
+        ]
+    )
+
+    # Then
+    assert [
+        call.kwargs["tags"]["resource"]
+        for call in mock_influxdb.return_value.add_data_point.call_args_list
+    ] == ["flags", "identities"]
+    mock_influxdb.return_value.write.assert_called_once_with()
+
+
 def test_track_feature_evaluation_influxdb__multiple_features__writes_all_data_points(
     mocker: MockerFixture,
 ) -> None:
@@ -271,3 +271,51 @@ def test_list_audit_log_for_organisation__non_enterprise__limits_logs_returned(
     response_json = response.json()
     assert response_json["count"] == 1
     assert response_json["results"][0]["log"] == "Something that happened today"
+
+
+def test_list_audit_log__cursor_pagination__returns_every_log_once(
+    admin_client: APIClient, project: Project
+) -> None:
+    # Given
+    created_date = timezone.now()
+    audit_logs = [
+        AuditLog.objects.create(project=project, created_date=created_date)
+        for _ in range(3)
+    ] + [
+        AuditLog.objects.create(
+            project=project, created_date=created_date - timedelta(seconds=1)
+        )
+    ]
+    url = reverse("api-v1:audit-list")
+
+    # When
+    first_page = admin_client.get(url, {"cursor": "", "page_size": 2}).json()
+    second_page = admin_client.get(first_page["next"]).json()
+    previous_page = admin_client.get(second_page["previous"]).json()
+
+    # Then
+    assert first_page["count"] == 4
+    assert first_page["previous"] is None
+    assert [log["id"] for log in first_page["results"]] == [
+        audit_logs[2].id,
+        audit_logs[1].id,
+    ]
+    assert [log["id"] for log in second_page["results"]] == [
+        audit_logs[0].id,
+        audit_logs[3].id,
+    ]
+    assert second_page["next"] is None
+    assert previous_page["results"] == first_page["results"]
+
+
+def test_list_audit_log__invalid_cursor__returns_404(
+    admin_client: APIClient, project: Project
+) -> None:
+    # Given
+    url = reverse("api-v1:audit-list")
+
+    # When
+    response = admin_client.get(url, {"cursor": "invalid"})
+
+    # Then
+    assert response.status_code == status.HTTP_404_NOT_FOUND
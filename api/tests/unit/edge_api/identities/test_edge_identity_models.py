@@ -545,15 +545,50 @@ def test_get_all_feature_states__post_v2_versioning_migration__returns_latest_ov
     edge_identity_dynamo_wrapper_mock.get_segment_ids.return_value = [segment.id]
 
     # When
-    with django_assert_num_queries(4):
-        feature_states, identity_override_feature_names = (
-            edge_identity_model.get_all_feature_states()
-        )
+    feature_states, identity_override_feature_names = (
+        edge_identity_model.get_all_feature_states()
+    )
 
     # Then
     assert len(feature_states) == 1
     assert feature_states[0] == v2_segment_override
 
+    # and the environment's feature states are cached for subsequent calls
+    with django_assert_num_queries(1):
+        cached_feature_states, _ = edge_identity_model.get_all_feature_states()
+    assert cached_feature_states == feature_states
+
+
+def test_get_all_feature_states__segment_override_created__returns_new_override(
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    segment: Segment,
+    edge_identity_model: EdgeIdentity,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    edge_identity_dynamo_wrapper_mock = mocker.patch(
+        "edge_api.identities.models.EdgeIdentity.dynamo_wrapper",
+    )
+    edge_identity_dynamo_wrapper_mock.get_segment_ids.return_value = [segment.id]
+    initial_feature_states, _ = edge_identity_model.get_all_feature_states()
+
+    feature_segment = FeatureSegment.objects.create(
+        segment=segment, feature=feature, environment=environment
+    )
+    segment_override = FeatureState.objects.create(
+        feature=feature, environment=environment, feature_segment=feature_segment
+    )
+    Environment.objects.filter(id=environment.id).update(updated_at=timezone.now())
+
+    # When
+    feature_states, _ = edge_identity_model.get_all_feature_states()
+
+    # Then
+    assert initial_feature_states == [feature_state]
+    assert feature_states == [segment_override]
+
 
 def test_delete__clickhouse_enabled__schedules_delayed_recount(
     mocker: MockerFixture,
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from environments.dynamodb.utils import estimate_document_size
+from environments.dynamodb.utils import estimate_document_size, get_document_hash
 
 
 def test_estimate_document_size__simple_document__returns_expected() -> None:
@@ -81,3 +81,21 @@ def test_estimate_document_size__empty_document__returns_expected() -> None:
 
     # Then
     assert result == len("{}".encode())
+
+
+def test_get_document_hash__same_content_in_different_order__returns_same_hash() -> (
+    None
+):
+    # Given
+    document = {"key": "value", "number": Decimal("42"), "data": b"\x1f\x8b"}
+    reordered_document = {"data": b"\x1f\x8b", "number": Decimal("42"), "key": "value"}
+
+    # When / Then
+    assert get_document_hash(document) == get_document_hash(reordered_document)
+
+
+def test_get_document_hash__different_binary_content__returns_different_hash() -> None:
+    # Given / When / Then
+    assert get_document_hash({"data": b"\x1f\x8b"}) != get_document_hash(
+        {"data": b"\x8b\x1f"}
+    )
@@ -1,5 +1,6 @@
 from pytest_django.asserts import assertQuerySetEqual as assert_queryset_equal
-from pytest_django.fixtures import DjangoAssertNumQueries
+from pytest_django.fixtures import DjangoAssertNumQueries, SettingsWrapper
+from pytest_mock import MockerFixture
 
 from environments.dynamodb.migrator import IdentityMigrator
 from environments.dynamodb.types import (
@@ -29,13 +30,16 @@ def test_migrate__valid_project__calls_internal_methods_correctly(  # type: igno
         "environments.dynamodb.migrator.DynamoEnvironmentAPIKeyWrapper", autospec=True
     )
     mocked_project_metadata_instance = mocker.MagicMock(
-        spec=DynamoProjectMetadata, id=project.id
+        spec=DynamoProjectMetadata, id=project.id, last_migrated_identity_pk=None
     )
     mocked_project_metadata.get_or_new.return_value = mocked_project_metadata_instance
 
     mocked_identity_wrapper = mocker.patch(
         "environments.dynamodb.migrator.DynamoIdentityWrapper", autospec=True
     )
+    mocked_identity_wrapper.return_value.iter_identity_documents.side_effect = (
+        lambda identities: iter(identities)
+    )
 
     identity_migrator = IdentityMigrator(project.id)  # type: ignore[no-untyped-call]
 
@@ -45,11 +49,20 @@ def test_migrate__valid_project__calls_internal_methods_correctly(  # type: igno
     # Then
     mocked_identity_wrapper.assert_called_once_with()
 
-    args, kwargs = mocked_identity_wrapper.return_value.write_identities.call_args
-    assert kwargs == {}
+    mocked_project_metadata_instance.start_identity_migration.assert_called_once_with()
+    (
+        args,
+        kwargs,
+    ) = mocked_identity_wrapper.return_value.write_identity_documents.call_args
+    assert kwargs == {
+        "table": mocked_identity_wrapper.return_value.get_table.return_value
+    }
 
     assert_queryset_equal(
-        list(args[0]), Identity.objects.filter(environment__project__id=project.id)
+        args[0], Identity.objects.filter(environment__project__id=project.id)
+    )
+    mocked_project_metadata_instance.checkpoint_identity_migration.assert_called_once_with(
+        identity.pk
     )
     # and
     args, kwargs = mocked_environment_wrapper.return_value.write_environments.call_args
@@ -74,6 +87,59 @@ def test_migrate__valid_project__calls_internal_methods_correctly(  # type: igno
     assert project.enable_dynamo_db is True
 
 
+def test_migrate__interrupted_migration__resumes_after_last_migrated_identity(
+    mocker: MockerFixture,
+    project: Project,
+    environment: Environment,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.IDENTITY_MIGRATION_CHUNK_SIZE = 2
+    identities = [
+        Identity.objects.create(identifier=f"identity_{i}", environment=environment)
+        for i in range(5)
+    ]
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentWrapper")
+    mocker.patch("environments.dynamodb.migrator.DynamoEnvironmentAPIKeyWrapper")
+    mocked_project_metadata = mocker.patch(
+        "environments.dynamodb.migrator.DynamoProjectMetadata"
+    )
+    mocked_project_metadata_instance = mocker.MagicMock(
+        spec=DynamoProjectMetadata,
+        id=project.id,
+        identity_migration_status=ProjectIdentityMigrationStatus.MIGRATION_IN_PROGRESS,
+        last_migrated_identity_pk=identities[0].pk,
+    )
+    mocked_project_metadata.get_or_new.return_value = mocked_project_metadata_instance
+    mocked_identity_wrapper = mocker.patch(
+        "environments.dynamodb.migrator.DynamoIdentityWrapper", autospec=True
+    )
+    mocked_identity_wrapper.return_value.iter_identity_documents.side_effect = (
+        lambda identities: ({"identifier": i.identifier} for i in identities)
+    )
+
+    identity_migrator = IdentityMigrator(project.id)  # type: ignore[no-untyped-call]
+
+    # When
+    identity_migrator.migrate()  # type: ignore[no-untyped-call]
+
+    # Then
+    mocked_project_metadata_instance.start_identity_migration.assert_not_called()
+    write_identity_documents = (
+        mocked_identity_wrapper.return_value.write_identity_documents
+    )
+    written_identifiers = [
+        document["identifier"]
+        for call in write_identity_documents.call_args_list
+        for document in call.args[0]
+    ]
+    assert written_identifiers == [i.identifier for i in identities[1:]]
+    mocked_project_metadata_instance.checkpoint_identity_migration.assert_has_calls(
+        [mocker.call(identities[2].pk), mocker.call(identities[4].pk)]
+    )
+    mocked_project_metadata_instance.finish_identity_migration.assert_called_once_with()
+
+
 def test_trigger_migration__valid_project__calls_internal_methods_correctly(  # type: ignore[no-untyped-def]
     mocker, project
 ):
@@ -83,6 +83,7 @@ def test_start_identity_migration__new_project__calls_put_item_correctly(mocker)
             "migration_end_time": None,
             "migration_start_time": migration_start_time.isoformat(),
             "triggered_at": None,
+            "last_migrated_identity_pk": None,
         }
     )
 
@@ -150,6 +151,7 @@ def test_finish_identity_migration__started_migration__calls_put_item_correctly(
             "migration_start_time": migration_start_time,
             "migration_end_time": migration_end_time.isoformat(),
             "triggered_at": None,
+            "last_migrated_identity_pk": None,
         }
     )
 
@@ -178,3 +180,22 @@ def test_delete__existing_metadata__removes_document_from_dynamodb(  # type: ign
     assert (
         flagsmith_project_metadata_table.scan()["Items"][0]["id"] == second_project_id
     )
+
+
+def test_checkpoint_identity_migration__started_migration__persists_last_migrated_identity_pk(
+    flagsmith_project_metadata_table: Table, mocker: MockerFixture
+) -> None:
+    # Given
+    project_id = 1
+    mocker.patch(
+        "environments.dynamodb.types.project_metadata_table",
+        flagsmith_project_metadata_table,
+    )
+    project_metadata = DynamoProjectMetadata.get_or_new(project_id)
+    project_metadata.start_identity_migration()  # type: ignore[no-untyped-call]
+
+    # When
+    project_metadata.checkpoint_identity_migration(last_migrated_identity_pk=42)
+
+    # Then
+    assert DynamoProjectMetadata.get_or_new(project_id).last_migrated_identity_pk == 42
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 from boto3.dynamodb.types import Binary
 from common.test_tools import AssertMetricFixture
@@ -123,6 +125,83 @@ def test_write_environments__compress_dynamo_documents_enabled__logs_expected(
     ]
 
 
+def test_write_environments__unchanged_since_last_written__skips_write(
+    environment: Environment,
+    dynamo_environment_wrapper: DynamoEnvironmentWrapper,
+    flagsmith_environment_table: Table,
+    assert_metric: AssertMetricFixture,
+) -> None:
+    # Given
+    dynamo_environment_wrapper.write_environments([environment])
+    flagsmith_environment_table.delete_item(Key={"api_key": environment.api_key})
+
+    # When
+    dynamo_environment_wrapper.write_environments([environment])
+
+    # Then
+    assert flagsmith_environment_table.scan()["Count"] == 0
+    assert_metric(
+        name="flagsmith_dynamo_environment_document_writes_total",
+        labels={"table": flagsmith_environment_table.name, "result": "skipped"},
+        value=1.0,
+    )
+
+
+def test_write_environments__only_updated_at_changed__skips_write(
+    environment: Environment,
+    dynamo_environment_wrapper: DynamoEnvironmentWrapper,
+    flagsmith_environment_table: Table,
+) -> None:
+    # Given
+    dynamo_environment_wrapper.write_environments([environment])
+    flagsmith_environment_table.delete_item(Key={"api_key": environment.api_key})
+    Environment.objects.filter(id=environment.id).update(
+        updated_at=environment.updated_at + timedelta(minutes=1)
+    )
+    environment.refresh_from_db()
+
+    # When
+    dynamo_environment_wrapper.write_environments([environment])
+
+    # Then
+    assert flagsmith_environment_table.scan()["Count"] == 0
+
+
+def test_write_environments__changed_since_last_written__writes_document(
+    environment: Environment,
+    dynamo_environment_wrapper: DynamoEnvironmentWrapper,
+    flagsmith_environment_table: Table,
+) -> None:
+    # Given
+    dynamo_environment_wrapper.write_environments([environment])
+    environment.name = "Changed"
+    environment.save()
+
+    # When
+    dynamo_environment_wrapper.write_environments([environment])
+
+    # Then
+    results = flagsmith_environment_table.scan()["Items"]
+    assert len(results) == 1
+    assert results[0]["name"] == "Changed"
+
+
+def test_delete_environment__written_document__writes_document_again(
+    environment: Environment,
+    dynamo_environment_wrapper: DynamoEnvironmentWrapper,
+    flagsmith_environment_table: Table,
+) -> None:
+    # Given
+    dynamo_environment_wrapper.write_environments([environment])
+    dynamo_environment_wrapper.delete_environment(environment.api_key)
+
+    # When
+    dynamo_environment_wrapper.write_environments([environment])
+
+    # Then
+    assert flagsmith_environment_table.scan()["Count"] == 1
+
+
 def test_get_item__valid_api_key__returns_expected_document(mocker):  # type: ignore[no-untyped-def]
     # Given
     dynamo_environment_wrapper = DynamoEnvironmentWrapper()
@@ -23,6 +23,7 @@ from environments.dynamodb.wrappers.exceptions import (
     CapacityBudgetExceeded,
     SystemTraitWriteRaceError,
 )
+from environments.identities import evaluation
 from environments.identities.models import Identity
 from environments.identities.traits.constants import (
     TRAIT_STRING_VALUE_MAX_LENGTH,
@@ -338,12 +339,39 @@ def test_get_segment_ids__matching_segment_exists__returns_correct_ids(  # type:
     mocked_get_item_from_uuid.assert_called_with(identity_uuid)
 
 
+def test_get_segment_ids__called_twice__compiles_project_segments_once(
+    project: "Project",
+    environment: "Environment",
+    identity: "Identity",
+    identity_matching_segment: Segment,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    identity_model = IdentityModel.model_validate(
+        map_identity_to_identity_document(identity)
+    )
+    dynamo_identity_wrapper = DynamoIdentityWrapper()
+    compile_segments_spy = mocker.spy(evaluation, "compile_segments")
+
+    # When
+    first_segment_ids = dynamo_identity_wrapper.get_segment_ids(
+        identity_model=identity_model
+    )
+    second_segment_ids = dynamo_identity_wrapper.get_segment_ids(
+        identity_model=identity_model
+    )
+
+    # Then
+    assert first_segment_ids == second_segment_ids == [identity_matching_segment.id]
+    compile_segments_spy.assert_called_once()
+
+
 def test_get_segment_ids__segment_with_feature_overrides__returns_correct_ids(
     project: "Project",
     environment: "Environment",
     feature: "Feature",
     identity: "Identity",
-    identity_matching_segment: "Segment",
+    identity_matching_segment: Segment,
     mocker: "MockerFixture",
 ) -> None:
     # Given - a segment with two feature overrides:
@@ -545,7 +573,7 @@ def test_get_segment_ids__with_identity_model__returns_empty_list(  # type: igno
 
 def test_get_segment_ids__compressed_environment_in_dynamo__returns_correct_segment_ids(
     identity: "Identity",
-    identity_matching_segment: "Segment",
+    identity_matching_segment: Segment,
     dynamodb_identity_wrapper: DynamoIdentityWrapper,
     flagsmith_identities_table: Table,
     flagsmith_environment_table: Table,
@@ -751,6 +779,103 @@ def test_delete_all_identities__multiple_identities__deletes_only_matching_envir
     assert flagsmith_identities_table.scan()["Items"][0] == identity_three
 
 
+def test_iter_all_items_parallel__identifiers_across_segments__yields_all_items(
+    flagsmith_identities_table: Table,
+    dynamodb_identity_wrapper: DynamoIdentityWrapper,
+) -> None:
+    # Given
+    environment_api_key = "environment_one"
+    # Including identifiers equal to the boundaries between segments
+    identifiers = ["-dash", "0", "F", "V", "identity", "k", "z", "~tilde"]
+    for identifier in identifiers:
+        flagsmith_identities_table.put_item(
+            Item={
+                "composite_key": f"{environment_api_key}_{identifier}",
+                "environment_api_key": environment_api_key,
+                "identifier": identifier,
+            }
+        )
+    flagsmith_identities_table.put_item(
+        Item={
+            "composite_key": "environment_two_identity",
+            "environment_api_key": "environment_two",
+            "identifier": "identity",
+        }
+    )
+
+    # When
+    items = list(
+        dynamodb_identity_wrapper.iter_all_items_parallel(
+            environment_api_key=environment_api_key,
+            total_segments=4,
+            limit=1,
+            projection_expression="composite_key",
+        )
+    )
+
+    # Then
+    assert sorted(item["composite_key"] for item in items) == sorted(
+        f"{environment_api_key}_{identifier}" for identifier in identifiers
+    )
+
+
+def test_iter_all_items_parallel__capacity_budget_exceeded__raises_resumable_checkpoint(
+    identity: "Identity",
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    dynamo_identity_wrapper = DynamoIdentityWrapper()
+    identity_document = map_identity_to_identity_document(identity)
+
+    mocked_table = mocker.MagicMock()
+    mocker.patch.object(dynamo_identity_wrapper, "get_table", return_value=mocked_table)
+    mocked_table.query.side_effect = [
+        {
+            "Items": [identity_document],
+            "LastEvaluatedKey": "next_page_key",
+            "ConsumedCapacity": {"CapacityUnits": Decimal("1.1")},
+        },
+        {
+            "Items": [identity_document],
+            "LastEvaluatedKey": "next_after_next_page_key",
+            "ConsumedCapacity": {"CapacityUnits": Decimal("1.1")},
+        },
+        {
+            "Items": [identity_document],
+            "ConsumedCapacity": {"CapacityUnits": Decimal("1.1")},
+        },
+    ]
+
+    # When
+    iterator = dynamo_identity_wrapper.iter_all_items_parallel(
+        environment_api_key="test_api_key",
+        total_segments=1,
+        limit=1,
+        capacity_budget=Decimal("2.0"),
+    )
+    results = [next(iterator), next(iterator)]
+    with pytest.raises(CapacityBudgetExceeded) as exc_info:
+        next(iterator)
+    checkpoint = exc_info.value.checkpoint
+    resumed_results = list(
+        dynamo_identity_wrapper.iter_all_items_parallel(
+            environment_api_key="test_api_key",
+            limit=1,
+            checkpoint=checkpoint,
+        )
+    )
+
+    # Then
+    assert results == [identity_document, identity_document]
+    assert exc_info.value.capacity_spent == Decimal("2.2")
+    assert resumed_results == [identity_document]
+    assert checkpoint is not None
+    assert checkpoint.is_complete
+    assert mocked_table.query.call_args.kwargs["ExclusiveStartKey"] == (
+        "next_after_next_page_key"
+    )
+
+
 def test_set_system_trait__document_with_system_traits__sets_only_given_key(
     dynamodb_identity_wrapper: DynamoIdentityWrapper,
 ) -> None:
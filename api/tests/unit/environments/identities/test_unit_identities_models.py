@@ -10,6 +10,7 @@ from flag_engine.segments.constants import (
 from pytest_django import DjangoAssertNumQueries
 
 from core.constants import FLOAT
+from core.request_origin import RequestOrigin
 from environments.identities.models import Identity
 from environments.identities.traits.models import Trait
 from environments.models import Environment
@@ -1081,3 +1082,88 @@ def test_identity_get_all_feature_states__returns_identity_override__when_v2_fea
     # Then
     assert len(all_feature_states) == 1
     assert all_feature_states[0] == identity_override
+
+
+def test_get_all_feature_states_in_memory__overrides__returns_same_flags_as_database(
+    environment: Environment,
+    project: Project,
+    identity: Identity,
+    trait: Trait,
+    identity_matching_segment: Segment,
+) -> None:
+    # Given
+    default_feature = Feature.objects.create(name="default", project=project)
+    segment_feature = Feature.objects.create(name="segment", project=project)
+    identity_feature = Feature.objects.create(name="identity", project=project)
+
+    feature_segment = FeatureSegment.objects.create(
+        feature=segment_feature,
+        segment=identity_matching_segment,
+        environment=environment,
+    )
+    FeatureState.objects.create(
+        feature=segment_feature,
+        feature_segment=feature_segment,
+        environment=environment,
+        enabled=True,
+    )
+    FeatureState.objects.create(
+        feature=identity_feature,
+        identity=identity,
+        environment=environment,
+        enabled=True,
+    )
+
+    # When
+    feature_states = identity.get_all_feature_states_in_memory()
+
+    # Then
+    expected_feature_states = identity.get_all_feature_states()
+    assert sorted(fs.id for fs in feature_states) == sorted(
+        fs.id for fs in expected_feature_states
+    )
+    enabled_by_feature = {fs.feature: fs.enabled for fs in feature_states}
+    assert enabled_by_feature == {
+        default_feature: False,
+        segment_feature: True,
+        identity_feature: True,
+    }
+
+
+def test_get_all_feature_states_in_memory__client_origin__excludes_server_key_only_features(
+    environment: Environment,
+    project: Project,
+    identity: Identity,
+    feature: Feature,
+) -> None:
+    # Given
+    Feature.objects.create(
+        name="server_key_only", project=project, is_server_key_only=True
+    )
+
+    # When
+    feature_states = identity.get_all_feature_states_in_memory(
+        origin=RequestOrigin.CLIENT
+    )
+
+    # Then
+    assert [fs.feature for fs in feature_states] == [feature]
+
+
+def test_get_all_feature_states_in_memory__environment_cached__only_queries_identity_overrides(
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment: Environment,
+    identity: Identity,
+    feature: Feature,
+    segment: Segment,
+    segment_featurestate: FeatureState,
+) -> None:
+    # Given
+    identity.get_all_feature_states_in_memory(traits=[])
+
+    # When
+    with django_assert_num_queries(1):
+        feature_states = identity.get_all_feature_states_in_memory(traits=[])
+
+    # Then
+    assert [fs.feature for fs in feature_states] == [feature]
@@ -8,10 +8,13 @@ from common.environments.permissions import (
     MANAGE_IDENTITIES,
     VIEW_IDENTITIES,
 )
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from flag_engine.segments.constants import PERCENTAGE_SPLIT
 from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -302,6 +305,33 @@ def test_identity_list__search_with_pagination__returns_second_page(
     assert response2.data["results"]
 
 
+def test_identity_list__cursor_pagination__returns_every_identity_once(
+    environment: Environment,
+    admin_client: APIClient,
+) -> None:
+    # Given
+    identities = [
+        Identity.objects.create(identifier=f"user.{i}", environment=environment)
+        for i in range(5)
+    ]
+    url = reverse(
+        "api-v1:environments:environment-identities-list",
+        args=[environment.api_key],
+    )
+
+    # When
+    response1 = admin_client.get(url, {"cursor": "", "page_size": 3})
+    response2 = admin_client.get(response1.data["next"])
+
+    # Then
+    assert response1.data["count"] == 5
+    assert [
+        identity["id"]
+        for identity in response1.data["results"] + response2.data["results"]
+    ] == [identity.id for identity in identities]
+    assert response2.data["next"] is None
+
+
 def test_identity_delete__existing_identity__removes_identity(
     environment: Environment,
     admin_client: APIClient,
@@ -1447,3 +1477,288 @@ def test_sdk_identities_get__given_identifier__retrieves_feature_states(
 
     # Then
     assert response.status_code == status.HTTP_200_OK
+
+
+def test_sdk_identities_get__in_memory_evaluation__queries_identity_data_only(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    identity: Identity,
+    settings: SettingsWrapper,
+    trait: Trait,
+) -> None:
+    # Given
+    settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION = True
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    url = f"/api/v1/identities/?identifier={identity.identifier}"
+    api_client.get(url)
+
+    # When
+    # identity, traits and identity overrides
+    with django_assert_num_queries(3):
+        response = api_client.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert [flag["feature"]["name"] for flag in response.json()["flags"]] == [
+        feature.name
+    ]
+
+
+def test_sdk_identities_post__in_memory_evaluation_client_key__excludes_server_key_only_feature(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    identity: Identity,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION = True
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    feature.is_server_key_only = True
+    feature.save()
+
+    data = {
+        "identifier": identity.identifier,
+        "traits": [{"trait_key": "foo", "trait_value": "bar"}],
+    }
+
+    # When
+    response = api_client.post(
+        reverse("api-v1:sdk-identities"),
+        data=json.dumps(data),
+        content_type="application/json",
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["flags"] == []
+
+
+@pytest.mark.parametrize("in_memory_evaluation", [True, False])
+def test_sdk_bulk_identify__identities_with_traits__returns_flags_for_each(
+    api_client: APIClient,
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature: Feature,
+    identity: Identity,
+    trait: Trait,
+    settings: SettingsWrapper,
+    in_memory_evaluation: bool,
+) -> None:
+    # Given
+    settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION = in_memory_evaluation
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    Trait.objects.create(identity=identity, trait_key="nulled", string_value="foo")
+    FeatureState.objects.create(
+        feature=feature, identity=identity, environment=environment, enabled=True
+    )
+
+    data = {
+        "identities": [
+            {
+                "identifier": identity.identifier,
+                "traits": [
+                    {"trait_key": trait.trait_key, "trait_value": "updated"},
+                    {"trait_key": "nulled", "trait_value": None},
+                ],
+            },
+            {
+                "identifier": "new_identity",
+                "traits": [{"trait_key": "new_trait", "trait_value": 1}],
+            },
+        ]
+    }
+
+    # When
+    response = api_client.post(
+        reverse("api-v1:sdk-bulk-identify"),
+        data=json.dumps(data),
+        content_type="application/json",
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert [
+        (
+            result["identifier"],
+            {t["trait_key"]: t["trait_value"] for t in result["traits"]},
+            [flag["enabled"] for flag in result["flags"]],
+        )
+        for result in response.json()
+    ] == [
+        (identity.identifier, {trait.trait_key: "updated"}, [True]),
+        ("new_identity", {"new_trait": 1}, [False]),
+    ]
+    assert dict(
+        Trait.objects.filter(identity__environment=environment).values_list(
+            "identity__identifier", "trait_key"
+        )
+    ) == {identity.identifier: trait.trait_key, "new_identity": "new_trait"}
+
+
+def test_sdk_bulk_identify__many_identities__uses_fixed_number_of_queries(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature_state: FeatureState,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.SDK_IDENTITIES_IN_MEMORY_EVALUATION = True
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    url = reverse("api-v1:sdk-bulk-identify")
+
+    def get_data(identifiers: range) -> str:
+        return json.dumps(
+            {
+                "identities": [
+                    {
+                        "identifier": f"identity_{i}",
+                        "traits": [{"trait_key": "key", "trait_value": i}],
+                    }
+                    for i in identifiers
+                ]
+            }
+        )
+
+    api_client.post(url, data=get_data(range(1)), content_type="application/json")
+
+    # When
+    # identities upsert, identities, traits, traits upsert and identity overrides
+    with django_assert_num_queries(5):
+        response = api_client.post(
+            url, data=get_data(range(1, 51)), content_type="application/json"
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 50
+
+
+def test_sdk_bulk_identify__in_memory_evaluation_disabled__query_count_independent_of_identities(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature_state: FeatureState,
+    segment_featurestate: FeatureState,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    url = reverse("api-v1:sdk-bulk-identify")
+
+    def get_data(identifiers: range) -> str:
+        return json.dumps(
+            {
+                "identities": [
+                    {
+                        "identifier": f"identity_{i}",
+                        "traits": [{"trait_key": "key", "trait_value": i}],
+                    }
+                    for i in identifiers
+                ]
+            }
+        )
+
+    api_client.post(url, data=get_data(range(1)), content_type="application/json")
+    with CaptureQueriesContext(connection) as captured_queries:
+        api_client.post(
+            url, data=get_data(range(1, 2)), content_type="application/json"
+        )
+
+    # When
+    with django_assert_num_queries(len(captured_queries)):
+        response = api_client.post(
+            url, data=get_data(range(2, 52)), content_type="application/json"
+        )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 50
+
+
+def test_sdk_bulk_identify__server_key_only_feature_with_client_key__excludes_flag(
+    api_client: APIClient,
+    environment: Environment,
+    feature: Feature,
+    identity: Identity,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    feature.is_server_key_only = True
+    feature.save()
+    FeatureState.objects.create(
+        feature=feature, identity=identity, environment=environment, enabled=True
+    )
+
+    # When
+    response = api_client.post(
+        reverse("api-v1:sdk-bulk-identify"),
+        data=json.dumps({"identities": [{"identifier": identity.identifier}]}),
+        content_type="application/json",
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0]["flags"] == []
+
+
+def test_sdk_bulk_identify__edge_project__forwards_identities_to_edge(
+    api_client: APIClient,
+    environment: Environment,
+    project: Project,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.EDGE_API_URL = "http://localhost"
+    project.enable_dynamo_db = True
+    project.save()
+    mocked_forward_identity_requests = mocker.patch(
+        "environments.identities.views.forward_identity_requests"
+    )
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    identities = [
+        {"identifier": "foo", "traits": [{"trait_key": "key", "trait_value": 1}]},
+        {"identifier": "bar"},
+    ]
+
+    # When
+    response = api_client.post(
+        reverse("api-v1:sdk-bulk-identify"),
+        data=json.dumps({"identities": identities}),
+        content_type="application/json",
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    args, kwargs = mocked_forward_identity_requests.delay.call_args
+    assert args == ()
+    assert kwargs["args"][0] == "POST"
+    assert kwargs["args"][1].get("X-Environment-Key") == environment.api_key
+    assert kwargs["args"][2] == project.id
+    assert kwargs["args"][3] == identities
+
+
+def test_sdk_bulk_identify__duplicate_identifiers__returns_400(
+    api_client: APIClient,
+    environment: Environment,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    data = {"identities": [{"identifier": "foo"}, {"identifier": "foo"}]}
+
+    # When
+    response = api_client.post(
+        reverse("api-v1:sdk-bulk-identify"),
+        data=json.dumps(data),
+        content_type="application/json",
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"identities": ["Identifiers must be unique."]}
@@ -42,3 +42,28 @@ def test_migrate_to_edge__already_migrated__raises_command_error(  # type: ignor
     # Then
     mocked_identity_migrator.assert_called_with(project_id)
     mocked_identity_migrator.return_value.migrate.assert_not_called()
+
+
+@pytest.mark.parametrize("can_resume", [True, False])
+def test_migrate_to_edge__resume__calls_migrate_if_can_resume(
+    mocker,  # type: ignore[no-untyped-def]
+    can_resume: bool,
+) -> None:
+    # Given
+    project_id = 1
+    mocked_identity_migrator = mocker.patch(
+        "environments.management.commands.migrate_to_edge.IdentityMigrator",
+        spec=IdentityMigrator,
+    )
+    mocked_identity_migrator.return_value.can_migrate = False
+    mocked_identity_migrator.return_value.can_resume = can_resume
+
+    # When
+    if can_resume:
+        call_command("migrate_to_edge", project_id, "--resume")
+    else:
+        with pytest.raises(CommandError):
+            call_command("migrate_to_edge", project_id, "--resume")
+
+    # Then
+    assert mocked_identity_migrator.return_value.migrate.called is can_resume
@@ -0,0 +1,82 @@
+import gzip
+import json
+
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from environments.sdk.encoding import (
+    EncodedEnvironmentDocument,
+    encode_environment_document,
+)
+from util.mappers.sdk import SDKDocument
+
+
+def test_encode_environment_document__returns_json_and_gzip_content(
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.BROTLI_INSTALLED = False
+    document: SDKDocument = {"api_key": "test_key", "feature_states": []}
+
+    # When
+    encoded_document = encode_environment_document(document)
+
+    # Then
+    assert json.loads(encoded_document.content) == document
+    assert gzip.decompress(encoded_document.gzip_content) == encoded_document.content
+    assert encoded_document.brotli_content is None
+    assert encode_environment_document(document) == encoded_document
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, has_brotli_content, expected_content_encoding",
+    [
+        ("", True, None),
+        ("identity", True, None),
+        ("gzip", True, "gzip"),
+        ("gzip, deflate, br", True, "br"),
+        ("gzip, deflate, br", False, "gzip"),
+        ("br;q=0, GZIP;q=0.8", True, "gzip"),
+        ("gzip;q=0", True, None),
+    ],
+)
+def test_encoded_environment_document_get_content_encoding__returns_expected(
+    accept_encoding: str,
+    has_brotli_content: bool,
+    expected_content_encoding: str | None,
+) -> None:
+    # Given
+    encoded_document = EncodedEnvironmentDocument(
+        content=b"content",
+        content_hash="hash",
+        gzip_content=b"gzip_content",
+        brotli_content=b"brotli_content" if has_brotli_content else None,
+    )
+
+    # When
+    content_encoding = encoded_document.get_content_encoding(accept_encoding)
+
+    # Then
+    assert content_encoding == expected_content_encoding
+
+
+@pytest.mark.parametrize(
+    "content_encoding, expected_etag",
+    [(None, "hash"), ("gzip", "hash-gzip"), ("br", "hash-br")],
+)
+def test_encoded_environment_document_get_etag__returns_etag_per_encoding(
+    content_encoding: str | None,
+    expected_etag: str,
+) -> None:
+    # Given
+    encoded_document = EncodedEnvironmentDocument(
+        content=b"content",
+        content_hash="hash",
+        gzip_content=b"gzip_content",
+    )
+
+    # When
+    etag = encoded_document.get_etag(content_encoding)
+
+    # Then
+    assert etag == expected_etag
@@ -0,0 +1,141 @@
+import pytest
+from freezegun import freeze_time
+from pytest_django import DjangoAssertNumQueries
+from pytest_mock import MockerFixture
+
+from environments import models as environment_models
+from environments.local_cache import (
+    EnvironmentLocalCache,
+    get_environment_cache_version,
+    get_or_create_environment_cache_version,
+    publish_environment_cache_versions,
+)
+from environments.models import Environment, EnvironmentAPIKey
+
+
+@pytest.fixture()
+def environment_local_cache(mocker: MockerFixture) -> EnvironmentLocalCache:
+    environment_local_cache = EnvironmentLocalCache(max_entries=2, timeout=5)
+    mocker.patch("environments.models.environment_local_cache", environment_local_cache)
+    return environment_local_cache
+
+
+def test_environment_local_cache_get__within_timeout__returns_copy_without_revalidation(
+    environment: Environment,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    local_cache = EnvironmentLocalCache(max_entries=1, timeout=5)
+    local_cache.set(environment.api_key, environment, "version")
+    mock_get_version = mocker.patch(
+        "environments.local_cache.get_environment_cache_version"
+    )
+
+    # When
+    cached_environment = local_cache.get(environment.api_key)
+
+    # Then
+    assert cached_environment == environment
+    assert cached_environment is not environment
+    mock_get_version.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "published_version, expected_hit",
+    [("version", True), ("new_version", False), (None, False)],
+)
+def test_environment_local_cache_get__timeout_elapsed__revalidates_version(
+    environment: Environment,
+    mocker: MockerFixture,
+    published_version: str | None,
+    expected_hit: bool,
+) -> None:
+    # Given
+    local_cache = EnvironmentLocalCache(max_entries=1, timeout=5)
+    with freeze_time("2026-01-01T00:00:00Z"):
+        local_cache.set(environment.api_key, environment, "version")
+    mocker.patch(
+        "environments.local_cache.get_environment_cache_version",
+        return_value=published_version,
+    )
+
+    # When
+    with freeze_time("2026-01-01T00:00:06Z"):
+        cached_environment = local_cache.get(environment.api_key)
+
+    # Then
+    assert (cached_environment == environment) is expected_hit
+    assert (local_cache.get(environment.api_key) is not None) is expected_hit
+
+
+def test_environment_local_cache_set__max_entries_exceeded__evicts_least_recently_used(
+    environment: Environment,
+) -> None:
+    # Given
+    local_cache = EnvironmentLocalCache(max_entries=2, timeout=5)
+    local_cache.set("key_1", environment, "version")
+    local_cache.set("key_2", environment, "version")
+    local_cache.get("key_1")
+
+    # When
+    local_cache.set("key_3", environment, "version")
+
+    # Then
+    assert local_cache.get("key_1") is not None
+    assert local_cache.get("key_2") is None
+    assert local_cache.get("key_3") is not None
+
+
+def test_get_or_create_environment_cache_version__published_version__returns_it() -> (
+    None
+):
+    # Given
+    publish_environment_cache_versions(["api_key"])
+    published_version = get_environment_cache_version("api_key")
+
+    # When
+    version = get_or_create_environment_cache_version("api_key")
+
+    # Then
+    assert published_version
+    assert version == published_version
+
+
+def test_get_from_cache__local_cache_enabled__serves_environment_without_queries(
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment: Environment,
+    environment_local_cache: EnvironmentLocalCache,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    Environment.get_from_cache(environment.api_key)
+    shared_cache_get_spy = mocker.spy(environment_models.environment_cache, "get")
+
+    # When
+    with django_assert_num_queries(0):
+        cached_environment = Environment.get_from_cache(environment.api_key)
+
+    # Then
+    assert cached_environment == environment
+    shared_cache_get_spy.assert_not_called()
+
+
+def test_get_from_cache__local_cache_enabled_environment_updated__reloads_environment(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    environment_local_cache: EnvironmentLocalCache,
+) -> None:
+    # Given
+    with freeze_time("2026-01-01T00:00:00Z"):
+        Environment.get_from_cache(environment_api_key.key)
+
+    environment.name = "updated name"
+    environment.save()
+
+    # When
+    with freeze_time("2026-01-01T00:00:06Z"):
+        cached_environment = Environment.get_from_cache(environment_api_key.key)
+
+    # Then
+    assert cached_environment
+    assert cached_environment.name == "updated name"
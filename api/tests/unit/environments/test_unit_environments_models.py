@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, Mock
 
 import pytest
 from common.test_tools import AssertMetricFixture
+from django.core.cache.backends.locmem import LocMemCache
 from django.db.models import Count, Q
 from django.test import override_settings
 from django.utils import timezone
@@ -28,6 +29,7 @@ from environments.models import (
     Webhook,
     environment_cache,
 )
+from environments.sdk.encoding import encode_environment_document
 from features.feature_types import MULTIVARIATE
 from features.models import Feature, FeatureSegment, FeatureState
 from features.multivariate.models import MultivariateFeatureOption
@@ -1350,3 +1352,114 @@ def test_write_environment_documents__persistent_caching_enabled__caches_sdk_doc
     expected_document = map_environment_to_sdk_document(environment)
 
     assert cached_document == expected_document
+
+
+@mock.patch("environments.models.environment_document_cache")
+def test_write_environment_documents__encoded_persistent_caching_enabled__caches_encoded_sdk_document(
+    mock_document_cache: MagicMock, environment: Environment, settings: typing.Any
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_MODE = EnvironmentDocumentCacheMode.PERSISTENT
+    settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED = True
+
+    # When
+    Environment.write_environment_documents(environment_id=environment.id)
+
+    # Then
+    cache_payload = mock_document_cache.set_many.call_args[0][0]
+    expected_document = map_environment_to_sdk_document(environment)
+    assert cache_payload == {
+        environment.api_key: expected_document,
+        f"encoded:{environment.api_key}": encode_environment_document(
+            expected_document
+        ),
+    }
+
+
+def test_get_environment_document__encoded_persistent_cache_rewritten__returns_updated_document(
+    environment: Environment,
+    feature: Feature,
+    settings: typing.Any,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_MODE = EnvironmentDocumentCacheMode.PERSISTENT
+    settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED = True
+    mocker.patch(
+        "environments.models.environment_document_cache",
+        LocMemCache(name="environment_document", params={}),
+    )
+    Environment.get_environment_document(environment.api_key)
+
+    Feature.objects.create(name="new_feature", project=environment.project)
+
+    # When
+    Environment.write_environment_documents(environment_id=environment.id)
+
+    # Then
+    environment_document = Environment.get_environment_document(environment.api_key)
+    assert "new_feature" in [
+        feature_state["feature"]["name"]
+        for feature_state in environment_document["feature_states"]
+    ]
+
+
+def test_get_encoded_environment_document__persistent_cache_miss__caches_encoded_document(
+    environment: Environment,
+    persistent_environment_document_cache: MagicMock,
+) -> None:
+    # When
+    encoded_document = Environment.get_encoded_environment_document(environment.api_key)
+
+    # Then
+    assert encoded_document == encode_environment_document(
+        map_environment_to_sdk_document(environment)
+    )
+    persistent_environment_document_cache.get.assert_called_once_with(
+        f"encoded:{environment.api_key}"
+    )
+    persistent_environment_document_cache.set.assert_called_once_with(
+        f"encoded:{environment.api_key}", encoded_document
+    )
+
+
+def test_delete_environment__encoded_persistent_cache__deletes_encoded_document(
+    environment: Environment,
+    persistent_environment_document_cache: MagicMock,
+    settings: typing.Any,
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED = True
+
+    # When
+    environment.delete()
+
+    # Then
+    persistent_environment_document_cache.delete.assert_has_calls(
+        [mock.call(environment.api_key), mock.call(f"encoded:{environment.api_key}")]
+    )
+
+
+def test_get_compiled_segments_from_cache__cache_miss__compiles_and_sets_cache(
+    environment: Environment,
+    segment: Segment,
+    segment_featurestate: FeatureState,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    mock_environment_segments_cache = mocker.patch(
+        "environments.models.environment_segments_cache"
+    )
+    mock_environment_segments_cache.get.return_value = None
+
+    # When
+    compiled_segments = environment.get_compiled_segments_from_cache()
+
+    # Then
+    assert [compiled_segment.segment for compiled_segment in compiled_segments] == [
+        segment
+    ]
+    mock_environment_segments_cache.set.assert_any_call(
+        f"compiled:{environment.id}:{environment.updated_at.timestamp()}",
+        compiled_segments,
+    )
@@ -1,3 +1,4 @@
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
 from audit.models import AuditLog
@@ -117,3 +118,27 @@ def test_delete_environment_from_dynamo__valid_environment__calls_all_wrappers(
     mocked_identity_wrapper.delete_all_identities.assert_called_once_with(
         environment_api_key
     )
+
+
+def test_process_environment_update__cache_flags_payloads__writes_flags_payloads(
+    environment: Environment,
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_PAYLOADS = True
+    audit_log = AuditLog.objects.create(
+        project=environment.project, environment=environment
+    )
+    mocker.patch("environments.tasks.Environment", autospec=True)
+    mock_write_flags_payloads = mocker.patch(
+        "environments.tasks.write_flags_payloads", autospec=True
+    )
+
+    # When
+    process_environment_update(audit_log_id=audit_log.id)
+
+    # Then
+    mock_write_flags_payloads.assert_called_once_with(
+        environment_id=environment.id, project_id=environment.project.id
+    )
@@ -1,3 +1,5 @@
+import gzip
+import hashlib
 import time
 from typing import TYPE_CHECKING
 from unittest.mock import ANY
@@ -11,6 +13,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.constants import FLAGSMITH_UPDATED_AT_HEADER
+from environments.enums import EnvironmentDocumentCacheMode
 from environments.identities.models import Identity
 from environments.models import Environment, EnvironmentAPIKey
 from features.feature_types import MULTIVARIATE
@@ -29,6 +32,7 @@ from segments.models import Segment
 
 if TYPE_CHECKING:
     from pytest_django import DjangoAssertNumQueries
+    from pytest_django.fixtures import SettingsWrapper
 
     from organisations.models import Organisation
 
@@ -317,3 +321,97 @@ def test_get_environment_document__if_modified_since_header__returns_304_or_200(
     # Then - actual environment is returned with a 200
     assert response4.status_code == status.HTTP_200_OK
     assert len(response4.content) > 0
+
+
+@pytest.mark.parametrize("accept_encoding", ["", "gzip", "br;q=0, gzip;q=0.5"])
+def test_get_environment_document__encoded_cache__returns_same_document(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature: Feature,
+    settings: "SettingsWrapper",
+    accept_encoding: str,
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_MODE = EnvironmentDocumentCacheMode.PERSISTENT
+    url = reverse("api-v1:environment-document")
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    expected_content = client.get(url).content
+
+    settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED = True
+    Environment.write_environment_documents(environment_id=environment.id)
+
+    # When
+    response = client.get(url, HTTP_ACCEPT_ENCODING=accept_encoding)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert "Accept-Encoding" in response.headers["Vary"]
+    expected_content_hash = hashlib.sha256(expected_content).hexdigest()
+    if accept_encoding:
+        assert response.headers["ETag"] == f'"{expected_content_hash}-gzip"'
+    else:
+        assert response.headers["ETag"] == f'"{expected_content_hash}"'
+    if accept_encoding:
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(response.content) == expected_content
+    else:
+        assert "Content-Encoding" not in response.headers
+        assert response.content == expected_content
+
+
+def test_get_environment_document__encoded_cache_if_none_match__returns_304_until_updated(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature: Feature,
+    settings: "SettingsWrapper",
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_MODE = EnvironmentDocumentCacheMode.PERSISTENT
+    settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED = True
+    url = reverse("api-v1:environment-document")
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    etag = client.get(url).headers["ETag"]
+
+    # When
+    not_modified_response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    Feature.objects.create(name="new_feature", project=environment.project)
+    Environment.write_environment_documents(environment_id=environment.id)
+    modified_response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    # Then
+    assert not_modified_response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified_response.content == b""
+    assert modified_response.status_code == status.HTTP_200_OK
+    assert modified_response.headers["ETag"] != etag
+    assert "new_feature" in [
+        feature_state["feature"]["name"]
+        for feature_state in modified_response.json()["feature_states"]
+    ]
+
+
+def test_get_environment_document__encoded_cache_other_encoding__returns_distinct_etag(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature: Feature,
+    settings: "SettingsWrapper",
+) -> None:
+    # Given
+    settings.CACHE_ENVIRONMENT_DOCUMENT_MODE = EnvironmentDocumentCacheMode.PERSISTENT
+    settings.CACHE_ENVIRONMENT_DOCUMENT_ENCODED = True
+    url = reverse("api-v1:environment-document")
+    client = APIClient()
+    client.credentials(HTTP_X_ENVIRONMENT_KEY=environment_api_key.key)
+    identity_etag = client.get(url).headers["ETag"]
+
+    # When
+    response = client.get(
+        url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=identity_etag
+    )
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] != identity_etag
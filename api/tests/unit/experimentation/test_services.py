@@ -1,5 +1,5 @@
 from dataclasses import asdict
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
@@ -29,6 +29,8 @@ from experimentation.models import (
     ExpectedDirection,
     Experiment,
     ExperimentMetric,
+    ExperimentResults,
+    ExperimentResultsPartial,
     ExperimentStatus,
     Metric,
     MetricAggregation,
@@ -1017,6 +1019,105 @@ def test_get_metric_variant_stats__shuffled_columns__maps_by_name(
     )
 
 
+def test_get_metric_variant_cohort_stats__metrics__groups_rows_by_cohort_day(
+    mocker: MockerFixture,
+) -> None:
+    # Given the warehouse returns per-day, per-variant counts for one metric
+    rows = [
+        (date(2026, 6, 1), "control", 1000, 100.0, 100.0),
+        (date(2026, 6, 1), "variant_a", 900, 90.0, 90.0),
+        (date(2026, 6, 2), "control", 10, 1.0, 1.0),
+    ]
+    mock_client = mocker.Mock()
+    mock_client.execute.return_value = (
+        rows,
+        [("cohort_day", "Date"), *_result_columns(1)],
+    )
+    mocker.patch(
+        "experimentation.services._get_clickhouse_client",
+        return_value=mock_client,
+    )
+    specs = [_spec(metric_id=7)]
+    cohort_start = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+    # When
+    cohorts = services.get_metric_variant_cohort_stats(
+        environment_key="env-key-123",
+        feature_name="my-feature",
+        window_start=datetime(2026, 5, 20, tzinfo=timezone.utc),
+        window_end=datetime(2026, 6, 10, tzinfo=timezone.utc),
+        cohort_start=cohort_start,
+        attribution_days=7,
+        specs=specs,
+    )
+
+    # Then each first-exposure day is decoded separately
+    assert cohorts == {
+        date(2026, 6, 1): _aggregates(
+            specs=specs,
+            exposure_counts={"control": 1000, "variant_a": 900},
+            metric_stats={
+                7: {
+                    "control": VariantStats(n=1000, sum=100.0, sum_squares=100.0),
+                    "variant_a": VariantStats(n=900, sum=90.0, sum_squares=90.0),
+                }
+            },
+        ),
+        date(2026, 6, 2): _aggregates(
+            specs=specs,
+            exposure_counts={"control": 10},
+            metric_stats={7: {"control": VariantStats(n=10, sum=1.0, sum_squares=1.0)}},
+        ),
+    }
+    # And only identities first exposed since cohort_start, and metric events
+    # within the attribution window, are queried
+    sql, params = mock_client.execute.call_args.args
+    assert "toDate(e.first_exposure, 'UTC') AS cohort_day" in sql
+    assert "AND e.first_exposure >= %(cohort_start)s" in sql
+    assert "m.timestamp >= %(cohort_start)s" in sql
+    assert "m.timestamp < e.first_exposure + toIntervalDay(%(attribution_days)s)" in sql
+    assert "GROUP BY cohort_day, variant" in sql
+    assert params["cohort_start"] == cohort_start
+    assert params["attribution_days"] == 7
+
+
+def test_merge_results_aggregates__partials__adds_up_counts_and_stats() -> None:
+    # Given aggregates of two separate groups of identities
+    specs = [_spec(metric_id=7)]
+    partials = [
+        _aggregates(
+            specs=specs,
+            exposure_counts={"control": 1000, "variant_a": 900},
+            metric_stats={
+                7: {
+                    "control": VariantStats(n=1000, sum=100.0, sum_squares=100.0),
+                    "variant_a": VariantStats(n=900, sum=90.0, sum_squares=90.0),
+                }
+            },
+        ),
+        _aggregates(
+            specs=specs,
+            exposure_counts={"control": 10},
+            metric_stats={7: {"control": VariantStats(n=10, sum=1.0, sum_squares=1.0)}},
+        ),
+    ]
+
+    # When
+    aggregates = services.merge_results_aggregates(specs, partials)
+
+    # Then
+    assert aggregates == _aggregates(
+        specs=specs,
+        exposure_counts={"control": 1010, "variant_a": 900},
+        metric_stats={
+            7: {
+                "control": VariantStats(n=1010, sum=101.0, sum_squares=101.0),
+                "variant_a": VariantStats(n=900, sum=90.0, sum_squares=90.0),
+            }
+        },
+    )
+
+
 @pytest.mark.parametrize(
     "aggregation, expected",
     [
@@ -1521,6 +1622,149 @@ def test_compute_results_summary__experiment__queries_warehouse_and_builds(
     assert summary.metrics[0].inference["variant_a"] is not None
 
 
+def _cohort_aggregates(
+    specs: list[MetricSpec],
+    metric_id: int,
+    n: int,
+) -> ResultsAggregates:
+    return _aggregates(
+        specs=specs,
+        exposure_counts={"control": n, "variant_a": n},
+        metric_stats={
+            metric_id: {
+                "control": VariantStats(n=n, sum=n / 10, sum_squares=n / 10),
+                "variant_a": VariantStats(n=n, sum=n / 5, sum_squares=n / 5),
+            }
+        },
+    )
+
+
+@pytest.mark.django_db
+def test_compute_incremental_results_summary__refreshed__reuses_closed_days(
+    environment: Environment,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given a running experiment with one metric and a 7 day attribution window
+    settings.EXPERIMENT_RESULTS_ATTRIBUTION_DAYS = 7
+    feature = _multivariate_feature(environment, {"variant_a": 50})
+    experiment = Experiment.objects.create(
+        environment=environment,
+        feature=feature,
+        name="exp",
+        hypothesis="h",
+        status=ExperimentStatus.RUNNING,
+        started_at=datetime(2026, 6, 1, 12, tzinfo=timezone.utc),
+    )
+    metric = Metric.objects.create(
+        environment=environment,
+        name="Purchases",
+        aggregation=MetricAggregation.OCCURRENCE,
+        direction=MetricDirection.UP,
+        definition={"version": 1, "event": "purchase"},
+    )
+    ExperimentMetric.objects.create(
+        experiment=experiment,
+        metric=metric,
+        expected_direction=ExpectedDirection.INCREASE,
+    )
+    specs = [_spec(metric_id=metric.id)]
+    results = ExperimentResults.objects.create(experiment=experiment)
+    mock_stats = mocker.patch(
+        "experimentation.services.get_metric_variant_cohort_stats",
+        side_effect=[
+            {
+                date(2026, 6, 1): _cohort_aggregates(specs, metric.id, 500),
+                date(2026, 6, 2): _cohort_aggregates(specs, metric.id, 300),
+                date(2026, 6, 3): _cohort_aggregates(specs, metric.id, 200),
+            },
+            {
+                date(2026, 6, 3): _cohort_aggregates(specs, metric.id, 250),
+            },
+        ],
+    )
+
+    # When results are computed, then refreshed a day later
+    services.compute_incremental_results_summary(
+        results,
+        window_end=datetime(2026, 6, 10, 6, tzinfo=timezone.utc),
+    )
+    summary = services.compute_incremental_results_summary(
+        results,
+        window_end=datetime(2026, 6, 11, 6, tzinfo=timezone.utc),
+    )
+
+    # Then days whose attribution window has passed are stored once
+    results.refresh_from_db()
+    assert results.partials_closed_until == date(2026, 6, 4)
+    assert sorted(
+        ExperimentResultsPartial.objects.filter(results=results).values_list(
+            "cohort_day", "variant", "n"
+        )
+    ) == [
+        (date(2026, 6, 1), "control", 500),
+        (date(2026, 6, 1), "variant_a", 500),
+        (date(2026, 6, 2), "control", 300),
+        (date(2026, 6, 2), "variant_a", 300),
+        (date(2026, 6, 3), "control", 250),
+        (date(2026, 6, 3), "variant_a", 250),
+    ]
+    # And the refresh only queries identities first exposed since then
+    assert mock_stats.call_args_list[0].kwargs["cohort_start"] == (
+        experiment.started_at
+    )
+    assert mock_stats.call_args_list[1].kwargs["cohort_start"] == datetime(
+        2026, 6, 3, tzinfo=timezone.utc
+    )
+    assert mock_stats.call_args_list[1].kwargs["attribution_days"] == 7
+    # And the summary adds up stored and freshly queried days
+    assert summary.metrics[0].variants == {
+        "control": VariantStats(n=1050, sum=105.0, sum_squares=105.0),
+        "variant_a": VariantStats(n=1050, sum=210.0, sum_squares=210.0),
+    }
+    assert summary.metrics[0].inference["variant_a"] is not None
+
+
+@pytest.mark.django_db
+def test_compute_incremental_results_summary__metrics_changed__recomputes_all_days(
+    experiment: Experiment,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given stored partials computed for a different set of metrics
+    settings.EXPERIMENT_RESULTS_ATTRIBUTION_DAYS = 7
+    experiment.started_at = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    experiment.save()
+    results = ExperimentResults.objects.create(
+        experiment=experiment,
+        partials_closed_until=date(2026, 6, 3),
+        partials_fingerprint="stale",
+    )
+    ExperimentResultsPartial.objects.create(
+        results=results,
+        cohort_day=date(2026, 6, 1),
+        variant="control",
+        n=500,
+        metric_stats={"999": {"sum": 1.0, "sum_squares": 1.0}},
+    )
+    mock_stats = mocker.patch(
+        "experimentation.services.get_metric_variant_cohort_stats",
+        return_value={},
+    )
+
+    # When
+    services.compute_incremental_results_summary(
+        results,
+        window_end=datetime(2026, 6, 5, tzinfo=timezone.utc),
+    )
+
+    # Then the stale partials are dropped and every day is queried again
+    assert not ExperimentResultsPartial.objects.filter(results=results).exists()
+    assert mock_stats.call_args.kwargs["cohort_start"] == experiment.started_at
+    results.refresh_from_db()
+    assert results.partials_fingerprint != "stale"
+
+
 def test_apply_experiment_rollout__no_segment__creates_segment_and_override(
     experiment: Experiment,
     multivariate_options: list[MultivariateFeatureOption],
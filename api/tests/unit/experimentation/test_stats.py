@@ -4,6 +4,7 @@ from experimentation.stats import (
     Inference,
     VariantStats,
     compare_to_control,
+    compare_treatments_to_control,
     srm_p_value,
 )
 
@@ -25,6 +26,18 @@ def test_variant_stats__float_noise__variance_clamped_to_zero() -> None:
     assert stats.variance == 0.0
 
 
+def test_variant_stats__add__sums_totals() -> None:
+    # Given stats gathered over two separate groups of identities
+    first = VariantStats(n=1000, sum=100.0, sum_squares=100.0)
+    second = VariantStats(n=500, sum=60.0, sum_squares=60.0)
+
+    # When
+    combined = first + second
+
+    # Then they combine as if gathered at once
+    assert combined == VariantStats(n=1500, sum=160.0, sum_squares=160.0)
+
+
 def test_compare_to_control__more_conversions__positive_lift_inference() -> None:
     # Given a 10% control and a 12% treatment, 1000 identities each
     control = VariantStats(n=1000, sum=100.0, sum_squares=100.0)
@@ -124,6 +137,38 @@ def test_compare_to_control__insufficient_observations__returns_none(
     assert compare_to_control(control, treatment) is None
 
 
+def test_compare_treatments_to_control__several_treatments__matches_pairwise() -> None:
+    # Given a control and treatments, one without enough observations
+    control = VariantStats(n=1000, sum=100.0, sum_squares=100.0)
+    treatments = [
+        VariantStats(n=1000, sum=120.0, sum_squares=120.0),
+        VariantStats(n=1, sum=1.0, sum_squares=1.0),
+        VariantStats(n=800, sum=70.0, sum_squares=70.0),
+    ]
+
+    # When
+    inferences = compare_treatments_to_control(control, treatments)
+
+    # Then each inference matches comparing that treatment on its own, in order
+    assert inferences[0] == compare_to_control(control, treatments[0])
+    assert inferences[1] is None
+    assert inferences[2] == compare_to_control(control, treatments[2])
+
+
+def test_compare_treatments_to_control__zero_control_mean__returns_none() -> None:
+    # Given a control that never converted
+    control = VariantStats(n=1000, sum=0.0, sum_squares=0.0)
+
+    # When
+    inferences = compare_treatments_to_control(
+        control,
+        [VariantStats(n=1000, sum=10.0, sum_squares=10.0)] * 2,
+    )
+
+    # Then
+    assert inferences == [None, None]
+
+
 def test_srm_p_value__balanced_split__no_mismatch() -> None:
     # Given observed counts exactly matching the expected 50/50 split
     # When
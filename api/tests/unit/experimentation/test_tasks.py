@@ -12,6 +12,7 @@ from django.utils import timezone
 from freezegun import freeze_time
 from moto import mock_s3  # type: ignore[import-untyped]
 from prometheus_client import REGISTRY
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 from pytest_structlog import StructuredLogCapture
 from task_processor.exceptions import TaskBackoffError
@@ -487,6 +488,38 @@ def test_compute_experiment_results__running_experiment__stores_summary(
     assert results.last_error_at is None
 
 
+@freeze_time("2026-06-11T12:00:00Z")
+def test_compute_experiment_results__attribution_window_set__computes_incrementally(
+    experiment: Experiment,
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+) -> None:
+    # Given a running experiment with an attribution window configured
+    settings.EXPERIMENT_RESULTS_ATTRIBUTION_DAYS = 7
+    experiment.status = ExperimentStatus.RUNNING
+    experiment.started_at = datetime(2026, 6, 10, tzinfo=dt_timezone.utc)
+    experiment.save()
+    mock_compute = mocker.patch(
+        "experimentation.tasks.compute_results_summary",
+    )
+    mock_compute_incremental = mocker.patch(
+        "experimentation.tasks.compute_incremental_results_summary",
+        return_value=_results_summary(),
+    )
+
+    # When
+    compute_experiment_results(experiment_id=experiment.id)
+
+    # Then the results row is refreshed from its stored partials
+    results = ExperimentResults.objects.get(experiment=experiment)
+    mock_compute_incremental.assert_called_once_with(
+        results,
+        window_end=timezone.now(),
+    )
+    mock_compute.assert_not_called()
+    assert results.payload == asdict(_results_summary())
+
+
 def test_compute_experiment_results__completed_experiment__window_ends_at_ended_at(
     experiment: Experiment,
     mocker: MockerFixture,
@@ -965,10 +998,10 @@ def test_deliver_events_for_connection__pending_objects__delivers_archives_and_r
     # When
     deliver_events_for_connection(connection_id=clickhouse_connection.id)
 
-    # Then both objects are inserted and archived, oldest first
+    # Then both objects are inserted and archived
     raw_insert = warehouse_client.return_value.raw_insert
     assert raw_insert.call_count == 2
-    assert [call.args[1] for call in move_object_spy.call_args_list] == [
+    assert sorted(call.args[1] for call in move_object_spy.call_args_list) == [
         _pending_key(environment.api_key, hour="13"),
         _pending_key(environment.api_key, hour="14"),
     ]
@@ -1038,17 +1071,21 @@ def test_deliver_events_for_connection__rejected_object__moves_to_failed_and_con
     # the second
     clickhouse_connection.status = WarehouseConnectionStatus.CONNECTED
     clickhouse_connection.save()
-    for hour in ("13", "14"):
+    for hour, body in (("13", b"invalid-events"), ("14", b"gzipped-events")):
         delivery_bucket.put_object(
             Bucket=DELIVERY_BUCKET_NAME,
             Key=_pending_key(environment.api_key, hour=hour),
-            Body=b"gzipped-events",
+            Body=body,
         )
     raw_insert = warehouse_client.return_value.raw_insert
-    raw_insert.side_effect = [
-        DatabaseError("Constraint `event_not_empty` violated", code=469),
-        raw_insert.return_value,
-    ]
+
+    # Objects are delivered concurrently, so reject by contents, not order.
+    def insert(*args: Any, insert_block: Any, **kwargs: Any) -> Any:
+        if insert_block.read() == b"invalid-events":
+            raise DatabaseError("Constraint `event_not_empty` violated", code=469)
+        return raw_insert.return_value
+
+    raw_insert.side_effect = insert
     rejected_objects_before = _delivery_objects_count("rejected")
 
     # When
@@ -1236,6 +1273,45 @@ def test_deliver_events_for_connection__time_budget_exhausted__defers_remaining(
     } in log.events
 
 
+def test_deliver_events_for_connection__more_objects_than_workers__delivers_all_with_client_per_worker(
+    clickhouse_connection: WarehouseConnection,
+    environment: Environment,
+    ingestion_infrastructure: OrganisationIngestionInfrastructure,
+    delivery_bucket: Any,
+    warehouse_client: Any,
+    mocker: MockerFixture,
+) -> None:
+    # Given more objects waiting than delivery workers
+    mocker.patch("experimentation.services.DELIVERY_MAX_WORKERS", 2)
+    hours = ("13", "14", "15", "16", "17")
+    for hour in hours:
+        delivery_bucket.put_object(
+            Bucket=DELIVERY_BUCKET_NAME,
+            Key=_pending_key(environment.api_key, hour=hour),
+            Body=b"gzipped-events",
+        )
+
+    # When
+    deliver_events_for_connection(connection_id=clickhouse_connection.id)
+
+    # Then every object is delivered, each worker using its own client
+    assert warehouse_client.call_count == 2
+    assert warehouse_client.return_value.raw_insert.call_count == len(hours)
+    assert (
+        warehouse_delivery_service.list_pending_objects(
+            DELIVERY_BUCKET_NAME,
+            environment_key=environment.api_key,
+        )
+        == []
+    )
+    assert sorted(
+        WarehouseDeliveryLog.objects.filter(
+            connection=clickhouse_connection,
+            outcome=WarehouseDeliveryOutcome.DELIVERED,
+        ).values_list("s3_key", flat=True)
+    ) == [_pending_key(environment.api_key, hour=hour) for hour in hours]
+
+
 def test_clean_up_old_warehouse_delivery_logs__old_and_recent_logs__deletes_only_expired(
     clickhouse_connection: WarehouseConnection,
     environment: Environment,
@@ -0,0 +1,102 @@
+import json
+
+from django.utils import timezone
+from pytest_mock import MockerFixture
+
+from core.request_origin import RequestOrigin
+from environments.models import Environment
+from features import flags_payloads
+from features.flags_payloads import (
+    flags_payloads_cache,
+    get_flags_payload,
+    write_flags_payloads,
+)
+from features.models import Feature, FeatureState
+
+
+def test_write_flags_payloads__environment__writes_payload_per_origin(
+    environment: Environment,
+    feature: Feature,
+) -> None:
+    # Given
+    feature.is_server_key_only = True
+    feature.save()
+
+    # When
+    write_flags_payloads(environment_id=environment.id)
+
+    # Then
+    updated_at = environment.updated_at.timestamp()
+    server_payload = flags_payloads_cache.get(f"{environment.id}:{updated_at}:SERVER")
+    client_payload = flags_payloads_cache.get(f"{environment.id}:{updated_at}:CLIENT")
+    assert [flag["feature"]["name"] for flag in json.loads(server_payload)] == [
+        feature.name
+    ]
+    assert json.loads(client_payload) == []
+
+
+def test_write_flags_payloads__hide_disabled_flags__writes_single_payload(
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+) -> None:
+    # Given
+    environment.hide_disabled_flags = True
+    environment.save()
+    feature_state.enabled = False
+    feature_state.save()
+
+    # When
+    write_flags_payloads(project_id=environment.project_id)
+
+    # Then
+    updated_at = environment.updated_at.timestamp()
+    assert (
+        json.loads(
+            flags_payloads_cache.get(f"{environment.id}:{updated_at}:HIDE_DISABLED")
+        )
+        == []
+    )
+    assert flags_payloads_cache.get(f"{environment.id}:{updated_at}:SERVER") is None
+    assert flags_payloads_cache.get(f"{environment.id}:{updated_at}:CLIENT") is None
+
+
+def test_get_flags_payload__not_written__renders_and_stores_payload(
+    environment: Environment,
+    feature: Feature,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    render_flags_payload_spy = mocker.spy(flags_payloads, "render_flags_payload")
+
+    # When
+    first_payload = get_flags_payload(environment, RequestOrigin.SERVER)
+    second_payload = get_flags_payload(environment, RequestOrigin.SERVER)
+
+    # Then
+    assert first_payload == second_payload
+    assert [flag["feature"]["name"] for flag in json.loads(first_payload)] == [
+        feature.name
+    ]
+    render_flags_payload_spy.assert_called_once_with(environment, RequestOrigin.SERVER)
+
+
+def test_get_flags_payload__environment_updated__does_not_serve_stale_payload(
+    environment: Environment,
+    feature: Feature,
+) -> None:
+    # Given
+    write_flags_payloads(environment_id=environment.id)
+
+    Feature.objects.create(name="new_feature", project=environment.project)
+    environment.updated_at = timezone.now()
+    environment.save()
+
+    # When
+    payload = get_flags_payload(environment, RequestOrigin.SERVER)
+
+    # Then
+    assert sorted(flag["feature"]["name"] for flag in json.loads(payload)) == [
+        feature.name,
+        "new_feature",
+    ]
@@ -46,6 +46,7 @@ from environments.permissions.models import UserEnvironmentPermission
 from features import views
 from features.dataclasses import EnvironmentFeatureOverridesData
 from features.feature_types import MULTIVARIATE, STANDARD
+from features.flags_payloads import write_flags_payloads
 from features.models import Feature, FeatureSegment, FeatureState
 from features.multivariate.models import MultivariateFeatureOption
 from features.value_types import STRING
@@ -5468,3 +5469,62 @@ def test_remove_group_owners__enforce_owners_user_owners_remain__returns_200(
     feature.refresh_from_db()
     assert group not in feature.group_owners.all()
     assert admin_user in feature.owners.all()
+
+
+def test_sdk_feature_states_get__cache_flags_payloads__serves_payload_without_queries(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+    environment: Environment,
+    feature: Feature,
+    feature_state: FeatureState,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    api_client.credentials(HTTP_X_ENVIRONMENT_KEY=environment.api_key)
+    url = reverse("api-v1:flags")
+
+    # Render the response the regular way, populating the environment cache
+    # used by the authentication class along the way
+    expected_response = api_client.get(url)
+
+    settings.CACHE_FLAGS_PAYLOADS = True
+    write_flags_payloads(environment_id=environment.id)
+
+    # When
+    with django_assert_num_queries(1):  # payload cache read
+        response = api_client.get(url)
+
+    # Then
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == expected_response.content
+    assert response.headers[FLAGSMITH_UPDATED_AT_HEADER] == str(
+        environment.updated_at.timestamp()
+    )
+
+
+def test_sdk_feature_states_get__cache_flags_payloads__server_key_only_feature__isolates_client_and_server_payloads(
+    environment: Environment,
+    environment_api_key: EnvironmentAPIKey,
+    feature: Feature,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.CACHE_FLAGS_PAYLOADS = True
+    feature.is_server_key_only = True
+    feature.save()
+
+    url = reverse("api-v1:flags")
+    server_client = APIClient(
+        headers={SDK_ENVIRONMENT_KEY_HEADER: environment_api_key.key}
+    )
+    client_client = APIClient(headers={SDK_ENVIRONMENT_KEY_HEADER: environment.api_key})
+
+    # When
+    server_response = server_client.get(url)
+    client_response = client_client.get(url)
+
+    # Then
+    assert [flag["feature"]["name"] for flag in server_response.json()] == [
+        feature.name
+    ]
+    assert client_response.json() == []
@@ -0,0 +1,58 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from environments.models import Environment
+from features.models import Feature
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LatestEnvironmentFeatureVersion,
+)
+
+
+def test_check_latest_feature_versions__consistent__succeeds(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+) -> None:
+    # Given / When
+    call_command("check_latest_feature_versions")
+
+    # Then
+    assert LatestEnvironmentFeatureVersion.objects.filter(
+        feature=feature, environment=environment_v2_versioning
+    ).exists()
+
+
+def test_check_latest_feature_versions__missing_latest_version__raises_error(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+) -> None:
+    # Given
+    LatestEnvironmentFeatureVersion.objects.all().delete()
+
+    # When
+    with pytest.raises(CommandError) as exc_info:
+        call_command("check_latest_feature_versions")
+
+    # Then
+    assert str(exc_info.value) == (
+        "Found 1 inconsistent latest versions. Run with --fix to update them."
+    )
+    assert not LatestEnvironmentFeatureVersion.objects.exists()
+
+
+def test_check_latest_feature_versions__fix__updates_inconsistent_latest_versions(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+) -> None:
+    # Given
+    LatestEnvironmentFeatureVersion.objects.all().delete()
+
+    # When
+    call_command("check_latest_feature_versions", fix=True)
+
+    # Then
+    assert LatestEnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    ).environment_feature_version == EnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
@@ -195,3 +195,86 @@ def test_fix_scheduled_fs_migration__corrupted_feature_states__restores_data(
         new_environment_2_scheduled_feature_state.change_request_id
         == environment_2_scheduled_cr.pk
     )
+
+
+@pytest.mark.skipif(
+    test_settings.SKIP_MIGRATION_TESTS is True,
+    reason="Skip migration tests to speed up tests where necessary",
+)
+def test_latest_environment_feature_version_migration__published_versions__populates_latest_versions(
+    migrator: Migrator,
+) -> None:
+    # Given
+    now = timezone.now()
+
+    old_state = migrator.apply_initial_migration(
+        ("feature_versioning", "0008_add_last_modified_indexes")
+    )
+
+    organisation_model_class = old_state.apps.get_model("organisations", "Organisation")
+    project_model_class = old_state.apps.get_model("projects", "Project")
+    environment_model_class = old_state.apps.get_model("environments", "Environment")
+    feature_model_class = old_state.apps.get_model("features", "Feature")
+    environment_feature_version_model_class = old_state.apps.get_model(
+        "feature_versioning", "EnvironmentFeatureVersion"
+    )
+
+    organisation = organisation_model_class.objects.create(name="Test Organisation")
+    project = project_model_class.objects.create(
+        name="Test Project", organisation=organisation
+    )
+    environment = environment_model_class.objects.create(
+        name="Test Environment", project=project, use_v2_feature_versioning=True
+    )
+    live_feature = feature_model_class.objects.create(
+        name="live_feature", project=project
+    )
+    scheduled_feature = feature_model_class.objects.create(
+        name="scheduled_feature", project=project
+    )
+
+    environment_feature_version_model_class.objects.create(
+        environment=environment,
+        feature=live_feature,
+        published_at=now,
+        live_from=now - timedelta(days=2),
+    )
+    live_version = environment_feature_version_model_class.objects.create(
+        environment=environment,
+        feature=live_feature,
+        published_at=now,
+        live_from=now - timedelta(days=1),
+    )
+    environment_feature_version_model_class.objects.create(
+        environment=environment,
+        feature=live_feature,
+        published_at=now,
+        live_from=now + timedelta(days=1),
+    )
+    environment_feature_version_model_class.objects.create(
+        environment=environment, feature=live_feature
+    )
+    scheduled_version = environment_feature_version_model_class.objects.create(
+        environment=environment,
+        feature=scheduled_feature,
+        published_at=now,
+        live_from=now + timedelta(days=1),
+    )
+
+    # When
+    new_state = migrator.apply_tested_migration(
+        ("feature_versioning", "0009_latestenvironmentfeatureversion")
+    )
+
+    # Then
+    latest_environment_feature_version_model_class = new_state.apps.get_model(
+        "feature_versioning", "LatestEnvironmentFeatureVersion"
+    )
+    assert set(
+        latest_environment_feature_version_model_class.objects.values_list(
+            "feature_id", "environment_feature_version_id", "live_from"
+        )
+    ) == {
+        (live_feature.id, live_version.uuid, live_version.live_from),
+        (scheduled_feature.id, scheduled_version.uuid, scheduled_version.live_from),
+    }
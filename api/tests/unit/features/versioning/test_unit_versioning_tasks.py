@@ -19,6 +19,7 @@ from features.models import Feature, FeatureSegment, FeatureState
 from features.versioning.exceptions import FeatureVersioningError
 from features.versioning.models import (
     EnvironmentFeatureVersion,
+    LatestEnvironmentFeatureVersion,
     VersionChangeSet,
 )
 from features.versioning.tasks import (
@@ -26,6 +27,7 @@ from features.versioning.tasks import (
     enable_v2_versioning,
     publish_version_change_set,
     trigger_update_version_webhooks,
+    update_latest_environment_feature_versions,
 )
 from features.versioning.versioning_service import (
     get_environment_flags_dict,
@@ -839,3 +841,27 @@ def test_publish_version_change_set__ignore_conflicts_with_invalid_data__sends_c
             "change_request": change_request,
         },
     )
+
+
+def test_update_latest_environment_feature_versions__scheduled_version_went_live__records_it(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+    admin_user: FFAdminUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    scheduled_version = EnvironmentFeatureVersion.objects.create(
+        feature=feature, environment=environment_v2_versioning
+    )
+    scheduled_version.publish(admin_user, live_from=timezone.now() + timedelta(hours=1))
+    freezer.tick(timedelta(hours=2))
+
+    # When
+    update_latest_environment_feature_versions()
+
+    # Then
+    latest_version = LatestEnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
+    assert latest_version.environment_feature_version == scheduled_version
+    assert latest_version.live_from == scheduled_version.live_from
@@ -3,6 +3,7 @@ from datetime import timedelta
 import pytest
 from django.db.models import Q
 from django.utils import timezone
+from freezegun.api import FrozenDateTimeFactory
 from pytest_django import DjangoAssertNumQueries
 from rest_framework.exceptions import ValidationError
 
@@ -21,7 +22,10 @@ from features.versioning.dataclasses import (
     MultivariateValueChangeSet,
     SegmentOverrideChangeSet,
 )
-from features.versioning.models import EnvironmentFeatureVersion
+from features.versioning.models import (
+    EnvironmentFeatureVersion,
+    LatestEnvironmentFeatureVersion,
+)
 from features.versioning.versioning_service import (
     get_current_live_environment_feature_version,
     get_environment_flags_list,
@@ -287,6 +291,95 @@ def test_get_environment_flags_list__v2_versioning_with_published_version__retur
     }
 
 
+def test_get_environment_flags_list__v2_scheduled_version_went_live__returns_it_before_latest_version_updated(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+    admin_user: FFAdminUser,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    # Given
+    initial_version = EnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
+    scheduled_version = EnvironmentFeatureVersion.objects.create(
+        feature=feature, environment=environment_v2_versioning
+    )
+    scheduled_version.publish(admin_user, live_from=timezone.now() + timedelta(hours=1))
+    scheduled_feature_state = scheduled_version.feature_states.get()
+
+    freezer.tick(timedelta(hours=2))
+
+    # When
+    environment_feature_states = get_environment_flags_list(
+        environment=environment_v2_versioning
+    )
+
+    # Then
+    assert environment_feature_states == [scheduled_feature_state]
+    assert (
+        LatestEnvironmentFeatureVersion.objects.get(
+            feature=feature, environment=environment_v2_versioning
+        ).environment_feature_version
+        == initial_version
+    )
+
+
+def test_update_latest_environment_feature_version__only_scheduled_versions__records_earliest(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+    admin_user: FFAdminUser,
+) -> None:
+    # Given
+    EnvironmentFeatureVersion.objects.filter(
+        feature=feature, environment=environment_v2_versioning
+    ).delete()
+    now = timezone.now()
+    later_version = EnvironmentFeatureVersion.objects.create(
+        feature=feature, environment=environment_v2_versioning
+    )
+    later_version.publish(admin_user, live_from=now + timedelta(days=2))
+    earlier_version = EnvironmentFeatureVersion.objects.create(
+        feature=feature, environment=environment_v2_versioning
+    )
+    earlier_version.publish(admin_user, live_from=now + timedelta(days=1))
+
+    # When
+    latest_version = LatestEnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
+
+    # Then
+    assert latest_version.environment_feature_version == earlier_version
+    assert latest_version.live_from == earlier_version.live_from
+    assert get_environment_flags_list(environment=environment_v2_versioning) == []
+
+
+def test_update_latest_environment_feature_version__latest_version_deleted__records_previous(
+    environment_v2_versioning: Environment,
+    feature: Feature,
+    admin_user: FFAdminUser,
+) -> None:
+    # Given
+    initial_version = EnvironmentFeatureVersion.objects.get(
+        feature=feature, environment=environment_v2_versioning
+    )
+    new_version = EnvironmentFeatureVersion.objects.create(
+        feature=feature, environment=environment_v2_versioning
+    )
+    new_version.publish(admin_user)
+
+    # When
+    new_version.delete()
+
+    # Then
+    assert (
+        LatestEnvironmentFeatureVersion.objects.get(
+            feature=feature, environment=environment_v2_versioning
+        ).environment_feature_version
+        == initial_version
+    )
+
+
 def test_get_environment_flags_list__v2_segment_override_removed__excludes_override(
     project: Project,
     feature: Feature,
@@ -5,6 +5,7 @@ import uuid
 from decimal import Decimal
 
 import boto3
+import pytest
 from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
 from django.core.serializers.json import DjangoJSONEncoder
@@ -29,6 +30,7 @@ from import_export.export import (
     export_metadata,
     export_organisation,
     export_projects,
+    serialize_export,
 )
 from integrations.amplitude.models import AmplitudeConfiguration
 from integrations.datadog.models import DataDogConfiguration
@@ -631,3 +633,24 @@ def test_export_projects__dynamo_db_project__reimports_with_dynamo_disabled(
     assert (
         Project.objects.filter(uuid=project.uuid, enable_dynamo_db=False).count() == 1
     )
+
+
+@pytest.mark.parametrize(
+    "jsonl, expected_output",
+    [
+        (False, '[{"id": 1},{"id": 2}]'),
+        (True, '{"id": 1}\n{"id": 2}\n'),
+    ],
+)
+def test_serialize_export__objects__serializes_one_object_at_a_time(
+    jsonl: bool,
+    expected_output: str,
+) -> None:
+    # Given
+    data = iter([{"id": 1}, {"id": 2}])
+
+    # When
+    output = "".join(serialize_export(data, jsonl=jsonl))
+
+    # Then
+    assert output == expected_output
@@ -4,7 +4,7 @@ import boto3
 from django.core.serializers.json import DjangoJSONEncoder
 from moto import mock_s3  # type: ignore[import-untyped]
 
-from import_export.export import export_organisation
+from import_export.export import S3OrganisationExporter, export_organisation
 from import_export.import_ import OrganisationImporter
 from organisations.models import Organisation
 
@@ -37,3 +37,34 @@ def test_import_organisation__valid_s3_export__imports_successfully(
 
     # Then
     assert Organisation.objects.filter(id=organisation.id).count() == 1
+
+
+@mock_s3  # type: ignore[misc]
+def test_import_organisation__streamed_jsonl_export__imports_successfully(
+    organisation: Organisation,
+) -> None:
+    # Given
+    bucket_name = "test-bucket"
+    file_key = "organisation-exports/org-1.jsonl.gz"
+
+    s3_resource = boto3.resource("s3", region_name="eu-west-2")
+    s3_resource.create_bucket(
+        Bucket=bucket_name,
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+    )
+
+    s3_client = boto3.client("s3")
+    S3OrganisationExporter(s3_client=s3_client).export_to_s3(
+        organisation.id, bucket_name, file_key
+    )
+    organisation_name = organisation.name
+    Organisation.objects.filter(id=organisation.id).update(name="Renamed")
+
+    importer = OrganisationImporter(s3_client=s3_client)  # type: ignore[no-untyped-call]
+
+    # When
+    importer.import_organisation(bucket_name, file_key)
+
+    # Then
+    organisation.refresh_from_db()
+    assert organisation.name == organisation_name
@@ -0,0 +1,104 @@
+import os
+import typing
+
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from integrations.amplitude.amplitude import AmplitudeWrapper
+from integrations.amplitude.models import AmplitudeConfiguration
+from integrations.common.dispatcher import IdentifyDispatcher
+from integrations.mixpanel.mixpanel import MixpanelWrapper
+from integrations.mixpanel.models import MixpanelConfiguration
+
+
+def test_identify_dispatcher_dispatch__postpone_disabled__sends_synchronously(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    dispatcher = IdentifyDispatcher()
+    wrapper = mocker.MagicMock()
+    user_data = {"user_id": "user"}
+
+    # When
+    dispatcher.dispatch(wrapper, user_data)
+
+    # Then
+    wrapper.identify_users.assert_called_once_with([user_data])
+
+
+def test_identify_dispatcher_flush__same_config__sends_batches_per_config(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ENABLE_POSTPONE_DECORATOR = True
+    mocker.patch.object(IdentifyDispatcher, "_start")
+    dispatcher = IdentifyDispatcher()
+    dispatcher._pid = os.getpid()
+
+    mocked_post = mocker.patch("integrations.amplitude.amplitude.session.post")
+    config = AmplitudeConfiguration(api_key="key")
+    other_config = AmplitudeConfiguration(api_key="other-key")
+
+    for user_id in ("user-1", "user-2"):
+        dispatcher.dispatch(AmplitudeWrapper(config), {"user_id": user_id})
+    dispatcher.dispatch(AmplitudeWrapper(other_config), {"user_id": "user-3"})
+
+    # When
+    dispatcher.flush()
+
+    # Then
+    assert [
+        (call.kwargs["data"]["api_key"], call.kwargs["data"]["identification"])
+        for call in mocked_post.call_args_list
+    ] == [
+        ("key", '[{"user_id": "user-1"}, {"user_id": "user-2"}]'),
+        ("other-key", '[{"user_id": "user-3"}]'),
+    ]
+
+
+def test_identify_dispatcher_dispatch__queue_full__drops_events(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+) -> None:
+    # Given
+    settings.ENABLE_POSTPONE_DECORATOR = True
+    settings.IDENTITY_INTEGRATIONS_QUEUE_SIZE = 1
+    mocker.patch.object(IdentifyDispatcher, "_start")
+    dispatcher = IdentifyDispatcher()
+    dispatcher._pid = os.getpid()
+    dropped_total = mocker.patch(
+        "integrations.common.dispatcher.flagsmith_identity_integrations_dropped_total"
+    )
+    wrapper = mocker.MagicMock()
+
+    # When
+    dispatcher.dispatch(wrapper, {"user_id": "user-1"})
+    dispatcher.dispatch(wrapper, {"user_id": "user-2"})
+
+    # Then
+    dropped_total.labels.return_value.inc.assert_called_once_with()
+    dispatcher.flush()
+    wrapper.identify_users.assert_called_once_with([{"user_id": "user-1"}])
+
+
+def test_mixpanel_identify_users__multiple_users__posts_single_request(
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    wrapper = MixpanelWrapper(MixpanelConfiguration(api_key="key"))
+    users_data: list[list[dict[str, typing.Any]]] = [
+        [{"$distinct_id": "user-1"}],
+        [{"$distinct_id": "user-2"}],
+    ]
+    mocked_post = mocker.patch("integrations.mixpanel.mixpanel.session.post")
+
+    # When
+    wrapper.identify_users(users_data)
+
+    # Then
+    mocked_post.assert_called_once()
+    assert mocked_post.call_args.kwargs["json"] == [
+        {"$distinct_id": "user-1"},
+        {"$distinct_id": "user-2"},
+    ]
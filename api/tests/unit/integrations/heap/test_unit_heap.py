@@ -88,7 +88,7 @@ def test_identify_integrations__heap_configured__posts_to_expected_url(
         api_key=api_key,
         base_url=base_url,
     )
-    mocked_post = mocker.patch("integrations.heap.heap.requests.post")
+    mocked_post = mocker.patch("integrations.heap.heap.session.post")
 
     # When
     identify_integrations(identity, identity.get_all_feature_states())  # type: ignore[no-untyped-call]
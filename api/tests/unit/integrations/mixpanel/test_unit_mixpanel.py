@@ -89,7 +89,7 @@ def test_mixpanel_identify_user__valid_identity__posts_to_api(
         feature_states=feature_states,
         trait_models=[],
     )
-    post_mock = mocker.patch("integrations.mixpanel.mixpanel.requests.post")
+    post_mock = mocker.patch("integrations.mixpanel.mixpanel.session.post")
     post_mock.return_value.status_code = 200
     post_mock.return_value.text = expected_response_text = "test content"
 
@@ -191,7 +191,7 @@ def test_identify_integrations__mixpanel_configured__posts_to_expected_url(
         api_key=api_key,
         base_url=base_url,
     )
-    mocked_post = mocker.patch("integrations.mixpanel.mixpanel.requests.post")
+    mocked_post = mocker.patch("integrations.mixpanel.mixpanel.session.post")
 
     # When
     identify_integrations(identity, identity.get_all_feature_states())  # type: ignore[no-untyped-call]
@@ -0,0 +1,301 @@
+import pytest
+from common.environments.permissions import VIEW_ENVIRONMENT
+from common.projects.permissions import CREATE_ENVIRONMENT, VIEW_PROJECT
+from django.db import connection
+from django.db.models import Q
+from django.test.utils import CaptureQueriesContext
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockerFixture
+
+from environments.models import Environment
+from environments.permissions.models import UserEnvironmentPermission
+from organisations.models import Organisation
+from permissions.models import PermissionModel
+from permissions.permission_service import (
+    get_permitted_environments_for_user,
+    get_permitted_projects_for_user,
+    is_user_project_admin,
+)
+from permissions.permissions_calculator import (
+    RoleData,
+    RolePermissionData,
+    get_environment_permission_data,
+    get_project_permission_data,
+)
+from permissions.user_permissions import (
+    ObjectPermissions,
+    UserPermissions,
+    get_user_permissions,
+)
+from projects.models import (
+    Project,
+    UserPermissionGroupProjectPermission,
+    UserProjectPermission,
+)
+from users.models import FFAdminUser, UserPermissionGroup
+
+
+@pytest.fixture(autouse=True)
+def cache_user_permissions(settings: SettingsWrapper, reset_cache: None) -> None:
+    settings.CACHE_USER_PERMISSIONS_SECONDS = 60
+
+
+def test_get_user_permissions__cache_disabled__returns_none(
+    settings: SettingsWrapper,
+    staff_user: FFAdminUser,
+) -> None:
+    # Given
+    settings.CACHE_USER_PERMISSIONS_SECONDS = 0
+
+    # When
+    user_permissions = get_user_permissions(staff_user)
+
+    # Then
+    assert user_permissions is None
+
+
+def test_get_user_permissions__user_and_group_permissions__materializes_permissions(
+    staff_user: FFAdminUser,
+    organisation: Organisation,
+    project: Project,
+    environment: Environment,
+    user_project_permission: UserProjectPermission,
+    user_project_permission_group: UserPermissionGroupProjectPermission,
+    user_permission_group: UserPermissionGroup,
+    user_environment_permission: UserEnvironmentPermission,
+    view_project_permission: PermissionModel,
+) -> None:
+    # Given
+    user_project_permission.add_permission(VIEW_PROJECT)
+    user_permission_group.users.add(staff_user)
+    user_project_permission_group.admin = True
+    user_project_permission_group.save()
+
+    # When
+    user_permissions = get_user_permissions(staff_user)
+
+    # Then
+    assert user_permissions is not None
+    assert user_permissions.organisation_ids == {organisation.id}
+    assert user_permissions.admin_organisation_ids == set()
+    assert user_permissions.projects[project.id].admin is True
+    assert user_permissions.projects[project.id].permissions == {VIEW_PROJECT}
+    assert user_permissions.environments[environment.id].admin is False
+    assert user_permissions.get_permitted_ids(
+        user_permissions.projects, VIEW_PROJECT, allow_admin=False
+    ) == {project.id}
+
+
+def test_get_permitted_projects_for_user__cached__does_not_query_permissions(
+    staff_user: FFAdminUser,
+    project: Project,
+    user_project_permission: UserProjectPermission,
+    view_project_permission: PermissionModel,
+) -> None:
+    # Given
+    user_project_permission.add_permission(VIEW_PROJECT)
+    assert list(get_permitted_projects_for_user(staff_user, VIEW_PROJECT)) == [project]
+
+    # When
+    with CaptureQueriesContext(connection) as captured_queries:
+        permitted_projects = list(
+            get_permitted_projects_for_user(staff_user, VIEW_PROJECT)
+        )
+
+    # Then
+    assert permitted_projects == [project]
+    assert not any(
+        "permission" in query["sql"] for query in captured_queries.captured_queries
+    )
+
+
+def test_get_permitted_projects_for_user__removed_from_group__invalidates_cache(
+    staff_user: FFAdminUser,
+    project: Project,
+    user_project_permission_group: UserPermissionGroupProjectPermission,
+    user_permission_group: UserPermissionGroup,
+) -> None:
+    # Given
+    user_permission_group.users.add(staff_user)
+    user_project_permission_group.add_permission(VIEW_PROJECT)
+    assert is_user_project_admin(staff_user, project) is False
+    assert get_permitted_projects_for_user(staff_user, VIEW_PROJECT).count() == 1
+
+    # When
+    user_permission_group.users.remove(staff_user)
+
+    # Then
+    assert get_permitted_projects_for_user(staff_user, VIEW_PROJECT).count() == 0
+
+
+def test_is_user_project_admin__group_permission_changed__invalidates_cache(
+    staff_user: FFAdminUser,
+    project: Project,
+    user_project_permission_group: UserPermissionGroupProjectPermission,
+    user_permission_group: UserPermissionGroup,
+) -> None:
+    # Given
+    user_permission_group.users.add(staff_user)
+    assert is_user_project_admin(staff_user, project) is False
+
+    # When
+    user_project_permission_group.admin = True
+    user_project_permission_group.save()
+
+    # Then
+    assert is_user_project_admin(staff_user, project) is True
+
+
+def test_get_permitted_environments_for_user__removed_from_organisation__invalidates_cache(
+    staff_user: FFAdminUser,
+    organisation: Organisation,
+    project: Project,
+    environment: Environment,
+    user_environment_permission: UserEnvironmentPermission,
+) -> None:
+    # Given
+    user_environment_permission.admin = True
+    user_environment_permission.save()
+    assert list(
+        get_permitted_environments_for_user(staff_user, project, VIEW_ENVIRONMENT)
+    ) == [environment]
+
+    # When
+    staff_user.remove_organisation(organisation)
+
+    # Then
+    assert (
+        list(get_permitted_environments_for_user(staff_user, project, VIEW_ENVIRONMENT))
+        == []
+    )
+
+
+def test_get_user_permissions__rbac_installed__materializes_role_permissions(
+    settings: SettingsWrapper,
+    mocker: MockerFixture,
+    staff_user: FFAdminUser,
+    project: Project,
+) -> None:
+    # Given
+    settings.IS_RBAC_INSTALLED = True
+    role_permission_data = RolePermissionData(
+        role=RoleData(id=1, name="Project Admin", tags=set()),
+        admin=True,
+        permissions={VIEW_PROJECT},
+    )
+    mocker.patch(
+        "permissions.user_permissions.get_role_permission_filter",
+        side_effect=lambda user, model_class, **kwargs: (
+            Q(id=project.id) if model_class is Project else Q(pk__in=[])
+        ),
+    )
+    get_roles_permission_data_for_project = mocker.patch(
+        "permissions.user_permissions.get_roles_permission_data_for_project",
+        return_value=[role_permission_data],
+    )
+
+    # When
+    user_permissions = get_user_permissions(staff_user)
+
+    # Then
+    assert user_permissions is not None
+    assert user_permissions.projects[project.id].roles == [role_permission_data]
+    assert user_permissions.projects[project.id].admin is True
+    assert user_permissions.organisations == {}
+    assert user_permissions.environments == {}
+    get_roles_permission_data_for_project.assert_called_once_with(
+        project.id, staff_user.id
+    )
+
+
+@pytest.mark.parametrize(
+    "tag_ids, expected_permitted_ids",
+    (
+        (None, {1}),
+        ([], set()),
+        ([1], {1}),
+        ([1, 2], {1}),
+        ([2], set()),
+    ),
+)
+def test_get_permitted_ids__tag_based_role_permission__only_permits_matching_tags(
+    tag_ids: list[int] | None,
+    expected_permitted_ids: set[int],
+) -> None:
+    # Given
+    user_permissions = UserPermissions(
+        organisation_roles={1: "USER"},
+        projects={
+            1: ObjectPermissions(
+                organisation_id=1,
+                roles=[
+                    RolePermissionData(
+                        role=RoleData(id=1, name="Tagged", tags={1}),
+                        permissions={CREATE_ENVIRONMENT},
+                    )
+                ],
+            )
+        },
+    )
+
+    # When
+    permitted_ids = user_permissions.get_permitted_ids(
+        user_permissions.projects, CREATE_ENVIRONMENT, tag_ids=tag_ids
+    )
+
+    # Then
+    assert permitted_ids == expected_permitted_ids
+    assert user_permissions.projects[1].permissions == set()
+
+
+def test_get_project_permission_data__cached__matches_uncached_without_querying_permissions(
+    settings: SettingsWrapper,
+    staff_user: FFAdminUser,
+    project: Project,
+    user_project_permission: UserProjectPermission,
+    user_project_permission_group: UserPermissionGroupProjectPermission,
+    user_permission_group: UserPermissionGroup,
+) -> None:
+    # Given
+    user_project_permission.add_permission(VIEW_PROJECT)
+    user_permission_group.users.add(staff_user)
+    user_project_permission_group.add_permission(CREATE_ENVIRONMENT)
+    settings.CACHE_USER_PERMISSIONS_SECONDS = 0
+    uncached_permission_data = get_project_permission_data(project, staff_user)
+    settings.CACHE_USER_PERMISSIONS_SECONDS = 60
+    get_user_permissions(staff_user)
+
+    # When
+    with CaptureQueriesContext(connection) as captured_queries:
+        permission_data = get_project_permission_data(project, staff_user)
+
+    # Then
+    assert permission_data == uncached_permission_data
+    assert permission_data.permissions == {VIEW_PROJECT, CREATE_ENVIRONMENT}
+    assert not any(
+        "permission" in query["sql"] for query in captured_queries.captured_queries
+    )
+
+
+def test_get_environment_permission_data__cached_project_admin_group__returns_inherited_admin(
+    staff_user: FFAdminUser,
+    environment: Environment,
+    user_project_permission_group: UserPermissionGroupProjectPermission,
+    user_permission_group: UserPermissionGroup,
+) -> None:
+    # Given
+    user_permission_group.users.add(staff_user)
+    user_project_permission_group.admin = True
+    user_project_permission_group.save()
+
+    # When
+    permission_data = get_environment_permission_data(environment, staff_user)
+
+    # Then
+    assert permission_data.admin is True
+    assert [
+        group_permission.group.id
+        for group_permission in permission_data.inherited_admin_groups
+    ] == [user_permission_group.id]
+    assert permission_data.groups == []
+    assert permission_data.admin_override is False
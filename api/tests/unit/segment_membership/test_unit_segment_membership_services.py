@@ -6,6 +6,7 @@ from common.test_tools import RunTasksFixture
 from django.db import connections
 from django.utils import timezone
 from flag_engine.segments.constants import EQUAL, REGEX
+from prometheus_client import REGISTRY
 from pytest_django.fixtures import DjangoAssertNumQueries, SettingsWrapper
 from pytest_mock import MockerFixture
 from task_processor.models import Task
@@ -17,8 +18,11 @@ from projects.models import Project
 from segment_membership.services import (
     compute_segment_counts_for_project,
     enqueue_membership_refresh,
+    get_changed_environment_keys,
     get_projects_to_process,
     get_segment_members_page,
+    get_segment_predicate,
+    get_segments_fingerprint,
     is_membership_enabled,
 )
 from segment_membership.tasks import refresh_project_segment_counts
@@ -124,6 +128,7 @@ def test_compute_segment_counts_for_project__unknown_env_key_in_row__skips(
     segment: Segment,
     segment_rule: SegmentRule,
     mocker: MockerFixture,
+    reset_cache: None,
 ) -> None:
     # Given
     mocker.patch(
@@ -146,6 +151,7 @@ def test_compute_segment_counts_for_project__untranslatable_segment__skips(
     segment: Segment,
     segment_rule: SegmentRule,
     mocker: MockerFixture,
+    reset_cache: None,
 ) -> None:
     # Given
     mocker.patch(
@@ -153,6 +159,8 @@ def test_compute_segment_counts_for_project__untranslatable_segment__skips(
         return_value=None,
     )
     cursor = MagicMock()
+    metric = "flagsmith_segment_membership_untranslatable_segments_total"
+    before = REGISTRY.get_sample_value(metric, {"operation": "count"}) or 0.0
 
     # When
     result = compute_segment_counts_for_project(project, cursor)
@@ -160,6 +168,7 @@ def test_compute_segment_counts_for_project__untranslatable_segment__skips(
     # Then
     assert result == []
     cursor.execute.assert_not_called()
+    assert REGISTRY.get_sample_value(metric, {"operation": "count"}) == before + 1
 
 
 def test_get_segment_members_page__untranslatable_segment__returns_empty_without_querying(
@@ -168,6 +177,7 @@ def test_get_segment_members_page__untranslatable_segment__returns_empty_without
     segment: Segment,
     segment_rule: SegmentRule,
     mocker: MockerFixture,
+    reset_cache: None,
 ) -> None:
     # Given
     mocker.patch(
@@ -175,6 +185,8 @@ def test_get_segment_members_page__untranslatable_segment__returns_empty_without
         return_value=None,
     )
     open_cursor = mocker.patch("segment_membership.services.open_clickhouse_cursor")
+    metric = "flagsmith_segment_membership_untranslatable_segments_total"
+    before = REGISTRY.get_sample_value(metric, {"operation": "members"}) or 0.0
 
     # When
     result = get_segment_members_page(segment, environment, cursor=None, limit=100)
@@ -182,6 +194,83 @@ def test_get_segment_members_page__untranslatable_segment__returns_empty_without
     # Then
     assert result == []
     open_cursor.assert_not_called()
+    assert REGISTRY.get_sample_value(metric, {"operation": "members"}) == before + 1
+
+
+def test_get_segment_predicate__translated__binds_params_prefixed_with_segment_id(
+    matching_segment: Segment,
+    reset_cache: None,
+) -> None:
+    # Given / When
+    result = get_segment_predicate(matching_segment)
+
+    # Then
+    assert result is not None
+    predicate, params = result
+    assert params
+    assert all(name.startswith(f"s{matching_segment.id}_") for name in params)
+    assert all(f"%({name})s" in predicate for name in params)
+
+
+def test_get_segment_predicate__cached__does_not_retranslate(
+    matching_segment: Segment,
+    mocker: MockerFixture,
+    reset_cache: None,
+) -> None:
+    # Given
+    translate_segment = mocker.patch(
+        "segment_membership.services.translate_segment",
+        return_value="TRUE",
+    )
+    get_segment_predicate(matching_segment)
+
+    # When
+    result = get_segment_predicate(Segment.objects.get(id=matching_segment.id))
+
+    # Then
+    assert result == ("TRUE", {})
+    translate_segment.assert_called_once()
+
+
+def test_get_segment_predicate__untranslatable_cached__does_not_retranslate(
+    segment: Segment,
+    segment_rule: SegmentRule,
+    mocker: MockerFixture,
+    reset_cache: None,
+) -> None:
+    # Given
+    translate_segment = mocker.patch(
+        "segment_membership.services.translate_segment",
+        return_value=None,
+    )
+    get_segment_predicate(segment)
+
+    # When
+    result = get_segment_predicate(segment)
+
+    # Then
+    assert result is None
+    translate_segment.assert_called_once()
+
+
+def test_get_segment_predicate__segment_updated__retranslates(
+    matching_segment: Segment,
+    reset_cache: None,
+) -> None:
+    # Given
+    get_segment_predicate(matching_segment)
+    Condition.objects.filter(rule__segment=matching_segment).update(value="baz")
+    matching_segment.version = (matching_segment.version or 1) + 1
+    matching_segment.save()
+
+    # When
+    result = get_segment_predicate(matching_segment)
+
+    # Then
+    assert result is not None
+    _, params = result
+    assert "baz" in params.values()
+    assert "bar" not in params.values()
 
 
 @pytest.fixture
@@ -346,6 +435,64 @@ def test_compute_segment_counts_for_project__multiple_segments__uses_single_quer
         compute_segment_counts_for_project(project, cursor)
 
 
+@pytest.mark.clickhouse
+def test_compute_segment_counts_for_project__environment_keys__counts_only_those(
+    segment_membership_identities: None,
+    matching_segment: Segment,
+    project: Project,
+) -> None:
+    # Given / When
+    with connections["clickhouse"].cursor() as cursor:
+        counts = compute_segment_counts_for_project(
+            project, cursor, environment_keys=set()
+        )
+
+    # Then
+    assert counts == []
+
+
+@pytest.mark.clickhouse
+def test_get_changed_environment_keys__recently_ingested_identities__returns_environment(
+    segment_membership_identities: None,
+    project: Project,
+    environment: Environment,
+) -> None:
+    # Given / When
+    with connections["clickhouse"].cursor() as cursor:
+        changed_since_recently = get_changed_environment_keys(
+            project, cursor, since=timezone.now() - timedelta(minutes=5)
+        )
+        changed_since_tomorrow = get_changed_environment_keys(
+            project, cursor, since=timezone.now() + timedelta(days=1)
+        )
+
+    # Then
+    assert changed_since_recently == {environment.api_key}
+    assert changed_since_tomorrow == set()
+
+
+def test_get_segments_fingerprint__segment_edited__changes(
+    project: Project,
+    segment: Segment,
+) -> None:
+    # Given
+    fingerprint = get_segments_fingerprint(project)
+
+    # When
+    segment.clone(is_revision=True)
+
+    # Then
+    assert get_segments_fingerprint(project) != fingerprint
+
+
+def test_get_segments_fingerprint__segments_unchanged__stable(
+    project: Project,
+    segment: Segment,
+) -> None:
+    # Given / When / Then
+    assert get_segments_fingerprint(project) == get_segments_fingerprint(project)
+
+
 @pytest.mark.clickhouse
 def test_get_segment_members_page__regex_with_percent__returns_matches(
     segment_membership_identities: None,
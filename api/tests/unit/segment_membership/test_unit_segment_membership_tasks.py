@@ -16,7 +16,12 @@ from environments.models import Environment
 from organisations.models import Organisation
 from projects.models import Project
 from segment_membership import tasks
-from segment_membership.models import SegmentMembershipCount, SegmentMembershipSeed
+from segment_membership.models import (
+    SegmentMembershipCount,
+    SegmentMembershipSeed,
+    SegmentMembershipWatermark,
+)
+from segment_membership.services import get_segments_fingerprint
 from segment_membership.tasks import (
     reconcile_segment_membership_seeds,
     refresh_all_segment_counts,
@@ -562,3 +567,119 @@ def test_refresh_project_segment_counts__never_matched_pair__no_row_written(
     assert not SegmentMembershipCount.objects.filter(
         segment=segment, environment=environment
     ).exists()
+
+
+def test_refresh_project_segment_counts__no_watermark__recounts_all_and_stores_watermark(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    project: Project,
+    segment: Segment,
+    enable_features: EnableFeaturesFixture,
+) -> None:
+    # Given a project never refreshed before
+    enable_features("segment_membership_inspection")
+    settings.CLICKHOUSE_ENABLED = True
+    cursor = MagicMock()
+    open_cursor = mocker.patch.object(tasks, "open_clickhouse_cursor")
+    open_cursor.return_value.__enter__.return_value = cursor
+    get_changed = mocker.patch.object(tasks, "get_changed_environment_keys")
+    compute = mocker.patch.object(
+        tasks, "compute_segment_counts_for_project", return_value=[]
+    )
+
+    # When
+    refresh_project_segment_counts(project.id)
+
+    # Then every environment is recounted
+    get_changed.assert_not_called()
+    compute.assert_called_once_with(project, cursor, environment_keys=None)
+    watermark = SegmentMembershipWatermark.objects.get(project=project)
+    assert watermark.segments_fingerprint == get_segments_fingerprint(project)
+
+
+def test_refresh_project_segment_counts__watermark__recounts_changed_environments_only(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    project: Project,
+    environment: Environment,
+    segment: Segment,
+    enable_features: EnableFeaturesFixture,
+) -> None:
+    # Given a previous refresh of the current segments, with no identities
+    # changed since
+    enable_features("segment_membership_inspection")
+    settings.CLICKHOUSE_ENABLED = True
+    settings.SEGMENT_MEMBERSHIP_INCREMENTAL_REFRESH = True
+    counted_at = timezone.now() - timedelta(hours=6)
+    SegmentMembershipWatermark.objects.create(
+        project=project,
+        counted_at=counted_at,
+        segments_fingerprint=get_segments_fingerprint(project),
+    )
+    SegmentMembershipCount.objects.create(
+        segment=segment,
+        environment=environment,
+        count=15,
+        last_synced_at=counted_at,
+    )
+    cursor = MagicMock()
+    open_cursor = mocker.patch.object(tasks, "open_clickhouse_cursor")
+    open_cursor.return_value.__enter__.return_value = cursor
+    get_changed = mocker.patch.object(
+        tasks, "get_changed_environment_keys", return_value=set()
+    )
+    compute = mocker.patch.object(
+        tasks, "compute_segment_counts_for_project", return_value=[]
+    )
+
+    # When
+    refresh_project_segment_counts(project.id)
+
+    # Then only changed environments are recounted, here none
+    get_changed.assert_called_once_with(
+        project,
+        cursor,
+        since=counted_at - tasks.CHANGED_IDENTITIES_OVERLAP,
+    )
+    compute.assert_called_once_with(project, cursor, environment_keys=set())
+    # And the unchanged environment keeps its count, now confirmed current
+    membership_count = SegmentMembershipCount.objects.get(
+        segment=segment, environment=environment
+    )
+    assert membership_count.count == 15
+    assert membership_count.last_synced_at > counted_at
+    assert SegmentMembershipWatermark.objects.get(project=project).counted_at == (
+        membership_count.last_synced_at
+    )
+
+
+def test_refresh_project_segment_counts__segments_changed__recounts_all(
+    mocker: MockerFixture,
+    settings: SettingsWrapper,
+    project: Project,
+    segment: Segment,
+    enable_features: EnableFeaturesFixture,
+) -> None:
+    # Given a previous refresh of different segment definitions
+    enable_features("segment_membership_inspection")
+    settings.CLICKHOUSE_ENABLED = True
+    settings.SEGMENT_MEMBERSHIP_INCREMENTAL_REFRESH = True
+    SegmentMembershipWatermark.objects.create(
+        project=project,
+        counted_at=timezone.now(),
+        segments_fingerprint="stale",
+    )
+    cursor = MagicMock()
+    open_cursor = mocker.patch.object(tasks, "open_clickhouse_cursor")
+    open_cursor.return_value.__enter__.return_value = cursor
+    get_changed = mocker.patch.object(tasks, "get_changed_environment_keys")
+    compute = mocker.patch.object(
+        tasks, "compute_segment_counts_for_project", return_value=[]
+    )
+
+    # When
+    refresh_project_segment_counts(project.id)
+
+    # Then
+    get_changed.assert_not_called()
+    compute.assert_called_once_with(project, cursor, environment_keys=None)
@@ -0,0 +1,146 @@
+import pytest
+from flag_engine.engine import get_evaluation_result
+from flag_engine.segments.constants import (
+    EQUAL,
+    GREATER_THAN_INCLUSIVE,
+    IS_NOT_SET,
+)
+from pytest_mock import MockerFixture
+
+from environments.identities.models import Identity
+from environments.identities.traits.models import Trait
+from environments.models import Environment
+from projects.models import Project
+from segments import evaluation
+from segments.evaluation import compile_segments, get_matching_segments
+from segments.models import Condition, Segment, SegmentRule
+from util.mappers.engine import map_environment_to_evaluation_context
+
+
+@pytest.fixture()
+def matrix_segment(project: Project) -> Segment:
+    segment: Segment = Segment.objects.create(project=project, name="matrix")
+    rule = SegmentRule.objects.create(segment=segment, type=SegmentRule.ALL_RULE)
+    Condition.objects.create(
+        rule=rule, property="pill-taken", operator=EQUAL, value="red"
+    )
+    any_rule = SegmentRule.objects.create(rule=rule, type=SegmentRule.ANY_RULE)
+    Condition.objects.create(
+        rule=any_rule,
+        property="oracle_confidence",
+        operator=GREATER_THAN_INCLUSIVE,
+        value="90",
+    )
+    Condition.objects.create(
+        rule=any_rule, property="can_fly", operator=EQUAL, value="True"
+    )
+    return segment
+
+
+def test_compile_segments__nested_rules__returns_required_trait_keys(
+    project: Project,
+    matrix_segment: Segment,
+) -> None:
+    # Given
+    none_segment = Segment.objects.create(project=project, name="none")
+    none_rule = SegmentRule.objects.create(
+        segment=none_segment, type=SegmentRule.NONE_RULE
+    )
+    Condition.objects.create(
+        rule=none_rule, property="pill-taken", operator=EQUAL, value="blue"
+    )
+
+    is_not_set_segment = Segment.objects.create(project=project, name="is_not_set")
+    is_not_set_rule = SegmentRule.objects.create(
+        segment=is_not_set_segment, type=SegmentRule.ALL_RULE
+    )
+    Condition.objects.create(
+        rule=is_not_set_rule, property="pill-taken", operator=IS_NOT_SET
+    )
+    Condition.objects.create(
+        rule=is_not_set_rule,
+        property="$.identity.identifier",
+        operator=EQUAL,
+        value="neo",
+    )
+
+    # When
+    compiled_segments = compile_segments(
+        [matrix_segment, none_segment, is_not_set_segment]
+    )
+
+    # Then
+    assert [
+        compiled_segment.required_trait_keys for compiled_segment in compiled_segments
+    ] == [frozenset({"pill-taken"}), frozenset(), frozenset()]
+
+
+@pytest.mark.parametrize(
+    "traits",
+    [
+        {},
+        {"pill-taken": "red"},
+        {"pill-taken": "red", "can_fly": True},
+        {"pill-taken": "red", "oracle_confidence": 95},
+        {"pill-taken": "blue", "oracle_confidence": 95},
+    ],
+)
+def test_get_matching_segments__traits__returns_same_segments_as_flag_engine(
+    environment: Environment,
+    identity: Identity,
+    matrix_segment: Segment,
+    traits: dict[str, str | int | bool],
+) -> None:
+    # Given
+    trait_models = [
+        Trait(
+            identity=identity,
+            trait_key=trait_key,
+            **Trait.generate_trait_value_data(trait_value),
+        )
+        for trait_key, trait_value in traits.items()
+    ]
+    context = map_environment_to_evaluation_context(
+        environment=environment,
+        identity=identity,
+        traits=trait_models,
+    )
+    expected_result = get_evaluation_result(
+        map_environment_to_evaluation_context(
+            environment=environment,
+            identity=identity,
+            traits=trait_models,
+            segments=[matrix_segment],
+        )
+    )
+
+    # When
+    segments = get_matching_segments(context, compile_segments([matrix_segment]))
+
+    # Then
+    assert [segment.pk for segment in segments] == [
+        segment_result["metadata"]["pk"]
+        for segment_result in expected_result["segments"]
+    ]
+
+
+def test_get_matching_segments__required_trait_absent__skips_evaluation(
+    environment: Environment,
+    identity: Identity,
+    matrix_segment: Segment,
+    mocker: MockerFixture,
+) -> None:
+    # Given
+    is_context_in_segment_spy = mocker.spy(evaluation, "is_context_in_segment")
+    context = map_environment_to_evaluation_context(
+        environment=environment,
+        identity=identity,
+        traits=[],
+    )
+
+    # When
+    segments = get_matching_segments(context, compile_segments([matrix_segment]))
+
+    # Then
+    assert segments == []
+    is_context_in_segment_spy.assert_not_called()
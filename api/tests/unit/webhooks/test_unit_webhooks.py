@@ -24,17 +24,19 @@ from organisations.models import Organisation, OrganisationWebhook
 from webhooks.webhooks import (
     WebhookEventType,
     WebhookType,
+    batch_webhook_events,
     call_environment_webhooks,
     call_integration_webhook,
     call_organisation_webhooks,
     call_webhook_with_failure_mail_after_retries,
+    deliver_webhooks,
     generate_environment_sample_webhook_data,
 )
 
 
-@mock.patch("webhooks.webhooks.requests")
+@mock.patch("webhooks.webhooks.session")
 def test_call_environment_webhooks__multiple_enabled_webhooks__requests_made_to_all_urls(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     environment: Environment,
 ) -> None:
     # Given
@@ -53,18 +55,18 @@ def test_call_environment_webhooks__multiple_enabled_webhooks__requests_made_to_
     )
 
     # Then
-    assert len(mock_requests.post.call_args_list) == 2
+    assert len(mock_session.post.call_args_list) == 2
 
     # and
-    call_1_args, _ = mock_requests.post.call_args_list[0]
-    call_2_args, _ = mock_requests.post.call_args_list[1]
+    call_1_args, _ = mock_session.post.call_args_list[0]
+    call_2_args, _ = mock_session.post.call_args_list[1]
     all_call_args = call_1_args + call_2_args
     assert all(str(webhook.url) in all_call_args for webhook in (webhook_1, webhook_2))
 
 
-@mock.patch("webhooks.webhooks.requests")
+@mock.patch("webhooks.webhooks.session")
 def test_call_environment_webhooks__disabled_webhook__request_not_made(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     environment: Environment,
 ) -> None:
     # Given
@@ -80,13 +82,13 @@ def test_call_environment_webhooks__disabled_webhook__request_not_made(
     )
 
     # Then
-    mock_requests.post.assert_not_called()
+    mock_session.post.assert_not_called()
 
 
 @mock.patch("webhooks.webhooks.WebhookSerializer")
-@mock.patch("webhooks.webhooks.requests")
+@mock.patch("webhooks.webhooks.session")
 def test_call_environment_webhooks__webhook_with_secret__request_has_correct_signature(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     webhook_serializer: MagicMock,
     environment: Environment,
 ) -> None:
@@ -113,15 +115,15 @@ def test_call_environment_webhooks__webhook_with_secret__request_has_correct_sig
         event_type=WebhookEventType.FLAG_UPDATED.value,
     )
     # When
-    _, kwargs = mock_requests.post.call_args_list[0]
+    _, kwargs = mock_session.post.call_args_list[0]
     # Then
     received_signature = kwargs["headers"][FLAGSMITH_SIGNATURE_HEADER]
     assert hmac.compare_digest(expected_signature, received_signature) is True
 
 
-@mock.patch("webhooks.webhooks.requests")
+@mock.patch("webhooks.webhooks.session")
 def test_call_environment_webhooks__no_secret_set__request_has_no_signature_header(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     environment: Environment,
 ) -> None:
     # Given
@@ -136,7 +138,7 @@ def test_call_environment_webhooks__no_secret_set__request_has_no_signature_head
     )
 
     # Then
-    _, kwargs = mock_requests.post.call_args_list[0]
+    _, kwargs = mock_session.post.call_args_list[0]
     assert FLAGSMITH_SIGNATURE_HEADER not in kwargs["headers"]
 
 
@@ -148,7 +150,7 @@ def test_call_environment_webhooks__multiple_webhooks_with_connection_error__sen
     environment: Environment,
 ) -> None:
     # Given
-    requests_post_mock = mocker.patch("webhooks.webhooks.requests.post")
+    requests_post_mock = mocker.patch("webhooks.webhooks.session.post")
     requests_post_mock.side_effect = expected_error()
     send_failure_email_mock: mock.Mock = mocker.patch(
         "webhooks.webhooks.send_failure_email"
@@ -213,7 +215,7 @@ def test_call_organisation_webhooks__multiple_webhooks_with_connection_error__se
     settings: SettingsWrapper,
 ) -> None:
     # Given
-    requests_post_mock = mocker.patch("webhooks.webhooks.requests.post")
+    requests_post_mock = mocker.patch("webhooks.webhooks.session.post")
     requests_post_mock.side_effect = expected_error()
     send_failure_email_mock: mock.Mock = mocker.patch(
         "webhooks.webhooks.send_failure_email"
@@ -273,7 +275,7 @@ def test_call_webhook_with_failure_mail_after_retries__non_2xx_response__logs_wa
     mock_response = MagicMock()
     mock_response.ok = False
     mock_response.status_code = 301
-    mocker.patch("webhooks.webhooks.requests.post", return_value=mock_response)
+    mocker.patch("webhooks.webhooks.session.post", return_value=mock_response)
     mock_logger = mocker.patch("webhooks.webhooks.logger")
 
     webhook = OrganisationWebhook.objects.create(
@@ -310,7 +312,7 @@ def test_call_webhook_with_failure_mail_after_retries__retry_disabled__does_not_
     mocker: MockerFixture, organisation: Organisation, settings: SettingsWrapper
 ):
     # Given
-    requests_post_mock = mocker.patch("webhooks.webhooks.requests.post")
+    requests_post_mock = mocker.patch("webhooks.webhooks.session.post")
     requests_post_mock.side_effect = ConnectionError
     send_failure_email_mock: mock.Mock = mocker.patch(
         "webhooks.webhooks.send_failure_email"
@@ -359,6 +361,110 @@ def test_call_integration_webhook__backoff_give_up__does_not_raise_error(
     assert result is None
 
 
+def test_batch_webhook_events__batching_enabled__delivers_single_batch_event(
+    mocker: MockerFixture,
+    environment: Environment,
+) -> None:
+    # Given
+    mock_session = mocker.patch("webhooks.webhooks.session")
+    batching_webhook = Webhook.objects.create(
+        url="http://url.1.com", enabled=True, environment=environment, batch_events=True
+    )
+    webhook = Webhook.objects.create(
+        url="http://url.2.com", enabled=True, environment=environment
+    )
+
+    # When
+    with batch_webhook_events():
+        for value in ("a", "b"):
+            call_environment_webhooks(
+                environment_id=environment.id,
+                data={"value": value},
+                event_type=WebhookEventType.FLAG_UPDATED.value,
+            )
+
+    # Then
+    posted_data = [
+        (args[0], json.loads(kwargs["data"]))
+        for args, kwargs in mock_session.post.call_args_list
+    ]
+    assert posted_data == [
+        (
+            str(webhook.url),
+            {"event_type": "FLAG_UPDATED", "data": {"value": "a"}},
+        ),
+        (
+            str(webhook.url),
+            {"event_type": "FLAG_UPDATED", "data": {"value": "b"}},
+        ),
+        (
+            str(batching_webhook.url),
+            {
+                "event_type": "BATCH",
+                "data": {
+                    "events": [
+                        {"event_type": "FLAG_UPDATED", "data": {"value": "a"}},
+                        {"event_type": "FLAG_UPDATED", "data": {"value": "b"}},
+                    ]
+                },
+            },
+        ),
+    ]
+
+
+def test_call_environment_webhooks__batching_enabled_outside_batch__delivers_event(
+    mocker: MockerFixture,
+    environment: Environment,
+) -> None:
+    # Given
+    mock_session = mocker.patch("webhooks.webhooks.session")
+    Webhook.objects.create(
+        url="http://url.1.com", enabled=True, environment=environment, batch_events=True
+    )
+
+    # When
+    call_environment_webhooks(
+        environment_id=environment.id,
+        data={},
+        event_type=WebhookEventType.FLAG_UPDATED.value,
+    )
+
+    # Then
+    mock_session.post.assert_called_once()
+
+
+def test_deliver_webhooks__connection_error__schedules_retry_without_waiting(
+    mocker: MockerFixture,
+    environment: Environment,
+) -> None:
+    # Given
+    mocker.patch("webhooks.webhooks.session.post", side_effect=ConnectionError)
+    retry_task_mock = mocker.patch(
+        "webhooks.tasks.call_webhook_with_failure_mail_after_retries"
+    )
+    send_failure_email_mock = mocker.patch("webhooks.webhooks.send_failure_email")
+    webhook_1 = Webhook.objects.create(
+        url="http://url.1.com", enabled=True, environment=environment
+    )
+    webhook_2 = Webhook.objects.create(
+        url="http://url.2.com", enabled=True, environment=environment
+    )
+
+    # When
+    deliver_webhooks(
+        [webhook_1.id, webhook_2.id],
+        data={},
+        webhook_type=WebhookType.ENVIRONMENT.value,
+    )
+
+    # Then
+    assert [call.kwargs["args"] for call in retry_task_mock.delay.call_args_list] == [
+        (webhook_1.id, {}, WebhookType.ENVIRONMENT.value, True, 3, 2),
+        (webhook_2.id, {}, WebhookType.ENVIRONMENT.value, True, 3, 2),
+    ]
+    send_failure_email_mock.assert_not_called()
+
+
 def test_send_test_webhook__200_response_from_webhook__returns_correct_response(
     mocker: MockerFixture,
     admin_client: APIClient,
@@ -2,10 +2,12 @@ from util.mappers.dynamodb import (
     map_engine_feature_state_to_identity_override,
     map_engine_identity_to_identity_document,
     map_environment_api_key_to_environment_api_key_document,
+    map_environment_document_to_compressed_environment_document,
     map_environment_to_compressed_environment_document,
     map_environment_to_compressed_environment_v2_document,
     map_environment_to_environment_document,
     map_environment_to_environment_v2_document,
+    map_environment_v2_document_to_compressed_environment_v2_document,
     map_identity_changeset_to_identity_override_changeset,
     map_identity_override_to_identity_override_document,
     map_identity_to_identity_document,
@@ -22,11 +24,13 @@ __all__ = (
     "map_engine_feature_state_to_identity_override",
     "map_engine_identity_to_identity_document",
     "map_environment_api_key_to_environment_api_key_document",
+    "map_environment_document_to_compressed_environment_document",
     "map_environment_to_compressed_environment_document",
     "map_environment_to_compressed_environment_v2_document",
     "map_environment_to_environment_document",
     "map_environment_to_environment_v2_document",
     "map_environment_to_sdk_document",
+    "map_environment_v2_document_to_compressed_environment_v2_document",
     "map_feature_state_to_engine",
     "map_feature_to_engine",
     "map_identity_changeset_to_identity_override_changeset",
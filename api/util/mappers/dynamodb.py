@@ -38,10 +38,12 @@ if TYPE_CHECKING:
 __all__ = (
     "map_engine_identity_to_identity_document",
     "map_environment_api_key_to_environment_api_key_document",
+    "map_environment_document_to_compressed_environment_document",
     "map_environment_to_compressed_environment_document",
     "map_environment_to_compressed_environment_v2_document",
     "map_environment_to_environment_document",
     "map_environment_to_environment_v2_document",
+    "map_environment_v2_document_to_compressed_environment_v2_document",
     "map_identity_to_identity_document",
 )
 
@@ -70,9 +72,17 @@ def map_environment_to_environment_document(
 
 def map_environment_to_compressed_environment_document(
     environment: "Environment",
+) -> CompressedEnvironmentDocument:
+    return map_environment_document_to_compressed_environment_document(
+        map_environment_to_environment_document(environment),
+    )
+
+
+def map_environment_document_to_compressed_environment_document(
+    environment_document: Document,
 ) -> CompressedEnvironmentDocument:
     return _get_compressed_environment_document(
-        document=map_environment_to_environment_document(environment),
+        document=environment_document,
         adapter=_environment_compressed_adapter,
     )
 
@@ -92,9 +102,17 @@ def map_environment_to_environment_v2_document(
 
 def map_environment_to_compressed_environment_v2_document(
     environment: "Environment",
+) -> CompressedEnvironmentDocument:
+    return map_environment_v2_document_to_compressed_environment_v2_document(
+        map_environment_to_environment_v2_document(environment),
+    )
+
+
+def map_environment_v2_document_to_compressed_environment_v2_document(
+    environment_v2_document: Document,
 ) -> CompressedEnvironmentDocument:
     return _get_compressed_environment_document(
-        document=map_environment_to_environment_v2_document(environment),
+        document=environment_v2_document,
         adapter=_environment_v2_meta_compressed_adapter,
     )
 
@@ -11,6 +11,9 @@ from webhooks.webhooks import (
 from webhooks.webhooks import (
     call_webhook_with_failure_mail_after_retries as call_webhook_with_failure_mail_after_retries_service,
 )
+from webhooks.webhooks import (
+    deliver_webhooks as deliver_webhooks_service,
+)
 
 call_environment_webhooks = register_task_handler()(
     call_environment_webhooks_service,
@@ -23,3 +26,7 @@ call_organisation_webhooks = register_task_handler()(
 call_webhook_with_failure_mail_after_retries = register_task_handler()(
     call_webhook_with_failure_mail_after_retries_service,
 )
+
+deliver_webhooks = register_task_handler()(
+    deliver_webhooks_service,
+)
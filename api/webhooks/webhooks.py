@@ -2,6 +2,9 @@ import enum
 import json
 import logging
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, Type, Union
 
@@ -12,6 +15,7 @@ from django.core.mail import EmailMultiAlternatives
 from django.core.serializers.json import DjangoJSONEncoder
 from django.template.loader import get_template
 from django.utils import timezone
+from requests.adapters import HTTPAdapter
 from task_processor.task_run_method import TaskRunMethod
 
 from core.constants import FLAGSMITH_SIGNATURE_HEADER
@@ -38,12 +42,37 @@ if typing.TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 WebhookModels = typing.Union[OrganisationWebhook, Webhook]
 
+# Shared by all webhook deliveries in the process, so connections to webhook
+# hosts are kept alive between events.
+session = requests.Session()
+session.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=settings.WEBHOOK_DELIVERY_POOL_HOSTS,
+        pool_maxsize=settings.WEBHOOK_DELIVERY_MAX_WORKERS,
+    ),
+)
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=settings.WEBHOOK_DELIVERY_POOL_HOSTS,
+        pool_maxsize=settings.WEBHOOK_DELIVERY_MAX_WORKERS,
+    ),
+)
+
+# Payloads of events triggered inside `batch_webhook_events`, keyed by
+# webhook type and webhook ID.
+_webhook_batches: ContextVar[dict[tuple[str, int], list[typing.Any]] | None] = (
+    ContextVar("webhook_batches", default=None)
+)
+
 
 class WebhookEventType(enum.Enum):
     FLAG_UPDATED = "FLAG_UPDATED"
     FLAG_DELETED = "FLAG_DELETED"
     AUDIT_LOG_CREATED = "AUDIT_LOG_CREATED"
     NEW_VERSION_PUBLISHED = "NEW_VERSION_PUBLISHED"
+    BATCH = "BATCH"
 
 
 class WebhookType(enum.Enum):
@@ -135,20 +164,8 @@ def _call_webhook(
     webhook: AbstractBaseWebhookModel,
     data: typing.Mapping,  # type: ignore[type-arg]
 ) -> requests.models.Response:
-    headers = {"content-type": "application/json"}
-    json_data = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
-    if webhook.secret:
-        signature = sign_payload(json_data, key=webhook.secret)
-        headers.update({FLAGSMITH_SIGNATURE_HEADER: signature})
-
     try:
-        res = requests.post(
-            str(webhook.url),
-            data=json_data,
-            headers=headers,
-            timeout=10,
-            allow_redirects=False,
-        )
+        res = _post_webhook(webhook, data)
         res.raise_for_status()
         return res
     except requests.exceptions.RequestException as exc:
@@ -156,6 +173,25 @@ def _call_webhook(
         raise
 
 
+def _post_webhook(
+    webhook: AbstractBaseWebhookModel,
+    data: typing.Any,
+) -> requests.models.Response:
+    headers = {"content-type": "application/json"}
+    json_data = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
+    if webhook.secret:
+        signature = sign_payload(json_data, key=webhook.secret)
+        headers.update({FLAGSMITH_SIGNATURE_HEADER: signature})
+
+    return session.post(
+        str(webhook.url),
+        data=json_data,
+        headers=headers,
+        timeout=10,
+        allow_redirects=False,
+    )
+
+
 def call_webhook_with_failure_mail_after_retries(  # type: ignore[no-untyped-def]
     webhook_id: int,
     data: typing.Mapping,  # type: ignore[type-arg]
@@ -184,67 +220,137 @@ def call_webhook_with_failure_mail_after_retries(  # type: ignore[no-untyped-def
     else:
         webhook = Webhook.objects.get(id=webhook_id)
 
-    headers = {"content-type": "application/json"}
-    json_data = json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder)
-    if webhook.secret:
-        signature = sign_payload(json_data, key=webhook.secret)
-        headers.update({FLAGSMITH_SIGNATURE_HEADER: signature})
-
     try:
-        res = requests.post(
-            str(webhook.url),
-            data=json_data,
-            headers=headers,
-            timeout=10,
-            allow_redirects=False,
+        res = _post_webhook(webhook, data)
+    except requests.exceptions.RequestException as exc:
+        _handle_webhook_error(
+            webhook,
+            data,
+            webhook_type,
+            exc,
+            send_failure_mail=send_failure_mail,
+            max_retries=max_retries,
+            try_count=try_count,
         )
-        if not res.ok:
-            logger.warning(
-                "Webhook %d returned HTTP %d (attempt %d/%d)",
-                webhook_id,
-                res.status_code,
-                try_count,
-                max_retries,
+        return
+    _log_unsuccessful_response(webhook, res, try_count, max_retries)
+    return res
+
+
+def deliver_webhooks(
+    webhook_ids: list[int],
+    data: typing.Any,
+    webhook_type: str,
+    max_retries: int = settings.WEBHOOK_BACKOFF_RETRIES,
+) -> None:
+    """
+    Deliver an event to a number of webhooks concurrently.
+
+    Failed deliveries are retried by delayed
+    `call_webhook_with_failure_mail_after_retries` tasks, so this never
+    waits between attempts.
+
+    :param webhook_ids: The IDs of the webhooks to deliver the event to.
+    :param data: The payload to be sent in the webhook requests.
+    :param webhook_type: The type of the webhooks to be triggered.
+    :param max_retries: The maximum number of attempts per webhook (int, default is 3).
+    """
+    webhooks = list(
+        get_webhook_model(WebhookType(webhook_type))
+        .objects.filter(id__in=webhook_ids)
+        .order_by("id")
+    )
+    if not webhooks:
+        return
+
+    # Only the requests are made by the pool; retries and failure emails
+    # are handled by the calling thread, which owns the database connection.
+    with ThreadPoolExecutor(
+        max_workers=min(len(webhooks), settings.WEBHOOK_DELIVERY_MAX_WORKERS)
+    ) as executor:
+        futures = [
+            executor.submit(_post_webhook, webhook, data) for webhook in webhooks
+        ]
+
+    for webhook, future in zip(webhooks, futures):
+        try:
+            res = future.result()
+        except requests.exceptions.RequestException as exc:
+            _handle_webhook_error(
+                webhook,
+                data,
+                webhook_type,
+                exc,
+                send_failure_mail=True,
+                max_retries=max_retries,
+                try_count=1,
             )
-    except requests.exceptions.RequestException as exc:
+        else:
+            _log_unsuccessful_response(webhook, res, 1, max_retries)
+
+
+def _log_unsuccessful_response(
+    webhook: WebhookModels,
+    res: requests.models.Response,
+    try_count: int,
+    max_retries: int,
+) -> None:
+    if not res.ok:
         logger.warning(
-            "Webhook call failed for webhook %d (attempt %d/%d): %s",
-            webhook_id,
+            "Webhook %d returned HTTP %d (attempt %d/%d)",
+            webhook.id,
+            res.status_code,
             try_count,
             max_retries,
-            exc,
         )
-        if try_count == max_retries or not settings.RETRY_WEBHOOKS:
-            if send_failure_mail:
-                send_failure_email(
-                    webhook,
-                    data,
-                    webhook_type,
-                    f"{f'HTTP {exc.response.status_code}' if exc.response else 'N/A'} ({exc.__class__.__name__})",
-                )
-        else:
-            from webhooks.tasks import call_webhook_with_failure_mail_after_retries
-
-            call_webhook_with_failure_mail_after_retries.delay(
-                delay_until=(
-                    timezone.now()
-                    + timezone.timedelta(  # type: ignore[attr-defined]
-                        seconds=settings.WEBHOOK_BACKOFF_BASE**try_count
-                    )
-                    if settings.TASK_RUN_METHOD == TaskRunMethod.TASK_PROCESSOR
-                    else None
-                ),
-                args=(
-                    webhook_id,
-                    data,
-                    webhook_type,
-                    send_failure_mail,
-                    max_retries,
-                    try_count + 1,
-                ),
+
+
+def _handle_webhook_error(
+    webhook: WebhookModels,
+    data: typing.Any,
+    webhook_type: str,
+    exc: requests.exceptions.RequestException,
+    send_failure_mail: bool,
+    max_retries: int,
+    try_count: int,
+) -> None:
+    logger.warning(
+        "Webhook call failed for webhook %d (attempt %d/%d): %s",
+        webhook.id,
+        try_count,
+        max_retries,
+        exc,
+    )
+    if try_count >= max_retries or not settings.RETRY_WEBHOOKS:
+        if send_failure_mail:
+            send_failure_email(
+                webhook,
+                data,
+                webhook_type,
+                f"{f'HTTP {exc.response.status_code}' if exc.response else 'N/A'} ({exc.__class__.__name__})",
             )
         return
-    return res
+
+    from webhooks.tasks import call_webhook_with_failure_mail_after_retries
+
+    call_webhook_with_failure_mail_after_retries.delay(
+        delay_until=(
+            timezone.now()
+            + timezone.timedelta(  # type: ignore[attr-defined]
+                seconds=settings.WEBHOOK_BACKOFF_BASE**try_count
+            )
+            if settings.TASK_RUN_METHOD == TaskRunMethod.TASK_PROCESSOR
+            else None
+        ),
+        args=(
+            webhook.id,
+            data,
+            webhook_type,
+            send_failure_mail,
+            max_retries,
+            try_count + 1,
+        ),
+    )
 
 
 def _call_webhooks(  # type: ignore[no-untyped-def]
@@ -254,17 +360,61 @@ def _call_webhooks(  # type: ignore[no-untyped-def]
     webhook_type: WebhookType,
     retries: int = settings.WEBHOOK_BACKOFF_RETRIES,
 ):
-    from webhooks.tasks import call_webhook_with_failure_mail_after_retries
+    from webhooks.tasks import deliver_webhooks
 
     webhook_data = {"event_type": event_type, "data": data}
     serializer = WebhookSerializer(data=webhook_data)
     serializer.is_valid(raise_exception=False)
+
+    batches = _webhook_batches.get()
+    webhook_ids = []
     for webhook in webhooks:
-        call_webhook_with_failure_mail_after_retries.delay(
-            args=(webhook.id, serializer.data, webhook_type.value, True, retries)  # type: ignore[has-type]
+        if batches is not None and webhook.batch_events:
+            batches.setdefault((webhook_type.value, webhook.id), []).append(
+                serializer.data
+            )
+        else:
+            webhook_ids.append(webhook.id)
+
+    if webhook_ids:
+        deliver_webhooks.delay(
+            args=(webhook_ids, serializer.data, webhook_type.value, retries)  # type: ignore[has-type]
         )
 
 
+@contextmanager
+def batch_webhook_events() -> typing.Iterator[None]:
+    """
+    Coalesce the events triggered inside the block into a single `BATCH`
+    event per webhook, for webhooks opted in with `batch_events`. The
+    batches are delivered when the block exits.
+    """
+    if _webhook_batches.get() is not None:
+        # Nested blocks add to the outermost batches.
+        yield
+        return
+
+    from webhooks.tasks import deliver_webhooks
+
+    batches: dict[tuple[str, int], list[typing.Any]] = {}
+    token = _webhook_batches.set(batches)
+    try:
+        yield
+    finally:
+        _webhook_batches.reset(token)
+        for (webhook_type, webhook_id), events in batches.items():
+            deliver_webhooks.delay(
+                args=(
+                    [webhook_id],
+                    {
+                        "event_type": WebhookEventType.BATCH.value,
+                        "data": {"events": events},
+                    },
+                    webhook_type,
+                )
+            )
+
+
 def send_failure_email(  # type: ignore[no-untyped-def]
     webhook: WebhookModels,
     data: typing.Mapping,  # type: ignore[type-arg]